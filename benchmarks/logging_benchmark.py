@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Logging Overhead Benchmark
+==========================
+
+Measures what DEBUG logging costs extraction running on a thread pool, for
+each logging mode of setup_logging():
+- off: WARNING level, the hot debug and info sites are skipped
+- sync: console and file handlers format and write on the worker threads
+- queue: records are queued and a listener thread formats and writes them
+- queue-json: as queue, with JSON records carrying the document id
+- queue-sampled: as queue-json, keeping 1 in --sample-rate records below
+  WARNING from the extractor loggers
+
+Console output goes to os.devnull and file output to a temporary file.
+'extract' is the time the worker threads took; 'drain' is the time the
+listener needed afterwards to write out records still queued.
+
+Documents are the synthetic in-memory tables of threading_benchmark.py, so
+PDF parsing is not measured.
+
+Usage:
+    python benchmarks/logging_benchmark.py --documents 200 --threads 4
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from threading_benchmark import _document_tables  # noqa: E402
+
+EXTRACTOR_LOGGER = 'form16x.form16_parser.extractors'
+
+MODES = {
+    'off': dict(log_level='WARNING', queue_logging=False, json_logging=False),
+    'sync': dict(log_level='DEBUG', queue_logging=False, json_logging=False),
+    'queue': dict(log_level='DEBUG', queue_logging=True, json_logging=False),
+    'queue-json': dict(log_level='DEBUG', queue_logging=True, json_logging=True),
+    'queue-sampled': dict(log_level='DEBUG', queue_logging=True, json_logging=True, sampled=True),
+}
+
+
+def run(mode, documents, threads, sample_rate, log_dir):
+    """Benchmark one logging mode; returns a JSON-serializable result"""
+    from form16x.form16_parser.config.settings import get_settings
+    from form16x.form16_parser.services.extraction_service import ExtractionService
+    from form16x.form16_parser.utils.structured_logging import document_context
+
+    options = dict(MODES[mode])
+    sample_rates = {EXTRACTOR_LOGGER: sample_rate} if options.pop('sampled', False) else {}
+    log_file = Path(log_dir) / f'{mode}.log'
+    # Set before logging_config is first imported, since the import configures logging
+    get_settings().logging.enable_file_logging = True
+    get_settings().logging.log_file_path = str(log_file)
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        from form16x.form16_parser.config.logging_config import setup_logging, shutdown_logging
+
+        setup_logging(sample_rates=sample_rates, **options)
+        extractor = ExtractionService().extractor
+
+        def extract(number):
+            with document_context(f'document-{number}.pdf'):
+                extractor.extract_all(_document_tables(number))
+
+        # Warm up every extractor before timing
+        extract(0)
+
+        start_time = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(extract, range(documents)))
+        extract_time = time.perf_counter() - start_time
+        shutdown_logging()
+        drain_time = time.perf_counter() - start_time - extract_time
+
+        for handler in logging.getLogger().handlers[:]:
+            handler.close()
+            logging.getLogger().removeHandler(handler)
+        log_bytes = log_file.stat().st_size
+
+    return {
+        'mode': mode,
+        'documents': documents,
+        'threads': threads,
+        'extract_seconds': extract_time,
+        'drain_seconds': drain_time,
+        'documents_per_second': documents / extract_time,
+        'log_mib': log_bytes / (1024 * 1024)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--documents', type=int, default=100, help='Documents extracted per mode')
+    parser.add_argument('--threads', type=int, default=4, help='Thread pool size')
+    parser.add_argument('--sample-rate', type=int, default=20,
+                        help='Keep 1 in n extractor records below WARNING in queue-sampled mode')
+    parser.add_argument('--modes', nargs='+', choices=list(MODES), default=list(MODES))
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        results = [run(mode, args.documents, args.threads, args.sample_rate, log_dir) for mode in args.modes]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    base = results[0]['extract_seconds']
+    print(f"{args.documents} documents on {args.threads} threads")
+    print(f"{'mode':<15}{'docs/s':>9}{'extract':>11}{'vs ' + results[0]['mode']:>10}{'drain':>11}{'log size':>12}")
+    for result in results:
+        print(f"{result['mode']:<15}{result['documents_per_second']:>9.1f}"
+              f"{result['extract_seconds'] * 1000:>8.0f} ms{result['extract_seconds'] / base:>9.2f}x"
+              f"{result['drain_seconds'] * 1000:>8.0f} ms{result['log_mib']:>8.2f} MiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Pre-fork Initialization Benchmark
+=================================
+
+Measures worker start-up time and per-worker memory with and without
+prefork_initialize() in the parent, the way a pre-fork server or the
+isolated extraction pool's fork server starts its workers.
+
+Each mode runs in a fresh interpreter that forks --children workers one at
+a time. A worker builds what an extraction worker needs (extraction service,
+keyword index, tax rules), runs a table and a text extraction and a garbage
+collection, then reports its start-up time and memory:
+- rss: resident set size
+- private: pages not shared with any other process (USS)
+
+Modes:
+- cold: the parent imports nothing; every worker builds everything itself
+- prefork: the parent runs prefork_initialize() (with gc.freeze())
+- prefork-nofreeze: as prefork, without freezing the garbage collector
+
+Linux only (os.fork and /proc/self/smaps_rollup).
+
+Usage:
+    python benchmarks/prefork_benchmark.py --children 8
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+MODES = ('cold', 'prefork', 'prefork-nofreeze')
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+SAMPLE_TEXT = (
+    "FORM NO. 16\n"
+    "Name and address of the Employer : ACME SOFTWARE PRIVATE LIMITED\n"
+    "TAN of the Deductor : ABCD12345E\n"
+    "Employee PAN : ABCDE1234F\n"
+    "Assessment Year : 2024-25\n"
+    "Full Name : TEST EMPLOYEE Designation\n"
+)
+
+
+def _memory_kb():
+    """Resident and private memory of this process in KiB"""
+    values = {}
+    with open('/proc/self/smaps_rollup') as rollup:
+        for line in rollup:
+            parts = line.split()
+            if len(parts) >= 2 and parts[0].endswith(':'):
+                values[parts[0][:-1]] = int(parts[1])
+    return {
+        'rss': values.get('Rss', 0),
+        'private': values.get('Private_Clean', 0) + values.get('Private_Dirty', 0)
+    }
+
+
+def _worker_startup():
+    """What an extraction worker builds and touches before its first document"""
+    import gc
+
+    import pandas as pd
+
+    from form16x.form16_parser.extractors.domains.identity.text_extractor import IdentityTextExtractor
+    from form16x.form16_parser.services.isolated_extraction import build_extraction_service
+    from form16x.form16_parser.tax_calculators.rules.json_rule_provider import JsonTaxRuleProvider
+    from form16x.form16_parser.utils.table_features import table_features
+
+    build_extraction_service(False)
+    JsonTaxRuleProvider().rule_pack.years()
+    table = pd.DataFrame([['Basic salary', '600000'], ['House rent allowance', '240000'],
+                          ['Tax deducted at source', '52000']])
+    table_features(table)
+    IdentityTextExtractor().extract_from_text(SAMPLE_TEXT)
+    gc.collect()
+
+
+def _run_mode(mode, children):
+    """Fork workers from this interpreter and collect their measurements"""
+    parent_init = 0.0
+    if mode != 'cold':
+        from form16x.form16_parser.services.prefork import prefork_initialize
+        parent_init = prefork_initialize(freeze=(mode == 'prefork'))['initialization_time']
+
+    samples = []
+    for _ in range(children):
+        read_fd, write_fd = os.pipe()
+        fork_time = time.perf_counter()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            try:
+                _worker_startup()
+                sample = dict(_memory_kb(), startup=time.perf_counter() - fork_time)
+                os.write(write_fd, json.dumps(sample).encode())
+            finally:
+                os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as reader:
+            data = reader.read()
+        os.waitpid(pid, 0)
+        samples.append(json.loads(data))
+
+    return {
+        'mode': mode,
+        'children': children,
+        'parent_init_ms': parent_init * 1000,
+        'startup_ms': statistics.mean(sample['startup'] for sample in samples) * 1000,
+        'rss_mib': statistics.mean(sample['rss'] for sample in samples) / 1024,
+        'private_mib': statistics.mean(sample['private'] for sample in samples) / 1024,
+        'parent_rss_mib': _memory_kb()['rss'] / 1024
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--children', type=int, default=4, help='Workers forked per mode')
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    parser.add_argument('--run-mode', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_mode:
+        print(json.dumps(_run_mode(args.run_mode, args.children)))
+        return
+
+    if not hasattr(os, 'fork') or not Path('/proc/self/smaps_rollup').exists():
+        sys.exit('This benchmark needs os.fork and /proc/self/smaps_rollup (Linux)')
+
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(REPO_ROOT), os.environ.get('PYTHONPATH')])))
+    results = []
+    for mode in args.modes:
+        output = subprocess.run(
+            [sys.executable, __file__, '--run-mode', mode, '--children', str(args.children)],
+            check=True, capture_output=True, text=True, env=env
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'mode':<18}{'parent init':>13}{'child startup':>15}{'child RSS':>12}{'child private':>15}")
+    for result in results:
+        print(f"{result['mode']:<18}{result['parent_init_ms']:>10.1f} ms{result['startup_ms']:>12.1f} ms"
+              f"{result['rss_mib']:>8.1f} MiB{result['private_mib']:>11.1f} MiB")
+
+
+if __name__ == '__main__':
+    main()
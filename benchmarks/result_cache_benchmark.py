@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Result Cache Benchmark
+======================
+
+Measures the per-call cost of MultiYearTaxCalculator and
+ComprehensiveTaxCalculator with the result cache disabled (every call
+calculates) and with every call a cache hit, the way the optimize flow and
+the regime comparison displays recalculate identical scenarios.
+
+Each call builds a fresh input, as callers do, so building the cache key
+is part of the measured hit cost.
+
+Usage:
+    python benchmarks/result_cache_benchmark.py --calls 5000
+"""
+
+import argparse
+import json
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from form16x.form16_parser.tax_calculators.comprehensive_calculator import (  # noqa: E402
+    ComprehensiveTaxCalculationInput, ComprehensiveTaxCalculator
+)
+from form16x.form16_parser.tax_calculators.interfaces.calculator_interface import (  # noqa: E402
+    TaxCalculationInput, TaxRegimeType
+)
+from form16x.form16_parser.tax_calculators.main_calculator import MultiYearTaxCalculator  # noqa: E402
+
+CALCULATORS = {
+    'base': (MultiYearTaxCalculator, TaxCalculationInput),
+    'comprehensive': (ComprehensiveTaxCalculator, ComprehensiveTaxCalculationInput),
+}
+
+
+def _input(input_cls, regime_type):
+    """A typical salaried scenario with deductions and exemptions"""
+    extra = dict(hra_received=Decimal('240000'), basic_salary=Decimal('600000'), rent_paid=Decimal('300000'),
+                 city_type='metro') if input_cls is ComprehensiveTaxCalculationInput else {}
+    return input_cls(
+        assessment_year='2024-25', regime_type=regime_type, gross_salary=Decimal('1500000.00'),
+        bank_interest_income=Decimal('12000'), standard_deduction=Decimal('50000'),
+        section_80c=Decimal('150000'), section_80d=Decimal('25000'),
+        other_deductions={'80G': Decimal('5000')}, tds_deducted=Decimal('180000'), **extra
+    )
+
+
+def run(name, calls, cached):
+    """Time calls calculations of one scenario per regime; returns a JSON-serializable result"""
+    calculator_cls, input_cls = CALCULATORS[name]
+    calculator = calculator_cls(cache_size=1024 if cached else 0)
+    regimes = (TaxRegimeType.OLD, TaxRegimeType.NEW)
+    # Warm up the rules (and, when cached, the entries)
+    for regime_type in regimes:
+        calculator.calculate_tax(_input(input_cls, regime_type))
+
+    start_time = time.perf_counter()
+    for number in range(calls):
+        calculator.calculate_tax(_input(input_cls, regimes[number % 2]))
+    elapsed = time.perf_counter() - start_time
+
+    return {
+        'calculator': name,
+        'cache': 'hit' if cached else 'off',
+        'calls': calls,
+        'microseconds_per_call': elapsed / calls * 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--calls', type=int, default=5000, help='Calculations timed per mode')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    results = [run(name, args.calls, cached) for name in CALCULATORS for cached in (False, True)]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{args.calls} calls per mode")
+    print(f"{'calculator':<15}{'cache':<7}{'us/call':>10}{'speedup':>10}")
+    for uncached, cached in zip(results[::2], results[1::2]):
+        for result in (uncached, cached):
+            speedup = uncached['microseconds_per_call'] / result['microseconds_per_call']
+            print(f"{result['calculator']:<15}{result['cache']:<7}"
+                  f"{result['microseconds_per_call']:>10.1f}{speedup:>9.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Thread-Pool Extraction Benchmark
+================================
+
+Measures extraction throughput of one shared extraction service driven
+from a thread pool, the way BatchProcessingService runs a batch, and checks
+that every document extracted concurrently matches its single-threaded
+result.
+
+On a standard build the GIL serializes the extractors, so throughput stays
+flat as threads are added; on a free-threaded build (3.13t and later) it
+should scale with cores. --compare runs the same benchmark under other
+interpreters, e.g. a free-threaded build next to the standard one.
+
+Documents are synthetic in-memory tables, so PDF parsing is not measured.
+
+Usage:
+    python benchmarks/threading_benchmark.py --documents 200 --threads 1 2 4 8
+    python benchmarks/threading_benchmark.py --compare python3.13 python3.13t
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import sysconfig
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+
+def _document_tables(number):
+    """Synthetic identity and salary tables for one document, with amounts varying by document"""
+    import pandas as pd
+
+    gross = 600000 + (number % 50) * 10000
+    perquisites = (number % 7) * 5000
+    return [
+        pd.DataFrame([
+            ["Name and address of the Employer/Specified Bank",
+             "Name and address of the Employee/Specified senior citizen"],
+            ["ACME SOFTWARE PRIVATE LIMITED", f"EMPLOYEE {chr(65 + number % 26)} TEST"],
+            ["PAN of the Deductor", "PAN of the Employee/Specified senior citizen"],
+            ["AAACA1234B", f"ABCDE{1000 + number % 9000}F"],
+            ["TAN of the Deductor", ""],
+            ["ABCD12345E", ""],
+        ]),
+        pd.DataFrame([
+            ['Gross Salary', ''],
+            ['(a) Salary as per provisions contained in section 17(1)', f'{gross}.00'],
+            ['(b) Value of perquisites under section 17(2)', f'{perquisites}.00'],
+            ['(d) Total', f'{gross + perquisites}.00'],
+            ['Standard deduction under section 16(ia)', '50000.00'],
+            ['Tax on total income', f'{gross // 10}.00'],
+            ['Health and education cess', f'{gross // 250}.00'],
+        ]),
+    ]
+
+
+def _summary(document):
+    """Fields compared between concurrent and single-threaded extraction"""
+    return json.dumps({
+        'employee': document.employee.model_dump(mode='json', warnings=False) if document.employee else None,
+        'employer': document.employer.model_dump(mode='json', warnings=False) if document.employer else None,
+        'salary': document.salary.model_dump(mode='json', warnings=False) if document.salary else None,
+        'tax': document.tax_computation.model_dump(mode='json', warnings=False) if document.tax_computation else None,
+        'detailed_perquisites': document.detailed_perquisites,
+    }, sort_keys=True, default=str)
+
+
+def run(documents, thread_counts):
+    """Benchmark this interpreter; returns a JSON-serializable result"""
+    from form16x.form16_parser.services.extraction_service import ExtractionService
+
+    logging.disable(logging.CRITICAL)
+    extractor = ExtractionService().extractor
+
+    # Single-threaded reference results (also warms up every extractor)
+    expected = [_summary(extractor.extract_all(_document_tables(number))) for number in range(documents)]
+
+    def extract(number):
+        return _summary(extractor.extract_all(_document_tables(number)))
+
+    runs = []
+    for threads in thread_counts:
+        start_time = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            results = list(executor.map(extract, range(documents)))
+        elapsed = time.perf_counter() - start_time
+        runs.append({
+            'threads': threads,
+            'seconds': elapsed,
+            'documents_per_second': documents / elapsed,
+            'mismatches': sum(1 for result, reference in zip(results, expected) if result != reference)
+        })
+
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return {
+        'python': sys.version.split()[0],
+        'free_threaded_build': bool(sysconfig.get_config_var('Py_GIL_DISABLED')),
+        'gil_enabled': is_gil_enabled() if is_gil_enabled else True,
+        'cpus': os.cpu_count(),
+        'documents': documents,
+        'runs': runs
+    }
+
+
+def _print_result(result):
+    build = 'free-threaded' if result['free_threaded_build'] else 'standard'
+    gil = 'on' if result['gil_enabled'] else 'off'
+    print(f"Python {result['python']} ({build} build, GIL {gil}), {result['cpus']} CPUs, "
+          f"{result['documents']} documents")
+    base = result['runs'][0]['documents_per_second']
+    print(f"{'threads':>8}{'docs/s':>10}{'speedup':>9}{'mismatches':>12}")
+    for run_result in result['runs']:
+        print(f"{run_result['threads']:>8}{run_result['documents_per_second']:>10.1f}"
+              f"{run_result['documents_per_second'] / base:>8.2f}x{run_result['mismatches']:>12}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--documents', type=int, default=100, help='Documents extracted per thread count')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8], help='Thread pool sizes')
+    parser.add_argument('--compare', nargs='+', metavar='PYTHON',
+                        help='Run under each of these interpreters instead of this one')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    if not args.compare:
+        results = [run(args.documents, args.threads)]
+    else:
+        results = []
+        for python in args.compare:
+            output = subprocess.run(
+                [python, __file__, '--json', '--documents', str(args.documents),
+                 '--threads', *map(str, args.threads)],
+                check=True, capture_output=True, text=True
+            ).stdout
+            results.extend(json.loads(output))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for index, result in enumerate(results):
+        if index:
+            print()
+        _print_result(result)
+    if any(run_result['mismatches'] for result in results for run_result in result['runs']):
+        sys.exit('Concurrent extraction results differ from single-threaded results')
+
+
+if __name__ == '__main__':
+    main()
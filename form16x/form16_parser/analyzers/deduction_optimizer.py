@@ -0,0 +1,463 @@
+"""
+Deduction Optimizer
+
+Exact search over deduction combinations for tax planning.
+
+Instead of multiplying an investment by an assumed marginal rate, every
+candidate plan is re-evaluated through the tax rules of the regime, so
+slab boundaries, the 87A rebate, surcharge and cess are all reflected in
+the reported savings.
+
+The search is a multiple-choice knapsack solved by dynamic programming
+over Pareto sets: each lever (80C, 80D, 80CCD(1B), HRA rent, 80E, 80G)
+contributes a small set of (investment, deduction) options on a rupee
+step grid, lever sets are merged one at a time and dominated plans
+(more investment for no more deduction) are pruned after every merge.
+Because tax never increases with a larger deduction, the surviving plans
+map directly onto the Pareto frontier of investment versus tax saved.
+"""
+
+from dataclasses import dataclass, field
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, List, Optional, Tuple
+import logging
+
+from ..tax_calculators.interfaces.calculator_interface import AgeCategory, TaxRegimeType
+
+logger = logging.getLogger(__name__)
+
+ZERO = Decimal('0')
+_RUPEE = Decimal('1')
+_CESS_RATE = Decimal('0.04')
+
+# Statutory defaults used when the regime configuration has no limit for a section
+DEFAULT_LIMITS = {
+    'section_80c': Decimal('150000'),
+    'section_80d': Decimal('25000'),
+    'section_80ccd_1b': Decimal('50000'),
+}
+
+
+class TaxEvaluator:
+    """
+    In-memory tax evaluator compiled from a regime's rules.
+
+    Mirrors MultiYearTaxCalculator.calculate_tax step for step (including
+    its rounding) without building input/result objects, and memoizes
+    results because an optimization run evaluates the same income many times.
+    """
+
+    def __init__(self, regime, age_category: AgeCategory = AgeCategory.BELOW_60):
+        """
+        Args:
+            regime: Tax regime implementation (OldTaxRegime/NewTaxRegime)
+            age_category: Age category selecting the slab table
+        """
+        self.regime = regime
+        self.age_category = age_category
+
+        settings = regime.get_regime_settings()
+        self.standard_deduction = settings.standard_deduction
+        self.rebate_limit = settings.rebate_limit
+        self.rebate_max_amount = settings.rebate_max_amount
+        self.surcharge_threshold = settings.surcharge_threshold_1
+
+        # (width or None for the top slab, rate) with rates converted like calculate_slab_wise_tax
+        self._slabs = tuple(
+            (
+                slab.to_amount - slab.from_amount if slab.to_amount is not None else None,
+                Decimal(str(slab.rate_percent / 100))
+            )
+            for slab in regime.get_tax_slabs(age_category)
+        )
+        self._cache: Dict[Tuple[Decimal, Decimal], Decimal] = {}
+
+    def standard_deduction_for(self, gross_salary: Decimal) -> Decimal:
+        """Standard deduction as applied by the calculator"""
+        return min(gross_salary, self.standard_deduction)
+
+    def slab_tax(self, taxable_income: Decimal) -> Decimal:
+        """Slab-wise tax before rebate, rounded per slab"""
+        tax = ZERO
+        remaining = taxable_income
+
+        for width, rate in self._slabs:
+            if remaining <= 0:
+                break
+            in_slab = remaining if width is None else min(remaining, width)
+            tax += (in_slab * rate).quantize(_RUPEE, rounding=ROUND_HALF_UP)
+            remaining -= in_slab
+
+        return tax
+
+    def total_tax(self, total_income: Decimal, taxable_income: Decimal) -> Decimal:
+        """
+        Total tax liability including rebate, surcharge and cess.
+
+        Args:
+            total_income: Income before deductions (drives rebate and surcharge)
+            taxable_income: Income after deductions and exemptions
+        """
+        key = (total_income, taxable_income)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        tax = self.slab_tax(taxable_income)
+
+        if total_income <= self.rebate_limit:
+            tax = max(ZERO, tax - min(tax, self.rebate_max_amount))
+
+        if total_income > self.surcharge_threshold:
+            # Rare path: reuse the regime's surcharge with marginal relief verbatim
+            tax += self.regime.calculate_surcharge(tax, total_income)
+
+        tax += (tax * _CESS_RATE).quantize(_RUPEE)
+
+        self._cache[key] = tax
+        return tax
+
+
+@dataclass
+class TaxProfile:
+    """Income and current deductions of one employee (amounts per financial year)"""
+    gross_salary: Decimal
+    other_income: Decimal = ZERO
+    age_category: AgeCategory = AgeCategory.BELOW_60
+
+    # Deductions already claimed
+    section_80c: Decimal = ZERO
+    section_80d: Decimal = ZERO
+    section_80ccd_1b: Decimal = ZERO
+    section_80e: Decimal = ZERO
+    section_80g: Decimal = ZERO
+    other_deductions: Decimal = ZERO
+
+    # House rent allowance inputs
+    hra_received: Decimal = ZERO
+    basic_salary: Decimal = ZERO
+    rent_paid: Decimal = ZERO
+    is_metro: bool = False
+    other_exemptions: Decimal = ZERO
+
+    # Headroom for levers that have no statutory cap
+    max_education_loan_interest: Decimal = ZERO
+    max_donation: Decimal = ZERO
+    donation_deduction_rate: Decimal = Decimal('0.5')
+
+    @property
+    def total_income(self) -> Decimal:
+        return self.gross_salary + self.other_income
+
+
+@dataclass
+class FrontierPoint:
+    """One Pareto-optimal plan: no other plan saves more tax for less investment"""
+    regime: str
+    investment: Decimal
+    tax_liability: Decimal
+    tax_saved: Decimal
+    allocation: Dict[str, Decimal] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict:
+        return {
+            'regime': self.regime,
+            'investment': self.investment,
+            'tax_liability': self.tax_liability,
+            'tax_saved': self.tax_saved,
+            'allocation': dict(self.allocation),
+        }
+
+
+@dataclass
+class OptimizationResult:
+    """Frontiers for each regime and the combined best-of-both frontier"""
+    baseline_regime: str
+    baseline_tax: Decimal
+    frontiers: Dict[str, List[FrontierPoint]] = field(default_factory=dict)
+    combined: List[FrontierPoint] = field(default_factory=list)
+    evaluations: int = 0
+
+    def best_for_budget(self, budget: Decimal, regime: Optional[str] = None) -> Optional[FrontierPoint]:
+        """Largest saving achievable with at most `budget` invested"""
+        points = self.frontiers.get(regime, []) if regime else self.combined
+        affordable = [point for point in points if point.investment <= budget]
+        return affordable[-1] if affordable else None
+
+    def plan_for_target(self, target_savings: Decimal, regime: Optional[str] = None) -> Optional[FrontierPoint]:
+        """
+        Cheapest plan saving at least `target_savings`.
+
+        Falls back to the largest achievable saving when the target is out of reach.
+        """
+        points = self.frontiers.get(regime, []) if regime else self.combined
+        for point in points:
+            if point.tax_saved >= target_savings:
+                return point
+        return points[-1] if points else None
+
+
+# A partial plan: (investment, deduction, amounts per lever in lever order)
+_Plan = Tuple[Decimal, Decimal, Tuple[Decimal, ...]]
+
+
+class DeductionOptimizer:
+    """Enumerate and prune deduction combinations against exact tax evaluation"""
+
+    LEVERS = ('80C', '80D', '80CCD(1B)', '10(13A)', '80E', '80G')
+
+    def __init__(self, old_regime=None, new_regime=None, step: Decimal = Decimal('5000')):
+        """
+        Args:
+            old_regime: Old regime implementation (None to skip the regime)
+            new_regime: New regime implementation (None to skip the regime)
+            step: Investment grid in rupees; lever limits are always added as candidates
+        """
+        self.logger = logging.getLogger(__name__)
+        self.regimes = {name: regime for name, regime in (('old', old_regime), ('new', new_regime)) if regime}
+        self.step = Decimal(str(step))
+        self._evaluators: Dict[Tuple[str, AgeCategory], TaxEvaluator] = {}
+
+        if not self.regimes:
+            raise ValueError("DeductionOptimizer requires at least one tax regime")
+
+    @classmethod
+    def from_rule_provider(cls, assessment_year: str, rule_provider=None, **kwargs) -> 'DeductionOptimizer':
+        """Build an optimizer from the configured tax rules for an assessment year"""
+        if rule_provider is None:
+            from ..tax_calculators.rules.json_rule_provider import JsonTaxRuleProvider
+            rule_provider = JsonTaxRuleProvider()
+
+        regimes = {}
+        for regime_type in (TaxRegimeType.OLD, TaxRegimeType.NEW):
+            if rule_provider.is_regime_supported(assessment_year, regime_type):
+                regimes[f'{regime_type.value}_regime'] = rule_provider.get_tax_regime(assessment_year, regime_type)
+
+        return cls(**regimes, **kwargs)
+
+    def evaluator(self, regime: str, age_category: AgeCategory = AgeCategory.BELOW_60) -> TaxEvaluator:
+        """Compiled evaluator for a regime, shared across profiles"""
+        key = (regime, age_category)
+        if key not in self._evaluators:
+            self._evaluators[key] = TaxEvaluator(self.regimes[regime], age_category)
+        return self._evaluators[key]
+
+    def optimize(self, profile: TaxProfile, budget: Optional[Decimal] = None,
+                 baseline_regime: str = 'old') -> OptimizationResult:
+        """
+        Compute the investment vs tax-saved frontier for every regime.
+
+        Savings are measured against the profile's current tax in
+        `baseline_regime`, so switching regime shows up as a saving too.
+
+        Args:
+            profile: Employee income and current deductions
+            budget: Maximum additional investment to consider (None for no limit)
+            baseline_regime: Regime the employee is currently taxed under
+        """
+        if baseline_regime not in self.regimes:
+            baseline_regime = next(iter(self.regimes))
+
+        baseline_tax = self.current_tax(profile, baseline_regime)
+        result = OptimizationResult(baseline_regime=baseline_regime, baseline_tax=baseline_tax)
+
+        for regime in self.regimes:
+            points, evaluations = self._regime_frontier(profile, regime, baseline_tax, budget)
+            result.frontiers[regime] = points
+            result.evaluations += evaluations
+
+        result.combined = self._prune_savings(
+            sorted((point for points in result.frontiers.values() for point in points),
+                   key=lambda point: (point.investment, -point.tax_saved))
+        )
+        return result
+
+    def current_tax(self, profile: TaxProfile, regime: str) -> Decimal:
+        """Tax under a regime with only the deductions already claimed"""
+        evaluator = self.evaluator(regime, profile.age_category)
+        taxable = max(ZERO, self._income_after_claims(profile, regime))
+        return evaluator.total_tax(profile.total_income, taxable)
+
+    def exact_savings(self, profile: TaxProfile, regime: str, investments: Dict[str, Decimal]) -> Decimal:
+        """Exact tax saved by making the given additional investments under a regime"""
+        levers = self._build_levers(profile, regime)
+        extra = ZERO
+        for lever in levers:
+            amount = investments.get(lever.name)
+            if amount:
+                extra += lever.deduction_for(Decimal(str(amount)))
+
+        evaluator = self.evaluator(regime, profile.age_category)
+        income = self._income_after_claims(profile, regime)
+        before = evaluator.total_tax(profile.total_income, max(ZERO, income))
+        after = evaluator.total_tax(profile.total_income, max(ZERO, income - extra))
+        return before - after
+
+    def exact_deduction_savings(self, profile: TaxProfile, regime: str, deduction: Decimal) -> Decimal:
+        """Exact tax saved by an additional Chapter VI-A deduction outside the modelled levers"""
+        if regime != 'old':
+            return ZERO
+
+        evaluator = self.evaluator(regime, profile.age_category)
+        income = self._income_after_claims(profile, regime)
+        before = evaluator.total_tax(profile.total_income, max(ZERO, income))
+        after = evaluator.total_tax(profile.total_income, max(ZERO, income - Decimal(str(deduction))))
+        return before - after
+
+    def _regime_frontier(self, profile: TaxProfile, regime: str, baseline_tax: Decimal,
+                         budget: Optional[Decimal]) -> Tuple[List[FrontierPoint], int]:
+        """Pareto frontier of one regime and the number of tax evaluations used"""
+        levers = self._build_levers(profile, regime)
+        evaluator = self.evaluator(regime, profile.age_category)
+        income = self._income_after_claims(profile, regime)
+
+        plans: List[_Plan] = [(ZERO, ZERO, ())]
+        for lever in levers:
+            plans = self._merge(plans, lever.options(self.step), budget)
+
+        points = []
+        for investment, deduction, amounts in plans:
+            tax = evaluator.total_tax(profile.total_income, max(ZERO, income - deduction))
+            allocation = {lever.name: amount for lever, amount in zip(levers, amounts) if amount > 0}
+            points.append(FrontierPoint(regime, investment, tax, baseline_tax - tax, allocation))
+
+        return self._prune_savings(points), len(plans)
+
+    def _merge(self, plans: List[_Plan], options: List[Tuple[Decimal, Decimal]],
+               budget: Optional[Decimal]) -> List[_Plan]:
+        """Combine plans with one lever's options, keeping only non-dominated plans"""
+        merged = []
+        for investment, deduction, amounts in plans:
+            for cost, gain in options:
+                total = investment + cost
+                if budget is not None and total > budget:
+                    continue
+                merged.append((total, deduction + gain, amounts + (cost,)))
+
+        merged.sort(key=lambda plan: (plan[0], -plan[1]))
+
+        frontier = []
+        best_deduction = Decimal('-1')
+        for plan in merged:
+            if plan[1] > best_deduction:
+                frontier.append(plan)
+                best_deduction = plan[1]
+        return frontier
+
+    @staticmethod
+    def _prune_savings(points: List[FrontierPoint]) -> List[FrontierPoint]:
+        """Drop plans that cost more without saving more (e.g. once tax reaches zero)"""
+        frontier = []
+        best_saving = None
+        for point in points:
+            if best_saving is None or point.tax_saved > best_saving:
+                frontier.append(point)
+                best_saving = point.tax_saved
+        return frontier
+
+    def _income_after_claims(self, profile: TaxProfile, regime: str) -> Decimal:
+        """Income left after the deductions and exemptions already claimed (may be negative)"""
+        evaluator = self.evaluator(regime, profile.age_category)
+        deductions = evaluator.standard_deduction_for(profile.gross_salary)
+
+        if regime == 'old':
+            deductions += (
+                profile.section_80c + profile.section_80d + profile.section_80ccd_1b +
+                profile.section_80e + profile.section_80g + profile.other_deductions
+            )
+            deductions += self._hra_exemption(profile, regime, profile.rent_paid)
+            deductions += profile.other_exemptions
+
+        return profile.total_income - deductions
+
+    def _hra_exemption(self, profile: TaxProfile, regime: str, rent_paid: Decimal) -> Decimal:
+        """HRA exemption under the regime's rules (zero where HRA is not exempt)"""
+        calculate = getattr(self.regimes[regime], 'calculate_hra_exemption', None)
+        if calculate is None or profile.hra_received <= 0:
+            return ZERO
+        return calculate(profile.hra_received, profile.basic_salary, rent_paid, profile.is_metro)
+
+    def _build_levers(self, profile: TaxProfile, regime: str) -> List['_Lever']:
+        """Deduction levers available to the profile under a regime"""
+        regime_impl = self.regimes[regime]
+        allows_deduction = getattr(regime_impl, '_allows_deduction', lambda section: False)
+        levers = []
+
+        def limit(section: str) -> Decimal:
+            configured = getattr(regime_impl, 'deduction_limits', {}).get(section)
+            return configured if configured else DEFAULT_LIMITS[section]
+
+        for name, section, claimed in (
+            ('80C', 'section_80c', profile.section_80c),
+            ('80D', 'section_80d', profile.section_80d),
+            ('80CCD(1B)', 'section_80ccd_1b', profile.section_80ccd_1b),
+        ):
+            if allows_deduction(section):
+                headroom = max(ZERO, limit(section) - claimed)
+                levers.append(_Lever(name, headroom))
+
+        if profile.hra_received > 0 and getattr(regime_impl, '_allows_exemption', lambda name: False)('hra'):
+            current = self._hra_exemption(profile, regime, profile.rent_paid)
+            ceiling = min(profile.hra_received, profile.basic_salary * (Decimal('0.50') if profile.is_metro else Decimal('0.40')))
+            # Rent needed to reach the ceiling: ceiling + 10% of basic
+            max_rent = max(ZERO, ceiling + profile.basic_salary * Decimal('0.10') - profile.rent_paid)
+            levers.append(_Lever(
+                '10(13A)', max_rent,
+                deduction=lambda extra: self._hra_exemption(profile, regime, profile.rent_paid + extra) - current,
+                breakpoints=(max(ZERO, profile.basic_salary * Decimal('0.10') - profile.rent_paid),)
+            ))
+
+        if profile.max_education_loan_interest > 0 and allows_deduction('section_80e'):
+            levers.append(_Lever('80E', profile.max_education_loan_interest))
+
+        if profile.max_donation > 0 and allows_deduction('section_80g'):
+            # Qualifying amount is capped at 10% of adjusted gross total income; use the
+            # income left after every other lever is maxed so any plan stays within the cap
+            other_headroom = sum((lever.max_investment for lever in levers if lever.name != '10(13A)'), ZERO)
+            adjusted_gti = max(ZERO, self._income_after_claims(profile, regime) - other_headroom)
+            qualifying = max(ZERO, adjusted_gti * Decimal('0.10') - profile.section_80g / profile.donation_deduction_rate)
+            rate = profile.donation_deduction_rate
+            levers.append(_Lever(
+                '80G', min(profile.max_donation, qualifying),
+                deduction=lambda amount: (amount * rate).quantize(_RUPEE, rounding=ROUND_HALF_UP)
+            ))
+
+        return [lever for lever in levers if lever.max_investment > 0]
+
+
+class _Lever:
+    """Maps an additional investment in one section to an additional deduction"""
+
+    __slots__ = ('name', 'max_investment', '_deduction', 'breakpoints')
+
+    def __init__(self, name: str, max_investment: Decimal, deduction=None, breakpoints: Tuple[Decimal, ...] = ()):
+        self.name = name
+        self.max_investment = max_investment.quantize(_RUPEE, rounding=ROUND_HALF_UP)
+        self._deduction = deduction
+        self.breakpoints = breakpoints
+
+    def deduction_for(self, amount: Decimal) -> Decimal:
+        amount = min(amount, self.max_investment)
+        if self._deduction is None:
+            return amount
+        return self._deduction(amount)
+
+    def options(self, step: Decimal) -> List[Tuple[Decimal, Decimal]]:
+        """Candidate (investment, deduction) pairs on the step grid plus the lever's breakpoints"""
+        amounts = set()
+        amount = ZERO
+        while amount < self.max_investment:
+            amounts.add(amount)
+            amount += step
+        amounts.add(self.max_investment)
+        amounts.update(point.quantize(_RUPEE, rounding=ROUND_HALF_UP)
+                       for point in self.breakpoints if ZERO < point < self.max_investment)
+
+        options = []
+        best = Decimal('-1')
+        for amount in sorted(amounts):
+            deduction = self.deduction_for(amount)
+            if deduction > best:
+                options.append((amount, deduction))
+                best = deduction
+        return options
@@ -5,6 +5,7 @@ Analyzes current tax situation and provides actionable optimization suggestions
 based on available deduction sections and investment opportunities.
 """
 
+from dataclasses import replace
 from typing import Dict, List, Optional, Any
 from decimal import Decimal
 import logging
@@ -12,6 +13,7 @@ import logging
 from ..models.salary_breakdown_models import (
     TaxOptimizationAnalysis, TaxOptimizationSuggestion, OptimizationDifficulty
 )
+from .deduction_optimizer import DeductionOptimizer, OptimizationResult, TaxProfile
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +21,15 @@ logger = logging.getLogger(__name__)
 class TaxOptimizationEngine:
     """Engine for analyzing tax optimization opportunities"""
     
-    def __init__(self):
+    def __init__(self, deduction_optimizer: Optional[DeductionOptimizer] = None):
+        """
+        Args:
+            deduction_optimizer: Optimizer used for exact savings. If None, one is built
+                from the tax rules of the Form16's assessment year when available.
+        """
         self.logger = logging.getLogger(__name__)
+        self.deduction_optimizer = deduction_optimizer
+        self._optimizers_by_year: Dict[str, Optional[DeductionOptimizer]] = {}
         
         # Current limits for AY 2024-25
         self.deduction_limits = {
@@ -38,7 +47,7 @@ class TaxOptimizationEngine:
             '80GG': Decimal('60000'),    # Rent paid (when no HRA)
         }
         
-        # Tax rates for calculating savings (approximate for middle income)
+        # Approximate rates, only used when tax rules are unavailable for exact evaluation
         self.marginal_tax_rates = {
             'old_regime': Decimal('0.30'),  # 30% (including cess)
             'new_regime': Decimal('0.20')   # 20% (average for middle income)
@@ -79,13 +88,17 @@ class TaxOptimizationEngine:
             )
             
             # Generate suggestions
+            exact = self._prepare_exact_evaluation(form16_data, current_deductions, current_regime)
             suggestions = self._generate_optimization_suggestions(
-                current_deductions, current_regime, form16_data, target_savings
+                current_deductions, current_regime, form16_data, target_savings, exact
             )
             
             for suggestion in suggestions:
                 analysis.add_suggestion(suggestion)
             
+            if exact is not None:
+                analysis.savings_frontier = [point.to_dict() for point in exact[2].combined]
+            
             return analysis
             
         except Exception as e:
@@ -109,12 +122,19 @@ class TaxOptimizationEngine:
         current_deductions: Dict[str, Any], 
         regime: str,
         form16_data: Dict[str, Any],
-        target_savings: Optional[int]
+        target_savings: Optional[int],
+        exact: Optional[tuple] = None
     ) -> List[TaxOptimizationSuggestion]:
-        """Generate list of optimization suggestions"""
+        """
+        Generate list of optimization suggestions
+        
+        Args:
+            exact: (optimizer, profile, optimization) from _prepare_exact_evaluation,
+                or None to estimate savings with approximate marginal rates
+        """
         
         suggestions = []
-        marginal_rate = self.marginal_tax_rates.get(regime, Decimal('0.25'))
+        marginal_rate = self.marginal_tax_rates.get(f'{regime}_regime', Decimal('0.25'))
         
         # Section 80C suggestions
         suggestions.extend(self._suggest_80c_investments(current_deductions, marginal_rate))
@@ -141,15 +161,153 @@ class TaxOptimizationEngine:
             suggestions.extend(self._suggest_education_loan_optimization(form16_data, marginal_rate))
             suggestions.extend(self._suggest_senior_citizen_benefits(form16_data, marginal_rate))
         
+        # Replace rate-based estimates with exact savings when tax rules are available
+        if exact is not None:
+            optimizer, profile, _ = exact
+            suggestions = self._apply_exact_savings(suggestions, optimizer, profile, regime)
+        
         # Sort by potential savings (highest first)
         suggestions.sort(key=lambda x: x.potential_tax_savings, reverse=True)
         
         # If target savings specified, prioritize to meet target
         if target_savings:
-            suggestions = self._prioritize_for_target(suggestions, target_savings)
+            if exact is not None:
+                suggestions = self._plan_for_target(suggestions, target_savings, regime, *exact)
+            else:
+                suggestions = self._prioritize_for_target(suggestions, target_savings)
         
         return suggestions[:10]  # Return top 10 suggestions
     
+    def _prepare_exact_evaluation(
+        self, 
+        form16_data: Dict[str, Any], 
+        current_deductions: Dict[str, Any], 
+        regime: str
+    ) -> Optional[tuple]:
+        """Optimizer, tax profile and frontier for exact savings (None when unavailable)"""
+        optimizer = self._get_deduction_optimizer(form16_data)
+        if optimizer is None or regime not in optimizer.regimes:
+            return None
+        
+        try:
+            profile = self._build_tax_profile(form16_data, current_deductions)
+            return optimizer, profile, optimizer.optimize(profile, baseline_regime=regime)
+        except Exception as e:
+            self.logger.warning(f"Exact savings evaluation failed, using estimated rates: {e}")
+            return None
+    
+    def _get_deduction_optimizer(self, form16_data: Dict[str, Any]) -> Optional[DeductionOptimizer]:
+        """Optimizer for the Form16's assessment year (None when tax rules are unavailable)"""
+        if self.deduction_optimizer is not None:
+            return self.deduction_optimizer
+        
+        form16 = form16_data.get('form16', {})
+        assessment_year = (
+            form16.get('part_b', {}).get('assessment_year') or
+            form16.get('part_a', {}).get('assessment_year') or
+            '2024-25'
+        )
+        
+        if assessment_year not in self._optimizers_by_year:
+            try:
+                self._optimizers_by_year[assessment_year] = DeductionOptimizer.from_rule_provider(assessment_year)
+            except Exception as e:
+                self.logger.debug(f"Tax rules unavailable for {assessment_year}, using estimated rates: {e}")
+                self._optimizers_by_year[assessment_year] = None
+        
+        return self._optimizers_by_year[assessment_year]
+    
+    def _build_tax_profile(self, form16_data: Dict[str, Any], current_deductions: Dict[str, Any]) -> TaxProfile:
+        """Build the optimizer's tax profile from Form16 data and current deductions"""
+        salary_data = form16_data.get('form16', {}).get('part_b', {})
+        gross = Decimal(str(salary_data.get('gross_salary', {}).get('total') or 2500000))  # Demo default
+        
+        allowances_exempt = salary_data.get('allowances_exempt_under_section_10', {}) or {}
+        rent_paid = (salary_data.get('landlord_details', {}) or {}).get('rent_paid')
+        
+        def claimed(key: str) -> Decimal:
+            return Decimal(str(current_deductions.get(key) or 0))
+        
+        profile = TaxProfile(
+            gross_salary=gross,
+            section_80c=claimed('80C'),
+            section_80d=claimed('80D'),
+            section_80ccd_1b=claimed('80CCD(1B)'),
+            max_donation=gross * Decimal('0.10')
+        )
+        
+        # Rent is only modelled when the Form16 actually reports it
+        if rent_paid:
+            profile.hra_received = Decimal(str(allowances_exempt.get('house_rent_allowance') or 0))
+            profile.basic_salary = gross * Decimal('0.5')  # Assume 50% basic
+            profile.rent_paid = Decimal(str(rent_paid))
+        
+        return profile
+    
+    def _apply_exact_savings(
+        self,
+        suggestions: List[TaxOptimizationSuggestion],
+        optimizer: DeductionOptimizer,
+        profile: TaxProfile,
+        regime: str
+    ) -> List[TaxOptimizationSuggestion]:
+        """Re-evaluate each suggestion's savings through the tax rules, dropping those that save nothing"""
+        evaluated = []
+        
+        for suggestion in suggestions:
+            # Investments in capped sections go through the optimizer's levers;
+            # other suggested amounts are deductions or exemptions in their own right
+            if suggestion.section in ('80C', '80D', '80CCD(1B)', '80G'):
+                savings = optimizer.exact_savings(profile, regime, {suggestion.section: suggestion.suggested_amount})
+            else:
+                savings = optimizer.exact_deduction_savings(profile, regime, suggestion.suggested_amount)
+            
+            if savings > 0:
+                evaluated.append(replace(suggestion, potential_tax_savings=savings))
+        
+        return evaluated
+    
+    def _plan_for_target(
+        self,
+        suggestions: List[TaxOptimizationSuggestion],
+        target_savings: int,
+        regime: str,
+        optimizer: DeductionOptimizer,
+        profile: TaxProfile,
+        optimization: OptimizationResult
+    ) -> List[TaxOptimizationSuggestion]:
+        """
+        Pick the cheapest frontier plan meeting the target and size suggestions to it.
+        
+        Each section's saving is its exact marginal contribution, so the savings
+        add up to the plan's total exactly.
+        """
+        plan = optimization.plan_for_target(Decimal(str(target_savings)), regime=regime)
+        if plan is None or not plan.allocation:
+            return self._prioritize_for_target(suggestions, target_savings)
+        
+        # Easiest, highest-ROI suggestion represents each section
+        suggestions.sort(key=lambda x: (x.difficulty.value, -x.roi_percentage))
+        by_section = {}
+        for suggestion in suggestions:
+            by_section.setdefault(suggestion.section, suggestion)
+        
+        planned = []
+        invested: Dict[str, Decimal] = {}
+        previous_savings = Decimal('0')
+        for section, amount in plan.allocation.items():
+            suggestion = by_section.get(section)
+            if suggestion is None:
+                continue
+            invested[section] = amount
+            savings = optimizer.exact_savings(profile, regime, invested)
+            planned.append(replace(
+                suggestion, suggested_amount=amount, potential_tax_savings=savings - previous_savings
+            ))
+            previous_savings = savings
+        
+        return planned or self._prioritize_for_target(suggestions, target_savings)
+    
     def _suggest_80c_investments(self, current_deductions: Dict, marginal_rate: Decimal) -> List[TaxOptimizationSuggestion]:
         """Suggest Section 80C investment opportunities"""
         suggestions = []
@@ -28,6 +28,9 @@ Example usage:
         section_80c=Decimal("150000"),
         # ... other parameters
     )
+    
+    # Calculate tax for a table of employees
+    results = api.calculate_tax_bulk(records_df, assessment_year="2024-25")
     ```
 """
 
@@ -37,7 +40,9 @@ from decimal import Decimal
 from enum import Enum
 
 from ..extractors.enhanced_form16_extractor import EnhancedForm16Extractor, ProcessingLevel
+from ..extractors.orchestration.traces_part_a import TracesPartAExtractor
 from ..pdf.reader import RobustPDFProcessor
+from ..services.extraction_service import extract_document
 from ..integrators.data_mapper import Form16ToTaxMapper
 from ..tax_calculators.comprehensive_calculator import (
     ComprehensiveTaxCalculator, ComprehensiveTaxCalculationInput
@@ -75,8 +80,10 @@ class TaxCalculationAPI:
         """Initialize the Tax Calculation API with required components."""
         self.extractor = EnhancedForm16Extractor(ProcessingLevel.ENHANCED)
         self.pdf_processor = RobustPDFProcessor()
+        self.part_a_extractor = TracesPartAExtractor()
         self.data_mapper = Form16ToTaxMapper()
         self.calculator = ComprehensiveTaxCalculator(YearSpecificTaxRuleProvider())
+        self._bulk_calculator = None
 
     def calculate_tax_from_form16(
         self,
@@ -86,7 +93,8 @@ class TaxCalculationAPI:
         age_category: AgeCategoryEnum = AgeCategoryEnum.BELOW_60,
         bank_interest: Optional[Decimal] = None,
         other_income: Optional[Decimal] = None,
-        verbose: bool = False
+        verbose: bool = False,
+        part_a_fast_path: bool = True
     ) -> Dict[str, Any]:
         """
         Calculate tax from Form16 PDF document.
@@ -99,6 +107,7 @@ class TaxCalculationAPI:
             bank_interest: Bank interest income (overrides Form16 data if provided)
             other_income: Other income (overrides Form16 data if provided)
             verbose: Whether to enable verbose logging
+            part_a_fast_path: Read TRACES Part A from word positions, as extract does
             
         Returns:
             Dictionary containing tax calculation results:
@@ -132,8 +141,10 @@ class TaxCalculationAPI:
                 print(f"Extracting data from Form16: {form16_path.name}")
             
             # First extract tables from PDF, then extract Form16 data from tables
-            extraction_result = self.pdf_processor.extract_tables(form16_path)
-            form16_result = self.extractor.extract_all(extraction_result.tables)
+            _, form16_result = extract_document(
+                form16_path, self.pdf_processor, self.extractor,
+                self.part_a_extractor if part_a_fast_path else None
+            )
             
             if not form16_result:
                 return {
@@ -390,6 +401,43 @@ class TaxCalculationAPI:
                 'assessment_year': assessment_year
             }
 
+    def calculate_tax_bulk(
+        self,
+        records,
+        assessment_year: Optional[str] = None,
+        regime: TaxRegime = TaxRegime.BOTH,
+        age_category: AgeCategoryEnum = AgeCategoryEnum.BELOW_60
+    ):
+        """
+        Calculate tax for a table of employee records in one vectorized pass.
+        
+        Args:
+            records: pandas DataFrame (or list of dicts) with one row per employee;
+                see BulkTaxCalculator for the recognised columns
+            assessment_year: Default for rows without an assessment_year column
+            regime: Default for rows without a regime column
+            age_category: Default for rows without an age_category or age column
+            
+        Returns:
+            DataFrame of the input columns plus per-regime tax, rebate, surcharge
+            and cess, the recommended regime, savings and an error column
+        """
+        import pandas as pd
+        from ..tax_calculators.bulk_calculator import BulkTaxCalculator
+        
+        if self._bulk_calculator is None:
+            self._bulk_calculator = BulkTaxCalculator(self.calculator.rule_provider)
+        
+        if not isinstance(records, pd.DataFrame):
+            records = pd.DataFrame(records)
+        
+        return self._bulk_calculator.calculate(
+            records,
+            assessment_year=assessment_year,
+            regime=TaxRegime(regime).value,
+            age_category=AgeCategoryEnum(age_category).value
+        )
+
     def get_supported_assessment_years(self) -> List[str]:
         """
         Get list of supported assessment years.
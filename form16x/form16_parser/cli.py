@@ -16,6 +16,11 @@ from .commands.optimize_command import OptimizeCommand
 from .commands.extract_command import ExtractCommand
 from .commands.consolidate_command import ConsolidateCommand
 from .commands.batch_command import BatchCommand
+from .commands.reprocess_command import ReprocessCommand
+from .commands.split_command import SplitCommand
+from .commands.queue_command import QueueCommand
+from .commands.query_command import QueryCommand
+from .commands.tax_bulk_command import TaxBulkCommand
 from .display.rich_ui_components import RichUIComponents
 from .display.cli_ascii_art import CLIAsciiArt
 
@@ -32,6 +37,11 @@ class CLIRouter:
             'extract': ExtractCommand,
             'consolidate': ConsolidateCommand,
             'batch': BatchCommand,
+            'reprocess': ReprocessCommand,
+            'split': SplitCommand,
+            'queue': QueueCommand,
+            'query': QueryCommand,
+            'tax-bulk': TaxBulkCommand,
             # Add other commands as they are refactored
         }
     
@@ -67,6 +77,21 @@ class CLIRouter:
         # Add batch command (new modular architecture)
         self._add_batch_parser(subparsers)
         
+        # Add reprocess command (incremental re-extraction)
+        self._add_reprocess_parser(subparsers)
+        
+        # Add split command (bulk PDFs of concatenated Form16s)
+        self._add_split_parser(subparsers)
+        
+        # Add queue command (progress of distributed batch runs)
+        self._add_queue_parser(subparsers)
+        
+        # Add query command (lookups in the result store)
+        self._add_query_parser(subparsers)
+        
+        # Add tax-bulk command (vectorized tax for employee tables)
+        self._add_tax_bulk_parser(subparsers)
+        
         # Legacy commands removed - all core functionality now uses modular architecture
         
         return parser
@@ -147,6 +172,41 @@ class CLIRouter:
             action="store_true",
             help="Pretty-print JSON output"
         )
+        extract_parser.add_argument(
+            "--compress",
+            choices=["gzip", "zstd"],
+            help="Compress JSON output (zstd requires the zstandard package)"
+        )
+        extract_parser.add_argument(
+            "--save-artifacts",
+            type=Path,
+            metavar="DIR",
+            help="Save intermediate extraction artifacts for the reprocess command"
+        )
+        extract_parser.add_argument(
+            "--templates",
+            type=Path,
+            metavar="DIR",
+            help="Read repeat employer layouts from learned templates in DIR (learned automatically)"
+        )
+        extract_parser.add_argument(
+            "--no-part-a-fast-path",
+            action="store_false",
+            dest="part_a_fast_path",
+            help="Detect tables on every page instead of reading TRACES Part A from word positions"
+        )
+        extract_parser.add_argument(
+            "--strategy-stats",
+            type=Path,
+            metavar="FILE",
+            help="Try the table extraction strategy that historically won for similar PDFs first (learned in FILE)"
+        )
+        extract_parser.add_argument(
+            "--result-store",
+            type=Path,
+            metavar="FILE",
+            help="Also store the result in an indexed result store for the query command"
+        )
         
         # Tax calculation options
         extract_parser.add_argument(
@@ -204,14 +264,28 @@ class CLIRouter:
             help="Consolidate multiple Form16s from different employers"
         )
         
-        # Files argument (required)
+        # Files argument (or --pan with --result-store)
         consolidate_parser.add_argument(
             "--files", "-f",
             dest="files",
             nargs="+",
-            required=True,
             help="List of Form 16 PDF files to consolidate"
         )
+        consolidate_parser.add_argument(
+            "--pan",
+            help="Consolidate this employee's Form16s from --result-store instead of PDF files"
+        )
+        consolidate_parser.add_argument(
+            "--assessment-year",
+            metavar="AY",
+            help="With --pan, only consolidate Form16s for this assessment year (e.g. 2024-25)"
+        )
+        consolidate_parser.add_argument(
+            "--result-store",
+            type=Path,
+            metavar="FILE",
+            help="Indexed result store; stored PDFs are not re-extracted and new ones are added"
+        )
         
         # Output options
         consolidate_parser.add_argument(
@@ -219,8 +293,20 @@ class CLIRouter:
             type=Path,
             help="Output JSON file path (default: consolidated_form16.json)"
         )
+        consolidate_parser.add_argument(
+            "--parquet-dir",
+            type=Path,
+            metavar="DIR",
+            help="Also export each Form16 to a partitioned Parquet dataset (requires pyarrow)"
+        )
         
         # Tax calculation options
+        consolidate_parser.add_argument(
+            "--no-part-a-fast-path",
+            action="store_false",
+            dest="part_a_fast_path",
+            help="Detect tables on every page instead of reading TRACES Part A from word positions"
+        )
         consolidate_parser.add_argument(
             "--calculate-tax",
             action="store_true",
@@ -274,10 +360,328 @@ class CLIRouter:
             action="store_true",
             help="Continue processing even if some files fail"
         )
+        batch_parser.add_argument(
+            "--schedule",
+            choices=["balanced", "longest", "shortest", "name"],
+            default="balanced",
+            help="File order by estimated cost: longest first (shortest total time), shortest first "
+                 "(earliest results), balanced or name (default: balanced)"
+        )
+        batch_parser.add_argument(
+            "--dedupe",
+            choices=["near", "exact", "off"],
+            default="exact",
+            help="Extract duplicate uploads once: identical bytes (exact), also identical text layer (near, "
+                 "reads the text of files with equal page counts), or off (default: exact)"
+        )
+        batch_parser.add_argument(
+            "--max-in-flight",
+            type=int,
+            metavar="N",
+            help="Most documents submitted at once (default: 2 per worker)"
+        )
+        batch_parser.add_argument(
+            "--rss-watermark",
+            type=int,
+            metavar="MB",
+            help="Pause submitting documents while process memory (RSS) is above MB"
+        )
+        batch_parser.add_argument(
+            "--timeout",
+            type=float,
+            metavar="SECONDS",
+            help="Fail documents taking longer than SECONDS (runs each document in a worker process)"
+        )
+        batch_parser.add_argument(
+            "--memory-limit",
+            type=int,
+            metavar="MB",
+            help="Fail documents whose worker process needs more than MB of memory (Unix only)"
+        )
+        batch_parser.add_argument(
+            "--retry-cheap",
+            action="store_true",
+            help="Retry documents that hit --timeout or --memory-limit with text and pdfplumber extraction only"
+        )
+        batch_parser.add_argument(
+            "--pretty",
+            action="store_true",
+            help="Pretty-print JSON output (compact by default)"
+        )
+        batch_parser.add_argument(
+            "--compress",
+            choices=["gzip", "zstd"],
+            help="Compress JSON output (zstd requires the zstandard package)"
+        )
+        batch_parser.add_argument(
+            "--save-artifacts",
+            type=Path,
+            metavar="DIR",
+            help="Save intermediate extraction artifacts for the reprocess command"
+        )
+        batch_parser.add_argument(
+            "--templates",
+            type=Path,
+            metavar="DIR",
+            help="Read repeat employer layouts from learned templates in DIR (learned automatically)"
+        )
+        batch_parser.add_argument(
+            "--no-part-a-fast-path",
+            action="store_false",
+            dest="part_a_fast_path",
+            help="Detect tables on every page instead of reading TRACES Part A from word positions"
+        )
+        batch_parser.add_argument(
+            "--strategy-stats",
+            type=Path,
+            metavar="FILE",
+            help="Try the table extraction strategy that historically won for similar PDFs first (learned in FILE)"
+        )
+        batch_parser.add_argument(
+            "--queue",
+            type=Path,
+            metavar="FILE",
+            help="Enqueue the input directory in a shared work queue (SQLite FILE on a volume all nodes mount)"
+        )
+        batch_parser.add_argument(
+            "--worker",
+            action="store_true",
+            help="With --queue, claim and process queued documents until the queue is drained "
+                 "(--parallel sets the workers in this process)"
+        )
+        batch_parser.add_argument(
+            "--lease",
+            type=float,
+            default=300.0,
+            metavar="SECONDS",
+            help="With --queue, seconds without a heartbeat before a document is reclaimed (default: 300)"
+        )
+        batch_parser.add_argument(
+            "--parquet-dir",
+            type=Path,
+            metavar="DIR",
+            help="Also export results to a partitioned Parquet dataset (requires pyarrow)"
+        )
+        batch_parser.add_argument(
+            "--result-store",
+            type=Path,
+            metavar="FILE",
+            help="Also store results in an indexed result store for the query command"
+        )
         
         # Common arguments
         self._add_common_arguments(batch_parser)
     
+    def _add_reprocess_parser(self, subparsers) -> None:
+        """Add the reprocess command parser."""
+        reprocess_parser = subparsers.add_parser(
+            "reprocess", 
+            help="Re-run only changed extractors using saved extraction artifacts"
+        )
+        
+        reprocess_parser.add_argument(
+            "--artifacts-dir", "-a",
+            type=Path,
+            required=True,
+            help="Directory of artifacts saved with --save-artifacts"
+        )
+        reprocess_parser.add_argument(
+            "--output-dir", "-o",
+            type=Path,
+            required=True,
+            help="Directory to save refreshed extraction results"
+        )
+        reprocess_parser.add_argument(
+            "--force",
+            nargs="+",
+            choices=["employee", "employer", "salary", "deductions", "tax", "metadata", "tds"],
+            help="Re-run these extractors even if unchanged"
+        )
+        reprocess_parser.add_argument(
+            "--documents",
+            nargs="+",
+            help="Only reprocess these document ids (PDF file stems)"
+        )
+        
+        # Common arguments
+        self._add_common_arguments(reprocess_parser)
+    
+    def _add_split_parser(self, subparsers) -> None:
+        """Add the split command parser."""
+        split_parser = subparsers.add_parser(
+            "split",
+            help="Split a PDF of concatenated Form16s and extract each employee"
+        )
+        
+        split_parser.add_argument(
+            "--input-file", "-i",
+            type=Path,
+            required=True,
+            help="PDF containing many employees' Form16s"
+        )
+        split_parser.add_argument(
+            "--output-dir", "-o",
+            type=Path,
+            required=True,
+            help="Directory to save one extraction result per employee"
+        )
+        split_parser.add_argument(
+            "--parallel",
+            type=int,
+            default=4,
+            help="Number of parallel extraction workers (default: 4)"
+        )
+        split_parser.add_argument(
+            "--stop-on-error",
+            action="store_true",
+            help="Stop when a certificate fails to extract"
+        )
+        split_parser.add_argument(
+            "--pretty",
+            action="store_true",
+            help="Pretty-print JSON output (compact by default)"
+        )
+        split_parser.add_argument(
+            "--compress",
+            choices=["gzip", "zstd"],
+            help="Compress JSON output (zstd requires the zstandard package)"
+        )
+        split_parser.add_argument(
+            "--strategy-stats",
+            type=Path,
+            metavar="FILE",
+            help="Try the table extraction strategy that historically won for similar PDFs first (learned in FILE)"
+        )
+        
+        # Common arguments
+        self._add_common_arguments(split_parser)
+    
+    def _add_queue_parser(self, subparsers) -> None:
+        """Add the queue command parser."""
+        queue_parser = subparsers.add_parser(
+            "queue",
+            help="Show progress of a distributed batch work queue"
+        )
+        
+        queue_parser.add_argument(
+            "queue_file",
+            type=Path,
+            help="Work queue created with batch --queue"
+        )
+        queue_parser.add_argument(
+            "--watch",
+            type=float,
+            metavar="SECONDS",
+            help="Refresh every SECONDS until the queue is drained"
+        )
+        queue_parser.add_argument(
+            "--requeue-failed",
+            action="store_true",
+            help="Put failed documents back in the queue"
+        )
+        queue_parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Print progress as JSON"
+        )
+        
+        # Common arguments
+        self._add_common_arguments(queue_parser)
+    
+    def _add_query_parser(self, subparsers) -> None:
+        """Add the query command parser."""
+        query_parser = subparsers.add_parser(
+            "query",
+            help="Look up stored Form16s by PAN, TAN, assessment year or certificate"
+        )
+        
+        query_parser.add_argument(
+            "result_store",
+            type=Path,
+            help="Result store written with --result-store"
+        )
+        query_parser.add_argument(
+            "--pan",
+            help="Employee PAN"
+        )
+        query_parser.add_argument(
+            "--tan",
+            help="Employer TAN"
+        )
+        query_parser.add_argument(
+            "--assessment-year", "--ay",
+            dest="assessment_year",
+            metavar="AY",
+            help="Assessment year (e.g. 2024-25)"
+        )
+        query_parser.add_argument(
+            "--certificate",
+            help="Certificate number"
+        )
+        query_parser.add_argument(
+            "--limit",
+            type=int,
+            help="Show at most this many documents"
+        )
+        query_parser.add_argument(
+            "--stats",
+            action="store_true",
+            help="Show document, employee and employer counts instead of documents"
+        )
+        query_parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Print results as JSON"
+        )
+        
+        # Common arguments
+        self._add_common_arguments(query_parser)
+    
+    def _add_tax_bulk_parser(self, subparsers) -> None:
+        """Add the tax-bulk command parser."""
+        tax_bulk_parser = subparsers.add_parser(
+            "tax-bulk",
+            help="Calculate tax for a CSV of employee records"
+        )
+        
+        tax_bulk_parser.add_argument(
+            "input",
+            type=Path,
+            help="CSV with one row per employee (gross_salary, assessment_year, regime, age_category, ...)"
+        )
+        tax_bulk_parser.add_argument(
+            "--output", "-o",
+            type=Path,
+            help="Result CSV (default: <input>_tax.csv)"
+        )
+        tax_bulk_parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=50000,
+            help="Rows calculated per chunk (default: 50000)"
+        )
+        tax_bulk_parser.add_argument(
+            "--assessment-year", "--ay",
+            dest="assessment_year",
+            metavar="AY",
+            help="Assessment year for rows without one (e.g. 2024-25)"
+        )
+        tax_bulk_parser.add_argument(
+            "--regime",
+            choices=["old", "new", "both"],
+            default="both",
+            help="Regime for rows without one (default: both)"
+        )
+        tax_bulk_parser.add_argument(
+            "--age-category",
+            choices=["below_60", "senior_60_to_80", "super_senior_above_80"],
+            default="below_60",
+            help="Age category for rows without age_category or age (default: below_60)"
+        )
+        
+        # Common arguments
+        self._add_common_arguments(tax_bulk_parser)
+    
     def _add_common_arguments(self, parser) -> None:
         """Add common arguments to a parser."""
         parser.add_argument(
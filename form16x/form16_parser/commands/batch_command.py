@@ -43,6 +43,12 @@ class BatchCommand(BaseCommand):
             if self._should_use_demo_mode(args, input_dir):
                 return self._handle_demo_mode(args, input_dir, output_dir)
             
+            if getattr(args, 'strategy_stats', None):
+                self.batch_service.extraction_service.use_strategy_stats(args.strategy_stats)
+            
+            if getattr(args, 'queue', None):
+                return self._run_queue(args, input_dir, output_dir)
+            
             # Process batch
             batch_result = self.batch_service.process_batch(
                 input_dir=input_dir,
@@ -50,7 +56,21 @@ class BatchCommand(BaseCommand):
                 pattern=getattr(args, 'pattern', '*.pdf'),
                 parallel_workers=getattr(args, 'parallel', 4),
                 continue_on_error=getattr(args, 'continue_on_error', False),
-                verbose=getattr(args, 'verbose', False)
+                verbose=getattr(args, 'verbose', False),
+                artifacts_dir=getattr(args, 'save_artifacts', None),
+                parquet_dir=getattr(args, 'parquet_dir', None),
+                pretty_json=getattr(args, 'pretty', False),
+                compression=getattr(args, 'compress', None),
+                template_dir=getattr(args, 'templates', None),
+                max_in_flight=getattr(args, 'max_in_flight', None),
+                rss_watermark_mb=getattr(args, 'rss_watermark', None),
+                timeout_seconds=getattr(args, 'timeout', None),
+                memory_limit_mb=getattr(args, 'memory_limit', None),
+                cheap_retry=getattr(args, 'retry_cheap', False),
+                schedule=getattr(args, 'schedule', 'balanced'),
+                dedupe=getattr(args, 'dedupe', 'exact'),
+                result_store=getattr(args, 'result_store', None),
+                part_a_fast_path=getattr(args, 'part_a_fast_path', True)
             )
             
             if not batch_result['success']:
@@ -69,6 +89,38 @@ class BatchCommand(BaseCommand):
             print(f"Unexpected error: {str(e)}")
             return 1
     
+    def _run_queue(self, args, input_dir: Path, output_dir: Path) -> int:
+        """Enqueue the input directory and, with --worker, work the shared queue."""
+        worker = getattr(args, 'worker', False)
+        result = self.batch_service.process_queue(
+            queue_file=Path(args.queue),
+            input_dir=input_dir,
+            output_dir=output_dir,
+            pattern=getattr(args, 'pattern', '*.pdf'),
+            parallel_workers=getattr(args, 'parallel', 4),
+            verbose=getattr(args, 'verbose', False),
+            pretty_json=getattr(args, 'pretty', False),
+            compression=getattr(args, 'compress', None),
+            template_dir=getattr(args, 'templates', None),
+            lease_seconds=getattr(args, 'lease', 300.0),
+            work=worker,
+            result_store=getattr(args, 'result_store', None),
+            part_a_fast_path=getattr(args, 'part_a_fast_path', True)
+        )
+        
+        if not result['success']:
+            print(f"Error: {result['error']}")
+            return 1
+        
+        if worker:
+            self._display_batch_results(result)
+        
+        queue = result['queue']
+        print(f"Queue {args.queue}: {result['enqueued']} newly enqueued, "
+              f"{queue['done']}/{queue['total']} done, {queue['failed']} failed, "
+              f"{queue['pending'] + queue['running']} remaining")
+        return 0
+    
     def _display_command_header(self) -> None:
         """Display the command header."""
         self.ui.show_animated_header("BATCH", "Process multiple Form16 files in parallel")
@@ -107,4 +159,22 @@ class BatchCommand(BaseCommand):
         self.batch_formatter.display_file_processing_progress(results, demo_mode)
         
         # Display summary
-        self.batch_formatter.display_batch_summary(statistics, demo_mode)
\ No newline at end of file
+        self.batch_formatter.display_batch_summary(statistics, demo_mode)
+        
+        columnar_export = batch_result.get('columnar_export')
+        if columnar_export:
+            print(f"Parquet export: {columnar_export['documents_written']} documents "
+                  f"written to {columnar_export['output_directory']}")
+            if columnar_export.get('error'):
+                print(f"Parquet export failed: {columnar_export['error']}")
+        
+        result_store = batch_result.get('result_store')
+        if result_store:
+            print(f"Result store: {result_store['documents']} documents for {result_store['employees']} "
+                  f"employees in {result_store['store']}")
+        
+        layout_templates = batch_result.get('layout_templates')
+        if layout_templates:
+            print(f"Layout templates: {layout_templates['hit']}/{layout_templates['lookups']} documents "
+                  f"read from templates ({layout_templates['hit_rate']:.0%} hit rate, "
+                  f"{layout_templates['templates']} templates)")
\ No newline at end of file
@@ -40,11 +40,20 @@ class ConsolidateCommand(BaseCommand):
             self._display_command_header()
             
             # Get file list and output path
-            form16_files = [Path(f) for f in args.files]
+            form16_files = [Path(f) for f in getattr(args, 'files', None) or []]
             output_file = Path(args.output) if args.output else Path("consolidated_form16.json")
+            pan = getattr(args, 'pan', None)
+            result_store = getattr(args, 'result_store', None)
+            
+            if not form16_files and not pan:
+                print("Error: Give Form16 files with --files, or --pan with --result-store")
+                return 1
+            if pan and not result_store:
+                print("Error: --pan consolidates stored Form16s and needs --result-store")
+                return 1
             
             # Check for demo mode
-            if self._should_use_demo_mode(args, form16_files):
+            if form16_files and self._should_use_demo_mode(args, form16_files):
                 return self._handle_demo_mode(args, form16_files, output_file)
             
             # Prepare tax arguments if requested
@@ -52,14 +61,29 @@ class ConsolidateCommand(BaseCommand):
             if getattr(args, 'calculate_tax', False):
                 tax_args = self._build_tax_args(args)
             
-            # Consolidate Form16 files
-            consolidation_result = self.consolidation_service.consolidate_form16_files(
-                form16_files=form16_files,
-                output_file=output_file,
-                verbose=getattr(args, 'verbose', False),
-                calculate_tax=getattr(args, 'calculate_tax', False),
-                tax_args=tax_args
-            )
+            if pan and not form16_files:
+                # Consolidate stored Form16s without re-extracting
+                consolidation_result = self.consolidation_service.consolidate_from_store(
+                    result_store=Path(result_store),
+                    pan=pan,
+                    assessment_year=getattr(args, 'assessment_year', None),
+                    output_file=output_file,
+                    calculate_tax=getattr(args, 'calculate_tax', False),
+                    tax_args=tax_args,
+                    parquet_dir=getattr(args, 'parquet_dir', None)
+                )
+            else:
+                # Consolidate Form16 files
+                consolidation_result = self.consolidation_service.consolidate_form16_files(
+                    form16_files=form16_files,
+                    output_file=output_file,
+                    verbose=getattr(args, 'verbose', False),
+                    calculate_tax=getattr(args, 'calculate_tax', False),
+                    tax_args=tax_args,
+                    parquet_dir=getattr(args, 'parquet_dir', None),
+                    result_store=result_store,
+                    part_a_fast_path=getattr(args, 'part_a_fast_path', True)
+                )
             
             if not consolidation_result['success']:
                 print(f"Error: {consolidation_result['error']}")
@@ -150,4 +174,7 @@ class ConsolidateCommand(BaseCommand):
         print(f"\nConsolidation completed successfully!")
         print(f"Employers processed: {employers_count}")
         print(f"Output file: {output_file}")
+        columnar_export = consolidation_result.get('columnar_export')
+        if columnar_export:
+            print(f"Parquet export: {columnar_export['output_directory']}")
         print(f"Processing time: {processing_time:.2f} seconds")
\ No newline at end of file
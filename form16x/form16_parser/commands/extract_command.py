@@ -14,6 +14,7 @@ from ..services.extraction_service import ExtractionService
 from ..services.tax_calculation_service import TaxCalculationService
 from ..presentation.formatters.tax_display_formatter import TaxDisplayFormatter
 from ..display.rich_ui_components import RichUIComponents
+from ..utils.serialization import get_serializer
 
 
 class ExtractCommand(BaseCommand):
@@ -66,7 +67,11 @@ class ExtractCommand(BaseCommand):
                 return 1
             
             # Save results to file
-            self._save_extraction_results(extraction_result, output_file, args)
+            output_file = self._save_extraction_results(extraction_result, output_file, args)
+            
+            if getattr(args, 'result_store', None):
+                from ..services.result_store import ResultStore
+                ResultStore(args.result_store).add_document(extraction_result['form16_result'], input_file)
             
             # Display tax results if calculated
             form16_data = extraction_result.get('form16_data', {})
@@ -281,12 +286,18 @@ class ExtractCommand(BaseCommand):
         # Check if we're in batch mode to skip UI delays
         batch_mode = hasattr(args, '_batch_mode') and args._batch_mode
         
+        if getattr(args, 'strategy_stats', None):
+            self.extraction_service.use_strategy_stats(args.strategy_stats)
+        
         return self.extraction_service.extract_form16_data(
             input_file=input_file,
             verbose=getattr(args, 'verbose', False),
             batch_mode=batch_mode,
             calculate_tax=getattr(args, 'calculate_tax', False),
-            tax_args=tax_args
+            tax_args=tax_args,
+            artifacts_dir=getattr(args, 'save_artifacts', None),
+            template_dir=getattr(args, 'templates', None),
+            part_a_fast_path=getattr(args, 'part_a_fast_path', True)
         )
     
     def _build_tax_args(self, args) -> Dict[str, Any]:
@@ -307,19 +318,16 @@ class ExtractCommand(BaseCommand):
         extraction_result: Dict[str, Any], 
         output_file: Path,
         args
-    ) -> None:
-        """Save extraction results to file."""
+    ) -> Path:
+        """Save extraction results to file and return the path written."""
         output_format = getattr(args, 'format', 'json')
         
         if output_format == 'json':
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(
-                    extraction_result['form16_data'], 
-                    f, 
-                    indent=2 if getattr(args, 'pretty', False) else None,
-                    ensure_ascii=False,
-                    default=str  # Convert Decimal objects to string
-                )
+            serializer = get_serializer(
+                pretty=getattr(args, 'pretty', False),
+                compression=getattr(args, 'compress', None)
+            )
+            return serializer.dump(extraction_result['form16_data'], output_file)
         elif output_format == 'csv':
             # For now, just save as JSON - CSV conversion can be added later
             with open(output_file, 'w', encoding='utf-8') as f:
@@ -328,6 +336,7 @@ class ExtractCommand(BaseCommand):
             # For now, just save as JSON - XLSX conversion can be added later
             with open(output_file, 'w', encoding='utf-8') as f:
                 json.dump(extraction_result['form16_data'], f, indent=2, ensure_ascii=False)
+        return output_file
     
     
     def _display_completion_message(
@@ -0,0 +1,101 @@
+"""
+Query Command Controller - Looks up stored Form16s.
+
+This controller answers lookups by employee PAN, employer TAN, assessment
+year and certificate number from the result store written by extract,
+batch and consolidate with --result-store.
+"""
+
+import json
+import time
+from pathlib import Path
+
+from .base_command import BaseCommand
+from ..services.result_store import ResultStore
+
+
+class QueryCommand(BaseCommand):
+    """Command controller for result store queries."""
+
+    def execute(self, args) -> int:
+        """
+        Execute the query command.
+
+        Args:
+            args: Parsed command line arguments
+
+        Returns:
+            int: Exit code (0 when documents were found, 1 otherwise)
+        """
+        try:
+            store_file = Path(args.result_store)
+            if not store_file.exists():
+                print(f"Error: Result store not found: {store_file}")
+                return 1
+
+            store = ResultStore(store_file)
+
+            if getattr(args, 'stats', False):
+                stats = store.stats()
+                if getattr(args, 'json', False):
+                    print(json.dumps(stats, indent=2))
+                else:
+                    self._display_stats(stats)
+                return 0
+
+            start_time = time.perf_counter()
+            documents = store.find(
+                pan=getattr(args, 'pan', None),
+                tan=getattr(args, 'tan', None),
+                assessment_year=getattr(args, 'assessment_year', None),
+                certificate_number=getattr(args, 'certificate', None),
+                limit=getattr(args, 'limit', None)
+            )
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+            if getattr(args, 'json', False):
+                print(json.dumps([document.to_dict() for document in documents], indent=2))
+            else:
+                self._display_documents(documents, elapsed_ms)
+
+            return 0 if documents else 1
+
+        except KeyboardInterrupt:
+            return 130
+        except Exception as e:
+            print(f"Unexpected error: {str(e)}")
+            return 1
+
+    def _display_documents(self, documents, elapsed_ms: float) -> None:
+        """Display matching documents as a table."""
+        from rich.console import Console
+        from rich.table import Table
+
+        table = Table(show_header=True, header_style="bold")
+        for column in ("AY", "PAN", "Employee", "TAN", "Employer", "Certificate", "Gross Salary", "TDS", "File"):
+            table.add_column(column, justify="right" if column in ("Gross Salary", "TDS") else "left")
+
+        for document in documents:
+            table.add_row(
+                document.assessment_year or "-",
+                document.employee_pan or "-",
+                document.employee_name or "-",
+                document.employer_tan or "-",
+                document.employer_name or "-",
+                document.certificate_number or "-",
+                f"{document.gross_salary:,.2f}" if document.gross_salary is not None else "-",
+                f"{document.total_tds:,.2f}" if document.total_tds is not None else "-",
+                Path(document.source_file).name
+            )
+
+        console = Console()
+        console.print(table)
+        console.print(f"{len(documents)} documents in {elapsed_ms:.1f} ms")
+
+    def _display_stats(self, stats) -> None:
+        """Display store counts."""
+        print(f"Result store: {stats['store']}")
+        print(f"  {stats['documents']} documents, {stats['employees']} employees, "
+              f"{stats['employers']} employers")
+        for year, count in stats['assessment_years'].items():
+            print(f"  AY {year}: {count} documents")
@@ -0,0 +1,76 @@
+"""
+Queue Command Controller - Reports progress of distributed batch runs.
+
+This controller reads the shared work queue used by batch --queue --worker
+processes on any number of nodes and shows global progress and throughput.
+"""
+
+import json
+import time
+from pathlib import Path
+
+from .base_command import BaseCommand
+from ..services.work_queue import WorkQueue
+
+
+class QueueCommand(BaseCommand):
+    """Command controller for work queue progress."""
+
+    def execute(self, args) -> int:
+        """
+        Execute the queue command.
+
+        Args:
+            args: Parsed command line arguments
+
+        Returns:
+            int: Exit code (0 for success, non-zero for failure)
+        """
+        try:
+            queue_file = Path(args.queue_file)
+            if not queue_file.exists():
+                print(f"Error: Work queue not found: {queue_file}")
+                return 1
+
+            queue = WorkQueue(queue_file)
+
+            if getattr(args, 'requeue_failed', False):
+                print(f"Requeued {queue.requeue_failed()} failed documents")
+
+            watch = getattr(args, 'watch', None)
+            while True:
+                progress = queue.progress()
+                if getattr(args, 'json', False):
+                    print(json.dumps(progress, indent=2))
+                else:
+                    self._display_progress(queue_file, progress)
+
+                if not watch or progress['pending'] + progress['running'] == 0:
+                    break
+                time.sleep(watch)
+
+            return 0 if progress['failed'] == 0 else 1
+
+        except KeyboardInterrupt:
+            return 130
+        except Exception as e:
+            print(f"Unexpected error: {str(e)}")
+            return 1
+
+    def _display_progress(self, queue_file: Path, progress) -> None:
+        """Display global queue progress."""
+        eta = progress['eta_seconds']
+        print(f"Queue: {queue_file}")
+        print(f"  {progress['done']}/{progress['total']} done ({progress['percent_complete']}%), "
+              f"{progress['running']} running, {progress['pending']} pending, {progress['failed']} failed")
+        print(f"  Throughput: {progress['documents_per_minute']} documents/minute"
+              + (f", ETA {eta // 60}m {eta % 60}s" if eta is not None else ""))
+        if progress['expired_leases']:
+            print(f"  {progress['expired_leases']} expired leases waiting to be reclaimed")
+
+        for worker in progress['workers']:
+            print(f"  Worker {worker['id']}: {worker['completed']} done, {worker['failed']} failed, "
+                  f"{worker['running']} running, last seen {worker['seconds_since_seen']}s ago")
+
+        for failure in progress['recent_failures']:
+            print(f"  FAILED {Path(failure['path']).name}: {failure['error']}")
@@ -0,0 +1,85 @@
+"""
+Reprocess Command Controller - Handles incremental re-extraction command.
+
+This controller re-runs only the domain extractors whose code or configuration
+changed, using artifacts saved by `extract`/`batch --save-artifacts`.
+"""
+
+from pathlib import Path
+
+from .base_command import BaseCommand
+from ..services.reprocess_service import ReprocessService
+from ..display.rich_ui_components import RichUIComponents
+
+
+class ReprocessCommand(BaseCommand):
+    """Command controller for incremental reprocessing."""
+
+    def __init__(self):
+        """Initialize the reprocess command with required services."""
+        self.reprocess_service = ReprocessService()
+        self.ui = RichUIComponents()
+
+    def execute(self, args) -> int:
+        """
+        Execute the reprocess command.
+
+        Args:
+            args: Parsed command line arguments
+
+        Returns:
+            int: Exit code (0 for success, non-zero for failure)
+        """
+        try:
+            self.setup_common_args(args)
+            self._display_command_header()
+
+            artifacts_dir = Path(args.artifacts_dir)
+            output_dir = Path(args.output_dir)
+
+            if not artifacts_dir.is_dir():
+                print(f"Error: Artifacts directory not found: {artifacts_dir}")
+                return 1
+
+            result = self.reprocess_service.reprocess_all(
+                artifacts_dir=artifacts_dir,
+                output_dir=output_dir,
+                force_domains=getattr(args, 'force', None),
+                document_ids=getattr(args, 'documents', None)
+            )
+
+            if not result['success']:
+                print(f"Error: {result['error']}")
+                return 1
+
+            self._display_results(result)
+
+            return 0 if result['statistics']['failed_documents'] == 0 else 1
+
+        except KeyboardInterrupt:
+            print("\nOperation cancelled by user")
+            return 130
+        except Exception as e:
+            print(f"Unexpected error: {str(e)}")
+            return 1
+
+    def _display_command_header(self) -> None:
+        """Display the command header."""
+        self.ui.show_animated_header("REPROCESS", "Re-run changed extractors from saved artifacts")
+
+    def _display_results(self, result) -> None:
+        """Display reprocessing results."""
+        for item in result['results']:
+            if item['success']:
+                rerun = ', '.join(item['rerun_domains']) or 'none (up to date)'
+                print(f"  {item['document_id']}: re-ran {rerun}")
+                self.log_verbose(f"{item['document_id']}: reused {', '.join(item['reused_domains'])}")
+            else:
+                print(f"  {item['document_id']}: FAILED - {item['error_message']}")
+
+        stats = result['statistics']
+        print(f"\nReprocessed {stats['successful_documents']}/{stats['total_documents']} documents "
+              f"in {result['processing_time']:.2f} seconds")
+        print(f"Extractor runs: {stats['extractor_runs']} executed, "
+              f"{stats['extractor_runs_skipped']} reused from artifacts")
+        print(f"Output: {result['output_directory']}")
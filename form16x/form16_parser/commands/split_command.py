@@ -0,0 +1,79 @@
+"""
+Split Command Controller - Handles bulk PDFs of concatenated Form16s.
+
+This controller splits one PDF holding many employees' Form16s into
+certificates and extracts each employee independently.
+"""
+
+from pathlib import Path
+
+from .base_command import BaseCommand
+from ..services.batch_processing_service import BatchProcessingService
+from ..presentation.formatters.batch_results_formatter import BatchResultsFormatter
+from ..display.rich_ui_components import RichUIComponents
+
+
+class SplitCommand(BaseCommand):
+    """Command controller for splitting and extracting bulk Form16 PDFs."""
+
+    def __init__(self):
+        """Initialize the split command with required services."""
+        self.batch_service = BatchProcessingService()
+        self.batch_formatter = BatchResultsFormatter()
+        self.ui = RichUIComponents()
+
+    def execute(self, args) -> int:
+        """
+        Execute the split command.
+
+        Args:
+            args: Parsed command line arguments
+
+        Returns:
+            int: Exit code (0 for success, non-zero for failure)
+        """
+        try:
+            self.setup_common_args(args)
+            self._display_command_header()
+
+            if getattr(args, 'strategy_stats', None):
+                self.batch_service.extraction_service.use_strategy_stats(args.strategy_stats)
+
+            result = self.batch_service.process_bulk_pdf(
+                input_file=Path(args.input_file),
+                output_dir=Path(args.output_dir),
+                parallel_workers=getattr(args, 'parallel', 4),
+                continue_on_error=not getattr(args, 'stop_on_error', False),
+                verbose=getattr(args, 'verbose', False),
+                pretty_json=getattr(args, 'pretty', False),
+                compression=getattr(args, 'compress', None)
+            )
+
+            if not result['success']:
+                print(f"Error: {result['error']}")
+                return 1
+
+            self._display_results(result)
+
+            return 0 if result['statistics']['failed_files'] == 0 else 1
+
+        except KeyboardInterrupt:
+            print("\nOperation cancelled by user")
+            return 130
+        except Exception as e:
+            print(f"Unexpected error: {str(e)}")
+            return 1
+
+    def _display_command_header(self) -> None:
+        """Display the command header."""
+        self.ui.show_animated_header("SPLIT", "Extract each employee from a bulk Form16 PDF")
+
+    def _display_results(self, result) -> None:
+        """Display per-employee results."""
+        for item in result['results']:
+            identity = item['certificate_number'] or item['employee_pan'] or 'unidentified'
+            status = 'OK' if item['success'] else f"FAILED - {item['error_message']}"
+            print(f"  #{item['certificate_index']:>4} pages {item['pages']:<9} {identity}: {status}")
+
+        self.batch_formatter.display_batch_summary(result['statistics'], False)
+        print(f"Output: {result['output_directory']}")
@@ -0,0 +1,63 @@
+"""
+Tax Bulk Command Controller - Calculates tax for tables of employees.
+
+This controller streams a CSV of employee records through the vectorized
+BulkTaxCalculator chunk by chunk and writes a result CSV with per-regime
+tax, rebate, surcharge and cess and the recommended regime.
+"""
+
+from pathlib import Path
+
+from .base_command import BaseCommand
+from ..tax_calculators.bulk_calculator import BulkTaxCalculator
+
+
+class TaxBulkCommand(BaseCommand):
+    """Command controller for bulk tax calculation."""
+
+    def execute(self, args) -> int:
+        """
+        Execute the tax-bulk command.
+
+        Args:
+            args: Parsed command line arguments
+
+        Returns:
+            int: Exit code (0 when every row was calculated, 1 otherwise)
+        """
+        try:
+            input_file = Path(args.input)
+            if not input_file.exists():
+                print(f"Error: Input file not found: {input_file}")
+                return 1
+
+            output_file = getattr(args, 'output', None) or input_file.with_name(f"{input_file.stem}_tax.csv")
+
+            calculator = BulkTaxCalculator()
+            stats = calculator.calculate_csv(
+                input_file,
+                output_file,
+                chunk_size=getattr(args, 'chunk_size', 50000),
+                assessment_year=getattr(args, 'assessment_year', None),
+                regime=getattr(args, 'regime', 'both'),
+                age_category=getattr(args, 'age_category', 'below_60')
+            )
+
+            print(f"Calculated {stats['rows']} records in {stats['processing_time']:.2f}s "
+                  f"({stats['rows_per_second']:,.0f} records/s, {stats['chunks']} chunks)")
+            print(f"  Recommended old regime: {stats['recommended']['old']}, "
+                  f"new regime: {stats['recommended']['new']}")
+            if stats['errors']:
+                print(f"  {stats['errors']} records failed (see the error column)")
+            print(f"Results saved to: {stats['output_file']}")
+
+            return 0 if stats['errors'] == 0 else 1
+
+        except KeyboardInterrupt:
+            return 130
+        except ValueError as e:
+            print(f"Error: {str(e)}")
+            return 1
+        except Exception as e:
+            print(f"Unexpected error: {str(e)}")
+            return 1
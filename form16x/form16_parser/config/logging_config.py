@@ -5,29 +5,54 @@ Logging Configuration
 
 Structured logging setup for Form16 extractor.
 Supports file and console output with proper formatting.
+
+In queue mode the root logger only puts records on an in-process queue; a
+QueueListener thread formats them and writes them to the console and file,
+so extraction worker threads never block on formatting or I/O. Records can
+be written as JSON with the id of the document being extracted, and
+high-frequency debug loggers can be sampled.
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 from form16x.form16_parser.config.settings import get_settings
+from form16x.form16_parser.utils.structured_logging import (
+    CorrelationFilter,
+    DeferredQueueHandler,
+    JsonFormatter,
+    SamplingFilter
+)
+
+# Listener of the active queue mode configuration
+_queue_listener: Optional[logging.handlers.QueueListener] = None
 
 
-def setup_logging(log_level: Optional[str] = None, log_file: Optional[Path] = None):
+def setup_logging(log_level: Optional[str] = None, log_file: Optional[Path] = None,
+                  queue_logging: Optional[bool] = None, json_logging: Optional[bool] = None,
+                  sample_rates: Optional[Dict[str, int]] = None):
     """
     Setup logging configuration based on settings
     
     Args:
         log_level: Override log level (DEBUG, INFO, WARNING, ERROR)
         log_file: Override log file path
+        queue_logging: Override queue mode (format and write on a listener thread)
+        json_logging: Override JSON records with document correlation ids
+        sample_rates: Override per-logger sampling (logger name -> keep 1 in n below WARNING)
     """
     settings = get_settings()
     
     # Use provided values or fall back to settings
     level = log_level or settings.logging.log_level
     file_path = log_file or settings.get_log_file_path()
+    use_queue = settings.logging.enable_queue_logging if queue_logging is None else queue_logging
+    use_json = settings.logging.enable_json_logging if json_logging is None else json_logging
+    rates = settings.logging.log_sample_rates if sample_rates is None else sample_rates
     
     # Convert string level to logging constant
     numeric_level = getattr(logging, level.upper(), logging.INFO)
@@ -36,25 +61,48 @@ def setup_logging(log_level: Optional[str] = None, log_file: Optional[Path] = No
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
     
-    # Clear any existing handlers
+    # Clear any existing handlers (and stop a previous queue listener)
+    shutdown_logging()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
     # Create formatter
-    formatter = _get_formatter(settings)
+    formatter = JsonFormatter() if use_json else _get_formatter(settings)
     
     # Console handler (always present)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
     console_handler.setLevel(numeric_level)
-    root_logger.addHandler(console_handler)
+    output_handlers = [console_handler]
     
     # File handler (if enabled)
     if settings.logging.enable_file_logging:
         file_handler = _create_file_handler(file_path, settings)
         file_handler.setFormatter(formatter)
         file_handler.setLevel(numeric_level)
-        root_logger.addHandler(file_handler)
+        output_handlers.append(file_handler)
+    
+    # Filters run on the logging thread, where the document context is set
+    record_filters = [SamplingFilter(rates)] if rates else []
+    if use_json:
+        record_filters.append(CorrelationFilter())
+    
+    if use_queue:
+        global _queue_listener
+        queue_handler = DeferredQueueHandler(queue.SimpleQueue())
+        queue_handler.setLevel(numeric_level)
+        entry_handlers = [queue_handler]
+        _queue_listener = logging.handlers.QueueListener(
+            queue_handler.queue, *output_handlers, respect_handler_level=True
+        )
+        _queue_listener.start()
+    else:
+        entry_handlers = output_handlers
+    
+    for handler in entry_handlers:
+        for record_filter in record_filters:
+            handler.addFilter(record_filter)
+        root_logger.addHandler(handler)
     
     # Set library loggers to WARNING to reduce noise
     logging.getLogger('camelot').setLevel(logging.WARNING)
@@ -63,6 +111,19 @@ def setup_logging(log_level: Optional[str] = None, log_file: Optional[Path] = No
     logging.getLogger('requests').setLevel(logging.WARNING)
 
 
+def shutdown_logging():
+    """Write out queued records and stop the queue listener, if running"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+atexit.register(shutdown_logging)
+
+
 def _get_formatter(settings) -> logging.Formatter:
     """Create log formatter based on settings"""
     
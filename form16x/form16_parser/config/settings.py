@@ -97,6 +97,15 @@ class LoggingSettings:
     enable_structured_logging: bool = False
     include_timestamp: bool = True
     include_process_info: bool = False
+    enable_json_logging: bool = False
+    
+    # Hot-path logging
+    enable_queue_logging: bool = False
+    log_sample_rates: dict = None  # logger name -> keep 1 in n records below WARNING
+    
+    def __post_init__(self):
+        if self.log_sample_rates is None:
+            self.log_sample_rates = {}
 
 
 class Settings:
@@ -146,6 +155,7 @@ class Settings:
             # Production: Optimized for performance
             self.logging.log_level = "INFO"
             self.logging.enable_file_logging = True
+            self.logging.enable_queue_logging = True
             self.validation.enable_strict_validation = False
             self.output.pretty_print_json = False
             self.extraction.enable_caching = True
@@ -171,6 +181,19 @@ class Settings:
         
         if log_file := os.getenv("FORM16_LOG_FILE"):
             self.logging.log_file_path = log_file
+        
+        if queue_logging := os.getenv("FORM16_LOG_QUEUE"):
+            self.logging.enable_queue_logging = queue_logging.lower() == "true"
+        
+        if os.getenv("FORM16_LOG_JSON", "").lower() == "true":
+            self.logging.enable_json_logging = True
+        
+        # e.g. FORM16_LOG_SAMPLE="form16x.form16_parser.extractors.domains.identity=20"
+        if sample_rates := os.getenv("FORM16_LOG_SAMPLE"):
+            for entry in sample_rates.split(","):
+                name, _, rate = entry.partition("=")
+                if name.strip() and rate.strip():
+                    self.logging.log_sample_rates[name.strip()] = int(rate)
     
     @property
     def data_dir(self) -> Path:
@@ -15,7 +15,8 @@ from .core_exceptions import (
     FieldExtractionError,
     DataValidationError,
     ComponentInitializationError,
-    ExtractionTimeoutError
+    ExtractionTimeoutError,
+    ExtractionMemoryError
 )
 
 def create_recovery_suggestions(error):
@@ -33,5 +34,6 @@ __all__ = [
     'DataValidationError',
     'ComponentInitializationError',
     'ExtractionTimeoutError',
+    'ExtractionMemoryError',
     'create_recovery_suggestions'
 ]
\ No newline at end of file
@@ -167,6 +167,25 @@ class ExtractionTimeoutError(Form16ExtractionError):
         })
 
 
+class ExtractionMemoryError(Form16ExtractionError):
+    """Extraction exceeded its memory limit"""
+    
+    def __init__(
+        self,
+        message: str,
+        memory_limit_mb: Optional[int] = None,
+        operation: Optional[str] = None,
+        **kwargs
+    ):
+        super().__init__(message, **kwargs)
+        self.memory_limit_mb = memory_limit_mb
+        self.operation = operation
+        self.context.update({
+            "memory_limit_mb": memory_limit_mb,
+            "operation": operation
+        })
+
+
 # Common error codes for monitoring and alerting
 class ErrorCodes:
     """Standardized error codes for production monitoring"""
@@ -216,6 +235,7 @@ class ErrorCodes:
     CONFIG_INVALID = "S001"
     COMPONENT_INIT_FAILED = "S002"
     TIMEOUT_EXCEEDED = "S003"
+    MEMORY_LIMIT_EXCEEDED = "S004"
 
 
 def create_recovery_suggestions(error_code: str) -> List[str]:
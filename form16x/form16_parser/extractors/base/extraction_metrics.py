@@ -10,7 +10,9 @@ Based on IncomeTaxAI patterns for performance monitoring and quality control.
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+import threading
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -90,6 +92,38 @@ class ExtractionSession:
     error_message: Optional[str] = None
 
 
+# Expected fields for each component
+COMPONENT_FIELDS: Mapping[ExtractorComponent, Tuple[str, ...]] = MappingProxyType({
+    ExtractorComponent.EMPLOYEE_EXTRACTOR: (
+        'name', 'pan', 'address', 'designation', 'father_name'
+    ),
+    ExtractorComponent.EMPLOYER_EXTRACTOR: (
+        'name', 'tan', 'address', 'pan'
+    ),
+    ExtractorComponent.SALARY_EXTRACTOR: (
+        'basic_salary', 'hra', 'transport_allowance', 'medical_allowance',
+        'special_allowance', 'overtime_allowance', 'commission_bonus',
+        'perquisites_value', 'gross_salary', 'exempt_allowances', 'net_taxable_salary'
+    ),
+    ExtractorComponent.DEDUCTIONS_EXTRACTOR: (
+        'section_80c_ppf', 'section_80c_life_insurance', 'section_80c_elss',
+        'section_80c_nsc', 'section_80c_fd', 'section_80c_ulip', 'section_80c_other',
+        'section_80d', 'section_80e', 'section_80g', 'section_80tta', 'section_80ttb',
+        'standard_deduction', 'professional_tax', 'total_deductions'
+    ),
+    ExtractorComponent.TAX_EXTRACTOR: (
+        'total_income', 'tax_on_total_income', 'education_cess', 'total_tax_cess',
+        'rebate_section_87a', 'net_tax', 'total_tds'
+    ),
+    ExtractorComponent.METADATA_EXTRACTOR: (
+        'certificate_number', 'assessment_year', 'pan', 'name'
+    ),
+    ExtractorComponent.QUARTERLY_TDS_EXTRACTOR: (
+        'q1_amount', 'q2_amount', 'q3_amount', 'q4_amount'
+    )
+})
+
+
 class ExtractionMetrics:
     """
     Infrastructure component for comprehensive extraction metrics collection.
@@ -100,43 +134,33 @@ class ExtractionMetrics:
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.current_session: Optional[ExtractionSession] = None
-        self.component_timers: Dict[ExtractorComponent, float] = {}
+        # Sessions and component timers are per thread, so one instance can
+        # collect metrics for documents extracted concurrently
+        self._local = threading.local()
         
-        # Define expected fields for each component
-        self.component_fields = {
-            ExtractorComponent.EMPLOYEE_EXTRACTOR: [
-                'name', 'pan', 'address', 'designation', 'father_name'
-            ],
-            ExtractorComponent.EMPLOYER_EXTRACTOR: [
-                'name', 'tan', 'address', 'pan'
-            ],
-            ExtractorComponent.SALARY_EXTRACTOR: [
-                'basic_salary', 'hra', 'transport_allowance', 'medical_allowance',
-                'special_allowance', 'overtime_allowance', 'commission_bonus',
-                'perquisites_value', 'gross_salary', 'exempt_allowances', 'net_taxable_salary'
-            ],
-            ExtractorComponent.DEDUCTIONS_EXTRACTOR: [
-                'section_80c_ppf', 'section_80c_life_insurance', 'section_80c_elss',
-                'section_80c_nsc', 'section_80c_fd', 'section_80c_ulip', 'section_80c_other',
-                'section_80d', 'section_80e', 'section_80g', 'section_80tta', 'section_80ttb',
-                'standard_deduction', 'professional_tax', 'total_deductions'
-            ],
-            ExtractorComponent.TAX_EXTRACTOR: [
-                'total_income', 'tax_on_total_income', 'education_cess', 'total_tax_cess',
-                'rebate_section_87a', 'net_tax', 'total_tds'
-            ],
-            ExtractorComponent.METADATA_EXTRACTOR: [
-                'certificate_number', 'assessment_year', 'pan', 'name'
-            ],
-            ExtractorComponent.QUARTERLY_TDS_EXTRACTOR: [
-                'q1_amount', 'q2_amount', 'q3_amount', 'q4_amount'
-            ]
-        }
+        # Expected fields for each component (shared, read-only)
+        self.component_fields = COMPONENT_FIELDS
+    
+    @property
+    def current_session(self) -> Optional[ExtractionSession]:
+        """The calling thread's active extraction session"""
+        return getattr(self._local, 'current_session', None)
+    
+    @current_session.setter
+    def current_session(self, session: Optional[ExtractionSession]) -> None:
+        self._local.current_session = session
+    
+    @property
+    def component_timers(self) -> Dict[ExtractorComponent, float]:
+        """The calling thread's running component timers"""
+        timers = getattr(self._local, 'component_timers', None)
+        if timers is None:
+            timers = self._local.component_timers = {}
+        return timers
     
     def start_session(self, file_name: str) -> str:
         """Start a new extraction session"""
-        session_id = f"session_{int(time.time() * 1000)}"
+        session_id = f"session_{int(time.time() * 1000)}_{threading.get_ident()}"
         
         self.current_session = ExtractionSession(
             session_id=session_id,
@@ -185,7 +209,7 @@ class ExtractionMetrics:
             return
         
         # Calculate field metrics
-        expected_fields = self.component_fields.get(component, [])
+        expected_fields = self.component_fields.get(component, ())
         fields_attempted = len(expected_fields)
         fields_extracted = self._count_extracted_fields(extraction_result, expected_fields)
         fields_validated = max(0, fields_extracted - validation_issues)
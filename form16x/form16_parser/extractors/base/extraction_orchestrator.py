@@ -10,6 +10,7 @@ This is the minimum implementation to make tests pass (GREEN phase).
 Security: Uses only synthetic test data, no real PII or financial information.
 """
 
+import threading
 import time
 from typing import Dict, List, Any, Optional
 from collections import defaultdict
@@ -24,6 +25,9 @@ class ExtractionOrchestrator:
     
     CRITICAL FIX: Routes "mixed" tables to multiple extractors instead of ignoring them.
     Addresses root cause: 87.9% salary data lost due to single-extractor routing.
+    
+    Safe to share across threads: each call builds its results and lineage
+    locally and publishes them to the shared metrics under a lock.
     """
     
     def __init__(self):
@@ -39,6 +43,7 @@ class ExtractionOrchestrator:
             'routes_distribution': defaultdict(int)
         }
         self.extraction_lineage: List[Dict] = []
+        self._lock = threading.Lock()
     
     def register_extractor(self, domain: str, extractor: Any) -> None:
         """
@@ -48,7 +53,8 @@ class ExtractionOrchestrator:
             domain: Domain name (salary, perquisite, metadata, etc.)
             extractor: Extractor instance with extract() method
         """
-        self.extractors[domain] = extractor
+        with self._lock:
+            self.extractors[domain] = extractor
     
     def process_table(self, table: pd.DataFrame, threshold: float = 0.4) -> Dict[str, Any]:
         """
@@ -78,16 +84,14 @@ class ExtractionOrchestrator:
         extractors_called = []
         
         for route in routes:
-            if route in self.extractors:
+            extractor = self.extractors.get(route)
+            if extractor is not None:
                 try:
                     # Call extractor
-                    extractor_result = self.extractors[route].extract(table)
+                    extractor_result = extractor.extract(table)
                     results[route] = extractor_result
                     extractors_called.append(route)
                     
-                    # Update metrics
-                    self.performance_metrics['routes_distribution'][route] += 1
-                    
                 except Exception as e:
                     errors.append(f"Error in {route} extractor: {str(e)}")
             else:
@@ -112,13 +116,16 @@ class ExtractionOrchestrator:
             'extractors_called': extractors_called,
             'threshold_used': threshold
         }
-        self.extraction_lineage.append(lineage_entry)
         
         # Update performance metrics
         processing_time = time.time() - start_time
-        self.performance_metrics['tables_processed'] += 1
-        self.performance_metrics['total_extractions'] += len(extractors_called)
-        self.performance_metrics['processing_times'].append(processing_time)
+        with self._lock:
+            self.extraction_lineage.append(lineage_entry)
+            for route in extractors_called:
+                self.performance_metrics['routes_distribution'][route] += 1
+            self.performance_metrics['tables_processed'] += 1
+            self.performance_metrics['total_extractions'] += len(extractors_called)
+            self.performance_metrics['processing_times'].append(processing_time)
         
         return results
     
@@ -153,8 +160,9 @@ class ExtractionOrchestrator:
         """
         # For simplicity, return the latest lineage entry
         # In production, this would match by table hash/signature
-        if self.extraction_lineage:
-            return self.extraction_lineage[-1]
+        with self._lock:
+            if self.extraction_lineage:
+                return self.extraction_lineage[-1]
         return None
     
     def get_performance_metrics(self) -> Dict[str, Any]:
@@ -164,14 +172,15 @@ class ExtractionOrchestrator:
         Returns:
             Performance metrics dictionary
         """
-        # Calculate averages
-        avg_processing_time = 0
-        if self.performance_metrics['processing_times']:
-            avg_processing_time = sum(self.performance_metrics['processing_times']) / len(self.performance_metrics['processing_times'])
-        
-        return {
-            'tables_processed': self.performance_metrics['tables_processed'],
-            'total_extractions': self.performance_metrics['total_extractions'],
-            'average_processing_time': avg_processing_time,
-            'routes_distribution': dict(self.performance_metrics['routes_distribution'])
-        }
\ No newline at end of file
+        with self._lock:
+            # Calculate averages
+            avg_processing_time = 0
+            if self.performance_metrics['processing_times']:
+                avg_processing_time = sum(self.performance_metrics['processing_times']) / len(self.performance_metrics['processing_times'])
+            
+            return {
+                'tables_processed': self.performance_metrics['tables_processed'],
+                'total_extractions': self.performance_metrics['total_extractions'],
+                'average_processing_time': avg_processing_time,
+                'routes_distribution': dict(self.performance_metrics['routes_distribution'])
+            }
\ No newline at end of file
@@ -12,13 +12,148 @@ Based on IncomeTaxAI patterns for robust field extraction.
 
 import logging
 import re
-from typing import Dict, List, Any, Tuple, Optional, Set
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Any, Mapping, NamedTuple, Tuple, Optional, Set
 from dataclasses import dataclass
 from enum import Enum
 import pandas as pd
 from difflib import SequenceMatcher
 import Levenshtein
 
+from form16x.form16_parser.utils.table_utils import cell_matrix
+
+# Comprehensive field patterns with variations and synonyms, shared read-only
+# by every FieldMatcher
+FIELD_PATTERNS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    # Identity fields
+    'employee_name': (
+        r'employee\s*name', r'name\s*of\s*employee', r'emp\s*name',
+        r'^name$', r'employee', r'full\s*name', r'person\s*name'
+    ),
+    'employee_pan': (
+        r'pan\s*no', r'pan\s*number', r'pan\s*card', r'^pan$',
+        r'income\s*tax\s*no', r'permanent\s*account\s*number'
+    ),
+    'employee_address': (
+        r'employee\s*address', r'address\s*of\s*employee', r'emp\s*address',
+        r'^address$', r'residential\s*address', r'home\s*address'
+    ),
+    'employer_name': (
+        r'employer\s*name', r'name\s*of\s*employer', r'company\s*name',
+        r'organization', r'deductor\s*name', r'firm\s*name'
+    ),
+    'employer_tan': (
+        r'tan\s*no', r'tan\s*number', r'^tan$', r'deductor\s*tan',
+        r'tax\s*deduction\s*account\s*number'
+    ),
+    'employer_address': (
+        r'employer\s*address', r'company\s*address', r'office\s*address',
+        r'deductor\s*address', r'registered\s*office'
+    ),
+    
+    # Salary fields with comprehensive patterns
+    'basic_salary': (
+        r'basic\s*salary', r'basic\s*pay', r'basic\s*wages', r'^basic$',
+        r'base\s*salary', r'salary\s*basic'
+    ),
+    'hra_received': (
+        r'house\s*rent\s*allowance', r'\bhra\b', r'rent\s*allowance',
+        r'housing\s*allowance', r'house\s*rent'
+    ),
+    'transport_allowance': (
+        r'transport\s*allowance', r'conveyance\s*allowance', r'transport',
+        r'travel\s*allowance', r'\bta\b', r'conveyance'
+    ),
+    'medical_allowance': (
+        r'medical\s*allowance', r'medical\s*reimbursement', r'medical',
+        r'health\s*allowance', r'medical\s*benefit'
+    ),
+    'special_allowance': (
+        r'special\s*allowance', r'special\s*pay', r'^special$',
+        r'spl\s*allowance', r'other\s*allowance'
+    ),
+    'gross_salary': (
+        r'gross\s*salary', r'total\s*gross', r'gross\s*total',
+        r'gross\s*pay', r'total\s*salary', r'^gross$'
+    ),
+    'net_taxable_salary': (
+        r'net\s*taxable\s*salary', r'taxable\s*salary', r'net\s*salary',
+        r'balance.*salary', r'net\s*pay'
+    ),
+    
+    # Tax fields
+    'tax_on_total_income': (
+        r'tax\s*on\s*total\s*income', r'income\s*tax', r'tax\s*liability',
+        r'tax\s*payable', r'total\s*tax'
+    ),
+    'total_tax_liability': (
+        r'total\s*tax\s*liability', r'net\s*tax\s*liability', r'final\s*tax',
+        r'tax\s*after.*', r'total.*tax'
+    ),
+    'health_education_cess': (
+        r'health.*education.*cess', r'cess', r'education\s*cess',
+        r'health\s*cess', r'4%.*cess'
+    ),
+    
+    # Deduction fields
+    'standard_deduction': (
+        r'standard\s*deduction', r'std\s*deduction', r'section\s*16'
+    ),
+    'professional_tax': (
+        r'professional\s*tax', r'prof\s*tax', r'pt', r'state\s*tax'
+    )
+})
+
+# Common field value indicators
+VALUE_INDICATORS: Tuple[str, ...] = (
+    r'amount', r'value', r'total', r'sum', r'₹', r'rs', r'inr'
+)
+
+# Position-based matching patterns
+POSITION_PATTERNS: Mapping[str, Mapping[str, Tuple[Tuple[int, int], ...]]] = MappingProxyType({
+    'salary_table': MappingProxyType({
+        'basic_salary': ((0, 1), (1, 1), (0, 2), (1, 2)),
+        'hra_received': ((2, 1), (3, 1), (2, 2), (3, 2)),
+        'transport_allowance': ((4, 1), (5, 1), (4, 2), (5, 2)),
+        'gross_salary': ((-1, 1), (-2, 1), (-1, 2), (-2, 2))  # Bottom rows
+    })
+})
+
+
+class _PatternForms(NamedTuple):
+    """Precomputed forms of one field pattern used by the matching strategies"""
+    regex: Optional[re.Pattern]
+    exact_text: str
+    fuzzy_text: str
+    words: Tuple[str, ...]
+    word_set: FrozenSet[str]
+
+
+@lru_cache(maxsize=None)
+def _pattern_forms(pattern: str) -> _PatternForms:
+    try:
+        regex = re.compile(pattern, re.IGNORECASE)
+    except re.error:
+        # Invalid patterns are skipped by pattern matching
+        regex = None
+    stripped = re.sub(r'[\\^$.*+?{}[\]|()]', '', pattern)
+    words = tuple(re.split(r'\W+', stripped))
+    return _PatternForms(
+        regex=regex,
+        exact_text=pattern.replace(r'\b', '').replace(r'\s*', ' '),
+        fuzzy_text=re.sub(r'\s+', ' ', stripped).strip(),
+        words=words,
+        word_set=frozenset(words)
+    )
+
+
+# Built at import so forked workers share them
+for _patterns in FIELD_PATTERNS.values():
+    for _pattern in _patterns:
+        _pattern_forms(_pattern)
+del _patterns, _pattern
+
 
 class MatchStrategy(Enum):
     """Field matching strategies"""
@@ -51,101 +186,10 @@ class FieldMatcher:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
-        # Comprehensive field patterns with variations and synonyms
-        self.field_patterns = {
-            # Identity fields
-            'employee_name': [
-                r'employee\s*name', r'name\s*of\s*employee', r'emp\s*name',
-                r'^name$', r'employee', r'full\s*name', r'person\s*name'
-            ],
-            'employee_pan': [
-                r'pan\s*no', r'pan\s*number', r'pan\s*card', r'^pan$',
-                r'income\s*tax\s*no', r'permanent\s*account\s*number'
-            ],
-            'employee_address': [
-                r'employee\s*address', r'address\s*of\s*employee', r'emp\s*address',
-                r'^address$', r'residential\s*address', r'home\s*address'
-            ],
-            'employer_name': [
-                r'employer\s*name', r'name\s*of\s*employer', r'company\s*name',
-                r'organization', r'deductor\s*name', r'firm\s*name'
-            ],
-            'employer_tan': [
-                r'tan\s*no', r'tan\s*number', r'^tan$', r'deductor\s*tan',
-                r'tax\s*deduction\s*account\s*number'
-            ],
-            'employer_address': [
-                r'employer\s*address', r'company\s*address', r'office\s*address',
-                r'deductor\s*address', r'registered\s*office'
-            ],
-            
-            # Salary fields with comprehensive patterns
-            'basic_salary': [
-                r'basic\s*salary', r'basic\s*pay', r'basic\s*wages', r'^basic$',
-                r'base\s*salary', r'salary\s*basic'
-            ],
-            'hra_received': [
-                r'house\s*rent\s*allowance', r'\bhra\b', r'rent\s*allowance',
-                r'housing\s*allowance', r'house\s*rent'
-            ],
-            'transport_allowance': [
-                r'transport\s*allowance', r'conveyance\s*allowance', r'transport',
-                r'travel\s*allowance', r'\bta\b', r'conveyance'
-            ],
-            'medical_allowance': [
-                r'medical\s*allowance', r'medical\s*reimbursement', r'medical',
-                r'health\s*allowance', r'medical\s*benefit'
-            ],
-            'special_allowance': [
-                r'special\s*allowance', r'special\s*pay', r'^special$',
-                r'spl\s*allowance', r'other\s*allowance'
-            ],
-            'gross_salary': [
-                r'gross\s*salary', r'total\s*gross', r'gross\s*total',
-                r'gross\s*pay', r'total\s*salary', r'^gross$'
-            ],
-            'net_taxable_salary': [
-                r'net\s*taxable\s*salary', r'taxable\s*salary', r'net\s*salary',
-                r'balance.*salary', r'net\s*pay'
-            ],
-            
-            # Tax fields
-            'tax_on_total_income': [
-                r'tax\s*on\s*total\s*income', r'income\s*tax', r'tax\s*liability',
-                r'tax\s*payable', r'total\s*tax'
-            ],
-            'total_tax_liability': [
-                r'total\s*tax\s*liability', r'net\s*tax\s*liability', r'final\s*tax',
-                r'tax\s*after.*', r'total.*tax'
-            ],
-            'health_education_cess': [
-                r'health.*education.*cess', r'cess', r'education\s*cess',
-                r'health\s*cess', r'4%.*cess'
-            ],
-            
-            # Deduction fields
-            'standard_deduction': [
-                r'standard\s*deduction', r'std\s*deduction', r'section\s*16'
-            ],
-            'professional_tax': [
-                r'professional\s*tax', r'prof\s*tax', r'pt', r'state\s*tax'
-            ]
-        }
-        
-        # Common field value indicators
-        self.value_indicators = [
-            r'amount', r'value', r'total', r'sum', r'₹', r'rs', r'inr'
-        ]
-        
-        # Position-based matching patterns
-        self.position_patterns = {
-            'salary_table': {
-                'basic_salary': [(0, 1), (1, 1), (0, 2), (1, 2)],
-                'hra_received': [(2, 1), (3, 1), (2, 2), (3, 2)],
-                'transport_allowance': [(4, 1), (5, 1), (4, 2), (5, 2)],
-                'gross_salary': [(-1, 1), (-2, 1), (-1, 2), (-2, 2)]  # Bottom rows
-            }
-        }
+        # Pattern tables are module-level and shared by every instance
+        self.field_patterns = FIELD_PATTERNS
+        self.value_indicators = VALUE_INDICATORS
+        self.position_patterns = POSITION_PATTERNS
     
     def find_field_matches(
         self,
@@ -236,7 +280,7 @@ class FieldMatcher:
     ) -> List[FieldMatch]:
         """Find all matches for a field in a table using various strategies"""
         matches = []
-        patterns = self.field_patterns.get(field_name, [])
+        patterns = self.field_patterns.get(field_name, ())
         
         if not patterns:
             return matches
@@ -261,13 +305,14 @@ class FieldMatcher:
     def _exact_match(self, table: pd.DataFrame, field_name: str, patterns: List[str]) -> List[FieldMatch]:
         """Exact string matching"""
         matches = []
+        cells = cell_matrix(table)
         
         for row_idx in range(len(table)):
             for col_idx in range(len(table.columns)):
-                cell_value = str(table.iloc[row_idx, col_idx]).lower().strip()
+                cell_value = cells[row_idx, col_idx].lower()
                 
                 for pattern in patterns:
-                    if pattern.replace(r'\b', '').replace(r'\s*', ' ') == cell_value:
+                    if _pattern_forms(pattern).exact_text == cell_value:
                         matches.append(FieldMatch(
                             field_name=field_name,
                             matched_text=cell_value,
@@ -283,17 +328,17 @@ class FieldMatcher:
     def _fuzzy_match(self, table: pd.DataFrame, field_name: str, patterns: List[str]) -> List[FieldMatch]:
         """Fuzzy string matching using edit distance"""
         matches = []
+        cells = cell_matrix(table)
         
         for row_idx in range(len(table)):
             for col_idx in range(len(table.columns)):
-                cell_value = str(table.iloc[row_idx, col_idx]).lower().strip()
+                cell_value = cells[row_idx, col_idx].lower()
                 
                 if len(cell_value) < 3:  # Skip very short strings
                     continue
                 
                 for pattern in patterns:
-                    clean_pattern = re.sub(r'[\\^$.*+?{}[\]|()]', '', pattern)
-                    clean_pattern = re.sub(r'\s+', ' ', clean_pattern).strip()
+                    clean_pattern = _pattern_forms(pattern).fuzzy_text
                     
                     # Use Levenshtein distance for fuzzy matching
                     similarity = 1 - (Levenshtein.distance(cell_value, clean_pattern) / 
@@ -314,37 +359,39 @@ class FieldMatcher:
     def _pattern_match(self, table: pd.DataFrame, field_name: str, patterns: List[str]) -> List[FieldMatch]:
         """Regular expression pattern matching"""
         matches = []
+        cells = cell_matrix(table)
         
         for row_idx in range(len(table)):
             for col_idx in range(len(table.columns)):
-                cell_value = str(table.iloc[row_idx, col_idx]).lower().strip()
+                cell_value = cells[row_idx, col_idx].lower()
                 
                 for pattern in patterns:
-                    try:
-                        if re.search(pattern, cell_value, re.IGNORECASE):
-                            matches.append(FieldMatch(
-                                field_name=field_name,
-                                matched_text=cell_value,
-                                position=(row_idx, col_idx),
-                                confidence=0.85,
-                                strategy=MatchStrategy.PATTERN_MATCH,
-                                reasoning=f"Pattern match: {pattern}"
-                            ))
-                            break
-                    except re.error:
+                    regex = _pattern_forms(pattern).regex
+                    if regex is None:
                         # Skip invalid regex patterns
                         continue
+                    if regex.search(cell_value):
+                        matches.append(FieldMatch(
+                            field_name=field_name,
+                            matched_text=cell_value,
+                            position=(row_idx, col_idx),
+                            confidence=0.85,
+                            strategy=MatchStrategy.PATTERN_MATCH,
+                            reasoning=f"Pattern match: {pattern}"
+                        ))
+                        break
         
         return matches
     
     def _semantic_match(self, table: pd.DataFrame, field_name: str, patterns: List[str]) -> List[FieldMatch]:
         """Semantic matching based on context and meaning"""
         matches = []
+        cells = cell_matrix(table)
         
         # Look for cells that contain field-related keywords in context
         for row_idx in range(len(table)):
             for col_idx in range(len(table.columns)):
-                cell_value = str(table.iloc[row_idx, col_idx]).lower().strip()
+                cell_value = cells[row_idx, col_idx].lower()
                 
                 # Check if cell contains any part of field patterns
                 semantic_score = self._calculate_semantic_score(cell_value, patterns, field_name)
@@ -371,7 +418,7 @@ class FieldMatcher:
         # Check if this looks like a salary table
         if 10 <= table_shape[0] <= 30 and 2 <= table_shape[1] <= 5:
             position_patterns = self.position_patterns.get('salary_table', {})
-            expected_positions = position_patterns.get(field_name, [])
+            expected_positions = position_patterns.get(field_name, ())
             
             for row_offset, col_offset in expected_positions:
                 # Handle negative indices (from end)
@@ -381,7 +428,7 @@ class FieldMatcher:
                 if (0 <= actual_row < table_shape[0] and 
                     0 <= actual_col < table_shape[1]):
                     
-                    cell_value = str(table.iloc[actual_row, actual_col])
+                    cell_value = cell_matrix(table)[actual_row, actual_col]
                     
                     # Only match if cell looks like a field label
                     if self._is_likely_field_label(cell_value):
@@ -412,8 +459,9 @@ class FieldMatcher:
         # Check pattern similarity
         pattern_scores = []
         for pattern in patterns:
-            pattern_words = re.split(r'\W+', re.sub(r'[\\^$.*+?{}[\]|()]', '', pattern))
-            pattern_overlap = set(pattern_words) & set(text_words)
+            forms = _pattern_forms(pattern)
+            pattern_words = forms.words
+            pattern_overlap = forms.word_set & set(text_words)
             if pattern_words:
                 pattern_scores.append(len(pattern_overlap) / len(pattern_words))
         
@@ -18,6 +18,7 @@ import re
 from decimal import Decimal
 
 from form16x.form16_parser.pdf.table_classifier import TableType
+from form16x.form16_parser.utils.table_features import register_keywords, table_features
 
 
 class ScoringCriteria(Enum):
@@ -79,6 +80,14 @@ class TableScorer:
             }
         }
         
+        # Flattened keyword sets per domain, scored from the shared table features
+        self._domain_keyword_sets = {
+            domain: frozenset(keyword for keywords in categories.values() for keyword in keywords)
+            for domain, categories in self.domain_keywords.items()
+        }
+        for keywords in self._domain_keyword_sets.values():
+            register_keywords(keywords)
+        
         # Expected table structures (rows, cols) for each domain
         self.domain_structures = {
             'identity': [(1, 2), (2, 2), (3, 2), (4, 2), (5, 2)],  # Key-value pairs
@@ -204,20 +213,13 @@ class TableScorer:
             return 0.0
         
         domain_keywords = self.domain_keywords[domain]
-        table_text = ' '.join(
-            str(cell).lower() for row in table.values 
-            for cell in row if pd.notna(cell)
-        )
+        features = table_features(table)
         
         total_matches = 0
         total_keywords = 0
         
         for category, keywords in domain_keywords.items():
-            category_matches = sum(
-                1 for keyword in keywords 
-                if keyword in table_text
-            )
-            total_matches += category_matches
+            total_matches += features.matched(keywords, scope='cells')
             total_keywords += len(keywords)
         
         return min(total_matches / max(total_keywords, 1), 1.0)
@@ -250,17 +252,7 @@ class TableScorer:
         if total_cells == 0:
             return 0.0
         
-        keyword_cells = 0
-        all_keywords = []
-        for keywords in self.domain_keywords[domain].values():
-            all_keywords.extend(keywords)
-        
-        for row in table.values:
-            for cell in row:
-                if pd.notna(cell):
-                    cell_text = str(cell).lower()
-                    if any(keyword in cell_text for keyword in all_keywords):
-                        keyword_cells += 1
+        keyword_cells = table_features(table).cells_with_any(self._domain_keyword_sets[domain])
         
         return keyword_cells / total_cells
     
@@ -276,13 +268,7 @@ class TableScorer:
         if total_cells == 0:
             return 0.0
         
-        numeric_cells = 0
-        for row in table.values:
-            for cell in row:
-                if pd.notna(cell) and self._is_numeric_value(str(cell)):
-                    numeric_cells += 1
-        
-        density = numeric_cells / total_cells
+        density = table_features(table).numeric_cells / total_cells
         return min(density * 2, 1.0)  # Scale up to reward numeric content
     
     def _score_positional_relevance(self, table_type: TableType, domain: str) -> float:
@@ -16,6 +16,11 @@ from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+from form16x.form16_parser.models.extraction_records import DATACLASS_SLOTS
+from form16x.form16_parser.utils.table_features import (
+    AMOUNT_PATTERN, TableFeatures, register_keywords, table_features
+)
+
 
 class ExtractorType(Enum):
     """Supported extractor types for multi-routing"""
@@ -26,7 +31,7 @@ class ExtractorType(Enum):
     DEDUCTION = "deduction"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DomainScore:
     """Multi-domain scores for table classification"""
     salary_score: float = 0.0
@@ -71,8 +76,14 @@ class MultiCategoryClassifier:
             'provident fund', 'life insurance', 'medical insurance'
         ]
         
+        self.metadata_indicators = ['form no', 'certificate', 'pan', 'tan', 'assessment year']
+        
         # Amount pattern for detecting monetary values
-        self.amount_pattern = re.compile(r'₹[\d,]+\.?\d*|[\d,]+\.?\d*')
+        self.amount_pattern = AMOUNT_PATTERN
+        
+        for keywords in (self.salary_keywords, self.perquisite_keywords, self.tax_keywords,
+                         self.metadata_keywords, self.deduction_keywords, self.metadata_indicators):
+            register_keywords(keywords)
     
     def score_table(self, table: pd.DataFrame) -> DomainScore:
         """
@@ -84,15 +95,15 @@ class MultiCategoryClassifier:
         Returns:
             DomainScore with scores for all domains [0.0, 1.0]
         """
-        # Convert table to string for text analysis
-        table_text = table.to_string().lower()
+        # Keyword counts and amount statistics from a single scan of the table
+        features = table_features(table)
         
         # Calculate domain-specific scores
-        salary_score = self._calculate_salary_score(table, self.salary_keywords)
-        perquisite_score = self._calculate_perquisite_score(table, self.perquisite_keywords)
-        tax_score = self._calculate_text_score(table_text, self.tax_keywords)
-        metadata_score = self._calculate_text_score(table_text, self.metadata_keywords)
-        deduction_score = self._calculate_text_score(table_text, self.deduction_keywords)
+        salary_score = self._calculate_salary_score(features, self.salary_keywords)
+        perquisite_score = self._calculate_perquisite_score(table, features, self.perquisite_keywords)
+        tax_score = self._calculate_text_score(features, self.tax_keywords)
+        metadata_score = self._calculate_text_score(features, self.metadata_keywords)
+        deduction_score = self._calculate_text_score(features, self.deduction_keywords)
         
         return DomainScore(
             salary_score=min(salary_score, 1.0),
@@ -133,19 +144,16 @@ class MultiCategoryClassifier:
                 
         return routes
     
-    def _calculate_salary_score(self, table: pd.DataFrame, keywords: List[str]) -> float:
+    def _calculate_salary_score(self, features: TableFeatures, keywords: List[str]) -> float:
         """Calculate salary domain score based on keywords and amounts"""
-        table_text = table.to_string().lower()
-        
         # Keyword score (0-0.7)
-        keyword_score = self._calculate_text_score(table_text, keywords)
+        keyword_score = self._calculate_text_score(features, keywords)
         
         # Amount score (0-0.3) - reduced weight for pure metadata tables 
-        amount_score = self._calculate_amount_score(table)
+        amount_score = self._calculate_amount_score(features)
         
         # Reduce salary score if this looks like pure metadata
-        metadata_indicators = ['form no', 'certificate', 'pan', 'tan', 'assessment year']
-        metadata_matches = sum(1 for indicator in metadata_indicators if indicator in table_text)
+        metadata_matches = features.matched(self.metadata_indicators, scope='segment')
         
         base_score = keyword_score * 0.7 + amount_score * 0.3
         
@@ -155,12 +163,11 @@ class MultiCategoryClassifier:
             
         return base_score
     
-    def _calculate_perquisite_score(self, table: pd.DataFrame, keywords: List[str]) -> float:
+    def _calculate_perquisite_score(self, table: pd.DataFrame, features: TableFeatures,
+                                    keywords: List[str]) -> float:
         """Calculate perquisite domain score with table structure analysis"""
-        table_text = table.to_string().lower()
-        
         # Keyword score
-        keyword_score = self._calculate_text_score(table_text, keywords)
+        keyword_score = self._calculate_text_score(features, keywords)
         
         # Structure score - perquisite tables are typically 4-5 columns wide
         structure_score = 0.0
@@ -168,34 +175,30 @@ class MultiCategoryClassifier:
             structure_score = 0.3
             
         # Check for specific perquisite column patterns
-        column_text = ' '.join(str(col).lower() for col in table.columns)
+        column_text = features.header_text
         if 'value' in column_text and 'amount' in column_text:
             structure_score += 0.2
             
         return min(keyword_score + structure_score, 1.0)
     
-    def _calculate_text_score(self, text: str, keywords: List[str]) -> float:
-        """Calculate score based on keyword matches in text"""
-        if not text or not keywords:
+    def _calculate_text_score(self, features: TableFeatures, keywords: List[str]) -> float:
+        """Calculate score based on keyword matches in the table text"""
+        if not features.text or not keywords:
             return 0.0
             
-        matches = sum(1 for keyword in keywords if keyword in text)
+        # Keywords must occur within one cell or column label
+        matches = features.matched(keywords, scope='segment')
         # Higher multiplier for better scoring
         return min(matches / len(keywords) * 1.8, 1.0)
     
-    def _calculate_amount_score(self, table: pd.DataFrame) -> float:
+    def _calculate_amount_score(self, features: TableFeatures) -> float:
         """Calculate score based on monetary amounts found in table"""
-        table_text = table.to_string()
-        amounts = self.amount_pattern.findall(table_text)
-        
-        if not amounts:
+        if not features.amounts:
             return 0.0
             
         # Score based on number of amounts and their magnitude
-        large_amounts = [amt for amt in amounts if self._parse_amount(amt) > 10000]
-        
-        amount_count_score = min(len(amounts) * 0.1, 0.5)
-        large_amount_score = min(len(large_amounts) * 0.2, 0.5)
+        amount_count_score = min(len(features.amounts) * 0.1, 0.5)
+        large_amount_score = min(features.count_amounts_above(10000) * 0.2, 0.5)
         
         return amount_count_score + large_amount_score
     
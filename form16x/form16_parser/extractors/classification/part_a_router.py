@@ -23,6 +23,7 @@ from dataclasses import dataclass
 import re
 
 from form16x.form16_parser.pdf.table_classifier import TableType
+from form16x.form16_parser.utils.table_features import register_keywords, table_features
 
 
 @dataclass
@@ -79,6 +80,36 @@ class PartARouter:
             r'deductions?\s+under\s+chapter\s+vi[-a]?'
         ]
         
+        # Weighted keywords for content-based relevance scoring
+        self.salary_relevance_keywords = [
+            ('salary', 0.3),
+            ('gross', 0.2),
+            ('basic', 0.2),
+            ('allowance', 0.2),
+            ('quarterly', 0.1),
+            ('annual', 0.1)
+        ]
+        
+        self.tax_relevance_keywords = [
+            ('tax', 0.4),
+            ('tds', 0.3),
+            ('deducted', 0.2),
+            ('chapter', 0.1)
+        ]
+        
+        self.metadata_relevance_keywords = [
+            ('total', 0.2),
+            ('income', 0.2),
+            ('assessment', 0.2),
+            ('year', 0.1),
+            ('summary', 0.1)
+        ]
+        
+        for weighted_keywords in (
+            self.salary_relevance_keywords, self.tax_relevance_keywords, self.metadata_relevance_keywords
+        ):
+            register_keywords(keyword for keyword, _ in weighted_keywords)
+        
         # Confidence thresholds
         self.high_confidence_threshold = 0.8
         self.medium_confidence_threshold = 0.5
@@ -124,11 +155,7 @@ class PartARouter:
         table = table_info['table']
         
         # Check for quarterly patterns in column names and values
-        all_text = ' '.join([
-            str(col).lower() for col in table.columns
-        ] + [
-            str(val).lower() for val in table.values.flatten() if pd.notna(val)
-        ])
+        all_text = table_features(table).text
         
         # Look for quarterly patterns
         has_quarterly = any(
@@ -148,11 +175,7 @@ class PartARouter:
         """Check if table contains PART A summary data"""
         table = table_info['table']
         
-        all_text = ' '.join([
-            str(col).lower() for col in table.columns
-        ] + [
-            str(val).lower() for val in table.values.flatten() if pd.notna(val)
-        ])
+        all_text = table_features(table).text
         
         # Look for summary patterns
         return any(
@@ -319,11 +342,7 @@ class PartARouter:
 
     def _has_part_a_content(self, table: pd.DataFrame) -> bool:
         """Check if table has PART A specific content patterns"""
-        all_text = ' '.join([
-            str(col).lower() for col in table.columns
-        ] + [
-            str(val).lower() for val in table.values.flatten() if pd.notna(val)
-        ])
+        all_text = table_features(table).text
         
         # Look for PART A indicators
         part_a_indicators = [
@@ -340,81 +359,19 @@ class PartARouter:
 
     def _calculate_salary_relevance(self, table: pd.DataFrame) -> float:
         """Calculate relevance score for salary extraction"""
-        score = 0.0
-        
-        all_text = ' '.join([
-            str(col).lower() for col in table.columns
-        ] + [
-            str(val).lower() for val in table.values.flatten() if pd.notna(val)
-        ])
-        
-        # Salary keywords
-        salary_keywords = [
-            ('salary', 0.3),
-            ('gross', 0.2),
-            ('basic', 0.2),
-            ('allowance', 0.2),
-            ('quarterly', 0.1),
-            ('annual', 0.1)
-        ]
+        features = table_features(table)
+        score = features.weighted(self.salary_relevance_keywords)
         
-        for keyword, weight in salary_keywords:
-            if keyword in all_text:
-                score += weight
-                
         # Presence of large amounts (likely salary figures)
-        for val in table.values.flatten():
-            if pd.notna(val) and isinstance(val, (int, float)):
-                if 50000 <= val <= 10000000:  # Reasonable salary range
-                    score += 0.1
-                    
+        for _ in range(features.count_values_between(50000, 10000000)):
+            score += 0.1
+        
         return min(score, 1.0)
 
     def _calculate_tax_relevance(self, table: pd.DataFrame) -> float:
         """Calculate relevance score for tax extraction"""
-        score = 0.0
-        
-        all_text = ' '.join([
-            str(col).lower() for col in table.columns
-        ] + [
-            str(val).lower() for val in table.values.flatten() if pd.notna(val)
-        ])
-        
-        # Tax keywords
-        tax_keywords = [
-            ('tax', 0.4),
-            ('tds', 0.3),
-            ('deducted', 0.2),
-            ('chapter', 0.1)
-        ]
-        
-        for keyword, weight in tax_keywords:
-            if keyword in all_text:
-                score += weight
-                
-        return min(score, 1.0)
+        return min(table_features(table).weighted(self.tax_relevance_keywords), 1.0)
 
     def _calculate_metadata_relevance(self, table: pd.DataFrame) -> float:
         """Calculate relevance score for metadata extraction"""
-        score = 0.0
-        
-        all_text = ' '.join([
-            str(col).lower() for col in table.columns
-        ] + [
-            str(val).lower() for val in table.values.flatten() if pd.notna(val)
-        ])
-        
-        # Metadata keywords
-        metadata_keywords = [
-            ('total', 0.2),
-            ('income', 0.2),
-            ('assessment', 0.2),
-            ('year', 0.1),
-            ('summary', 0.1)
-        ]
-        
-        for keyword, weight in metadata_keywords:
-            if keyword in all_text:
-                score += weight
-                
-        return min(score, 1.0)
\ No newline at end of file
+        return min(table_features(table).weighted(self.metadata_relevance_keywords), 1.0)
\ No newline at end of file
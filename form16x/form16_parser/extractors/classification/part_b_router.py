@@ -23,6 +23,7 @@ from dataclasses import dataclass
 import re
 
 from form16x.form16_parser.pdf.table_classifier import TableType
+from form16x.form16_parser.utils.table_features import register_keywords, table_features
 
 
 @dataclass
@@ -90,6 +91,46 @@ class PartBRouter:
             r'address'
         ]
         
+        # Weighted keywords for content-based relevance scoring
+        self.salary_relevance_keywords = [
+            ('section 17', 0.4),    # Primary PART B indicator
+            ('gross salary', 0.3),
+            ('perquisites', 0.2),
+            ('basic salary', 0.2),
+            ('allowance', 0.1)
+        ]
+        
+        self.tax_relevance_keywords = [
+            ('tax computation', 0.5),
+            ('total income', 0.3),
+            ('tax on', 0.2),
+            ('gross total income', 0.3),
+            ('chapter vi', 0.2)
+        ]
+        
+        self.deductions_relevance_keywords = [
+            ('section 80', 0.4),
+            ('deductions', 0.3),
+            ('life insurance', 0.2),
+            ('medical insurance', 0.2),
+            ('charitable', 0.1)
+        ]
+        
+        self.identity_relevance_keywords = [
+            ('employee', 0.3),
+            ('employer', 0.3),
+            ('pan', 0.2),
+            ('tan', 0.2),
+            ('address', 0.1),
+            ('name', 0.1)
+        ]
+        
+        for weighted_keywords in (
+            self.salary_relevance_keywords, self.tax_relevance_keywords,
+            self.deductions_relevance_keywords, self.identity_relevance_keywords
+        ):
+            register_keywords(keyword for keyword, _ in weighted_keywords)
+        
         # Confidence thresholds (higher than PART A due to structured nature)
         self.high_confidence_threshold = 0.9
         self.medium_confidence_threshold = 0.7
@@ -137,11 +178,7 @@ class PartBRouter:
         table = table_info['table']
         
         # Check for section 17 patterns in column names and values
-        all_text = ' '.join([
-            str(col).lower() for col in table.columns
-        ] + [
-            str(val).lower() for val in table.values.flatten() if pd.notna(val)
-        ])
+        all_text = table_features(table).text
         
         # Look for section 17 salary patterns
         section_17_matches = sum(
@@ -156,11 +193,7 @@ class PartBRouter:
         """Check if table contains employer-employee identity information"""
         table = table_info['table']
         
-        all_text = ' '.join([
-            str(col).lower() for col in table.columns
-        ] + [
-            str(val).lower() for val in table.values.flatten() if pd.notna(val)
-        ])
+        all_text = table_features(table).text
         
         # Look for identity patterns
         identity_matches = sum(
@@ -355,11 +388,7 @@ class PartBRouter:
 
     def _has_part_b_content(self, table: pd.DataFrame) -> bool:
         """Check if table has PART B specific content patterns"""
-        all_text = ' '.join([
-            str(col).lower() for col in table.columns
-        ] + [
-            str(val).lower() for val in table.values.flatten() if pd.notna(val)
-        ])
+        all_text = table_features(table).text
         
         # Look for PART B indicators
         part_b_indicators = [
@@ -377,107 +406,23 @@ class PartBRouter:
 
     def _calculate_salary_relevance(self, table: pd.DataFrame) -> float:
         """Calculate relevance score for salary extraction"""
-        score = 0.0
-        
-        all_text = ' '.join([
-            str(col).lower() for col in table.columns
-        ] + [
-            str(val).lower() for val in table.values.flatten() if pd.notna(val)
-        ])
-        
-        # Salary keywords (higher weights for PART B specific terms)
-        salary_keywords = [
-            ('section 17', 0.4),    # Primary PART B indicator
-            ('gross salary', 0.3),
-            ('perquisites', 0.2),
-            ('basic salary', 0.2),
-            ('allowance', 0.1)
-        ]
+        features = table_features(table)
+        score = features.weighted(self.salary_relevance_keywords)
         
-        for keyword, weight in salary_keywords:
-            if keyword in all_text:
-                score += weight
-                
         # Presence of salary-range amounts
-        for val in table.values.flatten():
-            if pd.notna(val) and isinstance(val, (int, float)):
-                if 100000 <= val <= 10000000:  # Typical annual salary range
-                    score += 0.1
-                    
+        for _ in range(features.count_values_between(100000, 10000000)):
+            score += 0.1
+        
         return min(score, 1.0)
 
     def _calculate_tax_relevance(self, table: pd.DataFrame) -> float:
         """Calculate relevance score for tax extraction"""
-        score = 0.0
-        
-        all_text = ' '.join([
-            str(col).lower() for col in table.columns
-        ] + [
-            str(val).lower() for val in table.values.flatten() if pd.notna(val)
-        ])
-        
-        # Tax keywords
-        tax_keywords = [
-            ('tax computation', 0.5),
-            ('total income', 0.3),
-            ('tax on', 0.2),
-            ('gross total income', 0.3),
-            ('chapter vi', 0.2)
-        ]
-        
-        for keyword, weight in tax_keywords:
-            if keyword in all_text:
-                score += weight
-                
-        return min(score, 1.0)
+        return min(table_features(table).weighted(self.tax_relevance_keywords), 1.0)
 
     def _calculate_deductions_relevance(self, table: pd.DataFrame) -> float:
         """Calculate relevance score for deductions extraction"""
-        score = 0.0
-        
-        all_text = ' '.join([
-            str(col).lower() for col in table.columns
-        ] + [
-            str(val).lower() for val in table.values.flatten() if pd.notna(val)
-        ])
-        
-        # Deductions keywords
-        deduction_keywords = [
-            ('section 80', 0.4),
-            ('deductions', 0.3),
-            ('life insurance', 0.2),
-            ('medical insurance', 0.2),
-            ('charitable', 0.1)
-        ]
-        
-        for keyword, weight in deduction_keywords:
-            if keyword in all_text:
-                score += weight
-                
-        return min(score, 1.0)
+        return min(table_features(table).weighted(self.deductions_relevance_keywords), 1.0)
 
     def _calculate_identity_relevance(self, table: pd.DataFrame) -> float:
         """Calculate relevance score for identity extraction"""
-        score = 0.0
-        
-        all_text = ' '.join([
-            str(col).lower() for col in table.columns
-        ] + [
-            str(val).lower() for val in table.values.flatten() if pd.notna(val)
-        ])
-        
-        # Identity keywords
-        identity_keywords = [
-            ('employee', 0.3),
-            ('employer', 0.3),
-            ('pan', 0.2),
-            ('tan', 0.2),
-            ('address', 0.1),
-            ('name', 0.1)
-        ]
-        
-        for keyword, weight in identity_keywords:
-            if keyword in all_text:
-                score += weight
-                
-        return min(score, 1.0)
\ No newline at end of file
+        return min(table_features(table).weighted(self.identity_relevance_keywords), 1.0)
\ No newline at end of file
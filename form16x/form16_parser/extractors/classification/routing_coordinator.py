@@ -158,6 +158,36 @@ class RoutingCoordinator:
         
         return extractor_summary
 
+    def build_extractor_table_sets(self, routing_decisions: List[RoutingDecision],
+                                   tables: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Turn routing decisions into per-extractor table subsets.
+        
+        Args:
+            routing_decisions: Decisions from coordinate_table_routing
+            tables: The table information list that was routed
+            
+        Returns:
+            Dict mapping extractor names to their routed table_info dicts,
+            highest routing confidence first (ties keep document order)
+        """
+        routed: Dict[str, List[Tuple[float, int]]] = {}
+        
+        for decision in routing_decisions:
+            for extractor_name, route_info in decision.extractor_routes.items():
+                routed.setdefault(extractor_name, []).append(
+                    (route_info.get('confidence', 0.0), decision.table_index)
+                )
+        
+        table_sets = {}
+        for extractor_name, entries in routed.items():
+            entries.sort(key=lambda entry: (-entry[0], entry[1]))
+            table_sets[extractor_name] = [tables[table_index] for _, table_index in entries]
+            self.logger.debug(f"Extractor '{extractor_name}': {len(entries)} routed tables, "
+                              f"top confidence {entries[0][0]:.2f}")
+        
+        return table_sets
+
     def validate_cross_part_consistency(self, routing_decisions: List[RoutingDecision]) -> CrossValidationData:
         """
         Validate consistency between PART A quarterly totals and PART B detailed breakdown.
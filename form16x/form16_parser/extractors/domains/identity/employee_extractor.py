@@ -10,9 +10,10 @@ Implements pattern-based extraction from Form16 PDF documents.
 
 import re
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 import pandas as pd
 from form16x.form16_parser.models.form16_models import EmployeeInfo
+from form16x.form16_parser.utils.table_utils import cell_matrix
 from form16x.form16_parser.extractors.base.interfaces import IExtractor, ExtractionResult
 
 
@@ -77,20 +78,26 @@ class EmployeeExtractor(IExtractor[EmployeeInfo]):
         """Extract employee information from Form16 tables (IExtractor interface)"""
         return self.extract_employee_info(tables, text_data)
     
-    def extract_employee_info(self, tables: List[pd.DataFrame], text_data: Optional[Dict[str, Any]] = None) -> EmployeeInfo:
+    def extract_employee_info(self, tables: List[pd.DataFrame], text_data: Optional[Dict[str, Any]] = None,
+                              required_fields: Optional[Sequence[str]] = None,
+                              min_confidence: float = 0.8) -> EmployeeInfo:
         """
         Extract employee information from Form16 tables and text data
         
         Args:
             tables: List of DataFrame objects from Form16
             text_data: Optional dictionary with text-extracted identity data
+            required_fields: Stop scanning tables once all of these fields are
+                filled with at least min_confidence (tables are expected to be
+                ordered most relevant first). None scans every table.
+            min_confidence: Confidence required for the early stop
             
         Returns:
             EmployeeInfo object with extracted data
         """
-        self.logger.info(f"Extracting employee info from {len(tables)} tables")
+        self.logger.info("Extracting employee info from %d tables", len(tables))
         if text_data:
-            self.logger.info(f"Also using text extraction data with {len(text_data)} fields")
+            self.logger.info("Also using text extraction data with %d fields", len(text_data))
         
         employee_info = EmployeeInfo()
         
@@ -105,30 +112,36 @@ class EmployeeExtractor(IExtractor[EmployeeInfo]):
             if table.empty:
                 continue
                 
-            self.logger.debug(f"Processing table {i} ({table.shape[0]}x{table.shape[1]})")
+            self.logger.debug("Processing table %d (%dx%d)", i, table.shape[0], table.shape[1])
             
             # Try different extraction strategies
             table_results = self._extract_from_table(table, i)
             
             # Update employee_info with best results
             self._merge_results(employee_info, table_results)
+            
+            if required_fields and self._fields_satisfied(employee_info, required_fields, min_confidence):
+                self.logger.debug("Required fields filled after %d of %d tables, stopping early", i + 1, len(tables))
+                break
         
         # Post-process and validate
         employee_info = self._post_process_employee_info(employee_info)
         
-        self.logger.info(f"Employee extraction complete: "
-                        f"Name: {employee_info.name}, PAN: {employee_info.pan}")
+        self.logger.info("Employee extraction complete: Name: %s, PAN: %s",
+                         employee_info.name, employee_info.pan)
         
         return employee_info
     
-    def extract_with_confidence(self, tables: List[pd.DataFrame], text_data: Optional[Dict[str, Any]] = None) -> ExtractionResult[EmployeeInfo]:
+    def extract_with_confidence(self, tables: List[pd.DataFrame], text_data: Optional[Dict[str, Any]] = None,
+                                required_fields: Optional[Sequence[str]] = None,
+                                min_confidence: float = 0.8) -> ExtractionResult[EmployeeInfo]:
         """
         Extract employee info with confidence scores (IExtractor interface)
         
         Returns:
             ExtractionResult with employee info and confidence scores
         """
-        employee_info = self.extract_employee_info(tables, text_data)
+        employee_info = self.extract_employee_info(tables, text_data, required_fields, min_confidence)
         
         # Calculate confidence scores for each field
         confidence_scores = self._calculate_confidence_scores(tables, employee_info)
@@ -191,11 +204,12 @@ class EmployeeExtractor(IExtractor[EmployeeInfo]):
         """Extract using key-value structure detection (no regex for data)"""
         
         results = {}
+        cells = cell_matrix(table)
         
         # Look for key-value structure in the table
         for row_idx in range(len(table)):
             for col_idx in range(len(table.columns)):
-                cell_value = str(table.iloc[row_idx, col_idx]).strip()
+                cell_value = cells[row_idx, col_idx]
                 
                 # Check if this cell contains an employee header
                 for header in self.employee_section_headers['key_value_employee_section']:
@@ -216,22 +230,23 @@ class EmployeeExtractor(IExtractor[EmployeeInfo]):
     
     def _find_adjacent_value(self, table: pd.DataFrame, row_idx: int, col_idx: int) -> str:
         """Find value adjacent to a header cell"""
+        cells = cell_matrix(table)
         
         # Check right (next column)
         if col_idx + 1 < len(table.columns):
-            value = str(table.iloc[row_idx, col_idx + 1]).strip()
+            value = cells[row_idx, col_idx + 1]
             if value and value.lower() not in ['nan', 'none', ':', '']:
                 return value
         
         # Check next column after colon
         if col_idx + 2 < len(table.columns):
-            value = str(table.iloc[row_idx, col_idx + 2]).strip()
+            value = cells[row_idx, col_idx + 2]
             if value and value.lower() not in ['nan', 'none', ':', '']:
                 return value
         
         # Check below (next row, same column)
         if row_idx + 1 < len(table):
-            value = str(table.iloc[row_idx + 1, col_idx]).strip()
+            value = cells[row_idx + 1, col_idx]
             if value and value.lower() not in ['nan', 'none', ':', '']:
                 return value
         
@@ -333,10 +348,11 @@ class EmployeeExtractor(IExtractor[EmployeeInfo]):
         """Extract employee data from side-by-side employer/employee columns (structure-based)"""
         
         results = {}
+        cells = cell_matrix(table)
         
         for row_idx in range(len(table)):
             for col_idx in range(len(table.columns)):
-                cell_value = str(table.iloc[row_idx, col_idx]).strip()
+                cell_value = cells[row_idx, col_idx]
                 
                 # Look for employee address section headers
                 for header in self.employee_section_headers['employee_address_section']:
@@ -345,7 +361,7 @@ class EmployeeExtractor(IExtractor[EmployeeInfo]):
                         
                         # Look for employee data in the next few rows in this column
                         for data_row in range(row_idx + 1, min(row_idx + 6, len(table))):
-                            employee_cell = str(table.iloc[data_row, employee_column]).strip()
+                            employee_cell = cells[data_row, employee_column]
                             
                             if employee_cell and employee_cell.lower() not in ['nan', 'none', '']:
                                 # Split multi-line employee data
@@ -381,7 +397,7 @@ class EmployeeExtractor(IExtractor[EmployeeInfo]):
                         
                         # Check next row for PAN value
                         if row_idx + 1 < len(table):
-                            pan_cell = str(table.iloc[row_idx + 1, employee_column]).strip()
+                            pan_cell = cells[row_idx + 1, employee_column]
                             if self._is_valid_pan_format(pan_cell):
                                 results['pan'] = {
                                     'value': pan_cell,
@@ -398,7 +414,7 @@ class EmployeeExtractor(IExtractor[EmployeeInfo]):
                         
                         # Check next row for Employee ID
                         if row_idx + 1 < len(table):
-                            id_cell = str(table.iloc[row_idx + 1, employee_column]).strip()
+                            id_cell = cells[row_idx + 1, employee_column]
                             if self._is_valid_employee_id(id_cell):
                                 results['employee_id'] = {
                                     'value': id_cell,
@@ -440,11 +456,12 @@ class EmployeeExtractor(IExtractor[EmployeeInfo]):
         """Extract from structured table format"""
         
         results = {}
+        cells = cell_matrix(table)
         
         # Look through table cells for employee data
         for row_idx in range(len(table)):
             for col_idx in range(len(table.columns)):
-                cell_value = str(table.iloc[row_idx, col_idx]).strip()
+                cell_value = cells[row_idx, col_idx]
                 
                 if not cell_value or cell_value.lower() in ['nan', 'none', '']:
                     continue
@@ -475,6 +492,7 @@ class EmployeeExtractor(IExtractor[EmployeeInfo]):
     
     def _extract_from_verification_section_DISABLED(self, table: pd.DataFrame, table_text: str) -> Dict[str, Any]:
         """Extract data from verification section (commonly contains designation info)"""
+        cells = cell_matrix(table)
         
         results = {}
         
@@ -502,7 +520,7 @@ class EmployeeExtractor(IExtractor[EmployeeInfo]):
                 ]
                 
                 if any(indicator in context_text for indicator in signing_officer_indicators):
-                    self.logger.debug(f"Rejecting designation from signing officer section: {line_clean}")
+                    self.logger.debug("Rejecting designation from signing officer section: %s", line_clean)
                     continue
                 
                 # Extract designation after this phrase
@@ -535,7 +553,7 @@ class EmployeeExtractor(IExtractor[EmployeeInfo]):
                 ]
                 
                 if any(indicator in context_text for indicator in signing_officer_indicators):
-                    self.logger.debug(f"Rejecting designation: pattern from signing officer section: {line_clean}")
+                    self.logger.debug("Rejecting designation: pattern from signing officer section: %s", line_clean)
                     continue
                 
                 # Check if designation value is on same line
@@ -583,7 +601,7 @@ class EmployeeExtractor(IExtractor[EmployeeInfo]):
         # Strategy for table-based verification section
         for row_idx in range(len(table)):
             for col_idx in range(len(table.columns)):
-                cell_value = str(table.iloc[row_idx, col_idx]).strip()
+                cell_value = cells[row_idx, col_idx]
                 
                 # Look for designation section headers
                 for header in self.employee_section_headers['designation_section']:
@@ -630,11 +648,12 @@ class EmployeeExtractor(IExtractor[EmployeeInfo]):
     def _table_to_text(self, table: pd.DataFrame) -> str:
         """Convert table to searchable text"""
         text_parts = []
+        cells = cell_matrix(table)
         
         for row_idx in range(len(table)):
             row_parts = []
             for col_idx in range(len(table.columns)):
-                cell_value = str(table.iloc[row_idx, col_idx]).strip()
+                cell_value = cells[row_idx, col_idx]
                 if cell_value and cell_value.lower() not in ['nan', 'none']:
                     row_parts.append(cell_value)
             
@@ -646,6 +665,7 @@ class EmployeeExtractor(IExtractor[EmployeeInfo]):
     def _get_cell_context(self, table: pd.DataFrame, row_idx: int, col_idx: int) -> str:
         """Get context around a cell for validation"""
         context_parts = []
+        cells = cell_matrix(table)
         
         # Check surrounding cells
         for r_offset in [-1, 0, 1]:
@@ -654,7 +674,7 @@ class EmployeeExtractor(IExtractor[EmployeeInfo]):
                 new_col = col_idx + c_offset
                 
                 if (0 <= new_row < len(table) and 0 <= new_col < len(table.columns)):
-                    cell_value = str(table.iloc[new_row, new_col]).strip()
+                    cell_value = cells[new_row, new_col]
                     if cell_value and cell_value.lower() not in ['nan', 'none']:
                         context_parts.append(cell_value)
         
@@ -703,6 +723,16 @@ class EmployeeExtractor(IExtractor[EmployeeInfo]):
                     setattr(employee_info, field_name, new_value)
                     setattr(employee_info, f'_{field_name}_confidence', new_confidence)
     
+    def _fields_satisfied(self, employee_info: EmployeeInfo, fields: Sequence[str], min_confidence: float) -> bool:
+        """Check whether all fields have a value with at least min_confidence"""
+        
+        for field_name in fields:
+            if not getattr(employee_info, field_name, None):
+                return False
+            if getattr(employee_info, f'_{field_name}_confidence', 0.0) < min_confidence:
+                return False
+        return True
+    
     def _post_process_employee_info(self, employee_info: EmployeeInfo) -> EmployeeInfo:
         """Post-process and clean employee info"""
         
@@ -773,9 +803,9 @@ class EmployeeExtractor(IExtractor[EmployeeInfo]):
                     if hasattr(employee_info, confidence_attr):
                         setattr(employee_info, confidence_attr, 0.9)
                     
-                    self.logger.debug(f"Set {model_field} from text data: {value}")
+                    self.logger.debug("Set %s from text data: %s", model_field, value)
                 else:
-                    self.logger.debug(f"Empty value for {text_field}: {repr(text_data[text_field])}")
+                    self.logger.debug("Empty value for %s: %r", text_field, text_data[text_field])
             else:
-                self.logger.debug(f"{text_field} not found in text_data or empty")
+                self.logger.debug("%s not found in text_data or empty", text_field)
     
@@ -17,6 +17,7 @@ import pandas as pd
 from form16x.form16_parser.models.form16_models import EmployerInfo
 from form16x.form16_parser.extractors.base.interfaces import IExtractor, ExtractionResult
 from form16x.form16_parser.pdf.table_classifier import TableType
+from form16x.form16_parser.utils.table_utils import cell_matrix
 
 logger = logging.getLogger(__name__)
 
@@ -158,34 +159,36 @@ class EmployerExtractor(IExtractor[EmployerInfo]):
     
     def _extract_from_address_block(self, table: pd.DataFrame, employer_info: EmployerInfo):
         """Extract employer data from address block format"""
+        cells = cell_matrix(table)
         
         for row_idx in range(len(table)):
             for col_idx in range(len(table.columns)):
-                cell_value = str(table.iloc[row_idx, col_idx]).strip()
+                cell_value = cells[row_idx, col_idx]
                 
                 # Look for employer name/address headers
                 if any(header in cell_value.lower() for header in self.employer_headers['name_address']):
                     # Check next row for employer data
                     if row_idx + 1 < len(table):
                         # Look in the same column first
-                        next_cell = str(table.iloc[row_idx + 1, col_idx]).strip()
+                        next_cell = cells[row_idx + 1, col_idx]
                         if self._is_company_name(next_cell):
                             self._parse_employer_block(next_cell, employer_info)
                         
                         # Also check adjacent columns
                         for offset in [-1, 1]:
                             if 0 <= col_idx + offset < len(table.columns):
-                                adjacent_cell = str(table.iloc[row_idx + 1, col_idx + offset]).strip()
+                                adjacent_cell = cells[row_idx + 1, col_idx + offset]
                                 if self._is_company_name(adjacent_cell):
                                     self._parse_employer_block(adjacent_cell, employer_info)
     
     def _extract_from_key_value_pairs(self, table: pd.DataFrame, employer_info: EmployerInfo):
         """Extract from key-value pair format"""
+        cells = cell_matrix(table)
         
         for row_idx in range(len(table)):
             if len(table.columns) >= 2:
-                key = str(table.iloc[row_idx, 0]).strip().lower()
-                value = str(table.iloc[row_idx, 1]).strip()
+                key = cells[row_idx, 0].lower()
+                value = cells[row_idx, 1]
                 
                 # Extract employer name
                 if 'employer name' in key or 'deductor name' in key or 'company name' in key:
@@ -204,28 +207,30 @@ class EmployerExtractor(IExtractor[EmployerInfo]):
     
     def _extract_tan_from_headers(self, table: pd.DataFrame, employer_info: EmployerInfo):
         """Extract TAN from tables with TAN headers"""
+        cells = cell_matrix(table)
         
         for row_idx in range(len(table)):
             for col_idx in range(len(table.columns)):
-                cell_value = str(table.iloc[row_idx, col_idx]).strip().lower()
+                cell_value = cells[row_idx, col_idx].lower()
                 
                 # Look for TAN headers
                 if any(header in cell_value for header in self.employer_headers['tan']):
                     # Check next row for TAN value
                     if row_idx + 1 < len(table):
-                        tan_value = str(table.iloc[row_idx + 1, col_idx]).strip().upper()
+                        tan_value = cells[row_idx + 1, col_idx].upper()
                         if self.tan_pattern.match(tan_value):
                             employer_info.tan = tan_value
                     
                     # Also check same row adjacent columns
                     for offset in [1, 2]:
                         if col_idx + offset < len(table.columns):
-                            tan_value = str(table.iloc[row_idx, col_idx + offset]).strip().upper()
+                            tan_value = cells[row_idx, col_idx + offset].upper()
                             if self.tan_pattern.match(tan_value):
                                 employer_info.tan = tan_value
     
     def _extract_from_columns(self, table: pd.DataFrame, employer_info: EmployerInfo):
         """Extract from column-based format (employer vs employee columns)"""
+        cells = cell_matrix(table)
         
         # Identify employer column
         employer_col = None
@@ -233,7 +238,7 @@ class EmployerExtractor(IExtractor[EmployerInfo]):
         for col_idx in range(len(table.columns)):
             # Check first few rows for employer indicators
             for row_idx in range(min(3, len(table))):
-                cell_value = str(table.iloc[row_idx, col_idx]).strip().lower()
+                cell_value = cells[row_idx, col_idx].lower()
                 if 'employer' in cell_value or 'deductor' in cell_value:
                     employer_col = col_idx
                     break
@@ -241,7 +246,7 @@ class EmployerExtractor(IExtractor[EmployerInfo]):
         if employer_col is not None:
             # Extract data from employer column
             for row_idx in range(len(table)):
-                cell_value = str(table.iloc[row_idx, employer_col]).strip()
+                cell_value = cells[row_idx, employer_col]
                 
                 # Check if it's company data
                 if self._is_company_name(cell_value):
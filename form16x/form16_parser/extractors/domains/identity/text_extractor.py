@@ -8,10 +8,95 @@ This module extracts data using colon-split patterns and other text-based method
 
 import logging
 import re
-from typing import Dict, Optional, Any, List
+from types import MappingProxyType
+from typing import Dict, Optional, Any, List, Mapping, Tuple
 from pathlib import Path
 
 
+# Compiled once at import and shared read-only by every extractor instance
+IDENTITY_PATTERNS: Mapping[str, re.Pattern] = MappingProxyType({
+    # High priority patterns - employee declaration/certification sections
+    'employee_name': re.compile(r'(?:Full\s+Name\s*:\s*([A-Z][A-Z\s]+)(?:\s+(?:Designation|EMPID|Page))|do\s+hereby\s+(?:declare|certify).*?Full\s+Name\s*:\s*([A-Z][A-Z\s]+))', re.IGNORECASE | re.DOTALL),
+    'employee_pan': re.compile(r'(?:Employee|EMP)\s*PAN\s*[:\-]?\s*([A-Z]{5}[0-9]{4}[A-Z]{1})', re.IGNORECASE),
+    'employee_address': re.compile(r'(?:Employee|EMP)\s*Address\s*[:\-]?\s*(.+?)(?:\n\n|\nPAN|\n[A-Z]{4})', re.IGNORECASE | re.DOTALL),
+    'employer_name': re.compile(r'(?:Name\s+of\s+the\s+Employer|Employer\s+Name)\s*[:\-]?\s*(.+?)(?:\n|TAN)', re.IGNORECASE),
+    'employer_tan': re.compile(r'TAN\s*[:\-]?\s*([A-Z]{4}[0-9]{5}[A-Z]{1})', re.IGNORECASE),
+    'employer_pan': re.compile(r'(?:Employer|EMP)\s*PAN\s*[:\-]?\s*([A-Z]{5}[0-9]{4}[A-Z]{1})', re.IGNORECASE),
+    'assessment_year': re.compile(r'Assessment\s+Year\s*[:\-]?\s*(\d{4}-\d{2})', re.IGNORECASE),
+    'financial_year': re.compile(r'Financial\s+Year\s*[:\-]?\s*(\d{4}-\d{2})', re.IGNORECASE),
+})
+
+# Common colon-separated labels in Form 16 - Be specific to avoid false matches
+_COLON_FIELD_LABELS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'employee_name': ('Employee Name', 'Name of the Employee', 'Employee Full Name'),
+    'employee_pan': ('Employee PAN', 'PAN of Employee', 'PAN of the Employee'),
+    'employee_address': ('Employee Address', 'Address of Employee', 'Address of the Employee'),
+    'employer_name': ('Name of the Employer', 'Employer Name', 'Name of Employer'),
+    'employer_tan': ('TAN', 'TAN Number', 'TAN of the Employer', 'TAN of Employer'),
+    'employer_pan': ('Employer PAN', 'PAN of Employer', 'PAN of the Employer'),
+    'assessment_year': ('Assessment Year', 'A.Y.'),
+    'financial_year': ('Financial Year', 'F.Y.'),
+})
+
+# Lower-cased key labels for the line-by-line strategy
+_LINE_FIELD_LABELS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'employee_name': (
+        'employee name',
+        'name of the employee',
+        'name and address of the employee',
+        'name and address of employee',
+        'full name',
+        'emp name',
+        'employee full name'
+    ),
+    'employee_pan': (
+        'employee pan',
+        'pan of employee',
+        'pan of the employee',
+        'emp pan',
+        'employee permanent account number'
+    ),
+    'employee_address': (
+        'employee address',
+        'address of employee',
+        'address of the employee',
+        'emp address',
+        'employee residential address'
+    ),
+    'employer_name': (
+        'name of the employer',
+        'name and address of the employer',
+        'name and address of employer',
+        'employer name',
+        'name of employer',
+        'company name'
+    ),
+    'employer_tan': (
+        'tan',
+        'tan number',
+        'employer tan',
+        'tax deduction account number'
+    ),
+    'employer_pan': (
+        'employer pan',
+        'pan of employer',
+        'company pan'
+    ),
+    'assessment_year': (
+        'assessment year',
+        'a.y.',
+        'ay',
+        'assessment yr'
+    ),
+    'financial_year': (
+        'financial year',
+        'f.y.',
+        'fy',
+        'financial yr'
+    ),
+})
+
+
 class IdentityTextExtractor:
     """
     Text-based extractor for identity information from PDF documents.
@@ -22,19 +107,9 @@ class IdentityTextExtractor:
         self.logger = logging.getLogger(__name__)
         self._patterns = self._initialize_patterns()
     
-    def _initialize_patterns(self) -> Dict[str, re.Pattern]:
-        """Initialize regex patterns for identity extraction with priority ordering"""
-        return {
-            # High priority patterns - employee declaration/certification sections
-            'employee_name': re.compile(r'(?:Full\s+Name\s*:\s*([A-Z][A-Z\s]+)(?:\s+(?:Designation|EMPID|Page))|do\s+hereby\s+(?:declare|certify).*?Full\s+Name\s*:\s*([A-Z][A-Z\s]+))', re.IGNORECASE | re.DOTALL),
-            'employee_pan': re.compile(r'(?:Employee|EMP)\s*PAN\s*[:\-]?\s*([A-Z]{5}[0-9]{4}[A-Z]{1})', re.IGNORECASE),
-            'employee_address': re.compile(r'(?:Employee|EMP)\s*Address\s*[:\-]?\s*(.+?)(?:\n\n|\nPAN|\n[A-Z]{4})', re.IGNORECASE | re.DOTALL),
-            'employer_name': re.compile(r'(?:Name\s+of\s+the\s+Employer|Employer\s+Name)\s*[:\-]?\s*(.+?)(?:\n|TAN)', re.IGNORECASE),
-            'employer_tan': re.compile(r'TAN\s*[:\-]?\s*([A-Z]{4}[0-9]{5}[A-Z]{1})', re.IGNORECASE),
-            'employer_pan': re.compile(r'(?:Employer|EMP)\s*PAN\s*[:\-]?\s*([A-Z]{5}[0-9]{4}[A-Z]{1})', re.IGNORECASE),
-            'assessment_year': re.compile(r'Assessment\s+Year\s*[:\-]?\s*(\d{4}-\d{2})', re.IGNORECASE),
-            'financial_year': re.compile(r'Financial\s+Year\s*[:\-]?\s*(\d{4}-\d{2})', re.IGNORECASE),
-        }
+    def _initialize_patterns(self) -> Mapping[str, re.Pattern]:
+        """Regex patterns for identity extraction with priority ordering (shared by all instances)"""
+        return IDENTITY_PATTERNS
     
     def extract_from_text(self, pdf_text: str) -> Dict[str, Any]:
         """
@@ -70,7 +145,7 @@ class IdentityTextExtractor:
                     best_match = self._find_best_employee_name_match(matches)
                     if best_match:
                         extracted_data[field_name] = best_match
-                        self.logger.debug(f"Found {field_name}: {best_match}")
+                        self.logger.debug("Found %s: %s", field_name, best_match)
                 else:
                     # Standard pattern matching for other fields
                     match = pattern.search(pdf_text)
@@ -88,10 +163,10 @@ class IdentityTextExtractor:
                         
                         if value:
                             extracted_data[field_name] = value
-                            self.logger.debug(f"Found {field_name}: {value}")
+                            self.logger.debug("Found %s: %s", field_name, value)
                             
             except Exception as e:
-                self.logger.warning(f"Error extracting {field_name}: {str(e)}")
+                self.logger.warning("Error extracting %s: %s", field_name, e)
         
         # Fallback strategy: Legacy colon-split patterns
         colon_split_data = self._extract_colon_split_patterns(pdf_text)
@@ -101,7 +176,7 @@ class IdentityTextExtractor:
             if key not in extracted_data and value:
                 extracted_data[key] = value
         
-        self.logger.info(f"Text extraction found {len(extracted_data)} identity fields")
+        self.logger.info("Text extraction found %d identity fields", len(extracted_data))
         return extracted_data
     
     def _extract_colon_split_patterns(self, text: str) -> Dict[str, str]:
@@ -119,17 +194,7 @@ class IdentityTextExtractor:
         
         results = {}
         
-        # Common colon-separated patterns in Form 16 - Be specific to avoid false matches
-        colon_patterns = {
-            'employee_name': ['Employee Name', 'Name of the Employee', 'Employee Full Name'],
-            'employee_pan': ['Employee PAN', 'PAN of Employee', 'PAN of the Employee'],
-            'employee_address': ['Employee Address', 'Address of Employee', 'Address of the Employee'],
-            'employer_name': ['Name of the Employer', 'Employer Name', 'Name of Employer'],
-            'employer_tan': ['TAN', 'TAN Number', 'TAN of the Employer', 'TAN of Employer'],
-            'employer_pan': ['Employer PAN', 'PAN of Employer', 'PAN of the Employer'],
-            'assessment_year': ['Assessment Year', 'A.Y.'],
-            'financial_year': ['Financial Year', 'F.Y.'],
-        }
+        colon_patterns = _COLON_FIELD_LABELS
         
         lines = text.split('\n')
         
@@ -221,62 +286,7 @@ class IdentityTextExtractor:
         lines = pdf_text.split('\n')
         
         # Field patterns to look for (key patterns that indicate the field)
-        field_patterns = {
-            'employee_name': [
-                'employee name',
-                'name of the employee', 
-                'name and address of the employee',
-                'name and address of employee',
-                'full name',
-                'emp name',
-                'employee full name'
-            ],
-            'employee_pan': [
-                'employee pan',
-                'pan of employee',
-                'pan of the employee',
-                'emp pan',
-                'employee permanent account number'
-            ],
-            'employee_address': [
-                'employee address',
-                'address of employee',
-                'address of the employee', 
-                'emp address',
-                'employee residential address'
-            ],
-            'employer_name': [
-                'name of the employer',
-                'name and address of the employer',
-                'name and address of employer',
-                'employer name',
-                'name of employer',
-                'company name'
-            ],
-            'employer_tan': [
-                'tan',
-                'tan number',
-                'employer tan',
-                'tax deduction account number'
-            ],
-            'employer_pan': [
-                'employer pan',
-                'pan of employer',
-                'company pan'
-            ],
-            'assessment_year': [
-                'assessment year',
-                'a.y.',
-                'ay',
-                'assessment yr'
-            ],
-            'financial_year': [
-                'financial year',
-                'f.y.',
-                'fy',
-                'financial yr'
-            ]
-        }
+        field_patterns = _LINE_FIELD_LABELS
         
         # Track context for employee name scoring
         context_window = []
@@ -301,7 +311,7 @@ class IdentityTextExtractor:
                     
                     for pattern in patterns:
                         if self._line_matches_pattern(line_lower, pattern):
-                            self.logger.debug(f"Found pattern match for {field_name}: '{line}' matches '{pattern}'")
+                            self.logger.debug("Found pattern match for %s: '%s' matches '%s'", field_name, line, pattern)
                             # Look for value in next line
                             if i + 1 < len(lines):
                                 next_line = lines[i + 1].strip()
@@ -327,15 +337,16 @@ class IdentityTextExtractor:
                                             # Accept valid names with reasonable context scores
                                             if context_score > -5:
                                                 results[field_name] = cleaned_value
-                                                self.logger.debug(f"Multi-line found {field_name}: {cleaned_value} (score: {context_score})")
+                                                self.logger.debug("Multi-line found %s: %s (score: %s)", field_name, cleaned_value, context_score)
                                             else:
-                                                self.logger.debug(f"Multi-line rejected {field_name}: {cleaned_value} (low context score: {context_score})")
+                                                self.logger.debug("Multi-line rejected %s: %s (low context score: %s)",
+                                                                  field_name, cleaned_value, context_score)
                                     else:
                                         # For other fields, use direct extraction
                                         cleaned_value = self._clean_field_value(field_name, value_line)
                                         if cleaned_value:
                                             results[field_name] = cleaned_value
-                                            self.logger.debug(f"Multi-line found {field_name}: {cleaned_value}")
+                                            self.logger.debug("Multi-line found %s: %s", field_name, cleaned_value)
                                     break
                 
                 # Keep track of context lines for employee name scoring
@@ -385,15 +396,15 @@ class IdentityTextExtractor:
                                 # Accept valid names with reasonable context scores
                                 if context_score > -5:
                                     results[field_name] = cleaned_value
-                                    self.logger.debug(f"Line-by-line found {field_name}: {cleaned_value} (score: {context_score})")
+                                    self.logger.debug("Line-by-line found %s: %s (score: %s)", field_name, cleaned_value, context_score)
                                 else:
-                                    self.logger.debug(f"Rejected {field_name}: {cleaned_value} (low context score: {context_score})")
+                                    self.logger.debug("Rejected %s: %s (low context score: %s)", field_name, cleaned_value, context_score)
                         else:
                             # For non-name fields, use direct extraction
                             cleaned_value = self._clean_field_value(field_name, value_part)
                             if cleaned_value:
                                 results[field_name] = cleaned_value
-                                self.logger.debug(f"Line-by-line found {field_name}: {cleaned_value}")
+                                self.logger.debug("Line-by-line found %s: %s", field_name, cleaned_value)
                         break
             
             # Update context window with current line
@@ -401,7 +412,7 @@ class IdentityTextExtractor:
             if len(context_window) > 10:
                 context_window.pop(0)
         
-        self.logger.debug(f"Line-by-line extraction found {len(results)} fields: {list(results.keys())}")
+        self.logger.debug("Line-by-line extraction found %d fields: %s", len(results), list(results))
         return results
     
     def _line_matches_pattern(self, line_text: str, pattern: str) -> bool:
@@ -561,14 +572,15 @@ class IdentityTextExtractor:
         # Only accept candidates with positive scores (employee sections)
         best_score = candidate_names[0][1]
         if best_score <= 0:
-            self.logger.debug(f"All employee name candidates have negative scores, rejecting all")
-            self.logger.debug(f"Best candidate: {candidate_names[0][0]} (score: {best_score})")
+            self.logger.debug("All employee name candidates have negative scores, rejecting all")
+            self.logger.debug("Best candidate: %s (score: %s)", candidate_names[0][0], best_score)
             return None
         
         best_name = candidate_names[0][0]
         
-        self.logger.debug(f"Employee name candidates: {[(name, score) for name, score, _ in candidate_names]}")
-        self.logger.debug(f"Selected best match: {best_name}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Employee name candidates: %s", [(name, score) for name, score, _ in candidate_names])
+        self.logger.debug("Selected best match: %s", best_name)
         
         return best_name
     
@@ -17,6 +17,7 @@ from typing import Dict, Any, List, Optional, Tuple
 from form16x.form16_parser.extractors.base.abstract_field_extractor import AbstractFieldExtractor
 from form16x.form16_parser.models.form16_models import Form16Metadata
 from form16x.form16_parser.pdf.table_classifier import TableType
+from form16x.form16_parser.utils.table_utils import cell_matrix
 
 
 class MetadataExtractorComponent(AbstractFieldExtractor):
@@ -59,11 +60,12 @@ class MetadataExtractorComponent(AbstractFieldExtractor):
         
         for table_info in tables:
             table = table_info['table']
+            cells = cell_matrix(table)
             
             # Extract metadata fields using comprehensive pattern matching approach
             for i in range(len(table)):
                 for j in range(len(table.columns)):
-                    cell_value = str(table.iloc[i, j]).strip()
+                    cell_value = cells[i, j]
                     cell_lower = cell_value.lower()
                     
                     # Skip empty cells
@@ -313,6 +315,7 @@ class MetadataExtractorComponent(AbstractFieldExtractor):
     def _search_nearby_for_metadata_value(self, table: pd.DataFrame, center_row: int, 
                                         center_col: int, validation_func) -> Optional[str]:
         """Search nearby cells for a value that passes validation (based on older codebase)"""
+        cells = cell_matrix(table)
         
         # Define search positions (same as older codebase approach)
         search_positions = [
@@ -327,7 +330,7 @@ class MetadataExtractorComponent(AbstractFieldExtractor):
         
         for row_pos, col_pos in search_positions:
             if 0 <= row_pos < len(table) and 0 <= col_pos < len(table.columns):
-                cell_value = str(table.iloc[row_pos, col_pos]).strip()
+                cell_value = cells[row_pos, col_pos]
                 if cell_value and cell_value.lower() not in ['nan', 'none', '']:
                     if validation_func(cell_value):
                         return cell_value
@@ -17,6 +17,7 @@ from typing import Dict, Any, List, Optional, Tuple
 from form16x.form16_parser.extractors.base.abstract_field_extractor import AbstractFieldExtractor
 from form16x.form16_parser.models.form16_models import TaxDeductionQuarterly
 from form16x.form16_parser.pdf.table_classifier import TableType
+from form16x.form16_parser.utils.table_utils import cell_matrix
 
 
 class QuarterlyTdsExtractorComponent(AbstractFieldExtractor):
@@ -62,12 +63,13 @@ class QuarterlyTdsExtractorComponent(AbstractFieldExtractor):
         
         for table_info in tables:
             table = table_info['table']
+            cells = cell_matrix(table)
             
             # First, find the header row with "Quarter(s)" to understand table structure
             header_row_idx = None
             for i in range(len(table)):
                 for j in range(len(table.columns)):
-                    cell_value = str(table.iloc[i, j]).lower()
+                    cell_value = cells[i, j].lower()
                     if 'quarter(s)' in cell_value or 'quarters' in cell_value:
                         header_row_idx = i
                         break
@@ -81,7 +83,7 @@ class QuarterlyTdsExtractorComponent(AbstractFieldExtractor):
             header_columns = {}
             if header_row_idx is not None:
                 for j in range(len(table.columns)):
-                    header_text = str(table.iloc[header_row_idx, j]).lower()
+                    header_text = cells[header_row_idx, j].lower()
                     
                     # Try to identify column purposes
                     if 'quarter' in header_text and 'quarter' not in header_columns:
@@ -98,7 +100,7 @@ class QuarterlyTdsExtractorComponent(AbstractFieldExtractor):
             # Extract quarterly data from subsequent rows - enhanced approach from older codebase
             for i in range(header_row_idx + 1, len(table)):
                 # Get the whole row as text to search for quarter indicators
-                row_text = ' '.join([str(table.iloc[i, j]) for j in range(len(table.columns))]).upper()
+                row_text = ' '.join(cells[i]).upper()
                 
                 # Check if this row contains quarter data (Q1, Q2, Q3, Q4)
                 quarter_match = None
@@ -109,7 +111,7 @@ class QuarterlyTdsExtractorComponent(AbstractFieldExtractor):
                 
                 # Also check specific quarter cell if column is identified
                 if not quarter_match and 'quarter' in header_columns:
-                    quarter_cell = str(table.iloc[i, header_columns['quarter']]).upper()
+                    quarter_cell = cells[i, header_columns['quarter']].upper()
                     for quarter in ['Q1', 'Q2', 'Q3', 'Q4']:
                         if quarter in quarter_cell:
                             quarter_match = quarter
@@ -120,13 +122,13 @@ class QuarterlyTdsExtractorComponent(AbstractFieldExtractor):
                     
                     # Enhanced receipt number extraction (working PDF fix)
                     if 'receipt' in header_columns:
-                        receipt_value = str(table.iloc[i, header_columns['receipt']]).strip()
+                        receipt_value = cells[i, header_columns['receipt']]
                         if receipt_value and self._is_valid_receipt_number(receipt_value):
                             tds_record.receipt_number = receipt_value.upper()
                     else:
                         # Scan row for receipt pattern if no column mapping
                         for j in range(len(table.columns)):
-                            cell_value = str(table.iloc[i, j]).strip()
+                            cell_value = cells[i, j]
                             
                             # PDF receipt pattern: Uppercase alphanumeric like ABCD1234
                             if (cell_value and 'nan' not in cell_value.lower() and 
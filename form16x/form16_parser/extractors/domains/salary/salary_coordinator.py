@@ -14,7 +14,7 @@ Key Features:
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import pandas as pd
 
 from .table_structure_analyzer import TableStructureAnalyzer
@@ -53,6 +53,24 @@ class SalaryCoordinator:
         Returns:
             Dictionary with salary components and their amounts
         """
+        results, _ = self.extract_components_with_perquisites(tables_data)
+        return results
+    
+    def extract_components_with_perquisites(
+        self, tables_data: List[pd.DataFrame]
+    ) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """
+        Enhanced multi-table salary extraction with the detailed perquisite breakdown
+        
+        The breakdown is returned rather than stored on the coordinator, so one
+        coordinator can serve several documents at once.
+        
+        Args:
+            tables_data: List of DataFrame objects from salary tables
+            
+        Returns:
+            Tuple of (salary components and their amounts, detailed perquisites)
+        """
         
         self.logger.info(f"Starting multi-table salary extraction with {len(tables_data)} tables")
         
@@ -104,9 +122,6 @@ class SalaryCoordinator:
         self.logger.info("Running specialized perquisite extraction for detailed breakdown")
         perquisite_results = self.perquisite_extractor.extract_perquisites(tables_data)
         
-        # Store detailed perquisite results (but don't include in results dict to avoid comparison issues)
-        self.detailed_perquisites = perquisite_results
-        
         # Only update total perquisites if not found in semantic extraction or if higher
         if perquisite_results.get('total_perquisites', 0) > 0:
             if results.get('perquisites_value', 0) == 0 or not semantic_found:
@@ -124,7 +139,8 @@ class SalaryCoordinator:
         self.logger.info(f"Extracted {extracted_count}/{len(self.target_components)} "
                         f"salary components")
         
-        return results
+        # Detailed perquisites are returned separately to avoid comparison issues in results
+        return results, perquisite_results
     
     def create_salary_breakdown(self, components: Dict[str, float]) -> SalaryBreakdown:
         """
@@ -15,6 +15,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from form16x.form16_parser.extractors.base.abstract_field_extractor import AbstractFieldExtractor
 from form16x.form16_parser.models.form16_models import SalaryBreakdown
 from form16x.form16_parser.pdf.table_classifier import TableType
+from form16x.form16_parser.utils.table_utils import cell_matrix
 
 
 class EnhancedSalaryExtractorComponent(AbstractFieldExtractor):
@@ -268,7 +269,7 @@ class EnhancedSalaryExtractorComponent(AbstractFieldExtractor):
             return None, {}
         
         # Extract components using coordinator
-        components = self.coordinator.extract_all_components(table_dfs)
+        components, detailed_perquisites = self.coordinator.extract_components_with_perquisites(table_dfs)
         
         # Create SalaryBreakdown
         salary_breakdown = self.coordinator.create_salary_breakdown(components)
@@ -277,13 +278,10 @@ class EnhancedSalaryExtractorComponent(AbstractFieldExtractor):
         metadata = {
             'extraction_method': 'coordinator_based',
             'tables_processed': len(table_dfs),
-            'components_found': sum(1 for v in components.values() if v > 0)
+            'components_found': sum(1 for v in components.values() if v > 0),
+            'detailed_perquisites': detailed_perquisites
         }
         
-        # Include detailed perquisites if available
-        if hasattr(self.coordinator, 'detailed_perquisites'):
-            metadata['detailed_perquisites'] = self.coordinator.detailed_perquisites
-        
         return salary_breakdown, metadata
     
     # Legacy position-based extraction method removed - using coordinator-based approach
@@ -346,9 +344,10 @@ class EnhancedSalaryExtractorComponent(AbstractFieldExtractor):
         """
         import re
         
+        cells = cell_matrix(table)
         for row_idx in range(len(table)):
             for col_idx in range(len(table.columns)):
-                cell_value = str(table.iloc[row_idx, col_idx]).strip().lower()
+                cell_value = cells[row_idx, col_idx].lower()
                 
                 if not cell_value or cell_value in ['nan', 'none', '']:
                     continue
@@ -19,10 +19,12 @@ Processing Levels:
 import logging
 import pandas as pd
 import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from decimal import Decimal
 from enum import IntEnum
 
 from form16x.form16_parser.models.form16_models import Form16Document
+from form16x.form16_parser.models.extraction_records import DocumentDraft
 from form16x.form16_parser.pdf.table_classifier import TableType
 
 # Import traditional extractor as baseline
@@ -52,6 +54,39 @@ from form16x.form16_parser.extractors.domains.tax.tax_computation_extractor impo
 from form16x.form16_parser.pdf.simple_classifier import get_simple_table_classifier
 
 
+# Domain extractors in the order their results are merged into Form16Document
+DOMAIN_EXTRACTION_ORDER = ('employee', 'employer', 'salary', 'deductions', 'tax', 'metadata', 'tds')
+
+# RoutingCoordinator extractor route serving each domain
+DOMAIN_ROUTES = {
+    'employee': 'identity',
+    'employer': 'identity',
+    'salary': 'salary',
+    'deductions': 'deductions',
+    'tax': 'tax',
+    'metadata': 'metadata',
+    'tds': 'tax',
+}
+
+# Document section and fields a routed table subset must fill; anything less
+# falls back to the full table set. Zero amounts and empty strings count as
+# missing, since extractors report fields they found no table for as zero.
+# For quarterly TDS at least one quarter must carry every listed field.
+ROUTED_COVERAGE_FIELDS = {
+    'employee': ('employee', ('name', 'pan', 'address')),
+    'employer': ('employer', ('name', 'tan', 'address')),
+    'salary': ('salary', ('gross_salary', 'net_taxable_salary')),
+    'deductions': ('chapter_via_deductions', ('total_chapter_via_deductions',)),
+    'tax': ('tax_computation', ('gross_total_income', 'tax_on_total_income',
+                                'health_education_cess', 'total_tax_liability')),
+    'metadata': ('metadata', ('certificate_number', 'assessment_year')),
+    'tds': ('quarterly_tds', ('quarter', 'amount_paid', 'tax_deducted')),
+}
+
+# Minimum field confidence for the employee extractor to stop scanning routed tables
+ROUTED_MIN_CONFIDENCE = 0.7
+
+
 class ProcessingLevel(IntEnum):
     """Progressive processing levels with descriptive names"""
     BASIC = 0          # Basic traditional approach (40.2% baseline)
@@ -269,7 +304,7 @@ class EnhancedForm16Extractor:
                     else:
                         scores[domain] = 0.0
                 except Exception as e:
-                    self.logger.warning(f"Scoring failed for domain {domain}: {e}")
+                    self.logger.warning("Scoring failed for domain %s: %s", domain, e)
                     scores[domain] = 0.0
             
             table_info['domain_scores'] = scores
@@ -279,7 +314,7 @@ class EnhancedForm16Extractor:
             # High-value tables get routed to multiple extractors (lowered threshold based on real scores)
             if table_info['best_score'] > 0.5:  # Adjusted from 0.7 to 0.5 based on testing
                 table_info['multi_extractor_candidate'] = True
-                self.logger.info(f"High-value table (score: {table_info['best_score']:.2f}) routed to multiple extractors")
+                self.logger.info("High-value table (score: %.2f) routed to multiple extractors", table_info['best_score'])
             else:
                 table_info['multi_extractor_candidate'] = False
         
@@ -302,7 +337,8 @@ class EnhancedForm16Extractor:
             t for t in all_tables if t['domain_scores'].get('deductions', 0) > 0.5
         ]
         
-        self.logger.info(f"Scoring-based routing: Found {len(enhanced_tables_by_type.get('_high_score_salary', []))} high-scoring salary tables")
+        self.logger.info("Scoring-based routing: Found %d high-scoring salary tables",
+                         len(enhanced_tables_by_type['_high_score_salary']))
         
         return enhanced_tables_by_type
     
@@ -314,18 +350,12 @@ class EnhancedForm16Extractor:
         self.logger.info("Using multi-category classification and routing (Phase 1 implementation)")
         
         # Use the routing coordinator to route tables to multiple extractors
-        routing_results = self.routing_coordinator.coordinate_table_routing(classified_tables)
+        routed_tables = self.route_tables(classified_tables)
         
-        # Create enhanced tables_by_type with routing information
-        tables_by_type = {}
-        for table_info in classified_tables:
-            table_type = table_info['classification'].table_type
-            if table_type not in tables_by_type:
-                tables_by_type[table_type] = []
-            tables_by_type[table_type].append(table_info)
+        tables_by_type = self._group_tables_by_type(classified_tables)
         
-        # Use coordinator-based extraction with optimized table routing
-        return self._extract_with_optimized_tables(tables_by_type, all_tables)
+        # Each extractor starts from its routed subset, highest confidence first
+        return self._extract_with_optimized_tables(tables_by_type, all_tables, routed_tables)
     
 # Fusion methods removed - using coordinator-based extraction instead
     
@@ -343,85 +373,220 @@ class EnhancedForm16Extractor:
         
         return domain_mapping.get(table_type, 'general')
     
-    def _extract_with_optimized_tables(self, tables_by_type: Dict[TableType, List], all_tables: List[pd.DataFrame]) -> Form16Document:
+    def _extract_with_optimized_tables(self, tables_by_type: Dict[TableType, List], all_tables: List[pd.DataFrame],
+                                       routed_tables: Optional[Dict[str, List[Dict]]] = None) -> Form16Document:
         """Extract using optimized table selection - mirror traditional extractor exactly"""
         
-        # Initialize Form16 document
-        form16_doc = Form16Document()
+        # Accumulate into a slotted draft; the Form16Document is built once at the end
+        draft = DocumentDraft()
         
         # Extract using EXACT same approach as traditional extractor
-        try:
-            # 1. Employee information 
-            employee_result = self.employee_extractor.extract_with_confidence(all_tables)
-            if employee_result.data:
-                form16_doc.employee = employee_result.data
-        except Exception as e:
-            self.logger.error(f"Employee extraction failed: {e}")
+        for domain in DOMAIN_EXTRACTION_ORDER:
+            routed = routed_tables.get(DOMAIN_ROUTES[domain]) if routed_tables else None
+            updates, _ = self.run_domain_extractor(domain, tables_by_type, all_tables, routed)
+            draft.apply(updates)
         
-        try:
-            # 2. Employer information 
-            employer_data, employer_metadata = self.employer_extractor.extract(tables_by_type)
-            if employer_data:
-                form16_doc.employer = employer_data
-        except Exception as e:
-            self.logger.error(f"Employer extraction failed: {e}")
+        return draft.to_document()
+    
+    def route_tables(self, classified_tables: List[Dict[str, Any]]) -> Optional[Dict[str, List[Dict]]]:
+        """
+        Route classified tables to extractors.
         
-        try:
-            # 3. Salary extraction
-            salary_data, salary_metadata = self.salary_extractor.extract(tables_by_type)
-            if salary_data:
-                form16_doc.salary = salary_data
-                # Store detailed perquisites if available
-                if 'detailed_perquisites' in salary_metadata:
-                    form16_doc.detailed_perquisites = salary_metadata['detailed_perquisites']
-                    self.logger.info(f"Stored detailed perquisites: {list(salary_metadata['detailed_perquisites'].keys())}")
-        except Exception as e:
-            self.logger.error(f"Salary extraction failed: {e}")
+        Returns:
+            Dict mapping RoutingCoordinator extractor names to their routed
+            table_info dicts (highest confidence first), or None when this
+            processing level does not route tables
+        """
+        if not (self.multi_classifier and self.routing_coordinator):
+            return None
+        
+        routing_results = self.routing_coordinator.coordinate_table_routing(classified_tables)
+        return self.routing_coordinator.build_extractor_table_sets(routing_results, classified_tables)
+    
+    def get_domain_extractor(self, domain: str) -> Any:
+        """Return the extractor instance responsible for a domain"""
+        
+        extractor_attributes = {
+            'employee': 'employee_extractor',
+            'employer': 'employer_extractor',
+            'salary': 'salary_extractor',
+            'deductions': 'deductions_extractor',
+            'tax': 'tax_extractor',
+            'metadata': 'metadata_extractor',
+            'tds': 'tds_extractor',
+        }
+        
+        if domain not in extractor_attributes:
+            raise ValueError(f"Unknown extraction domain: {domain}")
+        
+        return getattr(self, extractor_attributes[domain])
+    
+    def run_domain_extractor(self, domain: str, tables_by_type: Dict[TableType, List],
+                             all_tables: List[pd.DataFrame],
+                             routed_tables: Optional[List[Dict]] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Run a single domain extractor in isolation.
+        
+        Args:
+            domain: One of DOMAIN_EXTRACTION_ORDER
+            tables_by_type: Classified tables grouped by type
+            all_tables: All tables in the document
+            routed_tables: Optional table_info dicts routed to this domain,
+                highest confidence first. They are tried on their own and the
+                full table set is only used when they leave required fields empty.
+            
+        Returns:
+            Tuple of (Form16Document field updates, extractor metadata)
+        """
+        if not routed_tables:
+            return self._run_domain_extractor(domain, tables_by_type, all_tables)
+        
+        routed_by_type = self._group_tables_by_type(routed_tables)
+        routed_frames = [table_info['table'] for table_info in routed_tables]
+        updates, metadata = self._run_domain_extractor(domain, routed_by_type, routed_frames, early_stop=True)
+        
+        if self._has_routed_coverage(domain, updates):
+            metadata['table_selection'] = 'routed'
+            metadata['routed_tables'] = len(routed_tables)
+            return updates, metadata
+        
+        self.logger.debug(f"{domain}: routed tables ({len(routed_tables)}) left required fields empty, "
+                          f"falling back to all {len(all_tables)} tables")
+        updates, metadata = self._run_domain_extractor(domain, tables_by_type, all_tables)
+        metadata['table_selection'] = 'fallback'
+        return updates, metadata
+    
+    def _has_routed_coverage(self, domain: str, updates: Dict[str, Any]) -> bool:
+        """Check whether a routed extraction filled every field the domain requires"""
+        section, fields = ROUTED_COVERAGE_FIELDS[domain]
+        data = updates.get(section)
+        if not data:
+            return False
+        if isinstance(data, list):
+            return any(all(_is_filled(getattr(row, field, None)) for field in fields) for row in data)
+        return all(_is_filled(getattr(data, field, None)) for field in fields)
+    
+    def _run_domain_extractor(self, domain: str, tables_by_type: Dict[TableType, List],
+                              all_tables: List[pd.DataFrame],
+                              early_stop: bool = False) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Run a domain extractor over the given tables"""
+        updates: Dict[str, Any] = {}
+        metadata: Dict[str, Any] = {}
         
         try:
-            # 4. Deductions extraction
-            self.logger.debug("Starting deductions extraction...")
-            deductions_data, deductions_metadata = self.deductions_extractor.extract(tables_by_type)
-            self.logger.debug(f"Deductions extraction completed, data: {deductions_data}")
-            if deductions_data:
-                form16_doc.chapter_via_deductions = deductions_data  # Fixed field assignment
-                if self.logger:
+            if domain == 'employee':
+                # 1. Employee information 
+                if early_stop:
+                    employee_result = self.employee_extractor.extract_with_confidence(
+                        all_tables,
+                        required_fields=ROUTED_COVERAGE_FIELDS['employee'][1],
+                        min_confidence=ROUTED_MIN_CONFIDENCE
+                    )
+                else:
+                    employee_result = self.employee_extractor.extract_with_confidence(all_tables)
+                metadata = dict(employee_result.metadata or {})
+                if employee_result.data:
+                    updates['employee'] = employee_result.data
+            
+            elif domain == 'employer':
+                # 2. Employer information 
+                employer_data, metadata = self.employer_extractor.extract(tables_by_type)
+                if employer_data:
+                    updates['employer'] = employer_data
+            
+            elif domain == 'salary':
+                # 3. Salary extraction
+                salary_data, metadata = self.salary_extractor.extract(tables_by_type)
+                if salary_data:
+                    updates['salary'] = salary_data
+                    # Store detailed perquisites if available
+                    if 'detailed_perquisites' in metadata:
+                        updates['detailed_perquisites'] = metadata['detailed_perquisites']
+                        self.logger.info(f"Stored detailed perquisites: {list(metadata['detailed_perquisites'].keys())}")
+            
+            elif domain == 'deductions':
+                # 4. Deductions extraction
+                self.logger.debug("Starting deductions extraction...")
+                deductions_data, metadata = self.deductions_extractor.extract(tables_by_type)
+                self.logger.debug(f"Deductions extraction completed, data: {deductions_data}")
+                if deductions_data:
+                    updates['chapter_via_deductions'] = deductions_data
                     self.logger.info(f"Deductions extraction successful: section_80c_total={deductions_data.section_80c_total}")
-            else:
-                if self.logger:
+                else:
                     self.logger.warning("Deductions extraction returned no data")
+            
+            elif domain == 'tax':
+                # 5. Tax computation extraction
+                tax_data, metadata = self.tax_extractor.extract(tables_by_type)
+                if tax_data:
+                    updates['tax_computation'] = tax_data
+            
+            elif domain == 'metadata':
+                # 6. Metadata extraction
+                metadata_data, metadata = self.metadata_extractor.extract(tables_by_type)
+                if metadata_data:
+                    updates['metadata'] = metadata_data
+            
+            elif domain == 'tds':
+                # 7. TDS extraction
+                tds_data, metadata = self.tds_extractor.extract(tables_by_type)
+                if tds_data:
+                    updates['quarterly_tds'] = tds_data
+            
+            else:
+                raise ValueError(f"Unknown extraction domain: {domain}")
+        
         except Exception as e:
-            self.logger.error(f"Deductions extraction failed: {e}")
-            # Print full traceback for debugging
-            import traceback
-            if self.logger:
+            label = 'TDS' if domain == 'tds' else domain.capitalize()
+            self.logger.error(f"{label} extraction failed: {e}")
+            if domain == 'deductions':
+                # Print full traceback for debugging
+                import traceback
                 self.logger.error(f"Deductions extraction traceback: {traceback.format_exc()}")
+            metadata = {'status': 'extraction_error', 'error': str(e)}
         
-        try:
-            # 5. Tax computation extraction
-            tax_data, tax_metadata = self.tax_extractor.extract(tables_by_type)
-            if tax_data:
-                form16_doc.tax_computation = tax_data
-        except Exception as e:
-            self.logger.error(f"Tax extraction failed: {e}")
+        return updates, metadata or {}
+    
+    def merge_domain_updates(self, domain_updates: Dict[str, Dict[str, Any]]) -> Form16Document:
+        """
+        Build a Form16Document from per-domain updates.
         
-        try:
-            # 6. Metadata extraction
-            metadata_data, metadata_metadata = self.metadata_extractor.extract(tables_by_type)
-            if metadata_data:
-                form16_doc.metadata = metadata_data
-        except Exception as e:
-            self.logger.error(f"Metadata extraction failed: {e}")
+        Domains are merged in DOMAIN_EXTRACTION_ORDER and the level-specific
+        post-processing (zero value recognition) is applied afterwards, so the
+        result matches what extract_all would have produced, provided each
+        domain was run with its route_tables() subset.
+        """
+        draft = DocumentDraft()
+        for domain in DOMAIN_EXTRACTION_ORDER:
+            draft.apply(domain_updates.get(domain, {}))
+        form16_doc = draft.to_document()
         
-        try:
-            # 7. TDS extraction
-            tds_data, tds_metadata = self.tds_extractor.extract(tables_by_type)
-            if tds_data:
-                form16_doc.quarterly_tds = tds_data
-        except Exception as e:
-            self.logger.error(f"TDS extraction failed: {e}")
+        if self.zero_handler and self.processing_level >= ProcessingLevel.ENHANCED:
+            form16_doc = self.zero_handler.enhance_with_zeros(form16_doc)
         
         return form16_doc
+    
+    def classify_tables(self, tables: List[pd.DataFrame],
+                        page_numbers: Optional[List[int]] = None) -> Tuple[List[Dict[str, Any]], Dict[TableType, List]]:
+        """
+        Classify tables and group them by type.
+        
+        Returns:
+            Tuple of (classified table_info dicts, tables_by_type)
+        """
+        classified_tables = self._classify_and_prepare_tables(tables, page_numbers)
+        return classified_tables, self._group_tables_by_type(classified_tables)
+
+
+def _is_filled(value: Any) -> bool:
+    """Whether an extracted value counts as found (not missing, zero or blank)"""
+    if value is None:
+        return False
+    if isinstance(value, (int, float, Decimal)):
+        return value != 0
+    if isinstance(value, str):
+        return bool(value.strip())
+    return True
 
 
 # Factory functions for easy testing
@@ -43,6 +43,7 @@ from form16x.form16_parser.pdf.simple_classifier import get_simple_table_classif
 # Import production error handling
 from form16x.form16_parser.error_handler import ProductionErrorHandler
 from form16x.form16_parser.exceptions import ErrorCodes, FieldExtractionError, ErrorSeverity
+from form16x.form16_parser.utils.table_utils import cell_matrix
 import traceback
 
 
@@ -78,13 +79,8 @@ class ModularSimpleForm16Extractor:
         self.metadata_component = MetadataExtractorComponent()  # NEW - fixes missing metadata fields
         self.tds_component = QuarterlyTdsExtractorComponent()  # NEW - fixes TDS amount assignment
         
-        # Set logger for components
-        self.tax_component.logger = self.logger
-        self.salary_component.logger = self.logger
-        self.employer_component.logger = self.logger
-        self.deductions_component.logger = self.logger
-        self.metadata_component.logger = self.logger
-        self.tds_component.logger = self.logger
+        # Components keep their own module loggers; extractors may be shared across threads,
+        # so nothing here mutates another component's state
         
         # Initialize proper table classifier
         self.classifier = get_simple_table_classifier()
@@ -441,9 +437,10 @@ class ModularSimpleForm16Extractor:
     
     def _table_has_amounts(self, table: pd.DataFrame) -> bool:
         """Check if table contains numeric amounts"""
+        cells = cell_matrix(table)
         for i in range(min(5, len(table))):  # Check first 5 rows
             for j in range(len(table.columns)):
-                cell_value = str(table.iloc[i, j])
+                cell_value = cells[i, j]
                 if self._parse_amount(cell_value) is not None:
                     return True
         return False
@@ -481,12 +478,13 @@ class ModularSimpleForm16Extractor:
         
         for table_info in tds_tables:
             table = table_info['table']
+            cells = cell_matrix(table)
             
             # Look for quarterly data structure
             header_row_idx = None
             for i in range(len(table)):
                 for j in range(len(table.columns)):
-                    cell_value = str(table.iloc[i, j]).lower()
+                    cell_value = cells[i, j].lower()
                     if 'quarter(s)' in cell_value or 'quarters' in cell_value:
                         header_row_idx = i
                         break
@@ -498,7 +496,7 @@ class ModularSimpleForm16Extractor:
             
             # Extract quarterly records from subsequent rows
             for i in range(header_row_idx + 1, len(table)):
-                row_text = ' '.join([str(table.iloc[i, j]) for j in range(len(table.columns))]).upper()
+                row_text = ' '.join(cells[i]).upper()
                 
                 # Check for quarter indicators
                 quarter_match = None
@@ -512,7 +510,7 @@ class ModularSimpleForm16Extractor:
                     
                     # Enhanced receipt number extraction (working PDF fix)
                     for j in range(len(table.columns)):
-                        cell_value = str(table.iloc[i, j]).strip()
+                        cell_value = cells[i, j]
                         
                         # PDF receipt pattern: Uppercase alphanumeric like ABCD1234
                         if (cell_value and 'nan' not in cell_value.lower() and 
@@ -525,7 +523,7 @@ class ModularSimpleForm16Extractor:
                     
                     # Extract amounts from the row
                     for j in range(len(table.columns)):
-                        cell_value = str(table.iloc[i, j]).strip()
+                        cell_value = cells[i, j]
                         amount = self._parse_amount(cell_value)
                         
                         if amount and amount > 0:
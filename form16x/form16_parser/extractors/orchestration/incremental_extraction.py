@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Incremental Extraction Support
+==============================
+
+Persists the intermediate artifacts of a Form16 extraction so that a later
+code or rule change only re-runs the domain extractors it affects:
+
+- Cleaned tables, page numbers and text_data from the PDF processor
+- TableClassification results and the tables_by_type grouping
+- Per-domain extractor output, versioned by an extractor fingerprint
+
+The fingerprint of a domain extractor is a hash of the source of every
+form16x module it (and its collaborators) is built from, and of every form16x
+module those import (helpers such as utils.table_utils, the models), plus its
+plain-data configuration attributes. Editing DeductionsExtractorComponent
+therefore changes only the 'deductions' fingerprint, while editing a shared
+helper changes the fingerprint of every domain that uses it.
+
+Artifacts are stored with pickle and must only be loaded from trusted,
+locally produced directories.
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import pickle
+import re
+import sys
+import time
+import types
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+ARTIFACT_FORMAT_VERSION = 1
+
+_PACKAGE_PREFIX = 'form16x.'
+_PLAIN_TYPES = (str, int, float, bool, type(None))
+
+
+@dataclass
+class DomainResult:
+    """Output of a single domain extractor, tagged with the fingerprint that produced it"""
+    fingerprint: str
+    updates: Dict[str, Any]
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class DocumentArtifacts:
+    """Intermediate artifacts of one document's extraction"""
+    document_id: str
+    source_file: str
+    tables: List[pd.DataFrame]
+    page_numbers: Optional[List[int]]
+    text_data: Optional[Dict[str, Any]]
+    classified_tables: List[Dict[str, Any]]
+    tables_by_type: Dict[Any, List[Dict[str, Any]]]
+    classification_fingerprint: str
+    domain_results: Dict[str, DomainResult] = field(default_factory=dict)
+    routed_tables: Optional[Dict[str, List[Dict[str, Any]]]] = None
+    processing_level: int = 0
+    created_at: float = field(default_factory=time.time)
+
+
+class ExtractorFingerprinter:
+    """Computes stable fingerprints of extractor code and configuration"""
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._module_hashes: Dict[str, str] = {}
+        self._module_imports: Dict[str, set] = {}
+
+    def fingerprint(self, component: Any) -> str:
+        """
+        Fingerprint a component by its code and plain-data configuration.
+
+        Args:
+            component: Extractor or classifier instance
+
+        Returns:
+            Hex digest identifying the component's behaviour
+        """
+        modules = sorted(self._with_imports(self._collect_modules(component, set())))
+
+        digest = hashlib.sha256()
+        for module_name in modules:
+            digest.update(module_name.encode('utf-8'))
+            digest.update(self._hash_module(module_name).encode('utf-8'))
+        digest.update(self._config_signature(component).encode('utf-8'))
+
+        return digest.hexdigest()[:16]
+
+    def _collect_modules(self, obj: Any, seen: set, depth: int = 0) -> set:
+        """Collect form16x modules defining the object's class hierarchy and collaborators"""
+        modules = set()
+
+        if depth > 4 or id(obj) in seen:
+            return modules
+        seen.add(id(obj))
+
+        for cls in type(obj).__mro__:
+            if cls.__module__.startswith(_PACKAGE_PREFIX):
+                modules.add(cls.__module__)
+
+        for value in getattr(obj, '__dict__', {}).values():
+            candidates = value.values() if isinstance(value, dict) else value if isinstance(value, (list, tuple)) else [value]
+            for candidate in candidates:
+                if type(candidate).__module__.startswith(_PACKAGE_PREFIX) and not isinstance(candidate, type):
+                    modules |= self._collect_modules(candidate, seen, depth + 1)
+
+        return modules
+
+    def _with_imports(self, modules: set) -> set:
+        """Add the form16x modules transitively imported by the given modules"""
+        result = set(modules)
+        pending = list(modules)
+        while pending:
+            for imported in self._imported_modules(pending.pop()):
+                if imported not in result:
+                    result.add(imported)
+                    pending.append(imported)
+        return result
+
+    def _imported_modules(self, module_name: str) -> set:
+        """form16x modules a module references: imported modules and the modules defining imported names"""
+        if module_name not in self._module_imports:
+            imported = set()
+            module = sys.modules.get(module_name)
+            package_prefix = module_name + '.'
+            for value in getattr(module, '__dict__', {}).values():
+                if isinstance(value, types.ModuleType):
+                    name = value.__name__
+                elif isinstance(value, (type, types.FunctionType)):
+                    name = getattr(value, '__module__', None) or ''
+                else:
+                    continue
+                # A package's loaded submodules are attributes of it without being dependencies
+                if (name.startswith(_PACKAGE_PREFIX) and name != module_name
+                        and not (isinstance(value, types.ModuleType) and name.startswith(package_prefix))):
+                    imported.add(name)
+            self._module_imports[module_name] = imported
+        return self._module_imports[module_name]
+
+    def _hash_module(self, module_name: str) -> str:
+        """Hash a module's source, caching per fingerprinter instance"""
+        if module_name not in self._module_hashes:
+            module = sys.modules.get(module_name)
+            try:
+                source = inspect.getsource(module) if module else module_name
+            except (OSError, TypeError):
+                source = module_name
+            self._module_hashes[module_name] = hashlib.sha256(source.encode('utf-8')).hexdigest()
+        return self._module_hashes[module_name]
+
+    def _config_signature(self, component: Any) -> str:
+        """Serialize plain-data instance attributes (keyword lists, thresholds, patterns)"""
+        config = {}
+        for name, value in sorted(getattr(component, '__dict__', {}).items()):
+            if name == 'logger':
+                continue
+            plain = self._to_plain(value)
+            if plain is not None:
+                config[name] = plain
+        return json.dumps(config, sort_keys=True, default=str)
+
+    def _to_plain(self, value: Any) -> Any:
+        """Convert a value to JSON-compatible data, or None if it is not plain configuration"""
+        if isinstance(value, _PLAIN_TYPES):
+            return value
+        if isinstance(value, re.Pattern):
+            return [value.pattern, value.flags]
+        if isinstance(value, (list, tuple)):
+            items = [self._to_plain(item) for item in value]
+            return items if all(item is not None for item in items) else None
+        if isinstance(value, (set, frozenset)):
+            items = [self._to_plain(item) for item in value]
+            return sorted(items, key=str) if all(item is not None for item in items) else None
+        if isinstance(value, dict):
+            items = {str(key): self._to_plain(item) for key, item in value.items()}
+            return items if all(item is not None for item in items.values()) else None
+        return None
+
+
+class ArtifactStore:
+    """File-backed store of per-document extraction artifacts"""
+
+    ARTIFACTS_FILE = 'artifacts.pkl'
+    MANIFEST_FILE = 'manifest.json'
+
+    def __init__(self, root_dir: Path):
+        self.logger = logging.getLogger(__name__)
+        self.root_dir = Path(root_dir)
+
+    def document_dir(self, document_id: str) -> Path:
+        """Directory holding one document's artifacts"""
+        return self.root_dir / document_id
+
+    def save(self, artifacts: DocumentArtifacts) -> Path:
+        """
+        Persist artifacts for a document, replacing any previous version.
+
+        Returns:
+            Path to the document's artifact directory
+        """
+        doc_dir = self.document_dir(artifacts.document_id)
+        doc_dir.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first so a crash never leaves a truncated pickle
+        artifacts_path = doc_dir / self.ARTIFACTS_FILE
+        temp_path = artifacts_path.with_suffix('.tmp')
+        with open(temp_path, 'wb') as f:
+            pickle.dump(artifacts, f, protocol=pickle.HIGHEST_PROTOCOL)
+        temp_path.replace(artifacts_path)
+
+        manifest = {
+            'format_version': ARTIFACT_FORMAT_VERSION,
+            'document_id': artifacts.document_id,
+            'source_file': artifacts.source_file,
+            'processing_level': artifacts.processing_level,
+            'table_count': len(artifacts.tables),
+            'classification_fingerprint': artifacts.classification_fingerprint,
+            'domain_fingerprints': {
+                domain: result.fingerprint for domain, result in artifacts.domain_results.items()
+            },
+            'created_at': artifacts.created_at,
+        }
+        with open(doc_dir / self.MANIFEST_FILE, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+
+        self.logger.debug(f"Saved extraction artifacts for {artifacts.document_id} to {doc_dir}")
+        return doc_dir
+
+    def load(self, document_id: str) -> DocumentArtifacts:
+        """Load a document's artifacts"""
+        artifacts_path = self.document_dir(document_id) / self.ARTIFACTS_FILE
+        if not artifacts_path.exists():
+            raise FileNotFoundError(f"No extraction artifacts for {document_id} in {self.root_dir}")
+
+        with open(artifacts_path, 'rb') as f:
+            return pickle.load(f)
+
+    def list_documents(self) -> List[str]:
+        """List document ids that have stored artifacts"""
+        if not self.root_dir.exists():
+            return []
+        return sorted(
+            path.parent.name for path in self.root_dir.glob(f'*/{self.ARTIFACTS_FILE}')
+        )
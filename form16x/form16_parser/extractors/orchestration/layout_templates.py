@@ -0,0 +1,567 @@
+#!/usr/bin/env python3
+"""
+Layout Templates
+================
+
+Direct cell-map extraction for employers whose Form16 layout repeats.
+
+Most documents come from a limited set of employers (often sharing a payroll
+vendor) whose table layout is identical from one employee to the next. A
+layout fingerprint (table shapes, header tokens, page positions and employer
+TAN) identifies such a layout. After a successful full extraction the
+template learns where each extracted value sits: a field -> (table, row,
+column, line) map. Positions are intersected across observations, so a
+field is only read from cells that held its value in every observation;
+when several such cells remain they must still agree when read.
+Values that never appear in a cell but were identical in every observation
+(employer name, assessment year, regime) are kept as constants. A template
+with any other learned field (one that varied and was never located, such
+as an address the extractor assembled from several cells) is never ready,
+since reading it would silently drop that field.
+
+When a new document matches a ready template its fields are read from the
+mapped cells and validated (amount format, PAN/TAN format, model
+validation). Any mismatch falls back to the full EnhancedForm16Extractor,
+whose result is learned again so the template heals itself.
+
+Templates are stored one JSON file per fingerprint, with lookup statistics
+(hits, misses, unmatched) kept alongside for hit-rate reporting. Updates are
+made under a file lock against the current files, so isolated worker
+processes sharing a template directory do not overwrite each other.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from decimal import Decimal, InvalidOperation
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from form16x.form16_parser.models.form16_models import Form16Document
+from form16x.form16_parser.utils.file_lock import file_lock, writer_temp_path
+from form16x.form16_parser.utils.table_utils import cell_matrix
+
+TEMPLATE_FORMAT_VERSION = 1
+
+# Form16Document sections covered by templates (quality metrics and raw data are not)
+TEMPLATE_SECTIONS = (
+    'metadata', 'employee', 'employer', 'salary', 'quarterly_tds',
+    'chapter_via_deductions', 'section16_deductions', 'tax_computation', 'detailed_perquisites'
+)
+LIST_SECTIONS = ('quarterly_tds',)
+
+# A value found in more cells than this carries no positional information
+MAX_CANDIDATE_POSITIONS = 16
+
+_AMOUNT_CELL = re.compile(r'^(?:₹|rs\.?|inr)?\s*\d[\d,]*(?:\.\d+)?$', re.IGNORECASE)
+_PAN = re.compile(r'^[A-Z]{5}[0-9]{4}[A-Z]$')
+_TAN = re.compile(r'^[A-Z]{4}[0-9]{5}[A-Z]$')
+_TAN_IN_TEXT = re.compile(r'\b[A-Z]{4}[0-9]{5}[A-Z]\b')
+_HEADER_TOKEN = re.compile(r'[a-z]{3,}')
+
+Position = Tuple[int, int, int, int]  # table, row, column, line (-1 for the whole cell)
+
+_INVALID = object()
+
+
+def _normalize_text(value: str) -> str:
+    return ' '.join(value.split())
+
+
+def _parse_amount_cell(text: str) -> Optional[Decimal]:
+    """Parse a cell that holds nothing but an amount"""
+    text = text.strip()
+    if not _AMOUNT_CELL.match(text):
+        return None
+    digits = re.sub(r'[^\d.]', '', text)
+    try:
+        return Decimal(digits)
+    except InvalidOperation:
+        return None
+
+
+def _value_kind(value: Any) -> str:
+    if isinstance(value, (bool, Enum)):
+        return 'constant'
+    if isinstance(value, (Decimal, int, float)):
+        return 'amount'
+    if isinstance(value, str):
+        return 'text'
+    return 'constant'
+
+
+def _flatten(data: Any, prefix: str = '') -> Dict[str, Any]:
+    """Flatten nested dicts/lists into dotted paths, skipping empty values"""
+    flat = {}
+    if isinstance(data, dict):
+        items = data.items()
+    elif isinstance(data, list):
+        items = enumerate(data)
+    else:
+        if data is not None:
+            flat[prefix] = data
+        return flat
+
+    for key, value in items:
+        key = str(key)
+        if '.' in key:
+            continue
+        flat.update(_flatten(value, f"{prefix}.{key}" if prefix else key))
+    return flat
+
+
+def _unflatten(flat: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild nested document data from dotted paths"""
+    data: Dict[str, Any] = {}
+    for path, value in flat.items():
+        node = data
+        parts = path.split('.')
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+        node[parts[-1]] = value
+
+    for section in LIST_SECTIONS:
+        if section in data:
+            data[section] = [item for _, item in sorted(data[section].items(), key=lambda entry: int(entry[0]))]
+    return data
+
+
+class LayoutFingerprinter:
+    """Computes layout fingerprints from a document's table structure"""
+
+    def fingerprint(self, tables: List[pd.DataFrame], page_numbers: Optional[List[int]] = None,
+                    text_data: Optional[Dict[str, Any]] = None) -> Tuple[str, Optional[str]]:
+        """
+        Fingerprint a document layout.
+
+        Args:
+            tables: Extracted tables
+            page_numbers: Page of each table, when known
+            text_data: Text-extracted identity data (used for the employer TAN)
+
+        Returns:
+            Tuple of (fingerprint, employer TAN or None)
+        """
+        employer_tan = self._employer_tan(tables, text_data)
+
+        signature: List[Any] = [employer_tan]
+        for index, table in enumerate(tables):
+            page = page_numbers[index] if page_numbers and index < len(page_numbers) else None
+            signature.append([list(table.shape), page, self._header_tokens(table)])
+
+        digest = hashlib.sha256(json.dumps(signature).encode('utf-8')).hexdigest()
+        return digest[:20], employer_tan
+
+    def _header_tokens(self, table: pd.DataFrame) -> List[str]:
+        """Label tokens of the first non-empty row (cells with digits are data, not labels)"""
+        for row in cell_matrix(table):
+            if not any(row):
+                continue
+            tokens = []
+            for cell in row:
+                if cell and not any(char.isdigit() for char in cell):
+                    tokens.extend(_HEADER_TOKEN.findall(cell.lower()))
+            return tokens
+        return []
+
+    def _employer_tan(self, tables: List[pd.DataFrame], text_data: Optional[Dict[str, Any]]) -> Optional[str]:
+        if text_data and text_data.get('employer_tan'):
+            tan = str(text_data['employer_tan']).strip().upper()
+            if _TAN.match(tan):
+                return tan
+
+        for table in tables:
+            for cell in cell_matrix(table).ravel():
+                match = _TAN_IN_TEXT.search(cell.upper()) if cell else None
+                if match:
+                    return match.group(0)
+        return None
+
+
+class _CellIndex:
+    """Amount and text lookup over every cell (and cell line) of a document"""
+
+    def __init__(self, tables: List[pd.DataFrame], index_values: bool = True):
+        self.cells = [cell_matrix(table) for table in tables]
+        self.amounts: Dict[Decimal, List[Position]] = {}
+        self.texts: Dict[str, List[Position]] = {}
+        if not index_values:
+            return
+
+        for table_index, matrix in enumerate(self.cells):
+            rows, cols = matrix.shape
+            for row in range(rows):
+                for col in range(cols):
+                    cell = matrix[row, col]
+                    if not cell:
+                        continue
+                    self._add(cell, (table_index, row, col, -1))
+                    lines = [line.strip() for line in cell.split('\n')]
+                    if len(lines) > 1:
+                        for line_index, line in enumerate(lines):
+                            if line:
+                                self._add(line, (table_index, row, col, line_index))
+
+    def _add(self, text: str, position: Position) -> None:
+        amount = _parse_amount_cell(text)
+        if amount is not None:
+            self.amounts.setdefault(amount, []).append(position)
+        self.texts.setdefault(_normalize_text(text), []).append(position)
+
+    def candidates(self, kind: str, value: Any) -> Optional[List[Position]]:
+        """Cells holding the value, or None when it is too common to locate"""
+        if kind == 'amount':
+            found = self.amounts.get(Decimal(str(value)), [])
+        elif kind == 'text':
+            found = self.texts.get(_normalize_text(value), [])
+        else:
+            return []
+        return found if len(found) <= MAX_CANDIDATE_POSITIONS else None
+
+    def read(self, position: Position) -> Optional[str]:
+        """Text at a position, or None if the position does not exist"""
+        table_index, row, col, line = position
+        if table_index >= len(self.cells):
+            return None
+        matrix = self.cells[table_index]
+        if row >= matrix.shape[0] or col >= matrix.shape[1]:
+            return None
+        cell = matrix[row, col]
+        if line < 0:
+            return cell
+        lines = [part.strip() for part in cell.split('\n')]
+        return lines[line] if line < len(lines) else ''
+
+
+@dataclass
+class LayoutTemplate:
+    """Learned field map for one layout fingerprint"""
+    fingerprint: str
+    employer_tan: Optional[str] = None
+    observations: int = 0
+    hits: int = 0
+    misses: int = 0
+    created_at: float = field(default_factory=time.time)
+    last_used: float = field(default_factory=time.time)
+    # path -> {'kind', 'positions' (None until located), 'value', 'stable', 'observed'}
+    fields: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def learn(self, index: _CellIndex, document: Form16Document) -> None:
+        """Fold one successfully extracted document into the field map"""
+        sections = set(TEMPLATE_SECTIONS)
+        # Extractors leave floats in some Decimal fields; they are read as amounts all the same
+        values = _flatten(document.model_dump(include=sections, warnings=False))
+        json_values = _flatten(document.model_dump(mode='json', include=sections, warnings=False))
+
+        for path, value in values.items():
+            kind = _value_kind(value)
+            candidates = index.candidates(kind, value)
+            json_value = json_values.get(path)
+
+            entry = self.fields.get(path)
+            if entry is None:
+                self.fields[path] = {
+                    'kind': kind,
+                    'positions': None if candidates is None else [list(position) for position in candidates],
+                    'value': json_value,
+                    'stable': self.observations == 0,
+                    'observed': 1,
+                }
+                continue
+
+            entry['observed'] += 1
+            if entry['value'] != json_value:
+                entry['stable'] = False
+            if candidates is not None:
+                located = {tuple(position) for position in candidates}
+                if entry['positions'] is None:
+                    entry['positions'] = [list(position) for position in candidates]
+                else:
+                    entry['positions'] = [position for position in entry['positions'] if tuple(position) in located]
+
+        self.observations += 1
+
+    def positional_fields(self) -> Dict[str, Tuple[str, List[Position]]]:
+        """Fields read directly from the cells that held them in every observation"""
+        return {
+            path: (entry['kind'], [tuple(position) for position in entry['positions']])
+            for path, entry in self.fields.items()
+            if entry['positions']
+        }
+
+    def constant_fields(self) -> Dict[str, Any]:
+        """Fields with the same value in every observation that are not read from a cell"""
+        positional = self.positional_fields()
+        return {
+            path: entry['value']
+            for path, entry in self.fields.items()
+            if path not in positional and entry['stable'] and entry['observed'] == self.observations
+        }
+
+    def unlocated_fields(self) -> List[str]:
+        """Learned fields that are neither read from a cell nor constant"""
+        known = set(self.positional_fields()) | set(self.constant_fields())
+        return sorted(path for path in self.fields if path not in known)
+
+    def is_ready(self, min_observations: int) -> bool:
+        """Whether enough documents agreed on the layout to read every learned field directly"""
+        return (self.observations >= min_observations and bool(self.positional_fields())
+                and not self.unlocated_fields())
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def read_document(self, tables: List[pd.DataFrame]) -> Optional[Form16Document]:
+        """
+        Build a document from the mapped cells.
+
+        Returns:
+            Form16Document, or None when any mapped cell fails validation
+        """
+        index = _CellIndex(tables, index_values=False)
+
+        flat: Dict[str, Any] = dict(self.constant_fields())
+        for path, (kind, positions) in self.positional_fields().items():
+            values = set()
+            for position in positions:
+                text = index.read(position)
+                if text is None:
+                    return None
+                values.add(self._read_value(path, kind, text) if text else None)
+
+            # Cells that always agreed while learning must still agree
+            if len(values) != 1:
+                return None
+            value = values.pop()
+            if value is _INVALID:
+                return None
+            if value is not None:
+                flat[path] = value
+
+        try:
+            return Form16Document.model_validate(_unflatten(flat))
+        except ValueError:
+            return None
+
+    def _read_value(self, path: str, kind: str, text: str) -> Any:
+        """Validate and convert a mapped cell, returning _INVALID on failure"""
+        if kind == 'amount':
+            amount = _parse_amount_cell(text)
+            return _INVALID if amount is None else str(amount)
+
+        value = _normalize_text(text)
+        if path.endswith('.pan') or path.endswith('.tan'):
+            value = value.upper()
+            if not (_PAN if path.endswith('.pan') else _TAN).match(value):
+                return _INVALID
+        return value
+
+
+class TemplateStore:
+    """File-backed index of layout templates with lookup statistics"""
+
+    TEMPLATES_DIR = 'templates'
+    STATS_FILE = 'stats.json'
+
+    def __init__(self, root_dir: Path, min_observations: int = 2):
+        self.logger = logging.getLogger(__name__)
+        self.root_dir = Path(root_dir)
+        self.min_observations = min_observations
+        self._templates: Dict[str, Optional[LayoutTemplate]] = {}
+        # File version each cached template was read at; other processes may rewrite it
+        self._template_versions: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._lock = threading.RLock()
+        self._stats = self._load_stats()
+
+    def get(self, fingerprint: str) -> Optional[LayoutTemplate]:
+        """Template for a fingerprint, (re)loading it from disk when its file changed"""
+        with self._lock:
+            version = self._template_version(fingerprint)
+            if fingerprint not in self._templates or self._template_versions.get(fingerprint) != version:
+                self._templates[fingerprint] = self._load_template(fingerprint)
+                self._template_versions[fingerprint] = version
+            return self._templates[fingerprint]
+
+    def learn(self, fingerprint: str, employer_tan: Optional[str],
+              tables: List[pd.DataFrame], document: Form16Document) -> LayoutTemplate:
+        """Fold a successful extraction into the template for its fingerprint"""
+        index = _CellIndex(tables)
+        with self._lock, file_lock(self._stats_path()):
+            # Other processes may have learned this layout since it was loaded
+            template = (self._load_template(fingerprint)
+                        or LayoutTemplate(fingerprint=fingerprint, employer_tan=employer_tan))
+            template.learn(index, document)
+            self._templates[fingerprint] = template
+            self._stats = self._load_stats()
+            self._stats['learned'] += 1
+            self._save_template(template)
+            self._save_stats()
+        return template
+
+    def record_lookup(self, fingerprint: str, status: str) -> None:
+        """Record a lookup outcome: 'hit', 'miss' (template failed validation) or 'unmatched'"""
+        with self._lock, file_lock(self._stats_path()):
+            self._stats = self._load_stats()
+            self._stats['lookups'] += 1
+            self._stats[status] += 1
+            template = self._templates.get(fingerprint)
+            if template is not None and status in ('hit', 'miss'):
+                template = self._load_template(fingerprint) or template
+                self._templates[fingerprint] = template
+                if status == 'hit':
+                    template.hits += 1
+                else:
+                    template.misses += 1
+                template.last_used = time.time()
+                self._save_template(template)
+            self._save_stats()
+
+    def stats(self) -> Dict[str, Any]:
+        """Store-wide lookup statistics, including lookups made by other processes"""
+        with self._lock:
+            self._stats = self._load_stats()
+            stats = dict(self._stats)
+        stats['templates'] = len(list(self._templates_dir().glob('*.json'))) if self._templates_dir().exists() else 0
+        stats['hit_rate'] = round(stats['hit'] / stats['lookups'], 4) if stats['lookups'] else 0.0
+        return stats
+
+    def template_stats(self) -> List[Dict[str, Any]]:
+        """Per-template statistics, most used first"""
+        rows = []
+        if not self._templates_dir().exists():
+            return rows
+        for path in self._templates_dir().glob('*.json'):
+            template = self.get(path.stem)
+            if template is None:
+                continue
+            rows.append({
+                'fingerprint': template.fingerprint,
+                'employer_tan': template.employer_tan,
+                'observations': template.observations,
+                'hits': template.hits,
+                'misses': template.misses,
+                'hit_rate': round(template.hit_rate, 4),
+                'mapped_fields': len(template.positional_fields()),
+                'constant_fields': len(template.constant_fields()),
+                'unlocated_fields': len(template.unlocated_fields()),
+                'ready': template.is_ready(self.min_observations),
+            })
+        rows.sort(key=lambda row: row['hits'] + row['misses'], reverse=True)
+        return rows
+
+    def _templates_dir(self) -> Path:
+        return self.root_dir / self.TEMPLATES_DIR
+
+    def _template_version(self, fingerprint: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = (self._templates_dir() / f'{fingerprint}.json').stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load_template(self, fingerprint: str) -> Optional[LayoutTemplate]:
+        path = self._templates_dir() / f'{fingerprint}.json'
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.pop('format_version', None) != TEMPLATE_FORMAT_VERSION:
+                return None
+            return LayoutTemplate(**data)
+        except (OSError, ValueError, TypeError) as e:
+            self.logger.warning(f"Ignoring unreadable layout template {path}: {e}")
+            return None
+
+    def _save_template(self, template: LayoutTemplate) -> None:
+        data = {'format_version': TEMPLATE_FORMAT_VERSION, **asdict(template)}
+        self._write_json(self._templates_dir() / f'{template.fingerprint}.json', data)
+        self._template_versions[template.fingerprint] = self._template_version(template.fingerprint)
+
+    def _stats_path(self) -> Path:
+        return self.root_dir / self.STATS_FILE
+
+    def _load_stats(self) -> Dict[str, int]:
+        stats = {'lookups': 0, 'hit': 0, 'miss': 0, 'unmatched': 0, 'learned': 0}
+        path = self._stats_path()
+        if path.exists():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    stats.update({key: int(value) for key, value in json.load(f).items() if key in stats})
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Resetting unreadable template statistics {path}: {e}")
+        return stats
+
+    def _save_stats(self) -> None:
+        self._write_json(self._stats_path(), self._stats)
+
+    def _write_json(self, path: Path, data: Dict[str, Any]) -> None:
+        # Write to a temporary file first so readers never see a truncated file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = writer_temp_path(path)
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        temp_path.replace(path)
+
+
+class TemplateExtractor:
+    """
+    Extractor front-end that reads repeat layouts from learned templates.
+
+    Drop-in for EnhancedForm16Extractor.extract_all: documents matching a ready
+    template are read from the mapped cells; everything else goes through the
+    full extractor, and successful full extractions are learned.
+    """
+
+    def __init__(self, store: TemplateStore, extractor: Any):
+        self.logger = logging.getLogger(__name__)
+        self.store = store
+        self.extractor = extractor
+        self.fingerprinter = LayoutFingerprinter()
+
+    def extract_all(self, tables: List[pd.DataFrame], page_numbers: Optional[List[int]] = None,
+                    text_data: Optional[Dict[str, Any]] = None) -> Form16Document:
+        """Extract a document, using its layout template when one matches"""
+        fingerprint, employer_tan = self.fingerprinter.fingerprint(tables, page_numbers, text_data)
+        template = self.store.get(fingerprint)
+
+        if template is not None and template.is_ready(self.store.min_observations):
+            document = template.read_document(tables)
+            if document is not None:
+                self.store.record_lookup(fingerprint, 'hit')
+                document.processing_metadata['layout_template'] = {
+                    'fingerprint': fingerprint,
+                    'status': 'hit',
+                    'mapped_fields': len(template.positional_fields()),
+                }
+                self.logger.debug(f"Layout template {fingerprint} hit")
+                return document
+            self.store.record_lookup(fingerprint, 'miss')
+            status = 'miss'
+            self.logger.info(f"Layout template {fingerprint} failed validation, running full extraction")
+        else:
+            self.store.record_lookup(fingerprint, 'unmatched')
+            status = 'unmatched'
+
+        document = self.extractor.extract_all(tables, page_numbers, text_data=text_data)
+
+        if self._is_successful(document):
+            self.store.learn(fingerprint, employer_tan, tables, document)
+            status = f'{status}_learned'
+
+        document.processing_metadata['layout_template'] = {'fingerprint': fingerprint, 'status': status}
+        return document
+
+    def _is_successful(self, document: Form16Document) -> bool:
+        """Only learn from extractions that identified the parties and the salary"""
+        has_identity = bool(document.employee.pan or document.employer.tan)
+        return has_identity and document.salary.gross_salary is not None
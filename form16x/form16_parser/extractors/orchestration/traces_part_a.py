@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+TRACES Part A Fast Path
+=======================
+
+Reads Part A of TRACES-generated Form16s from positioned words instead of
+detected tables.
+
+TRACES prints Part A with a fixed layout: a certificate header, the
+employer and employee name/address blocks, a PAN/TAN row, the assessment
+year and period, and the quarterly summary table. Every value sits below its
+label in the label's column, so pdfplumber word coordinates are enough to
+read it. This is far cheaper than lattice detection.
+
+Results check themselves before they are used:
+- PAN and TAN must be valid.
+- At least one quarter must be present.
+- The quarterly amounts must add up to the reported Total row.
+
+A document failing any check returns None and goes through the general
+table path unchanged.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from form16x.form16_parser.models.form16_models import (
+    EmployeeInfo, EmployerInfo, Form16Document, Form16Metadata, TaxDeductionQuarterly
+)
+
+# Part A is at the start of the certificate; never look further than this
+MAX_PART_A_PAGES = 3
+
+# Words whose tops differ by less than this (points) share a line
+LINE_TOLERANCE = 3.0
+
+# Lines below a label searched for its value
+VALUE_LINES = 3
+
+AMOUNT_COLUMNS = ('amount_paid', 'tax_deducted', 'tax_deposited')
+
+_PAN = re.compile(r'^[A-Z]{5}[0-9]{4}[A-Z]$')
+_TAN = re.compile(r'^[A-Z]{4}[0-9]{5}[A-Z]$')
+_CERTIFICATE = re.compile(r'^(?=.*[A-Z])[A-Z0-9]{6,12}$')
+_ASSESSMENT_YEAR = re.compile(r'^20\d{2}-\d{2}(?:\d{2})?$')
+_DATE = re.compile(r'^\d{2}-[A-Za-z]{3}-\d{4}$|^\d{2}[/.-]\d{2}[/.-]\d{4}$')
+_AMOUNT = re.compile(r'^\d[\d,]*\.\d{2}$')
+_RECEIPT = re.compile(r'^(?=.*[A-Z])[A-Z0-9]{6,15}$')
+_QUARTER = re.compile(r'^Q[1-4]$')
+
+
+@dataclass
+class PartAResult:
+    """Part A values read by the fast path, with the checks they passed"""
+    metadata: Form16Metadata
+    employer: EmployerInfo
+    employee: EmployeeInfo
+    quarterly_tds: List[TaxDeductionQuarterly]
+    pages: List[int]
+    checks: Dict[str, Any] = field(default_factory=dict)
+    page_count: Optional[int] = None
+
+    @property
+    def tables_from_page(self) -> int:
+        """First page left for table detection (1 when Part A shares the document's only pages)"""
+        next_page = max(self.pages) + 1
+        return next_page if self.page_count and next_page <= self.page_count else 1
+
+    def apply_to(self, document: Form16Document) -> Form16Document:
+        """Overlay the Part A values onto a document from the general path"""
+        for section in ('metadata', 'employer', 'employee'):
+            values = {name: value for name, value in getattr(self, section).model_dump().items()
+                      if value not in (None, '', {})}
+            setattr(document, section, getattr(document, section).model_copy(update=values))
+        document.quarterly_tds = list(self.quarterly_tds)
+        document.processing_metadata['part_a_fast_path'] = {
+            'status': 'used', 'pages': self.pages, 'checks': self.checks
+        }
+        return document
+
+
+def _parse_amount(text: str) -> Optional[Decimal]:
+    try:
+        return Decimal(text.replace(',', ''))
+    except InvalidOperation:
+        return None
+
+
+def _parse_date(text: str) -> Optional[date]:
+    for fmt in ('%d-%b-%Y', '%d-%m-%Y', '%d/%m/%Y', '%d.%m.%Y'):
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+class _PageLayout:
+    """Words of one page grouped into lines, with label and column lookups"""
+
+    def __init__(self, words: Sequence[Dict[str, Any]], page_width: float):
+        self.page_width = page_width
+        self.lines: List[List[Dict[str, Any]]] = []
+        for word in sorted(words, key=lambda w: (round(w['top'], 1), w['x0'])):
+            if self.lines and abs(word['top'] - self.lines[-1][0]['top']) < LINE_TOLERANCE:
+                self.lines[-1].append(word)
+            else:
+                self.lines.append([word])
+        for line in self.lines:
+            line.sort(key=lambda w: w['x0'])
+
+    def find(self, phrase: str, start_line: int = 0) -> Optional[Tuple[int, float, float]]:
+        """(line index, x0, x1) of the first occurrence of a phrase"""
+        # A token matches a word it starts, up to punctuation ('Quarter' matches 'Quarter(s)')
+        tokens = [re.compile(re.escape(token) + r'(?![a-z0-9])') for token in phrase.lower().split()]
+        for line_index in range(start_line, len(self.lines)):
+            texts = [w['text'].lower() for w in self.lines[line_index]]
+            for i in range(len(texts) - len(tokens) + 1):
+                if all(token.match(texts[i + k]) for k, token in enumerate(tokens)):
+                    words = self.lines[line_index]
+                    return line_index, words[i]['x0'], words[i + len(tokens) - 1]['x1']
+        return None
+
+    def has(self, phrase: str) -> bool:
+        return self.find(phrase) is not None
+
+    def column_words(self, line_index: int, x0: float, x1: float) -> List[Dict[str, Any]]:
+        """Words of a line whose centre falls inside [x0, x1)"""
+        return [w for w in self.lines[line_index] if x0 <= (w['x0'] + w['x1']) / 2 < x1]
+
+    def value_below(self, label: Tuple[int, float, float], pattern: re.Pattern,
+                    x1: Optional[float] = None, same_line: bool = True) -> Optional[str]:
+        """
+        First word matching pattern right of the label or below it in its column.
+
+        Args:
+            label: Result of find()
+            pattern: Regex the value must match
+            x1: Right edge of the label's column (default: page width)
+            same_line: Also look right of the label on its own line
+        """
+        line_index, label_x0, label_x1 = label
+        column_end = x1 if x1 is not None else self.page_width
+        if same_line:
+            for word in self.column_words(line_index, label_x1, column_end):
+                if pattern.match(word['text']):
+                    return word['text']
+        for below in range(line_index + 1, min(line_index + 1 + VALUE_LINES, len(self.lines))):
+            for word in self.column_words(below, label_x0 - LINE_TOLERANCE, column_end):
+                if pattern.match(word['text']):
+                    return word['text']
+        return None
+
+
+class TracesPartAExtractor:
+    """Fast-path Part A reader for TRACES-generated Form16s"""
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+
+    def extract(self, pdf_path: Path) -> Optional[PartAResult]:
+        """
+        Read Part A from a PDF's word coordinates.
+
+        Args:
+            pdf_path: Form16 PDF
+
+        Returns:
+            PartAResult when the document is a TRACES Part A that passes its
+            checks, otherwise None (use the general path)
+        """
+        try:
+            import pdfplumber
+        except ImportError:
+            return None
+
+        try:
+            pages = []
+            with pdfplumber.open(str(pdf_path)) as pdf:
+                page_count = len(pdf.pages)
+                for page in pdf.pages[:MAX_PART_A_PAGES]:
+                    layout = _PageLayout(page.extract_words(), float(page.width))
+                    if layout.has('PART B'):
+                        break
+                    pages.append(layout)
+            result = self.extract_from_layouts(pages)
+            if result is not None:
+                result.page_count = page_count
+            return result
+        except Exception as e:
+            self.logger.debug(f"Part A fast path unavailable for {pdf_path.name}: {e}")
+            return None
+
+    def extract_from_layouts(self, layouts: List[_PageLayout]) -> Optional[PartAResult]:
+        """Map the leading Part A pages to models and check them"""
+        if not layouts or not self._is_traces_part_a(layouts[0]):
+            return None
+
+        first = layouts[0]
+        metadata = self._read_metadata(first)
+        employer, employee = self._read_parties(first)
+
+        quarterly_tds, totals = [], {}
+        part_a_pages = []
+        for page_number, layout in enumerate(layouts, 1):
+            if page_number > 1 and not layout.has('Quarter'):
+                break
+            part_a_pages.append(page_number)
+            page_quarters, page_totals = self._read_quarters(layout)
+            quarterly_tds.extend(page_quarters)
+            totals.update(page_totals)
+
+        checks = self._check(employer, employee, quarterly_tds, totals)
+        if not checks['passed']:
+            self.logger.info(f"Part A fast path rejected: {checks['failures']}")
+            return None
+
+        return PartAResult(metadata, employer, employee, quarterly_tds, part_a_pages, checks)
+
+    def _is_traces_part_a(self, layout: _PageLayout) -> bool:
+        return all(layout.has(anchor) for anchor in (
+            'Certificate No', 'PAN of the Deductor', 'TAN of the Deductor', 'PAN of the Employee', 'Quarter'
+        ))
+
+    def _read_metadata(self, layout: _PageLayout) -> Form16Metadata:
+        metadata = Form16Metadata(form16_type='TRACES')
+
+        certificate_label = layout.find('Certificate No')
+        last_updated_label = layout.find('Last updated on')
+        if certificate_label:
+            column_end = last_updated_label[1] if (
+                last_updated_label and last_updated_label[0] == certificate_label[0]) else None
+            metadata.certificate_number = layout.value_below(certificate_label, _CERTIFICATE, column_end)
+        if last_updated_label:
+            metadata.last_updated = _parse_date(layout.value_below(last_updated_label, _DATE) or '')
+
+        year_label = layout.find('Assessment Year')
+        if year_label:
+            metadata.assessment_year = layout.value_below(year_label, _ASSESSMENT_YEAR)
+            if metadata.assessment_year:
+                start = int(metadata.assessment_year[:4])
+                metadata.financial_year = f"{start - 1}-{str(start)[2:]}"
+
+        period_label = layout.find('Period with the Employer')
+        if period_label:
+            line_index, x0, _ = period_label
+            dates = [w['text'] for below in range(line_index + 1, min(line_index + 1 + VALUE_LINES, len(layout.lines)))
+                     for w in layout.column_words(below, x0 - LINE_TOLERANCE, layout.page_width)
+                     if _DATE.match(w['text'])]
+            if len(dates) >= 2:
+                metadata.period_from, metadata.period_to = _parse_date(dates[0]), _parse_date(dates[1])
+        return metadata
+
+    def _read_parties(self, layout: _PageLayout) -> Tuple[EmployerInfo, EmployeeInfo]:
+        employer, employee = EmployerInfo(), EmployeeInfo()
+
+        ids_label = layout.find('PAN of the Deductor')
+        tan_label = layout.find('TAN of the Deductor')
+        employee_pan_label = layout.find('PAN of the Employee')
+        if ids_label and tan_label and employee_pan_label:
+            employer.pan = layout.value_below(ids_label, _PAN, tan_label[1], same_line=False)
+            employer.tan = layout.value_below(tan_label, _TAN, employee_pan_label[1], same_line=False)
+            employee.pan = layout.value_below(employee_pan_label, _PAN, same_line=False)
+
+        employer_label = layout.find('Name and address of the Employer')
+        employee_label = layout.find('Name and address of the Employee')
+        block_end = ids_label[0] if ids_label else len(layout.lines)
+        if employer_label and employee_label and employer_label[0] == employee_label[0]:
+            employer.name, employer.address = self._read_block(layout, employer_label, employee_label[1], block_end)
+            employee.name, employee.address = self._read_block(layout, employee_label, layout.page_width, block_end)
+        return employer, employee
+
+    def _read_block(self, layout: _PageLayout, label: Tuple[int, float, float],
+                    x1: float, end_line: int) -> Tuple[Optional[str], Optional[str]]:
+        """Name (first line) and address (remaining lines) of a name/address block"""
+        line_index, x0, _ = label
+        lines = []
+        for below in range(line_index + 1, end_line):
+            words = layout.column_words(below, x0 - LINE_TOLERANCE, x1)
+            if words:
+                lines.append(' '.join(w['text'] for w in words))
+        if not lines:
+            return None, None
+        return lines[0], (', '.join(lines[1:]) or None)
+
+    def _read_quarters(self, layout: _PageLayout) -> Tuple[List[TaxDeductionQuarterly], Dict[str, Decimal]]:
+        header = layout.find('Quarter')
+        if header is None:
+            return [], {}
+
+        # Header labels wrap over several lines; locate columns by keyword centres
+        columns: Dict[str, float] = {}
+        first_row = header[0]
+        while first_row < len(layout.lines) and not _QUARTER.match(layout.lines[first_row][0]['text']):
+            for word in layout.lines[first_row]:
+                text = word['text'].lower()
+                for column, keyword in (('receipt', 'receipt'), ('amount_paid', 'paid'),
+                                        ('tax_deducted', 'deducted'), ('tax_deposited', 'deposited')):
+                    if text.startswith(keyword) and column not in columns:
+                        columns[column] = (word['x0'] + word['x1']) / 2
+            first_row += 1
+        if not any(column in columns for column in AMOUNT_COLUMNS):
+            return [], {}
+
+        quarters, totals = [], {}
+        for line in layout.lines[first_row:]:
+            label = line[0]['text']
+            if _QUARTER.match(label):
+                values = self._row_values(line[1:], columns)
+                quarters.append(TaxDeductionQuarterly(quarter=label, **values))
+            elif label.lower().startswith('total'):
+                totals = {name: value for name, value in self._row_values(line[1:], columns).items()
+                          if name in AMOUNT_COLUMNS}
+                break
+        return quarters, totals
+
+    def _row_values(self, words: List[Dict[str, Any]], columns: Dict[str, float]) -> Dict[str, Any]:
+        """Assign each amount/receipt word to the nearest matching column"""
+        values: Dict[str, Any] = {}
+        for word in words:
+            text, centre = word['text'], (word['x0'] + word['x1']) / 2
+            if _AMOUNT.match(text):
+                candidates = [c for c in AMOUNT_COLUMNS if c in columns]
+                value = _parse_amount(text)
+            elif _RECEIPT.match(text) and 'receipt' in columns:
+                candidates, value = ['receipt'], text
+            else:
+                continue
+            column = min(candidates, key=lambda c: abs(columns[c] - centre))
+            values.setdefault('receipt_number' if column == 'receipt' else column, value)
+        return values
+
+    def _check(self, employer: EmployerInfo, employee: EmployeeInfo,
+               quarterly_tds: List[TaxDeductionQuarterly], totals: Dict[str, Decimal]) -> Dict[str, Any]:
+        failures = []
+        if not employee.pan:
+            failures.append('employee PAN missing or invalid')
+        if not employer.tan:
+            failures.append('employer TAN missing or invalid')
+        if not quarterly_tds:
+            failures.append('no quarters')
+        if not totals:
+            failures.append('no Total row')
+
+        checksums = {}
+        for column, total in totals.items():
+            quarter_sum = sum((getattr(q, column) or Decimal('0') for q in quarterly_tds), Decimal('0'))
+            checksums[column] = abs(quarter_sum - total) <= Decimal('1')
+            if not checksums[column]:
+                failures.append(f"{column} quarters sum to {quarter_sum}, Total row says {total}")
+
+        return {'passed': not failures, 'checksums': checksums, 'failures': failures}
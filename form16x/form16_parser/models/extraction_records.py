@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Extraction-Time Records
+=======================
+
+Lightweight, slotted containers used on the extraction hot path.
+
+Per-table and per-document intermediate results are created many times per
+document, so they avoid pydantic validation and per-instance __dict__.
+The pydantic models in form16_models remain the public types: a
+DocumentDraft is turned into a Form16Document exactly once, at the end of
+extraction, and section values that are not already validated models are
+validated at that point.
+"""
+
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from form16x.form16_parser.models.form16_models import (
+    ChapterVIADeductions, EmployeeInfo, EmployerInfo, Form16Document, Form16Metadata,
+    SalaryBreakdown, Section16Deductions, TaxComputation, TaxDeductionQuarterly
+)
+
+# dataclass(slots=True) is only available on Python 3.10+
+DATACLASS_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+_SECTION_MODELS = {
+    'metadata': Form16Metadata,
+    'employee': EmployeeInfo,
+    'employer': EmployerInfo,
+    'salary': SalaryBreakdown,
+    'chapter_via_deductions': ChapterVIADeductions,
+    'section16_deductions': Section16Deductions,
+    'tax_computation': TaxComputation,
+}
+
+
+@dataclass(**DATACLASS_SLOTS)
+class DocumentDraft:
+    """Mutable accumulator for a Form16Document under extraction"""
+    metadata: Optional[Any] = None
+    employee: Optional[Any] = None
+    employer: Optional[Any] = None
+    salary: Optional[Any] = None
+    quarterly_tds: Optional[List[Any]] = None
+    chapter_via_deductions: Optional[Any] = None
+    section16_deductions: Optional[Any] = None
+    tax_computation: Optional[Any] = None
+    extraction_confidence: Dict[str, float] = field(default_factory=dict)
+    detailed_perquisites: Dict[str, float] = field(default_factory=dict)
+    processing_metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def apply(self, updates: Dict[str, Any]) -> 'DocumentDraft':
+        """Apply Form16Document field updates"""
+        for field_name, value in updates.items():
+            setattr(self, field_name, value)
+        return self
+
+    def to_document(self) -> Form16Document:
+        """
+        Build the Form16Document in a single construction.
+
+        Sections produced by extractors are already validated pydantic models and
+        are passed through; plain dict sections are validated here. Empty sections
+        fall back to the model defaults.
+        """
+        values: Dict[str, Any] = {}
+
+        for section_name, model_cls in _SECTION_MODELS.items():
+            section = getattr(self, section_name)
+            if section is None:
+                continue
+            values[section_name] = section if isinstance(section, BaseModel) else model_cls.model_validate(section)
+
+        if self.quarterly_tds:
+            values['quarterly_tds'] = [
+                record if isinstance(record, BaseModel) else TaxDeductionQuarterly.model_validate(record)
+                for record in self.quarterly_tds
+            ]
+
+        for field_name in ('extraction_confidence', 'detailed_perquisites', 'processing_metadata'):
+            value = getattr(self, field_name)
+            if value:
+                values[field_name] = value
+
+        return Form16Document.model_construct(**values)
@@ -143,8 +143,8 @@ class SalaryBreakdown(BaseModel):
     
     def get_non_zero_fields(self) -> Dict[str, Decimal]:
         """Get all fields with non-zero values"""
-        return {k: v for k, v in self.dict().items() 
-                if v is not None and v > 0}
+        values = ((name, getattr(self, name)) for name in type(self).model_fields)
+        return {k: v for k, v in values if v is not None and v > 0}
     
     def calculate_totals(self):
         """Calculate derived totals from components"""
@@ -304,7 +304,7 @@ class Form16Document(BaseModel):
             "confidence_scores": self.extraction_confidence,
             "missing_critical_fields": self.missing_fields,
             "extraction_errors": self.extraction_errors,
-            "quality_score": self._calculate_quality_score()
+            "quality_score": self._calculate_quality_score(extracted_fields)
         }
     
     def _count_total_fields(self) -> int:
@@ -325,16 +325,16 @@ class Form16Document(BaseModel):
         """Count successfully extracted fields"""
         count = 0
         
-        # Count non-None fields in each section
-        for field_name, field_value in self.employee.dict().items():
-            if field_value is not None and str(field_value).strip():
-                count += 1
-                
-        for field_name, field_value in self.employer.dict().items():
-            if field_value is not None and str(field_value).strip():
-                count += 1
-                
-        for field_name, field_value in self.salary.dict().items():
+        # Count non-None fields in each section, reading attributes directly
+        # instead of materializing a .dict() copy per section
+        for section in (self.employee, self.employer):
+            for field_name in type(section).model_fields:
+                field_value = getattr(section, field_name)
+                if field_value is not None and str(field_value).strip():
+                    count += 1
+        
+        for field_name in SalaryBreakdown.model_fields:
+            field_value = getattr(self.salary, field_name)
             if field_value is not None and field_value != 0:
                 count += 1
                 
@@ -343,13 +343,16 @@ class Form16Document(BaseModel):
         
         return count
     
-    def _calculate_quality_score(self) -> float:
+    def _calculate_quality_score(self, extracted_fields: Optional[int] = None) -> float:
         """Calculate overall extraction quality score"""
         if not self.extraction_confidence:
             return 0.0
+        
+        if extracted_fields is None:
+            extracted_fields = self._count_extracted_fields()
             
         avg_confidence = sum(self.extraction_confidence.values()) / len(self.extraction_confidence)
-        completeness = self._count_extracted_fields() / self._count_total_fields()
+        completeness = extracted_fields / self._count_total_fields()
         error_penalty = max(0, 1 - len(self.extraction_errors) * 0.1)
         
         return (avg_confidence * 0.4 + completeness * 0.5 + error_penalty * 0.1) * 100
@@ -6,7 +6,7 @@ breakdowns, and tax optimization suggestions.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 from decimal import Decimal
 from enum import Enum
 
@@ -146,6 +146,7 @@ class TaxOptimizationAnalysis:
     suggestions: List[TaxOptimizationSuggestion] = field(default_factory=list)
     potential_total_savings: Decimal = field(default=Decimal('0'))
     optimized_tax_liability: Decimal = field(default=Decimal('0'))
+    savings_frontier: List[Dict[str, Any]] = field(default_factory=list)  # Investment vs exact tax saved
     
     def __post_init__(self):
         """Calculate total potential savings"""
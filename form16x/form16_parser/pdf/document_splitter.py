@@ -0,0 +1,161 @@
+"""
+Bulk Form16 Document Splitter
+=============================
+
+Splits one PDF holding many employees' Form16s into per-certificate page
+ranges. Pages are streamed through the text layer one at a time, so a bulk
+file of thousands of pages never has more than one page's text in memory.
+
+A new certificate starts when a page carries a certificate number or employee
+PAN different from the current certificate's. The "FORM NO. 16" header is
+recorded on each segment but does not split on its own, since Part A and
+Part B pages both carry it.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+
+
+FORM16_HEADER_PATTERN = re.compile(r'FORM\s*NO\.?\s*16(?!\s*A)\b', re.IGNORECASE)
+CERTIFICATE_PATTERN = re.compile(r'(?i:Certificate\s*(?:No\.?|Number))\s*[:\-]?\s*([A-Z0-9]{6,12})\b')
+PAN_PATTERN = re.compile(r'\b[A-Z]{3}P[A-Z][0-9]{4}[A-Z]\b')
+
+# Label words that can follow "Certificate No." in the text layer
+_NOT_CERTIFICATES = {'UPDATED', 'NUMBER'}
+
+
+@dataclass
+class DocumentSegment:
+    """Page range (1-based, inclusive) of one employee's certificate"""
+    index: int
+    first_page: int
+    last_page: int
+    certificate_number: Optional[str] = None
+    employee_pans: List[str] = field(default_factory=list)
+    has_header: bool = False
+
+    @property
+    def page_count(self) -> int:
+        return self.last_page - self.first_page + 1
+
+    @property
+    def employee_pan(self) -> Optional[str]:
+        return self.employee_pans[0] if self.employee_pans else None
+
+    @property
+    def label(self) -> str:
+        """Short name for output files"""
+        return self.certificate_number or self.employee_pan or f"pages_{self.first_page}-{self.last_page}"
+
+
+def page_identifiers(text: str) -> Tuple[bool, Optional[str], List[str]]:
+    """Form16 header flag, certificate number and individual PANs found on a page"""
+    certificate = None
+    for match in CERTIFICATE_PATTERN.finditer(text):
+        value = match.group(1)
+        if value not in _NOT_CERTIFICATES and re.search(r'[A-Z]', value):
+            certificate = value
+            break
+
+    pans = list(dict.fromkeys(PAN_PATTERN.findall(text)))
+    return bool(FORM16_HEADER_PATTERN.search(text)), certificate, pans
+
+
+class Form16DocumentSplitter:
+    """Detects certificate boundaries in bulk Form16 PDFs"""
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+
+    def split_texts(self, page_texts: Iterable[str]) -> Iterator[DocumentSegment]:
+        """
+        Group consecutive pages into certificates.
+
+        Each segment is yielded as soon as the next certificate starts, so the
+        caller can process it while later pages are still being read.
+
+        Args:
+            page_texts: Text of each page, in order
+
+        Yields:
+            DocumentSegment per certificate
+        """
+        current: Optional[DocumentSegment] = None
+        current_pans: Set[str] = set()
+
+        for page_number, text in enumerate(page_texts, 1):
+            has_header, certificate, pans = page_identifiers(text or '')
+
+            if current is not None and self._starts_new_certificate(current, current_pans, certificate, pans):
+                yield current
+                current = DocumentSegment(index=current.index + 1, first_page=page_number, last_page=page_number)
+                current_pans = set()
+            elif current is None:
+                current = DocumentSegment(index=0, first_page=page_number, last_page=page_number)
+
+            current.last_page = page_number
+            current.has_header = current.has_header or has_header
+            if certificate and current.certificate_number is None:
+                current.certificate_number = certificate
+            for pan in pans:
+                if pan not in current_pans:
+                    current_pans.add(pan)
+                    current.employee_pans.append(pan)
+
+        if current is not None:
+            yield current
+
+    def _starts_new_certificate(self, current: DocumentSegment, current_pans: Set[str],
+                                certificate: Optional[str], pans: List[str]) -> bool:
+        if certificate and current.certificate_number and certificate != current.certificate_number:
+            return True
+        # An individual employer PAN repeats on every certificate, so only a page
+        # sharing no PAN with the current certificate is a different employee
+        return bool(pans and current_pans and current_pans.isdisjoint(pans))
+
+    def split(self, pdf_path: Path) -> Iterator[DocumentSegment]:
+        """Stream a PDF's text layer page by page and yield its certificates"""
+        import PyPDF2
+
+        reader = PyPDF2.PdfReader(str(pdf_path))
+        yield from self.split_texts(self._page_texts(reader, pdf_path))
+
+    def split_to_files(self, pdf_path: Path, output_dir: Path) -> Iterator[Tuple[DocumentSegment, Path]]:
+        """
+        Split a bulk PDF and write each certificate as its own PDF.
+
+        Args:
+            pdf_path: Bulk PDF
+            output_dir: Directory for the per-certificate PDFs
+
+        Yields:
+            (segment, path of its PDF) as each certificate is completed
+        """
+        import PyPDF2
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        reader = PyPDF2.PdfReader(str(pdf_path))
+
+        for segment in self.split_texts(self._page_texts(reader, pdf_path)):
+            writer = PyPDF2.PdfWriter()
+            for page_index in range(segment.first_page - 1, segment.last_page):
+                writer.add_page(reader.pages[page_index])
+
+            segment_path = output_dir / f"{pdf_path.stem}_{segment.index + 1:04d}.pdf"
+            with open(segment_path, 'wb') as segment_file:
+                writer.write(segment_file)
+
+            self.logger.debug(f"Certificate {segment.index + 1} ({segment.label}): "
+                              f"pages {segment.first_page}-{segment.last_page}")
+            yield segment, segment_path
+
+    def _page_texts(self, reader, pdf_path: Path) -> Iterator[str]:
+        for page_number, page in enumerate(reader.pages, 1):
+            try:
+                yield page.extract_text() or ''
+            except Exception as e:
+                self.logger.warning(f"Could not read text of page {page_number} in {pdf_path.name}: {e}")
+                yield ''
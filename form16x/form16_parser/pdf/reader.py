@@ -7,13 +7,22 @@ Uses Camelot as primary, with fallbacks for different Form 16 layouts.
 """
 
 import logging
+import math
+import multiprocessing
+import os
+import threading
+import weakref
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 import pandas as pd
 from dataclasses import dataclass
 from enum import Enum
 
+from ..utils.table_utils import _cache_cell_matrix, string_matrix
+from .strategy_stats import StrategyStatsStore, document_fingerprint
+
 # PDF processing libraries - LAZY LOADED for performance
 import sys
 from typing import TYPE_CHECKING
@@ -47,6 +56,98 @@ PDFPLUMBER_AVAILABLE = 'pdfplumber' in sys.modules or _check_module_availability
 PYPDF2_AVAILABLE = 'PyPDF2' in sys.modules or _check_module_availability('PyPDF2')
 
 
+def probe_document(pdf_path: Path) -> Tuple[Optional[str], Optional[int], Optional[Tuple[int, int]]]:
+    """
+    Producer, page count and first page size in points, read without parsing pages.
+    
+    Only the xref, the document info and the page tree down to the first leaf
+    are read, so this stays cheap for documents of any length.
+    """
+    import PyPDF2
+    
+    reader = PyPDF2.PdfReader(str(pdf_path))
+    metadata = reader.metadata
+    producer = metadata.get('/Producer') if metadata else None
+    
+    pages = reader.trailer['/Root']['/Pages']
+    page_count = int(pages.get('/Count', 0))
+    box = pages.get('/MediaBox')
+    node = pages
+    while node.get('/Kids'):
+        node = node['/Kids'][0].get_object()
+        box = node.get('/MediaBox', box)
+    
+    page_size = None
+    if page_count and box:
+        x1, y1, x2, y2 = (float(value) for value in box)
+        page_size = (round(abs(x2 - x1)), round(abs(y2 - y1)))
+    return (str(producer) if producer else None), page_count, page_size
+
+
+# Camelot parameter sets per flavor; 'default' is tried first, extra sets after it
+CAMELOT_PARAMETER_SETS: Dict[str, Dict[str, Dict[str, Any]]] = {
+    'lattice': {
+        'default': {
+            'line_scale': 40,  # Adjust for better line detection
+            'copy_text': ['h'],  # Handle headers properly
+            'shift_text': ['l', 'r'],  # Handle text alignment
+        },
+    },
+    'stream': {
+        'default': {
+            'row_tol': 2,  # Row tolerance
+            'column_tol': 0,  # Column tolerance
+            'edge_tol': 50,  # Edge tolerance
+        },
+    },
+}
+
+
+def page_chunks(page_count: int, workers: int, min_chunk_pages: int = 2) -> List[Tuple[int, int]]:
+    """
+    Split pages 1..page_count into contiguous inclusive ranges.
+    
+    Aims for about two chunks per worker so a slow page does not leave the
+    other workers idle, without going below min_chunk_pages per chunk.
+    """
+    if page_count <= 0:
+        return []
+    chunk_size = max(min_chunk_pages, math.ceil(page_count / (max(1, workers) * 2)))
+    return [(first, min(first + chunk_size - 1, page_count))
+            for first in range(1, page_count + 1, chunk_size)]
+
+
+def _camelot_page_chunk(pdf_path: str, camelot_kwargs: Dict[str, Any],
+                        first: int, last: int) -> List[Tuple[int, pd.DataFrame]]:
+    """Camelot tables for pages first..last (runs in a page worker process)"""
+    camelot = _lazy_import('camelot')
+    tables = camelot.read_pdf(pdf_path, pages=f"{first}-{last}", **camelot_kwargs)
+    return [(int(table.page), table.df) for table in tables]
+
+
+def _pdfplumber_page_chunk(pdf_path: str, first: int = 1,
+                           last: Optional[int] = None) -> Tuple[List[Tuple[int, list]], List[str], int]:
+    """Raw pdfplumber tables for pages first..last, warnings and the document page count"""
+    import pdfplumber
+    
+    raw_tables = []
+    warnings = []
+    
+    with pdfplumber.open(pdf_path) as pdf:
+        total_pages = len(pdf.pages)
+        for page_num in range(first, (last or total_pages) + 1):
+            try:
+                # Extract tables from this page
+                for table_data in pdf.pages[page_num - 1].extract_tables():
+                    if table_data and len(table_data) > 1:  # At least 2 rows
+                        raw_tables.append((page_num, table_data))
+            
+            except Exception as e:
+                warnings.append(f"Error extracting from page {page_num}: {str(e)}")
+    
+    return raw_tables, warnings, total_pages
+
+
 class ExtractionStrategy(Enum):
     """PDF extraction strategies (tables and text)"""
     CAMELOT_LATTICE = "camelot_lattice"
@@ -72,11 +173,18 @@ class TableExtractionResult:
     text_data: Optional[Dict[str, Any]] = None
 
 
+@dataclass
+class _PageTable:
+    """Camelot table returned by a page worker (page number and raw DataFrame)"""
+    page: int
+    df: pd.DataFrame
+
+
 class IPDFProcessor(ABC):
     """Abstract interface for PDF processing"""
     
     @abstractmethod
-    def extract_tables(self, pdf_path: Path) -> TableExtractionResult:
+    def extract_tables(self, pdf_path: Path, first_page: int = 1) -> TableExtractionResult:
         """Extract tables from PDF file"""
         pass
     
@@ -92,9 +200,58 @@ class RobustPDFProcessor(IPDFProcessor):
     to handle ANY Form 16 document structure
     """
     
-    def __init__(self):
+    # Default order of table strategies (text extraction always runs as well)
+    PREFERRED_ORDER = [
+        ExtractionStrategy.CAMELOT_LATTICE,    # Fast and accurate for most Form16s
+        ExtractionStrategy.TEXT_EXTRACTION,    # Always run for hybrid approach
+        ExtractionStrategy.CAMELOT_STREAM,     # Secondary camelot strategy
+        ExtractionStrategy.PDFPLUMBER,         # Fast lightweight option
+        ExtractionStrategy.TABULA_LATTICE,     # Slower but comprehensive
+        ExtractionStrategy.FALLBACK
+    ]
+    
+    # Cheap subset for retrying documents that exceeded their time or memory limit
+    CHEAP_STRATEGIES = (
+        ExtractionStrategy.TEXT_EXTRACTION,
+        ExtractionStrategy.PDFPLUMBER,
+        ExtractionStrategy.FALLBACK
+    )
+    
+    # A learned winner reproducing its usual confidence within this margin ends the search
+    LEARNED_CONFIDENCE_MARGIN = 0.05
+    
+    # Documents with at least this many pages are split across page workers
+    PARALLEL_PAGE_THRESHOLD = 8
+    
+    def __init__(self, strategy_stats: Optional[StrategyStatsStore] = None,
+                 camelot_parameter_sets: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None,
+                 page_workers: Optional[int] = None,
+                 strategies: Optional[Tuple[ExtractionStrategy, ...]] = None):
+        """
+        Args:
+            strategy_stats: Learn and reuse the winning strategy per document fingerprint
+            camelot_parameter_sets: Extra or replacement Camelot parameter sets per flavor
+            page_workers: Worker processes for page-parallel table detection on large
+                documents (default: CPU count, 1 disables)
+            strategies: Only use these strategies (default: every installed one)
+        """
         self.logger = logging.getLogger(__name__)
+        self.page_workers = page_workers if page_workers is not None else (os.cpu_count() or 1)
+        self._page_pool: Optional[ProcessPoolExecutor] = None
+        self._page_pool_finalizer: Optional[weakref.finalize] = None
+        self._page_pool_lock = threading.Lock()
         self.extraction_strategies = self._initialize_strategies()
+        if strategies is not None:
+            self.extraction_strategies = {
+                strategy: available and strategy in strategies
+                for strategy, available in self.extraction_strategies.items()
+            }
+        self.strategy_stats = strategy_stats
+        self.camelot_parameter_sets = {
+            flavor: dict(parameter_sets) for flavor, parameter_sets in CAMELOT_PARAMETER_SETS.items()
+        }
+        for flavor, parameter_sets in (camelot_parameter_sets or {}).items():
+            self.camelot_parameter_sets.setdefault(flavor, {}).update(parameter_sets)
     
     def _initialize_strategies(self) -> Dict[ExtractionStrategy, bool]:
         """Initialize available extraction strategies"""
@@ -113,13 +270,57 @@ class RobustPDFProcessor(IPDFProcessor):
         
         return strategies
     
+    def close(self) -> None:
+        """Shut down the page worker pool, if one was started"""
+        with self._page_pool_lock:
+            if self._page_pool is not None:
+                self._page_pool_finalizer.detach()
+                self._page_pool.shutdown(wait=True)
+                self._page_pool = None
+                self._page_pool_finalizer = None
+    
+    def _get_page_pool(self) -> ProcessPoolExecutor:
+        with self._page_pool_lock:
+            if self._page_pool is None:
+                # spawn: batch runs extractions on threads, which fork does not mix with
+                self._page_pool = ProcessPoolExecutor(
+                    max_workers=self.page_workers, mp_context=multiprocessing.get_context('spawn')
+                )
+                # Services own processors without closing them; stop the workers with the processor
+                self._page_pool_finalizer = weakref.finalize(self, self._page_pool.shutdown, wait=False)
+            return self._page_pool
+    
+    def _page_chunks_for(self, pdf_path: Path, first_page: int = 1,
+                         page_count: Optional[int] = None) -> Optional[List[Tuple[int, int]]]:
+        """Page ranges for parallel detection, or None when the document is processed in one call"""
+        if self.page_workers <= 1:
+            return None
+        if page_count is None:
+            page_count = self._probe_document(pdf_path)[1]
+        if not page_count or page_count - first_page + 1 < self.PARALLEL_PAGE_THRESHOLD:
+            return None
+        workers = min(self.page_workers, os.cpu_count() or 1)
+        offset = first_page - 1
+        chunks = [(first + offset, last + offset) for first, last in page_chunks(page_count - offset, workers)]
+        return chunks if len(chunks) > 1 else None
+    
+    def _map_page_chunks(self, worker, pdf_path: Path, chunks: List[Tuple[int, int]], *args) -> List[Any]:
+        """Run worker(pdf_path, *args, first, last) per chunk in the pool, results in page order"""
+        pool = self._get_page_pool()
+        futures = [pool.submit(worker, str(pdf_path), *args, first, last) for first, last in chunks]
+        return [future.result() for future in futures]
+    
     def get_supported_strategies(self) -> List[ExtractionStrategy]:
         """Get list of supported extraction strategies"""
         return [strategy for strategy, available in self.extraction_strategies.items() if available]
     
-    def extract_tables(self, pdf_path: Path) -> TableExtractionResult:
+    def extract_tables(self, pdf_path: Path, first_page: int = 1) -> TableExtractionResult:
         """
         Extract tables using multiple strategies for maximum robustness
+        
+        Args:
+            pdf_path: PDF file
+            first_page: Detect tables from this page on (text extraction still reads every page)
         """
         import time
         start_time = time.time()
@@ -131,50 +332,62 @@ class RobustPDFProcessor(IPDFProcessor):
         if logging.getLogger().isEnabledFor(logging.INFO):
             self.logger.info(f"Extracting tables from: {pdf_path.name}")
         
-        # Try strategies in order of preference (optimized for speed)
-        preferred_order = [
-            ExtractionStrategy.CAMELOT_LATTICE,    # Fast and accurate for most Form16s
-            ExtractionStrategy.TEXT_EXTRACTION,    # Always run for hybrid approach
-            ExtractionStrategy.CAMELOT_STREAM,     # Secondary camelot strategy
-            ExtractionStrategy.PDFPLUMBER,         # Fast lightweight option
-            ExtractionStrategy.TABULA_LATTICE,     # Slower but comprehensive
-            ExtractionStrategy.FALLBACK
-        ]
-        
         best_result = None
+        best_candidate = None
         text_extraction_result = None
         all_warnings = []
-        
-        for strategy in preferred_order:
+        attempts = []
+        
+        candidates = self._candidate_plan()
+        candidate_ids = list(candidates)
+        stats_keys = []
+        plan = None
+        # One probe serves the fingerprint and every strategy's page ranges
+        probe = self._probe_document(pdf_path)
+        
+        if self.strategy_stats is not None:
+            # Text extraction runs first so the TAN can refine the fingerprint
+            text_extraction_result = self._run_text_extraction(pdf_path, all_warnings)
+            stats_keys = self._fingerprint_keys(pdf_path, text_extraction_result, probe)
+            plan = self.strategy_stats.plan(stats_keys, candidate_ids)
+            candidate_ids = plan.order
+            if plan.winner and logging.getLogger().isEnabledFor(logging.INFO):
+                self.logger.info(f"Learned strategy order for fingerprint {plan.fingerprint}: "
+                                 f"{', '.join(candidate_ids)}")
+        
+        for candidate_id in candidate_ids:
+            strategy, parameter_set = candidates[candidate_id]
             if not self.extraction_strategies.get(strategy, False):
                 continue
-                
+            
+            # Handle text extraction separately for hybrid approach
+            if strategy == ExtractionStrategy.TEXT_EXTRACTION:
+                if text_extraction_result is None:
+                    text_extraction_result = self._run_text_extraction(pdf_path, all_warnings)
+                continue
+            
+            attempt_start = time.time()
             try:
                 # Conditional debug logging for performance
                 if logging.getLogger().isEnabledFor(logging.DEBUG):
-                    self.logger.debug(f"Trying strategy: {strategy.value}")
-                result = self._extract_with_strategy(pdf_path, strategy)
-                
-                # Handle text extraction separately for hybrid approach
-                if strategy == ExtractionStrategy.TEXT_EXTRACTION:
-                    if result and result.text_data:
-                        if logging.getLogger().isEnabledFor(logging.INFO):
-                            self.logger.info(f"Text extraction found {len(result.text_data)} identity fields")
-                        text_extraction_result = result
-                        all_warnings.extend(result.warnings)
-                    continue
+                    self.logger.debug(f"Trying strategy: {candidate_id}")
+                result = self._extract_with_strategy(pdf_path, strategy, parameter_set, first_page,
+                                                     page_count=probe[1])
                 
                 if result and result.tables:
                     if logging.getLogger().isEnabledFor(logging.INFO):
-                        self.logger.info(f"Success with {strategy.value}: {len(result.tables)} tables extracted")
+                        self.logger.info(f"Success with {candidate_id}: {len(result.tables)} tables extracted")
                     
                     # Calculate confidence score for this result
                     confidence = self._calculate_extraction_confidence(result.tables, strategy)
+                    attempts.append({'candidate': candidate_id, 'succeeded': True,
+                                     'confidence': confidence, 'seconds': time.time() - attempt_start})
                     
                     if best_result is None or confidence > best_result.confidence_score:
                         result.confidence_score = confidence
                         result.strategy_used = strategy
                         best_result = result
+                        best_candidate = candidate_id
                     
                     all_warnings.extend(result.warnings)
                     
@@ -187,13 +400,34 @@ class RobustPDFProcessor(IPDFProcessor):
                         if logging.getLogger().isEnabledFor(logging.DEBUG):
                             self.logger.debug(f"Early termination: very high confidence {confidence:.2f}")
                         break
+                    elif (plan is not None and candidate_id == plan.winner
+                          and confidence >= plan.expected_confidence - self.LEARNED_CONFIDENCE_MARGIN):
+                        if logging.getLogger().isEnabledFor(logging.DEBUG):
+                            self.logger.debug(f"Early termination: learned winner {candidate_id} "
+                                              f"reproduced confidence {confidence:.2f}")
+                        break
+                else:
+                    attempts.append({'candidate': candidate_id, 'succeeded': False,
+                                     'confidence': 0.0, 'seconds': time.time() - attempt_start})
                         
             except Exception as e:
-                warning = f"Strategy {strategy.value} failed: {str(e)}"
+                attempts.append({'candidate': candidate_id, 'succeeded': False,
+                                 'confidence': 0.0, 'seconds': time.time() - attempt_start})
+                warning = f"Strategy {candidate_id} failed: {str(e)}"
                 self.logger.warning(warning)
                 all_warnings.append(warning)
                 continue
         
+        if self.strategy_stats is not None:
+            self.strategy_stats.record(stats_keys, attempts, best_candidate, seconds=time.time() - start_time)
+            if best_result is not None:
+                best_result.metadata['strategy_selection'] = {
+                    'candidate': best_candidate,
+                    'fingerprint': stats_keys[0] if stats_keys else None,
+                    'learned_winner': plan.winner if plan else None,
+                    'attempts': [attempt['candidate'] for attempt in attempts]
+                }
+        
         # Create hybrid result combining tables and text data
         if best_result and text_extraction_result:
             # Combine the best table result with text extraction data
@@ -218,7 +452,7 @@ class RobustPDFProcessor(IPDFProcessor):
                 strategy_used=ExtractionStrategy.FALLBACK,
                 confidence_score=0.0,
                 processing_time=processing_time,
-                metadata={"pdf_path": str(pdf_path), "total_strategies_tried": len(preferred_order)},
+                metadata={"pdf_path": str(pdf_path), "total_strategies_tried": len(candidates)},
                 warnings=all_warnings,
                 page_numbers=[]
             )
@@ -231,23 +465,87 @@ class RobustPDFProcessor(IPDFProcessor):
         
         return best_result
     
-    def _extract_with_strategy(self, pdf_path: Path, strategy: ExtractionStrategy) -> Optional[TableExtractionResult]:
-        """Extract tables using a specific strategy"""
+    def _candidate_plan(self) -> Dict[str, Tuple[ExtractionStrategy, Optional[str]]]:
+        """Candidate ids in default order, mapped to (strategy, Camelot parameter set)"""
+        candidates = {}
+        for strategy in self.PREFERRED_ORDER:
+            flavor = {
+                ExtractionStrategy.CAMELOT_LATTICE: 'lattice',
+                ExtractionStrategy.CAMELOT_STREAM: 'stream',
+            }.get(strategy)
+            if flavor is None:
+                candidates[strategy.value] = (strategy, None)
+                continue
+            for parameter_set in self.camelot_parameter_sets.get(flavor, {}):
+                candidates[f"{strategy.value}:{parameter_set}"] = (strategy, parameter_set)
+        return candidates
+    
+    def _run_text_extraction(self, pdf_path: Path, all_warnings: List[str]) -> Optional[TableExtractionResult]:
+        """Run the text strategy for the hybrid result, None if it found nothing"""
+        if not self.extraction_strategies.get(ExtractionStrategy.TEXT_EXTRACTION, False):
+            return None
+        try:
+            result = self._extract_with_strategy(pdf_path, ExtractionStrategy.TEXT_EXTRACTION)
+        except Exception as e:
+            warning = f"Strategy {ExtractionStrategy.TEXT_EXTRACTION.value} failed: {str(e)}"
+            self.logger.warning(warning)
+            all_warnings.append(warning)
+            return None
+        
+        if result and result.text_data:
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                self.logger.info(f"Text extraction found {len(result.text_data)} identity fields")
+            all_warnings.extend(result.warnings)
+            return result
+        return None
+    
+    def _fingerprint_keys(self, pdf_path: Path,
+                          text_extraction_result: Optional[TableExtractionResult],
+                          probe: Optional[Tuple[Optional[str], Optional[int], Optional[Tuple[int, int]]]] = None
+                          ) -> List[str]:
+        """Strategy statistics keys for a document, most specific first"""
+        producer, page_count, page_size = probe if probe is not None else self._probe_document(pdf_path)
+        tan = None
+        if text_extraction_result and text_extraction_result.text_data:
+            tan = text_extraction_result.text_data.get('employer_tan')
+        
+        layout_key = document_fingerprint(producer, page_count, page_size)
+        if tan:
+            return [document_fingerprint(producer, page_count, page_size, str(tan).upper()), layout_key]
+        return [layout_key]
+    
+    def _probe_document(self, pdf_path: Path) -> Tuple[Optional[str], Optional[int], Optional[Tuple[int, int]]]:
+        """Cheap pre-parse properties: producer, page count and first page size in points"""
+        if not PYPDF2_AVAILABLE:
+            return None, None, None
+        try:
+            return probe_document(pdf_path)
+        except Exception as e:
+            self.logger.debug(f"Could not probe {pdf_path.name} for fingerprinting: {e}")
+            return None, None, None
+    
+    def _extract_with_strategy(self, pdf_path: Path, strategy: ExtractionStrategy,
+                               parameter_set: Optional[str] = None,
+                               first_page: int = 1,
+                               page_count: Optional[int] = None) -> Optional[TableExtractionResult]:
+        """Extract tables using a specific strategy (and Camelot parameter set)"""
         
         if strategy == ExtractionStrategy.CAMELOT_LATTICE:
-            return self._extract_with_camelot(pdf_path, flavor='lattice')
+            return self._extract_with_camelot(pdf_path, flavor='lattice', parameter_set=parameter_set or 'default',
+                                              first_page=first_page, page_count=page_count)
         
         elif strategy == ExtractionStrategy.CAMELOT_STREAM:
-            return self._extract_with_camelot(pdf_path, flavor='stream')
+            return self._extract_with_camelot(pdf_path, flavor='stream', parameter_set=parameter_set or 'default',
+                                              first_page=first_page, page_count=page_count)
         
         elif strategy == ExtractionStrategy.TABULA_LATTICE:
-            return self._extract_with_tabula(pdf_path, lattice=True)
+            return self._extract_with_tabula(pdf_path, lattice=True, first_page=first_page, page_count=page_count)
         
         elif strategy == ExtractionStrategy.TABULA_STREAM:
-            return self._extract_with_tabula(pdf_path, lattice=False)
+            return self._extract_with_tabula(pdf_path, lattice=False, first_page=first_page, page_count=page_count)
         
         elif strategy == ExtractionStrategy.PDFPLUMBER:
-            return self._extract_with_pdfplumber(pdf_path)
+            return self._extract_with_pdfplumber(pdf_path, first_page=first_page, page_count=page_count)
         
         elif strategy == ExtractionStrategy.TEXT_EXTRACTION:
             return self._extract_with_text_extraction(pdf_path)
@@ -257,7 +555,9 @@ class RobustPDFProcessor(IPDFProcessor):
         
         return None
     
-    def _extract_with_camelot(self, pdf_path: Path, flavor: str = 'lattice') -> TableExtractionResult:
+    def _extract_with_camelot(self, pdf_path: Path, flavor: str = 'lattice',
+                              parameter_set: str = 'default', first_page: int = 1,
+                              page_count: Optional[int] = None) -> TableExtractionResult:
         """Extract using Camelot (primary strategy)"""
         if not CAMELOT_AVAILABLE:
             raise ImportError("Camelot not available")
@@ -268,24 +568,29 @@ class RobustPDFProcessor(IPDFProcessor):
         # Camelot parameters optimized for Form 16
         camelot_kwargs = {
             'flavor': flavor,
-            'pages': 'all',
+            'pages': 'all' if first_page <= 1 else f"{first_page}-end",
             'suppress_stdout': True
         }
         
-        if flavor == 'lattice':
-            camelot_kwargs.update({
-                'line_scale': 40,  # Adjust for better line detection
-                'copy_text': ['h'],  # Handle headers properly
-                'shift_text': ['l', 'r'],  # Handle text alignment
-            })
-        else:  # stream
-            camelot_kwargs.update({
-                'row_tol': 2,  # Row tolerance
-                'column_tol': 0,  # Column tolerance
-                'edge_tol': 50,  # Edge tolerance
-            })
+        camelot_kwargs.update(self.camelot_parameter_sets[flavor][parameter_set])
+        
+        tables = None
+        chunks = self._page_chunks_for(pdf_path, first_page, page_count)
+        if chunks:
+            chunk_kwargs = {key: value for key, value in camelot_kwargs.items() if key != 'pages'}
+            try:
+                tables = [
+                    _PageTable(page, df)
+                    for chunk_tables in self._map_page_chunks(_camelot_page_chunk, pdf_path, chunks, chunk_kwargs)
+                    for page, df in chunk_tables
+                ]
+                self.logger.debug(f"Camelot {flavor}: {len(chunks)} page chunks processed in parallel")
+            except Exception as e:
+                self.logger.warning(f"Page-parallel Camelot failed, processing serially: {e}")
+                tables = None
         
-        tables = camelot.read_pdf(str(pdf_path), **camelot_kwargs)
+        if tables is None:
+            tables = camelot.read_pdf(str(pdf_path), **camelot_kwargs)
         
         if not tables:
             return TableExtractionResult(
@@ -326,6 +631,7 @@ class RobustPDFProcessor(IPDFProcessor):
             processing_time=0.0,
             metadata={
                 'flavor': flavor,
+                'parameter_set': parameter_set,
                 'total_tables_found': len(tables),
                 'valid_tables': len(dataframes)
             },
@@ -333,7 +639,8 @@ class RobustPDFProcessor(IPDFProcessor):
             page_numbers=page_numbers
         )
     
-    def _extract_with_tabula(self, pdf_path: Path, lattice: bool = True) -> TableExtractionResult:
+    def _extract_with_tabula(self, pdf_path: Path, lattice: bool = True, first_page: int = 1,
+                             page_count: Optional[int] = None) -> TableExtractionResult:
         """Extract using Tabula (fallback strategy)"""
         if not TABULA_AVAILABLE:
             raise ImportError("Tabula not available")
@@ -341,8 +648,14 @@ class RobustPDFProcessor(IPDFProcessor):
         # Lazy import tabula only when needed
         tabula = _lazy_import('tabula')
         
+        pages = 'all'
+        if first_page > 1:
+            if page_count is None:
+                page_count = self._probe_document(pdf_path)[1]
+            pages = f"{first_page}-{page_count}" if page_count else 'all'
+        
         tabula_kwargs = {
-            'pages': 'all',
+            'pages': pages,
             'multiple_tables': True,
             'lattice': lattice,
             'pandas_options': {'header': None}  # Don't assume header row
@@ -387,42 +700,45 @@ class RobustPDFProcessor(IPDFProcessor):
             page_numbers=list(range(1, len(cleaned_tables) + 1))  # Approximate page numbers
         )
     
-    def _extract_with_pdfplumber(self, pdf_path: Path) -> TableExtractionResult:
+    def _extract_with_pdfplumber(self, pdf_path: Path, first_page: int = 1,
+                                 page_count: Optional[int] = None) -> TableExtractionResult:
         """Extract using pdfplumber (text-based extraction)"""
         if not PDFPLUMBER_AVAILABLE:
             raise ImportError("pdfplumber not available")
         
-        import pdfplumber
+        raw_tables = None
+        chunks = self._page_chunks_for(pdf_path, first_page, page_count)
+        if chunks:
+            try:
+                chunk_results = self._map_page_chunks(_pdfplumber_page_chunk, pdf_path, chunks)
+                raw_tables = [table for chunk_tables, _, _ in chunk_results for table in chunk_tables]
+                warnings = [warning for _, chunk_warnings, _ in chunk_results for warning in chunk_warnings]
+                total_pages = chunk_results[0][2]
+            except Exception as e:
+                self.logger.warning(f"Page-parallel pdfplumber failed, processing serially: {e}")
+                raw_tables = None
+        
+        if raw_tables is None:
+            raw_tables, warnings, total_pages = _pdfplumber_page_chunk(str(pdf_path), first_page)
         
         tables = []
         page_numbers = []
-        warnings = []
         
-        with pdfplumber.open(pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
-                try:
-                    # Extract tables from this page
-                    page_tables = page.extract_tables()
-                    
-                    for table_data in page_tables:
-                        if table_data and len(table_data) > 1:  # At least 2 rows
-                            # Convert to DataFrame
-                            df = pd.DataFrame(table_data)
-                            cleaned_df = self._clean_dataframe(df)
-                            
-                            if not cleaned_df.empty:
-                                tables.append(cleaned_df)
-                                page_numbers.append(page_num)
-                
-                except Exception as e:
-                    warnings.append(f"Error extracting from page {page_num}: {str(e)}")
+        for page_num, table_data in raw_tables:
+            # Convert to DataFrame
+            df = pd.DataFrame(table_data)
+            cleaned_df = self._clean_dataframe(df)
+            
+            if not cleaned_df.empty:
+                tables.append(cleaned_df)
+                page_numbers.append(page_num)
         
         return TableExtractionResult(
             tables=tables,
             strategy_used=ExtractionStrategy.PDFPLUMBER,
             confidence_score=0.0,
             processing_time=0.0,
-            metadata={'total_pages_processed': len(pdf.pages) if 'pdf' in locals() else 0},
+            metadata={'total_pages_processed': total_pages},
             warnings=warnings,
             page_numbers=page_numbers
         )
@@ -548,24 +864,26 @@ class RobustPDFProcessor(IPDFProcessor):
         if cleaned_df.empty:
             return cleaned_df
         
-        # Optimize string cleaning - vectorized operations
-        object_columns = cleaned_df.select_dtypes(include=['object']).columns
-        if len(object_columns) > 0:
-            # Batch convert and clean string columns
-            for col in object_columns:
-                series = cleaned_df[col]
-                # Only process if series has data
-                if not series.empty:
-                    series_str = series.astype(str, copy=False)
-                    series_clean = series_str.str.strip()
-                    # Use vectorized replace for common null values
-                    null_mask = series_clean.isin(['nan', 'None', '', 'NaN', 'null'])
-                    cleaned_df[col] = series_clean.where(~null_mask, None)
-        
         # Reset index only if needed
         if not cleaned_df.index.equals(pd.RangeIndex(len(cleaned_df))):
             cleaned_df = cleaned_df.reset_index(drop=True)
         
+        # Clean all string columns at once as a single NumPy string matrix
+        object_columns = cleaned_df.select_dtypes(include=['object']).columns
+        if len(object_columns) > 0:
+            strings, empty_mask = string_matrix(
+                cleaned_df[object_columns], ('nan', 'None', '', 'NaN', 'null')
+            )
+            values = strings.astype(object)
+            values[empty_mask] = None
+            
+            if len(object_columns) == len(cleaned_df.columns):
+                cleaned_df = pd.DataFrame(values, columns=cleaned_df.columns)
+                # Hand the stripped matrix to extractors reading via cell_matrix()
+                _cache_cell_matrix(cleaned_df, strings.astype(object))
+            else:
+                cleaned_df[object_columns] = values
+        
         return cleaned_df
     
     def _calculate_extraction_confidence(self, tables: List[pd.DataFrame], strategy: ExtractionStrategy) -> float:
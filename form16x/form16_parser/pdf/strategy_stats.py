@@ -0,0 +1,264 @@
+"""
+Extraction Strategy Statistics
+==============================
+
+Learns which table extraction strategy (and parameter set) wins for each kind
+of document. Documents are keyed by a cheap pre-parse fingerprint - producer
+string, page count, first page size and the employer TAN when known - and the
+winning strategy, its confidence and time are recorded per fingerprint.
+
+Counts decay geometrically on every new observation of a fingerprint, so an
+employer changing its Form16 layout moves the learned order within a few
+documents. Statistics live in a single JSON file written atomically.
+
+Records are kept in memory and merged into the file every save_every
+documents, on flush() and at interpreter exit. Each save takes a file lock,
+re-reads the file and replays the pending records onto it, so stores in
+several processes sharing one file do not drop each other's records.
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..utils.file_lock import file_lock, writer_temp_path
+
+# One record() call: keys, attempts, winner, seconds
+StrategyRecord = Tuple[List[str], List[Dict[str, Any]], Optional[str], Optional[float]]
+
+
+def document_fingerprint(producer: Optional[str], page_count: Optional[int],
+                         page_size: Optional[Sequence[float]], tan: Optional[str] = None) -> str:
+    """Stable short key for a document's pre-parse properties"""
+    payload = json.dumps(
+        [(producer or '').strip(), page_count, list(page_size) if page_size else None, tan],
+        separators=(',', ':')
+    )
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def _flush_at_exit(store_ref: 'weakref.ref') -> None:
+    store = store_ref()
+    if store is not None:
+        store.flush()
+
+
+@dataclass
+class StrategyPlan:
+    """Candidate order for one document, with the learned winner if any"""
+    order: List[str]
+    fingerprint: Optional[str] = None
+    winner: Optional[str] = None
+    expected_confidence: Optional[float] = None
+    demoted: List[str] = field(default_factory=list)
+
+
+class StrategyStatsStore:
+    """
+    Decaying per-fingerprint win statistics for extraction strategies.
+
+    Candidates are opaque strings (e.g. 'camelot_stream:default'). Each
+    fingerprint keeps, per candidate, decayed wins, attempts and failures plus
+    moving averages of confidence and seconds taken. Records reach the file
+    in batches of save_every; call flush() or close() when done.
+
+    A store opened with persist=False (in isolated worker processes) never
+    writes the file; its records are collected with take_records() and
+    recorded by the store of the process that owns the file.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path, decay: float = 0.8, min_win_weight: float = 0.5,
+                 max_fingerprints: int = 5000, persist: bool = True, save_every: int = 25):
+        if not 0.0 < decay < 1.0:
+            raise ValueError(f"decay must be between 0 and 1, got {decay}")
+
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path)
+        self.decay = decay
+        self.min_win_weight = min_win_weight
+        self.max_fingerprints = max_fingerprints
+        self.persist = persist
+        self.save_every = max(1, save_every)
+        self._lock = threading.RLock()
+        self._fingerprints: Dict[str, Dict[str, Any]] = self._load()
+        self._unsaved_records: List[StrategyRecord] = []
+        if persist:
+            atexit.register(_flush_at_exit, weakref.ref(self))
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable strategy statistics {self.path}: {e}")
+            return {}
+        if data.get('version') != self.VERSION:
+            self.logger.info(f"Discarding strategy statistics with version {data.get('version')}")
+            return {}
+        return data.get('fingerprints', {})
+
+    def _save(self, fingerprints: Dict[str, Dict[str, Any]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = writer_temp_path(self.path)
+        temp_path.write_text(
+            json.dumps({'version': self.VERSION, 'fingerprints': fingerprints}, separators=(',', ':')),
+            encoding='utf-8'
+        )
+        temp_path.replace(self.path)
+
+    def flush(self) -> None:
+        """Merge pending records into the statistics file"""
+        with self._lock:
+            if not self.persist or not self._unsaved_records:
+                return
+            try:
+                with file_lock(self.path):
+                    fingerprints = self._load()
+                    for keys, attempts, winner, seconds in self._unsaved_records:
+                        self._apply(fingerprints, keys, attempts, winner, seconds)
+                    self._save(fingerprints)
+            except OSError as e:
+                self.logger.warning(f"Could not save strategy statistics to {self.path}: {e}")
+                return
+            self._fingerprints = fingerprints
+            self._unsaved_records = []
+
+    def close(self) -> None:
+        """Save pending records; the store remains usable"""
+        self.flush()
+
+    def plan(self, keys: Sequence[str], candidates: Sequence[str]) -> StrategyPlan:
+        """
+        Order candidates for a document using the most specific known key.
+
+        Args:
+            keys: Fingerprints from most to least specific (e.g. with and without TAN)
+            candidates: Candidate ids in the default order
+
+        Returns:
+            StrategyPlan with historical winners first, candidates that keep
+            failing without ever winning last, and the rest in default order
+        """
+        with self._lock:
+            for key in keys:
+                entry = self._fingerprints.get(key)
+                if entry:
+                    break
+            else:
+                return StrategyPlan(order=list(candidates))
+
+            stats = entry['candidates']
+            winners = sorted(
+                (c for c in candidates if stats.get(c, {}).get('wins', 0.0) >= self.min_win_weight),
+                key=lambda c: (-stats[c]['wins'], stats[c]['seconds'])
+            )
+            demoted = [
+                c for c in candidates
+                if c not in winners and stats.get(c, {}).get('failures', 0.0) >= self.min_win_weight
+            ]
+            rest = [c for c in candidates if c not in winners and c not in demoted]
+
+            winner = winners[0] if winners else None
+            return StrategyPlan(
+                order=winners + rest + demoted,
+                fingerprint=key,
+                winner=winner,
+                expected_confidence=stats[winner]['confidence'] if winner else None,
+                demoted=demoted
+            )
+
+    def record(self, keys: Sequence[str], attempts: Sequence[Dict[str, Any]], winner: Optional[str],
+               seconds: Optional[float] = None) -> None:
+        """
+        Record one document's strategy attempts under every key.
+
+        Args:
+            keys: Fingerprints the document matches
+            attempts: Dicts with 'candidate', 'succeeded', 'confidence' and 'seconds'
+            winner: Candidate whose result was used, or None if all failed
+            seconds: Total table extraction time for the document
+        """
+        with self._lock:
+            self._apply(self._fingerprints, keys, attempts, winner, seconds)
+            self._unsaved_records.append((list(keys), [dict(a) for a in attempts], winner, seconds))
+            if self.persist and len(self._unsaved_records) >= self.save_every:
+                self.flush()
+
+    def _apply(self, fingerprints: Dict[str, Dict[str, Any]], keys: Sequence[str],
+               attempts: Sequence[Dict[str, Any]], winner: Optional[str], seconds: Optional[float]) -> None:
+        """Fold one record into a fingerprint table"""
+        alpha = 1.0 - self.decay
+        for key in keys:
+            entry = fingerprints.setdefault(key, {'observations': 0.0, 'candidates': {}})
+            entry['observations'] = entry['observations'] * self.decay + 1.0
+            entry['updated'] = time.time()
+            if seconds is not None:
+                previous = entry.get('seconds', seconds)
+                entry['seconds'] = previous + alpha * (seconds - previous)
+
+            stats = entry['candidates']
+            for candidate_stats in stats.values():
+                for counter in ('wins', 'attempts', 'failures'):
+                    candidate_stats[counter] *= self.decay
+
+            for attempt in attempts:
+                candidate_stats = stats.setdefault(attempt['candidate'], {
+                    'wins': 0.0, 'attempts': 0.0, 'failures': 0.0,
+                    'confidence': attempt['confidence'], 'seconds': attempt['seconds']
+                })
+                candidate_stats['attempts'] += 1.0
+                candidate_stats['seconds'] += alpha * (attempt['seconds'] - candidate_stats['seconds'])
+                if attempt['succeeded']:
+                    candidate_stats['confidence'] += alpha * (attempt['confidence'] - candidate_stats['confidence'])
+                else:
+                    candidate_stats['failures'] += 1.0
+
+            if winner is not None and winner in stats:
+                stats[winner]['wins'] += 1.0
+
+            # Forget candidates whose history has decayed away
+            for candidate in [c for c, s in stats.items() if s['attempts'] < 0.01]:
+                del stats[candidate]
+
+        if len(fingerprints) > self.max_fingerprints:
+            oldest = sorted(fingerprints, key=lambda k: fingerprints[k].get('updated', 0.0))
+            for key in oldest[:len(fingerprints) - self.max_fingerprints]:
+                del fingerprints[key]
+
+    def take_records(self) -> List[StrategyRecord]:
+        """Records made since the last call by a store that does not persist (empty otherwise)"""
+        with self._lock:
+            if self.persist:
+                return []
+            records, self._unsaved_records = self._unsaved_records, []
+            return records
+
+    def expected_seconds(self, keys: Sequence[str]) -> Optional[float]:
+        """Typical table extraction time for the most specific known key, if recorded"""
+        with self._lock:
+            for key in keys:
+                entry = self._fingerprints.get(key)
+                if entry and 'seconds' in entry:
+                    return entry['seconds']
+            return None
+
+    def summary(self) -> Dict[str, Any]:
+        """Fingerprint count and the current winner per fingerprint"""
+        with self._lock:
+            winners = {}
+            for key, entry in self._fingerprints.items():
+                stats = entry['candidates']
+                best = max(stats, key=lambda c: stats[c]['wins'], default=None)
+                if best is not None and stats[best]['wins'] >= self.min_win_weight:
+                    winners[key] = best
+            return {'fingerprints': len(self._fingerprints), 'winners': winners}
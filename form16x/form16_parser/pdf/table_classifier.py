@@ -14,6 +14,9 @@ from typing import List, Dict, Optional, Tuple
 import pandas as pd
 from dataclasses import dataclass
 
+from form16x.form16_parser.models.extraction_records import DATACLASS_SLOTS
+from form16x.form16_parser.utils.table_utils import cell_matrix
+
 
 class TableType(Enum):
     """Form16 table types based on structure analysis"""
@@ -29,7 +32,7 @@ class TableType(Enum):
     UNKNOWN = "unknown"                          # Unclassified
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TableClassification:
     """Result of table classification"""
     table_type: TableType
@@ -433,9 +436,10 @@ class Form16TableClassifier:
     
     def _detect_amounts(self, table: pd.DataFrame) -> bool:
         """Detect if table contains monetary amounts"""
+        cells = cell_matrix(table)
         for row_idx in range(len(table)):
             for col_idx in range(len(table.columns)):
-                cell_value = str(table.iloc[row_idx, col_idx])
+                cell_value = cells[row_idx, col_idx]
                 if self._looks_like_amount(cell_value):
                     return True
         return False
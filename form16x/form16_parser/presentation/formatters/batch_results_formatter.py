@@ -113,6 +113,10 @@ class BatchResultsFormatter:
             f"Total processing time: {total_time:.1f} seconds"
         ]
         
+        duplicates_avoided = statistics.get('duplicates_avoided', 0)
+        if duplicates_avoided:
+            summary_lines.append(f"Duplicates reused (not re-extracted): {duplicates_avoided}")
+        
         if demo_mode:
             summary_lines.append("")
             summary_lines.append("[DEMO MODE] Batch processing completed successfully!")
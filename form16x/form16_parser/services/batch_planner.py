@@ -0,0 +1,280 @@
+"""
+Batch Planner - Cost estimates and scheduling order for batch runs.
+
+This module decides the order in which a batch processes its files:
+- Each file's cost is estimated cheaply before scheduling, from its size,
+  its page count (read from the xref) and, when strategy statistics are in
+  use, the recorded extraction time for its document fingerprint
+- Files are then ordered longest-first (shortest makespan), shortest-first
+  (earliest results), balanced (large and small alternating) or by name
+- The estimates also drive the batch ETA
+- Byte-identical files, and optionally files whose text layers match, are
+  found before scheduling so each distinct document is extracted only once
+"""
+
+import hashlib
+import logging
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+from ..pdf.reader import probe_document
+from ..pdf.strategy_stats import StrategyStatsStore, document_fingerprint
+from .batch_scheduler import balanced_order, file_size
+
+
+SCHEDULE_ORDERS = ('balanced', 'longest', 'shortest', 'name')
+DEDUPE_MODES = ('off', 'exact', 'near')
+
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def content_digest(path: Path) -> str:
+    """SHA-256 of a file's bytes, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as stream:
+        for chunk in iter(lambda: stream.read(_HASH_CHUNK_BYTES), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def text_layer_digest(path: Path, max_pages: Optional[int] = None) -> Optional[str]:
+    """
+    SHA-256 of a PDF's whitespace-normalised text layer.
+
+    Matches re-saved copies whose metadata, producer timestamps or object
+    layout differ. Returns None for PDFs without a text layer, so scans are
+    never matched on their (empty) text.
+
+    Args:
+        path: PDF file
+        max_pages: Only read this many leading pages (all pages when None)
+    """
+    import PyPDF2
+
+    reader = PyPDF2.PdfReader(str(path))
+    digest = hashlib.sha256()
+    has_text = False
+    pages = reader.pages if max_pages is None else reader.pages[:max_pages]
+    for page in pages:
+        text = re.sub(r'\s+', ' ', page.extract_text() or '').strip()
+        has_text = has_text or bool(text)
+        digest.update(text.encode('utf-8'))
+        digest.update(b'\f')
+    return digest.hexdigest() if has_text else None
+
+
+@dataclass
+class DuplicateGroup:
+    """Files holding the same document; only the primary is extracted"""
+    primary: Path
+    matches: Dict[Path, str] = field(default_factory=dict)  # duplicate -> 'identical' or 'text'
+
+    @property
+    def duplicates(self) -> List[Path]:
+        return list(self.matches)
+
+
+@dataclass
+class FileEstimate:
+    """Estimated processing cost of one batch file"""
+    path: Path
+    size_bytes: int
+    page_count: Optional[int]
+    estimated_seconds: float
+    fingerprint: Optional[str] = None
+    from_history: bool = False
+
+
+class BatchPlanner:
+    """Estimates per-file cost and orders batch files by it"""
+
+    # Cost model used without history; only relative sizes matter for ordering
+    BASE_SECONDS = 2.0
+    SECONDS_PER_PAGE = 1.5
+    SECONDS_PER_MB = 1.0
+
+    # Form16 PDFs run to roughly this many bytes per page when the xref is unreadable
+    BYTES_PER_PAGE = 60 * 1024
+
+    def __init__(self, strategy_stats: Optional[StrategyStatsStore] = None):
+        """
+        Initialize the planner.
+
+        Args:
+            strategy_stats: Recorded per-fingerprint extraction times to prefer over the model
+        """
+        self.logger = logging.getLogger(__name__)
+        self.strategy_stats = strategy_stats
+        # probe_document results, shared by near-duplicate detection and estimate()
+        self._probes: Dict[Path, Tuple[Optional[str], Optional[int], Optional[Tuple[int, int]]]] = {}
+
+    def _probe(self, pdf_file: Path) -> Tuple[Optional[str], Optional[int], Optional[Tuple[int, int]]]:
+        """Producer, page count and page size of a file, probed once per planner"""
+        if pdf_file not in self._probes:
+            try:
+                self._probes[pdf_file] = probe_document(pdf_file)
+            except Exception as e:
+                self.logger.debug(f"Could not read page count of {pdf_file.name}: {e}")
+                self._probes[pdf_file] = (None, None, None)
+        return self._probes[pdf_file]
+
+    def estimate(self, pdf_file: Path) -> FileEstimate:
+        """Estimate the processing cost of one file"""
+        size = file_size(pdf_file)
+        producer, page_count, page_size = self._probe(pdf_file)
+
+        fingerprint = None
+        if page_count:
+            fingerprint = document_fingerprint(producer, page_count, page_size)
+            if self.strategy_stats is not None:
+                seconds = self.strategy_stats.expected_seconds([fingerprint])
+                if seconds is not None:
+                    return FileEstimate(pdf_file, size, page_count, seconds, fingerprint, from_history=True)
+
+        pages = page_count or max(1, round(size / self.BYTES_PER_PAGE))
+        seconds = (self.BASE_SECONDS + self.SECONDS_PER_PAGE * pages
+                   + self.SECONDS_PER_MB * size / (1024 * 1024))
+        return FileEstimate(pdf_file, size, page_count, seconds, fingerprint)
+
+    def find_duplicates(self, pdf_files: Sequence[Path],
+                        mode: str = 'exact') -> Tuple[List[Path], Dict[Path, DuplicateGroup]]:
+        """
+        Find files holding the same document.
+
+        Only files sharing a size are content-hashed, so in 'exact' mode
+        unique files cost a stat. 'near' mode also probes every file; files
+        sharing a page count have their first page's text compared, and only
+        files whose first pages match have their whole text layer read.
+
+        Args:
+            pdf_files: Files in processing order; the first of each group is its primary
+            mode: 'exact' for byte-identical files, 'near' to also match on the
+                text layer, 'off' to skip detection
+
+        Returns:
+            (files to extract, DuplicateGroup per primary that has duplicates)
+        """
+        if mode not in DEDUPE_MODES:
+            raise ValueError(f"Unknown dedupe mode '{mode}', expected one of {', '.join(DEDUPE_MODES)}")
+        if mode == 'off':
+            return list(pdf_files), {}
+
+        groups: Dict[Path, DuplicateGroup] = {}
+
+        def add(primary: Path, duplicate: Path, kind: str) -> None:
+            group = groups.setdefault(primary, DuplicateGroup(primary))
+            group.matches[duplicate] = kind
+            # A primary found to duplicate another file brings its own copies along
+            if duplicate in groups:
+                group.matches.update(groups.pop(duplicate).matches)
+
+        sizes = defaultdict(int)
+        for pdf_file in pdf_files:
+            sizes[file_size(pdf_file)] += 1
+
+        unique = []
+        by_content: Dict[Tuple[int, str], Path] = {}
+        for pdf_file in pdf_files:
+            size = file_size(pdf_file)
+            if sizes[size] > 1:
+                try:
+                    key = (size, content_digest(pdf_file))
+                except OSError as e:
+                    self.logger.warning(f"Could not hash {pdf_file.name}: {e}")
+                else:
+                    if key in by_content:
+                        add(by_content[key], pdf_file, 'identical')
+                        continue
+                    by_content[key] = pdf_file
+            unique.append(pdf_file)
+
+        if mode == 'near' and len(unique) > 1:
+            unique = self._merge_text_duplicates(unique, add)
+
+        duplicates = sum(len(group.matches) for group in groups.values())
+        if duplicates:
+            self.logger.info(f"Found {duplicates} duplicate files of {len(groups)} documents")
+        return unique, groups
+
+    def _text_digest(self, pdf_file: Path, max_pages: Optional[int] = None) -> Optional[str]:
+        try:
+            return text_layer_digest(pdf_file, max_pages)
+        except Exception as e:
+            self.logger.debug(f"Could not read text layer of {pdf_file.name}: {e}")
+            return None
+
+    @staticmethod
+    def _shared_keys(keys: Dict[Path, Optional[Hashable]]) -> Dict[Path, Hashable]:
+        """Keys held by more than one file (None keys never match)"""
+        counts = defaultdict(int)
+        for key in keys.values():
+            if key is not None:
+                counts[key] += 1
+        return {pdf_file: key for pdf_file, key in keys.items() if key is not None and counts[key] > 1}
+
+    def _merge_text_duplicates(self, pdf_files: List[Path], add) -> List[Path]:
+        page_counts = {}
+        for pdf_file in pdf_files:
+            page_count = self._probe(pdf_file)[1]
+            page_counts[pdf_file] = page_count or None
+
+        # Certificates from one employer share a page count, but their first pages rarely match
+        first_pages = {}
+        for pdf_file, page_count in self._shared_keys(page_counts).items():
+            digest = self._text_digest(pdf_file, max_pages=1)
+            first_pages[pdf_file] = (page_count, digest) if digest else None
+
+        text_keys = {}
+        for pdf_file, (page_count, first_page) in self._shared_keys(first_pages).items():
+            digest = first_page if page_count == 1 else self._text_digest(pdf_file)
+            text_keys[pdf_file] = (page_count, digest) if digest else None
+
+        unique = []
+        by_text: Dict[Tuple[int, str], Path] = {}
+        for pdf_file in pdf_files:
+            key = text_keys.get(pdf_file)
+            if key is not None:
+                if key in by_text:
+                    add(by_text[key], pdf_file, 'text')
+                    continue
+                by_text[key] = pdf_file
+            unique.append(pdf_file)
+        return unique
+
+    def plan(self, pdf_files: Sequence[Path], order: str = 'balanced') -> List[FileEstimate]:
+        """
+        Estimate every file and order them for scheduling.
+
+        Args:
+            pdf_files: Files to process
+            order: 'longest' first for makespan, 'shortest' first for early
+                results, 'balanced' to alternate large and small, or 'name'
+
+        Returns:
+            FileEstimate per file in processing order
+        """
+        if order not in SCHEDULE_ORDERS:
+            raise ValueError(f"Unknown schedule order '{order}', expected one of {', '.join(SCHEDULE_ORDERS)}")
+
+        estimates = {pdf_file: self.estimate(pdf_file) for pdf_file in pdf_files}
+
+        def cost(pdf_file: Path) -> float:
+            return estimates[pdf_file].estimated_seconds
+
+        if order == 'longest':
+            ordered = sorted(pdf_files, key=lambda pdf_file: (-cost(pdf_file), str(pdf_file)))
+        elif order == 'shortest':
+            ordered = sorted(pdf_files, key=lambda pdf_file: (cost(pdf_file), str(pdf_file)))
+        elif order == 'balanced':
+            ordered = balanced_order(pdf_files, cost)
+        else:
+            ordered = list(pdf_files)
+
+        from_history = sum(estimate.from_history for estimate in estimates.values())
+        self.logger.info(f"Planned {len(ordered)} files in {order} order, "
+                         f"{from_history} estimated from history, "
+                         f"{sum(map(cost, ordered)):.0f}s estimated work")
+        return [estimates[pdf_file] for pdf_file in ordered]
@@ -9,6 +9,7 @@ This service handles the complex workflow of:
 """
 
 import os
+import tempfile
 import time
 import concurrent.futures
 from pathlib import Path
@@ -16,6 +17,12 @@ from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from .extraction_service import ExtractionService
+from .batch_planner import BatchPlanner, DuplicateGroup
+from .batch_scheduler import BatchScheduler, SchedulerCounts
+from .isolated_extraction import IsolatedExtractionPool
+from .result_store import ResultStore
+from .work_queue import QueueWorker, WorkQueue
+from ..utils.serialization import JsonSerializer, get_serializer
 from ..progress import Form16ProgressTracker
 from ..dummy_generator import DummyDataGenerator
 
@@ -35,7 +42,21 @@ class BatchProcessingService:
         pattern: str = "*.pdf",
         parallel_workers: int = 4,
         continue_on_error: bool = False,
-        verbose: bool = False
+        verbose: bool = False,
+        artifacts_dir: Optional[Path] = None,
+        parquet_dir: Optional[Path] = None,
+        pretty_json: bool = False,
+        compression: Optional[str] = None,
+        template_dir: Optional[Path] = None,
+        max_in_flight: Optional[int] = None,
+        rss_watermark_mb: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
+        memory_limit_mb: Optional[int] = None,
+        cheap_retry: bool = False,
+        schedule: str = 'balanced',
+        dedupe: str = 'exact',
+        result_store: Optional[Path] = None,
+        part_a_fast_path: bool = True
     ) -> Dict[str, Any]:
         """
         Process multiple Form16 files in parallel.
@@ -47,6 +68,23 @@ class BatchProcessingService:
             parallel_workers: Number of parallel processing workers
             continue_on_error: Continue processing even if some files fail
             verbose: Enable verbose logging
+            artifacts_dir: Persist intermediate artifacts for the reprocess command
+            parquet_dir: Also export results to a partitioned Parquet dataset here
+            pretty_json: Indent JSON output (compact by default)
+            compression: Compress JSON output with 'gzip' or 'zstd'
+            template_dir: Layout template store for repeat employers
+            max_in_flight: Most documents submitted at once (default: 2 per worker)
+            rss_watermark_mb: Pause submitting new documents while RSS is above this
+            timeout_seconds: Wall-clock limit per document (runs documents in worker processes)
+            memory_limit_mb: Memory limit per worker process (runs documents in worker processes)
+            cheap_retry: Retry documents that breach a limit with text and pdfplumber only
+            schedule: File order - 'longest' or 'shortest' estimated cost first,
+                'balanced' (alternating) or 'name'
+            dedupe: Extract duplicate files once - 'exact' (same bytes), 'near'
+                (also same text layer, reads the text of files sharing a page count) or 'off'
+            result_store: Also store each extracted document in this ResultStore database
+            part_a_fast_path: Read TRACES Part A from word positions and detect
+                tables on the remaining pages only
             
         Returns:
             Dictionary containing batch processing results and statistics
@@ -70,16 +108,40 @@ class BatchProcessingService:
         # Create output directory
         output_dir.mkdir(parents=True, exist_ok=True)
         
+        serializer = get_serializer(pretty=pretty_json, compression=compression)
+        
+        # Columnar export writes incrementally as documents complete
+        columnar_exporter = None
+        if parquet_dir:
+            from ..utils.columnar_export import ColumnarExporter
+            columnar_exporter = ColumnarExporter(parquet_dir)
+        
+        store = ResultStore(result_store) if result_store else None
+        
         # Process files in parallel
         processing_results = self._process_files_parallel(
-            pdf_files, output_dir, parallel_workers, continue_on_error, verbose
+            pdf_files, output_dir, parallel_workers, continue_on_error, verbose, artifacts_dir,
+            columnar_exporter, serializer, template_dir, max_in_flight, rss_watermark_mb,
+            timeout_seconds, memory_limit_mb, cheap_retry, schedule, dedupe, store, part_a_fast_path
         )
         
+        export_stats = None
+        if columnar_exporter:
+            # Every JSON result is already written; a failed export must not fail the batch
+            try:
+                export_stats = columnar_exporter.close()
+            except Exception as e:
+                export_stats = {
+                    'output_directory': str(parquet_dir),
+                    'documents_written': columnar_exporter.documents_written,
+                    'error': str(e)
+                }
+        
         # Aggregate results
         total_processing_time = time.time() - start_time
         batch_stats = self._calculate_batch_statistics(processing_results, total_processing_time)
         
-        return {
+        result = {
             'success': True,
             'results': processing_results,
             'statistics': batch_stats,
@@ -87,6 +149,206 @@ class BatchProcessingService:
             'output_directory': str(output_dir),
             'processing_time': total_processing_time
         }
+        if export_stats:
+            result['columnar_export'] = export_stats
+        if store is not None:
+            result['result_store'] = store.stats()
+        if template_dir:
+            result['layout_templates'] = self.extraction_service.get_template_extractor(template_dir).store.stats()
+        return result
+    
+    def process_queue(
+        self,
+        queue_file: Path,
+        input_dir: Path,
+        output_dir: Path,
+        pattern: str = "*.pdf",
+        parallel_workers: int = 1,
+        verbose: bool = False,
+        pretty_json: bool = False,
+        compression: Optional[str] = None,
+        template_dir: Optional[Path] = None,
+        lease_seconds: float = 300.0,
+        work: bool = True,
+        result_store: Optional[Path] = None,
+        part_a_fast_path: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Process a directory through a shared work queue, alongside other workers.
+        
+        The directory is enqueued idempotently, so every node can be started
+        with the same arguments. Each of parallel_workers threads then claims
+        documents until the queue is drained. Result files are written
+        atomically, so a document redone after an expired lease is harmless.
+        
+        Args:
+            queue_file: SQLite queue database on the shared volume
+            input_dir: Directory containing PDF files (same path on every node)
+            output_dir: Directory for results (same path on every node)
+            pattern: File pattern to match
+            parallel_workers: Queue workers in this process
+            verbose: Enable verbose logging
+            pretty_json: Indent JSON output (compact by default)
+            compression: Compress JSON output with 'gzip' or 'zstd'
+            template_dir: Layout template store for repeat employers
+            lease_seconds: Lease length; a worker silent for this long loses its document
+            work: Claim and process documents (False only enqueues)
+            result_store: Also store each extracted document in this ResultStore database
+            part_a_fast_path: Read TRACES Part A from word positions
+            
+        Returns:
+            Dictionary with this worker's results and statistics plus global queue progress
+        """
+        start_time = time.time()
+        
+        discovery_result = self._discover_files(input_dir, pattern)
+        if not discovery_result['success']:
+            return discovery_result
+        
+        queue = WorkQueue(queue_file, lease_seconds=lease_seconds)
+        enqueued = queue.enqueue(discovery_result['files'])
+        
+        processing_results = []
+        if work:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            serializer = get_serializer(pretty=pretty_json, compression=compression)
+            store = ResultStore(result_store) if result_store else None
+            
+            def process(pdf_file: Path) -> Dict[str, Any]:
+                return self._process_single_file_for_batch(
+                    pdf_file, output_dir, verbose, serializer=serializer, template_dir=template_dir,
+                    result_store=store, part_a_fast_path=part_a_fast_path
+                )
+            
+            workers = max(1, min(parallel_workers, os.cpu_count() or 1))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(QueueWorker(queue, process).run) for _ in range(workers)]
+                for future in futures:
+                    processing_results.extend(future.result())
+            processing_results.sort(key=lambda x: x['file_name'])
+        
+        total_processing_time = time.time() - start_time
+        return {
+            'success': True,
+            'results': processing_results,
+            'statistics': self._calculate_batch_statistics(processing_results, total_processing_time),
+            'enqueued': enqueued,
+            'queue': queue.progress(),
+            'input_directory': str(input_dir),
+            'output_directory': str(output_dir),
+            'processing_time': total_processing_time
+        }
+    
+    def process_bulk_pdf(
+        self,
+        input_file: Path,
+        output_dir: Path,
+        parallel_workers: int = 4,
+        continue_on_error: bool = True,
+        verbose: bool = False,
+        pretty_json: bool = False,
+        compression: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Split a PDF of concatenated Form16s and extract each employee separately.
+        
+        Certificates are cut out as they are found while streaming the text
+        layer, and each one is extracted on its own while later pages are still
+        being split. At most two certificates per worker are waiting at a time.
+        
+        Args:
+            input_file: PDF holding many employees' Form16s
+            output_dir: Directory to save one extraction result per employee
+            parallel_workers: Number of parallel extraction workers
+            continue_on_error: Keep going when a certificate fails to extract
+            verbose: Enable verbose logging
+            pretty_json: Indent JSON output (compact by default)
+            compression: Compress JSON output with 'gzip' or 'zstd'
+            
+        Returns:
+            Dictionary containing per-employee results and statistics
+        """
+        from ..pdf.document_splitter import Form16DocumentSplitter
+        
+        start_time = time.time()
+        
+        if not input_file.is_file():
+            return {
+                'success': False,
+                'error': f'Input file not found: {input_file}',
+                'processing_time': time.time() - start_time
+            }
+        
+        output_dir.mkdir(parents=True, exist_ok=True)
+        serializer = get_serializer(pretty=pretty_json, compression=compression)
+        max_workers = max(1, min(parallel_workers, os.cpu_count() or 4))
+        
+        processing_results = []
+        pending = set()
+        
+        def collect(futures) -> bool:
+            keep_going = True
+            for future in futures:
+                result = future.result()
+                processing_results.append(result)
+                keep_going = keep_going and (result['success'] or continue_on_error)
+            return keep_going
+        
+        with tempfile.TemporaryDirectory(prefix='form16x_split_') as segment_dir, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            keep_going = True
+            segments = Form16DocumentSplitter().split_to_files(input_file, Path(segment_dir))
+            for segment, segment_pdf in segments:
+                pending.add(executor.submit(
+                    self._process_certificate_for_bulk, segment, segment_pdf, output_dir, verbose, serializer
+                ))
+                if len(pending) >= max_workers * 2:
+                    done, pending = concurrent.futures.wait(
+                        pending, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    keep_going = collect(done)
+                    if not keep_going:
+                        break
+            
+            if not keep_going:
+                for future in pending:
+                    future.cancel()
+                pending = {future for future in pending if not future.cancelled()}
+            collect(concurrent.futures.wait(pending).done)
+        
+        processing_results.sort(key=lambda result: result['certificate_index'])
+        total_processing_time = time.time() - start_time
+        
+        return {
+            'success': True,
+            'results': processing_results,
+            'statistics': self._calculate_batch_statistics(processing_results, total_processing_time),
+            'input_file': str(input_file),
+            'output_directory': str(output_dir),
+            'processing_time': total_processing_time
+        }
+    
+    def _process_certificate_for_bulk(
+        self,
+        segment: Any,
+        segment_pdf: Path,
+        output_dir: Path,
+        verbose: bool,
+        serializer: JsonSerializer
+    ) -> Dict[str, Any]:
+        """Extract one certificate split from a bulk PDF, then drop its temporary PDF."""
+        try:
+            result = self._process_single_file_for_batch(segment_pdf, output_dir, verbose, serializer=serializer)
+        finally:
+            segment_pdf.unlink(missing_ok=True)
+        
+        result.update({
+            'certificate_index': segment.index + 1,
+            'pages': f"{segment.first_page}-{segment.last_page}",
+            'certificate_number': segment.certificate_number,
+            'employee_pan': segment.employee_pan
+        })
+        return result
     
     def process_batch_demo(
         self,
@@ -218,17 +480,49 @@ class BatchProcessingService:
         output_dir: Path,
         parallel_workers: int,
         continue_on_error: bool,
-        verbose: bool
+        verbose: bool,
+        artifacts_dir: Optional[Path] = None,
+        columnar_exporter: Optional[Any] = None,
+        serializer: Optional[JsonSerializer] = None,
+        template_dir: Optional[Path] = None,
+        max_in_flight: Optional[int] = None,
+        rss_watermark_mb: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
+        memory_limit_mb: Optional[int] = None,
+        cheap_retry: bool = False,
+        schedule: str = 'balanced',
+        dedupe: str = 'exact',
+        result_store: Optional[ResultStore] = None,
+        part_a_fast_path: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Process files in parallel using ThreadPoolExecutor.
         
+        Duplicate files are extracted once and their outputs written from the
+        primary's result. Files are ordered by their BatchPlanner cost estimates and submitted
+        through a BatchScheduler window rather than all at once, with
+        submission paused while RSS is above the watermark. Progress and ETA
+        are measured in estimated seconds of work rather than file counts.
+        
         Args:
             pdf_files: List of PDF files to process
             output_dir: Output directory for results
             parallel_workers: Number of parallel workers
             continue_on_error: Continue processing on errors
             verbose: Enable verbose logging
+            artifacts_dir: Optional directory for incremental extraction artifacts
+            columnar_exporter: Optional ColumnarExporter receiving each extracted document
+            serializer: JSON serializer for result files (compact by default)
+            template_dir: Optional layout template store for repeat employers
+            max_in_flight: Most documents submitted at once (default: 2 per worker)
+            rss_watermark_mb: Pause submission while RSS is above this many MiB
+            timeout_seconds: Wall-clock limit per document in an isolated worker process
+            memory_limit_mb: Address-space limit per isolated worker process
+            cheap_retry: Retry documents that breach a limit with the cheap strategy subset
+            schedule: BatchPlanner order for the files
+            dedupe: BatchPlanner duplicate detection mode
+            result_store: Optional ResultStore receiving each extracted document
+            part_a_fast_path: Read TRACES Part A from word positions
             
         Returns:
             List of processing results for each file
@@ -241,62 +535,116 @@ class BatchProcessingService:
         
         # Limit workers to reasonable number
         max_workers = min(parallel_workers, len(pdf_files), os.cpu_count() or 4)
+        scheduler = BatchScheduler(
+            max_in_flight=max_in_flight or max_workers * 2,
+            rss_watermark_bytes=rss_watermark_mb * 1024 * 1024 if rss_watermark_mb else None
+        )
+        
+        stats = self.extraction_service.pdf_processor.strategy_stats
+        planner = BatchPlanner(strategy_stats=stats)
+        unique_files, duplicate_groups = planner.find_duplicates(pdf_files, dedupe)
+        estimates = planner.plan(unique_files, schedule)
+        cost = {estimate.path: estimate.estimated_seconds for estimate in estimates}
+        completed_cost = 0.0
+        
+        isolated_pool = None
+        if timeout_seconds or memory_limit_mb:
+            isolated_pool = IsolatedExtractionPool(
+                workers=max_workers,
+                timeout_seconds=timeout_seconds,
+                memory_limit_mb=memory_limit_mb,
+                cheap_retry=cheap_retry,
+                strategy_stats=stats
+            )
+        
+        def submit(executor, pdf_file):
+            return executor.submit(
+                self._process_single_file_for_batch,
+                pdf_file,
+                output_dir,
+                verbose,
+                artifacts_dir,
+                columnar_exporter,
+                serializer,
+                template_dir,
+                isolated_pool,
+                duplicate_groups.get(pdf_file),
+                result_store,
+                part_a_fast_path
+            )
+        
+        def on_result(pdf_file, future) -> bool:
+            nonlocal completed_cost
+            completed_cost += cost[pdf_file]
+            try:
+                result = future.result()
+                processing_results.append(result)
+                if pdf_file in duplicate_groups:
+                    processing_results.extend(
+                        self._duplicate_results(duplicate_groups[pdf_file], result, output_dir)
+                    )
+                return True
+                
+            except Exception as e:
+                error_result = {
+                    'file_name': pdf_file.name,
+                    'file_path': str(pdf_file),
+                    'output_file': str(output_dir / pdf_file.stem) + '.json',
+                    'success': False,
+                    'processing_time': 0.0,
+                    'fields_extracted': 0,
+                    'total_fields': 0,
+                    'extraction_rate': 0.0,
+                    'error_message': str(e)
+                }
+                processing_results.append(error_result)
+                if pdf_file in duplicate_groups:
+                    processing_results.extend(
+                        self._duplicate_results(duplicate_groups[pdf_file], error_result, output_dir)
+                    )
+                
+                # Stop submitting remaining files
+                return continue_on_error
         
         # Create progress bar
         with Progress(
             TextColumn("[bold blue]Processing files..."),
             BarColumn(bar_width=40),
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TextColumn("({task.completed}/{task.total})"),
+            TextColumn("({task.fields[done]}/{task.fields[files]})"),
+            TextColumn("[dim]{task.fields[in_flight]} in flight, {task.fields[queued]} queued{task.fields[paused]}"),
             TimeRemainingColumn(),
             console=console
         ) as progress:
             
             # Add main task for batch progress
-            batch_task = progress.add_task("Batch processing", total=len(pdf_files))
+            # Measured in estimated seconds so the ETA follows the cost estimates
+            batch_task = progress.add_task(
+                "Batch processing", total=sum(cost.values()), done=0, files=len(unique_files),
+                in_flight=0, queued=len(unique_files), paused=""
+            )
             
-            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all tasks
-                future_to_file = {
-                    executor.submit(
-                        self._process_single_file_for_batch,
-                        pdf_file,
-                        output_dir,
-                        verbose
-                    ): pdf_file
-                    for pdf_file in pdf_files
-                }
-                
-                # Collect results as they complete
-                for future in concurrent.futures.as_completed(future_to_file):
-                    pdf_file = future_to_file[future]
-                    
-                    try:
-                        result = future.result()
-                        processing_results.append(result)
-                        
-                    except Exception as e:
-                        error_result = {
-                            'file_name': pdf_file.name,
-                            'file_path': str(pdf_file),
-                            'output_file': str(output_dir / pdf_file.stem) + '.json',
-                            'success': False,
-                            'processing_time': 0.0,
-                            'fields_extracted': 0,
-                            'total_fields': 0,
-                            'extraction_rate': 0.0,
-                            'error_message': str(e)
-                        }
-                        processing_results.append(error_result)
-                        
-                        if not continue_on_error:
-                            # Cancel remaining tasks
-                            for remaining_future in future_to_file:
-                                remaining_future.cancel()
-                            break
-                    
-                    # Update progress
-                    progress.advance(batch_task)
+            def on_progress(counts: SchedulerCounts) -> None:
+                progress.update(
+                    batch_task,
+                    completed=completed_cost,
+                    done=counts.completed,
+                    in_flight=counts.in_flight,
+                    queued=counts.queued,
+                    paused=" (paused: memory)" if counts.paused_for_memory else ""
+                )
+            
+            try:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    scheduler.run(
+                        executor, [estimate.path for estimate in estimates], len(unique_files),
+                        submit, on_result, on_progress
+                    )
+            finally:
+                if isolated_pool is not None:
+                    isolated_pool.close()
+                if stats is not None:
+                    stats.flush()
         
         # Sort results by file name for consistent output
         processing_results.sort(key=lambda x: x['file_name'])
@@ -306,7 +654,15 @@ class BatchProcessingService:
         self,
         pdf_file: Path,
         output_dir: Path,
-        verbose: bool
+        verbose: bool,
+        artifacts_dir: Optional[Path] = None,
+        columnar_exporter: Optional[Any] = None,
+        serializer: Optional[JsonSerializer] = None,
+        template_dir: Optional[Path] = None,
+        isolated_pool: Optional[IsolatedExtractionPool] = None,
+        duplicates: Optional[DuplicateGroup] = None,
+        result_store: Optional[ResultStore] = None,
+        part_a_fast_path: bool = True
     ) -> Dict[str, Any]:
         """
         Process a single file for batch processing.
@@ -315,36 +671,56 @@ class BatchProcessingService:
             pdf_file: Path to PDF file to process
             output_dir: Output directory for results
             verbose: Enable verbose logging
+            artifacts_dir: Optional directory for incremental extraction artifacts
+            columnar_exporter: Optional ColumnarExporter receiving the extracted document
+            serializer: JSON serializer for the result file (compact by default)
+            template_dir: Optional layout template store for repeat employers
+            isolated_pool: Run the extraction in a worker process under time and memory limits
+            duplicates: Files holding the same document, written from this file's result
+            result_store: Optional ResultStore receiving the extracted document
+            part_a_fast_path: Read TRACES Part A from word positions
             
         Returns:
             Dictionary containing processing results for the file
         """
         start_time = time.time()
+        serializer = serializer or get_serializer()
         
         try:
             # Determine output file path
             output_file = output_dir / (pdf_file.stem + '.json')
             
             # Use extraction service with batch mode enabled
-            extraction_result = self.extraction_service.extract_form16_data(
+            extract = (isolated_pool.extract if isolated_pool is not None
+                       else self.extraction_service.extract_form16_data)
+            extraction_result = extract(
                 input_file=pdf_file,
                 verbose=verbose,
                 batch_mode=True,  # Skip UI delays
-                calculate_tax=False  # Don't calculate tax in batch mode by default
+                calculate_tax=False,  # Don't calculate tax in batch mode by default
+                artifacts_dir=artifacts_dir,
+                template_dir=template_dir,
+                part_a_fast_path=part_a_fast_path
             )
             
             if extraction_result['extraction_success']:
-                # Save result to file
-                import json
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(extraction_result['form16_data'], f, indent=2, ensure_ascii=False, default=str)
+                # Save result to file (streamed, optionally compressed)
+                output_file = serializer.dump(extraction_result['form16_data'], output_file)
+                
+                if columnar_exporter is not None:
+                    columnar_exporter.add_document(
+                        extraction_result['form16_result'], pdf_file.stem, str(pdf_file)
+                    )
+                
+                if result_store is not None:
+                    result_store.add_document(extraction_result['form16_result'], pdf_file)
                 
                 # Calculate extraction statistics
                 fields_extracted = self._count_extracted_fields(extraction_result['form16_data'])
                 total_fields = 250  # Estimated total possible fields
                 extraction_rate = (fields_extracted / total_fields) * 100
                 
-                return {
+                result = {
                     'file_name': pdf_file.name,
                     'file_path': str(pdf_file),
                     'output_file': str(output_file),
@@ -355,6 +731,11 @@ class BatchProcessingService:
                     'extraction_rate': extraction_rate,
                     'error_message': None
                 }
+                if duplicates is not None:
+                    result['duplicate_outputs'] = self._write_duplicate_outputs(
+                        duplicates, extraction_result, output_dir, serializer, columnar_exporter, result_store
+                    )
+                return result
             else:
                 return {
                     'file_name': pdf_file.name,
@@ -378,9 +759,90 @@ class BatchProcessingService:
                 'fields_extracted': 0,
                 'total_fields': 0,
                 'extraction_rate': 0.0,
-                'error_message': str(e)
+                'error_message': str(e),
+                'error_type': type(e).__name__
             }
     
+    def _write_duplicate_outputs(
+        self,
+        group: DuplicateGroup,
+        extraction_result: Dict[str, Any],
+        output_dir: Path,
+        serializer: JsonSerializer,
+        columnar_exporter: Optional[Any] = None,
+        result_store: Optional[ResultStore] = None
+    ) -> Dict[Path, str]:
+        """
+        Write the primary's extraction under each duplicate's output name.
+        
+        Args:
+            group: Duplicate files of the extracted primary
+            extraction_result: The primary's extract_form16_data result
+            output_dir: Output directory for results
+            serializer: JSON serializer for result files
+            columnar_exporter: Optional ColumnarExporter also receiving each duplicate
+            result_store: Optional ResultStore also receiving each duplicate
+            
+        Returns:
+            Output file per duplicate
+        """
+        form16_data = extraction_result['form16_data']
+        outputs = {}
+        for duplicate, match in group.matches.items():
+            data = dict(form16_data)
+            data['metadata'] = dict(
+                form16_data.get('metadata', {}),
+                file_name=duplicate.name,
+                duplicate_of=group.primary.name,
+                duplicate_match=match
+            )
+            outputs[duplicate] = str(serializer.dump(data, output_dir / (duplicate.stem + '.json')))
+            
+            if columnar_exporter is not None:
+                columnar_exporter.add_document(
+                    extraction_result['form16_result'], duplicate.stem, str(duplicate)
+                )
+            if result_store is not None:
+                result_store.add_document(extraction_result['form16_result'], duplicate)
+        return outputs
+    
+    def _duplicate_results(
+        self,
+        group: DuplicateGroup,
+        primary_result: Dict[str, Any],
+        output_dir: Path
+    ) -> List[Dict[str, Any]]:
+        """
+        Batch results for a primary's duplicates, mirroring the primary's outcome.
+        
+        Args:
+            group: Duplicate files of the primary
+            primary_result: The primary's batch result
+            output_dir: Output directory for results
+            
+        Returns:
+            One result per duplicate, marked with duplicate_of
+        """
+        outputs = primary_result.pop('duplicate_outputs', {})
+        results = []
+        for duplicate, match in group.matches.items():
+            success = primary_result['success'] and duplicate in outputs
+            results.append({
+                'file_name': duplicate.name,
+                'file_path': str(duplicate),
+                'output_file': outputs.get(duplicate, str(output_dir / (duplicate.stem + '.json'))),
+                'success': success,
+                'processing_time': 0.0,
+                'fields_extracted': primary_result['fields_extracted'] if success else 0,
+                'total_fields': primary_result['total_fields'] if success else 0,
+                'extraction_rate': primary_result['extraction_rate'] if success else 0.0,
+                'error_message': None if success else
+                    f"Duplicate of {group.primary.name}: {primary_result['error_message']}",
+                'duplicate_of': group.primary.name,
+                'duplicate_match': match
+            })
+        return results
+    
     def _count_extracted_fields(self, form16_data: Dict[str, Any]) -> int:
         """
         Count the number of successfully extracted fields.
@@ -447,6 +909,9 @@ class BatchProcessingService:
         ]
         avg_extraction_rate = sum(successful_rates) / len(successful_rates) if successful_rates else 0
         
+        # Duplicates were written from another file's extraction
+        duplicates_avoided = sum(1 for result in processing_results if result.get('duplicate_of'))
+        
         return {
             'total_files': total_files,
             'successful_files': successful_files,
@@ -455,5 +920,6 @@ class BatchProcessingService:
             'total_processing_time': round(total_processing_time, 2),
             'average_processing_time': round(avg_processing_time, 2),
             'average_extraction_rate': round(avg_extraction_rate, 1),
+            'duplicates_avoided': duplicates_avoided,
             'timestamp': datetime.now().isoformat()
         }
\ No newline at end of file
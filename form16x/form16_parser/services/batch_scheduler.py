@@ -0,0 +1,181 @@
+"""
+Batch Scheduler - Bounded in-flight submission with memory backpressure.
+
+This module keeps large batch runs inside a fixed memory budget:
+- Only a bounded window of documents is submitted to the executor at a time
+- Submission pauses while process RSS is above a configurable watermark
+- Work is ordered so large and small files alternate across workers
+- In-flight, queued and completed counts are reported for progress display
+"""
+
+import concurrent.futures
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, Sequence
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Resident set size of this process, or None where it cannot be read cheaply"""
+    try:
+        with open('/proc/self/statm', 'rb') as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except Exception:
+        return None
+
+
+def file_size(path: Path) -> int:
+    """Size of a file in bytes, 0 if it cannot be read"""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def balanced_order(files: Sequence[Path], cost: Callable[[Path], float] = file_size) -> List[Path]:
+    """
+    Alternate the largest and smallest remaining files.
+
+    Keeps big PDFs from bunching up on all workers at once (which is when
+    memory peaks) while still starting them early.
+
+    Args:
+        files: Files to order
+        cost: Size or estimated cost of a file (default: size in bytes)
+    """
+    by_size = sorted(files, key=lambda path: (-cost(path), str(path)))
+    ordered = []
+    low, high = 0, len(by_size) - 1
+    while low <= high:
+        ordered.append(by_size[low])
+        if low != high:
+            ordered.append(by_size[high])
+        low += 1
+        high -= 1
+    return ordered
+
+
+@dataclass
+class SchedulerCounts:
+    """Progress counters for a scheduled batch"""
+    queued: int
+    in_flight: int
+    completed: int
+    paused_for_memory: bool = False
+
+
+class BatchScheduler:
+    """Submits work to an executor through a bounded window with RSS backpressure."""
+
+    def __init__(self, max_in_flight: int, rss_watermark_bytes: Optional[int] = None,
+                 poll_interval: float = 0.25, rss_reader: Callable[[], Optional[int]] = current_rss_bytes):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_in_flight: Most documents submitted but not yet collected
+            rss_watermark_bytes: Pause submission while RSS is above this (None disables)
+            poll_interval: Seconds between RSS checks while paused
+            rss_reader: Callable returning current RSS in bytes
+        """
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least 1, got {max_in_flight}")
+
+        self.logger = logging.getLogger(__name__)
+        self.max_in_flight = max_in_flight
+        self.rss_watermark_bytes = rss_watermark_bytes
+        self.poll_interval = poll_interval
+        self.rss_reader = rss_reader
+
+    def _above_watermark(self) -> bool:
+        if self.rss_watermark_bytes is None:
+            return False
+        rss = self.rss_reader()
+        return rss is not None and rss > self.rss_watermark_bytes
+
+    def run(
+        self,
+        executor: concurrent.futures.Executor,
+        items: Iterable[Any],
+        total: int,
+        submit: Callable[[concurrent.futures.Executor, Any], concurrent.futures.Future],
+        on_result: Callable[[Any, concurrent.futures.Future], bool],
+        on_progress: Optional[Callable[[SchedulerCounts], None]] = None
+    ) -> SchedulerCounts:
+        """
+        Run items through the executor.
+
+        Args:
+            executor: Executor to submit to
+            items: Work items, consumed lazily in order
+            total: Number of items (for queued counts)
+            submit: Submits one item and returns its future
+            on_result: Called with (item, future) as each completes; return False to stop submitting
+            on_progress: Called with updated counts after every change
+
+        Returns:
+            Final counts
+        """
+        in_flight = {}
+        submitted = completed = 0
+        keep_going = True
+        paused_logged = False
+
+        def report(paused: bool = False) -> None:
+            if on_progress is not None:
+                on_progress(SchedulerCounts(total - submitted, len(in_flight), completed, paused))
+
+        def collect(timeout: Optional[float]) -> None:
+            nonlocal completed, keep_going
+            done, _ = concurrent.futures.wait(
+                in_flight, timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                item = in_flight.pop(future)
+                completed += 1
+                if not on_result(item, future):
+                    keep_going = False
+            if done:
+                report()
+
+        for item in items:
+            if not keep_going:
+                break
+
+            while in_flight and len(in_flight) >= self.max_in_flight:
+                collect(None)
+
+            # Memory backpressure: drain until RSS drops (never stall with nothing running)
+            while keep_going and in_flight and self._above_watermark():
+                if not paused_logged:
+                    self.logger.info(f"RSS above watermark, pausing submission with {len(in_flight)} in flight")
+                    paused_logged = True
+                report(paused=True)
+                collect(self.poll_interval)
+            paused_logged = False
+
+            if not keep_going:
+                break
+            in_flight[submit(executor, item)] = item
+            submitted += 1
+            report()
+
+        if not keep_going:
+            for future in list(in_flight):
+                if future.cancel():
+                    in_flight.pop(future)
+
+        while in_flight:
+            collect(None)
+
+        counts = SchedulerCounts(total - submitted, 0, completed)
+        if on_progress is not None:
+            on_progress(counts)
+        return counts
@@ -7,6 +7,7 @@ This service handles the complex workflow of:
 - Financial year validation and consolidation
 - Merging employee data across multiple employers
 - Tax calculation for consolidated income
+- Reusing documents already held in a result store instead of re-extracting
 """
 
 import time
@@ -15,10 +16,15 @@ from typing import List, Dict, Any, Optional, Tuple
 from decimal import Decimal
 
 from ..extractors.enhanced_form16_extractor import EnhancedForm16Extractor, ProcessingLevel
+from ..extractors.orchestration.traces_part_a import TracesPartAExtractor
 from ..pdf.reader import RobustPDFProcessor
 from ..utils.json_builder import Form16JSONBuilder
+from ..utils.structured_logging import document_context
 from ..progress import Form16ProgressTracker
 from ..dummy_generator import DummyDataGenerator
+from .batch_planner import content_digest
+from .extraction_service import extract_document
+from .result_store import ResultStore
 
 
 class ConsolidationService:
@@ -28,6 +34,7 @@ class ConsolidationService:
         """Initialize the consolidation service with required dependencies."""
         self.extractor = EnhancedForm16Extractor(ProcessingLevel.ENHANCED)
         self.pdf_processor = RobustPDFProcessor()
+        self.part_a_extractor = TracesPartAExtractor()
         self.dummy_generator = DummyDataGenerator()
     
     def consolidate_form16_files(
@@ -36,7 +43,10 @@ class ConsolidationService:
         output_file: Path,
         verbose: bool = False,
         calculate_tax: bool = False,
-        tax_args: Optional[Dict[str, Any]] = None
+        tax_args: Optional[Dict[str, Any]] = None,
+        parquet_dir: Optional[Path] = None,
+        result_store: Optional[Path] = None,
+        part_a_fast_path: bool = True
     ) -> Dict[str, Any]:
         """
         Consolidate multiple Form16 files into a single comprehensive document.
@@ -47,6 +57,10 @@ class ConsolidationService:
             verbose: Enable verbose logging
             calculate_tax: Whether to calculate consolidated tax
             tax_args: Additional arguments for tax calculation
+            parquet_dir: Also export each employer's Form16 to a partitioned Parquet dataset
+            result_store: ResultStore database; PDFs already stored are not re-extracted
+                and newly extracted ones are added
+            part_a_fast_path: Read TRACES Part A from word positions, as extract does
             
         Returns:
             Dictionary containing consolidation results and metadata
@@ -65,18 +79,89 @@ class ConsolidationService:
         # Initialize progress tracker
         progress_tracker = Form16ProgressTracker(enable_animation=not verbose)
         
+        store = ResultStore(result_store) if result_store else None
+        
         # Extract data from all Form16 files
         with progress_tracker.status_spinner(f"Consolidating {len(form16_files)} Form16 files..."):
             extraction_results = self._extract_all_form16_data(
-                form16_files, verbose, progress_tracker
+                form16_files, verbose, progress_tracker, store, part_a_fast_path
             )
         
         if not extraction_results['success']:
             return extraction_results
         
-        extracted_forms = extraction_results['extracted_forms']
-        financial_years = extraction_results['financial_years']
+        return self._consolidate_extracted_forms(
+            extraction_results['extracted_forms'], extraction_results['financial_years'],
+            output_file, calculate_tax, tax_args, parquet_dir, start_time
+        )
+    
+    def consolidate_from_store(
+        self,
+        result_store: Path,
+        pan: str,
+        assessment_year: Optional[str] = None,
+        output_file: Path = Path("consolidated_form16.json"),
+        calculate_tax: bool = False,
+        tax_args: Optional[Dict[str, Any]] = None,
+        parquet_dir: Optional[Path] = None
+    ) -> Dict[str, Any]:
+        """
+        Consolidate an employee's stored Form16s without touching the PDFs.
         
+        Args:
+            result_store: ResultStore database written by extract, batch or consolidate
+            pan: Employee PAN
+            assessment_year: Only consolidate certificates for this assessment year
+            output_file: Path for consolidated output file
+            calculate_tax: Whether to calculate consolidated tax
+            tax_args: Additional arguments for tax calculation
+            parquet_dir: Also export each employer's Form16 to a partitioned Parquet dataset
+            
+        Returns:
+            Dictionary containing consolidation results and metadata
+        """
+        start_time = time.time()
+        
+        result_store = Path(result_store)
+        if not result_store.exists():
+            return {
+                'success': False,
+                'error': f'Result store not found: {result_store}',
+                'processing_time': time.time() - start_time
+            }
+        
+        store = ResultStore(result_store)
+        stored = store.find(pan=pan, assessment_year=assessment_year)
+        if not stored:
+            return {
+                'success': False,
+                'error': f'No stored Form16s for PAN {pan}'
+                         + (f' in assessment year {assessment_year}' if assessment_year else ''),
+                'processing_time': time.time() - start_time
+            }
+        
+        extracted_forms = []
+        financial_years = set()
+        for document in stored:
+            form_data = self._stored_form(store, document.id, Path(document.source_file))
+            financial_years.add(form_data['financial_year'])
+            extracted_forms.append(form_data)
+        
+        return self._consolidate_extracted_forms(
+            extracted_forms, financial_years, output_file, calculate_tax, tax_args, parquet_dir, start_time
+        )
+    
+    def _consolidate_extracted_forms(
+        self,
+        extracted_forms: List[Dict[str, Any]],
+        financial_years: set,
+        output_file: Path,
+        calculate_tax: bool,
+        tax_args: Optional[Dict[str, Any]],
+        parquet_dir: Optional[Path],
+        start_time: float
+    ) -> Dict[str, Any]:
+        """Validate financial years, merge the forms and calculate tax if requested."""
         # Validate financial year consistency
         fy_validation = self._validate_financial_years(financial_years)
         if not fy_validation['valid']:
@@ -91,6 +176,15 @@ class ConsolidationService:
         # Build consolidated Form16
         consolidated_result = self._build_consolidated_form16(extracted_forms, common_fy)
         
+        # Export the per-employer documents in columnar form if requested
+        columnar_export = None
+        if parquet_dir:
+            from ..utils.columnar_export import export_documents
+            columnar_export = export_documents(
+                ((Path(form['file_name']).stem, form['form16_result']) for form in extracted_forms),
+                parquet_dir
+            )
+        
         # Calculate consolidated tax if requested
         tax_results = None
         if calculate_tax and tax_args:
@@ -109,7 +203,8 @@ class ConsolidationService:
             'financial_year': common_fy,
             'employers_count': len(extracted_forms),
             'processing_time': processing_time,
-            'output_file': str(output_file)
+            'output_file': str(output_file),
+            'columnar_export': columnar_export
         }
     
     def consolidate_demo_data(
@@ -202,7 +297,9 @@ class ConsolidationService:
         self,
         form16_files: List[Path],
         verbose: bool,
-        progress_tracker: Form16ProgressTracker
+        progress_tracker: Form16ProgressTracker,
+        store: Optional[ResultStore] = None,
+        part_a_fast_path: bool = True
     ) -> Dict[str, Any]:
         """
         Extract data from all Form16 files.
@@ -211,6 +308,8 @@ class ConsolidationService:
             form16_files: List of Form16 file paths
             verbose: Enable verbose logging
             progress_tracker: Progress tracking instance
+            store: Result store to read already extracted files from and add new ones to
+            part_a_fast_path: Read TRACES Part A from word positions
             
         Returns:
             Dictionary containing extraction results for all files
@@ -222,15 +321,28 @@ class ConsolidationService:
             print(f"\nExtracting data from {len(form16_files)} Form16 files...")
         
         for i, form16_file in enumerate(form16_files, 1):
-            with progress_tracker.status_spinner(f"Processing {form16_file.name} ({i}/{len(form16_files)})"):
+            with progress_tracker.status_spinner(f"Processing {form16_file.name} ({i}/{len(form16_files)})"), \
+                    document_context(form16_file.name):
                 if verbose:
                     print(f"[{i}/{len(form16_files)}] Processing: {form16_file.name}")
                 
                 try:
+                    if store is not None:
+                        digest = content_digest(form16_file)
+                        document_id = store.find_by_content(digest)
+                        if document_id is not None:
+                            if verbose:
+                                print(f"  Using stored result for {form16_file.name}")
+                            form_data = self._stored_form(store, document_id, form16_file)
+                            financial_years.add(form_data['financial_year'])
+                            extracted_forms.append(form_data)
+                            continue
+                    
                     # Extract tables and Form16 data
-                    extraction_result = self.pdf_processor.extract_tables(form16_file)
-                    text_data = getattr(extraction_result, 'text_data', None)
-                    form16_result = self.extractor.extract_all(extraction_result.tables, text_data=text_data)
+                    _, form16_result = extract_document(
+                        form16_file, self.pdf_processor, self.extractor,
+                        self.part_a_extractor if part_a_fast_path else None
+                    )
                     
                     # Build comprehensive JSON
                     form16_json = Form16JSONBuilder.build_comprehensive_json(
@@ -240,6 +352,9 @@ class ConsolidationService:
                         extraction_metadata=getattr(form16_result, 'extraction_metadata', {})
                     )
                     
+                    if store is not None:
+                        store.add_document(form16_result, form16_file, content_sha256=digest)
+                    
                     # Extract and validate financial year
                     fy_info = self._extract_financial_year_info(form16_result, form16_file)
                     financial_years.add(fy_info['financial_year'])
@@ -265,6 +380,35 @@ class ConsolidationService:
             'financial_years': financial_years
         }
     
+    def _stored_form(self, store: ResultStore, document_id: int, form16_file: Path) -> Dict[str, Any]:
+        """
+        Build a consolidation entry from a stored document instead of extracting the PDF.
+        
+        Args:
+            store: Result store holding the document
+            document_id: Stored document id
+            form16_file: PDF the entry is reported under
+            
+        Returns:
+            Entry shaped like those built by _extract_all_form16_data
+        """
+        form16_result = store.load(document_id)
+        form16_json = Form16JSONBuilder.build_comprehensive_json(
+            form16_doc=form16_result,
+            pdf_file_name=form16_file.name,
+            processing_time=0.0,
+            extraction_metadata={}
+        )
+        fy_info = self._extract_financial_year_info(form16_result, form16_file)
+        return {
+            'file_name': form16_file.name,
+            'file_path': str(form16_file),
+            'form16_result': form16_result,
+            'form16_json': form16_json,
+            'financial_year': fy_info['financial_year'],
+            'assessment_year': fy_info['assessment_year']
+        }
+    
     def _validate_financial_years(self, financial_years: set) -> Dict[str, Any]:
         """
         Validate that all Form16s are from the same financial year.
@@ -8,18 +8,72 @@ This service handles the entire PDF extraction workflow including:
 - Tax calculation integration
 """
 
+import threading
 import time
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from decimal import Decimal
 
 from ..extractors.enhanced_form16_extractor import EnhancedForm16Extractor, ProcessingLevel
+from ..extractors.orchestration.traces_part_a import PartAResult, TracesPartAExtractor
+from ..models.form16_models import Form16Document
 from ..pdf.reader import RobustPDFProcessor
 from ..utils.json_builder import Form16JSONBuilder
+from ..utils.structured_logging import document_context
 from ..progress import Form16ProgressTracker, Form16ProcessingStages
 from ..dummy_generator import DummyDataGenerator
 
 
+def read_tables(
+    input_file: Path,
+    pdf_processor: RobustPDFProcessor,
+    part_a_extractor: Optional[TracesPartAExtractor] = None
+) -> Tuple[Any, Optional[PartAResult]]:
+    """
+    Detect a Form16 PDF's tables, reading TRACES Part A first when possible.
+    
+    Args:
+        input_file: Path to PDF file
+        pdf_processor: Table detection
+        part_a_extractor: Part A fast path (None to detect tables on every page)
+        
+    Returns:
+        (PDF extraction result, PartAResult or None). With a PartAResult,
+        tables cover only the pages after Part A and the result must be
+        applied to the extracted document.
+    """
+    part_a = part_a_extractor.extract(input_file) if part_a_extractor is not None else None
+    if part_a is not None:
+        return pdf_processor.extract_tables(input_file, first_page=part_a.tables_from_page), part_a
+    return pdf_processor.extract_tables(input_file), None
+
+
+def extract_document(
+    input_file: Path,
+    pdf_processor: RobustPDFProcessor,
+    extractor: EnhancedForm16Extractor,
+    part_a_extractor: Optional[TracesPartAExtractor] = None
+) -> Tuple[Any, Form16Document]:
+    """
+    Detect tables in a Form16 PDF and extract the document from them.
+    
+    Args:
+        input_file: Path to PDF file
+        pdf_processor: Table detection
+        extractor: Form16 extractor run on the tables
+        part_a_extractor: Part A fast path (None to detect tables on every page)
+        
+    Returns:
+        (PDF extraction result, extracted Form16Document)
+    """
+    extraction_result, part_a = read_tables(input_file, pdf_processor, part_a_extractor)
+    text_data = getattr(extraction_result, 'text_data', None)
+    form16_result = extractor.extract_all(extraction_result.tables, text_data=text_data)
+    if part_a is not None:
+        part_a.apply_to(form16_result)
+    return extraction_result, form16_result
+
+
 class ExtractionService:
     """Service for handling PDF extraction workflow."""
     
@@ -27,7 +81,10 @@ class ExtractionService:
         """Initialize the extraction service with required dependencies."""
         self.extractor = EnhancedForm16Extractor(ProcessingLevel.ENHANCED)
         self.pdf_processor = RobustPDFProcessor()
+        self.part_a_extractor = TracesPartAExtractor()
         self.dummy_generator = DummyDataGenerator()
+        self._template_extractors: Dict[str, Any] = {}
+        self._template_lock = threading.Lock()
     
     def extract_form16_data(
         self, 
@@ -35,7 +92,10 @@ class ExtractionService:
         verbose: bool = False,
         batch_mode: bool = False,
         calculate_tax: bool = False,
-        tax_args: Optional[Dict[str, Any]] = None
+        tax_args: Optional[Dict[str, Any]] = None,
+        artifacts_dir: Optional[Path] = None,
+        template_dir: Optional[Path] = None,
+        part_a_fast_path: bool = True
     ) -> Dict[str, Any]:
         """
         Extract Form16 data from PDF file.
@@ -46,6 +106,11 @@ class ExtractionService:
             batch_mode: Skip UI delays for batch processing
             calculate_tax: Whether to calculate tax
             tax_args: Additional arguments for tax calculation
+            artifacts_dir: Persist intermediate artifacts here for incremental reprocessing
+            template_dir: Layout template store for repeat employers
+            part_a_fast_path: Read TRACES Part A from word positions and detect
+                tables on the remaining pages only (not used with artifacts_dir,
+                whose saved tables must cover the whole document)
             
         Returns:
             Dict containing extraction results and metadata
@@ -58,8 +123,8 @@ class ExtractionService:
             dummy_mode=False
         )
         
-        # Process PDF with animated progress
-        with progress_tracker.processing_pipeline(input_file.name) as progress:
+        # Process PDF with animated progress; records logged meanwhile carry the file name
+        with progress_tracker.processing_pipeline(input_file.name) as progress, document_context(input_file.name):
             # Stage 1: Reading PDF
             progress.advance_stage(Form16ProcessingStages.READING_PDF)
             if not batch_mode:
@@ -70,7 +135,12 @@ class ExtractionService:
             if verbose:
                 print(f"Processing PDF: {input_file}")
             
-            extraction_result = self.pdf_processor.extract_tables(input_file)
+            use_part_a = part_a_fast_path and not artifacts_dir
+            extraction_result, part_a = read_tables(
+                input_file, self.pdf_processor, self.part_a_extractor if use_part_a else None
+            )
+            if part_a is not None and verbose:
+                print(f"Read TRACES Part A from pages {part_a.pages} without table detection")
             tables = extraction_result.tables
             text_data = getattr(extraction_result, 'text_data', None)
             
@@ -88,7 +158,16 @@ class ExtractionService:
             
             # Stage 5: Extract Form16 data
             progress.advance_stage(Form16ProcessingStages.EXTRACTING_JSON)
-            form16_result = self.extractor.extract_all(tables, text_data=text_data)
+            if artifacts_dir:
+                form16_result = self._extract_and_store_artifacts(
+                    input_file, extraction_result, artifacts_dir
+                )
+            elif template_dir:
+                form16_result = self.get_template_extractor(template_dir).extract_all(tables, text_data=text_data)
+            else:
+                form16_result = self.extractor.extract_all(tables, text_data=text_data)
+            if part_a is not None:
+                part_a.apply_to(form16_result)
             processing_time = time.time() - start_time
             
             # Build comprehensive JSON result
@@ -117,6 +196,71 @@ class ExtractionService:
             'extraction_success': True
         }
     
+    def use_strategy_stats(self, stats_file: Path) -> None:
+        """
+        Learn the winning table extraction strategy per document fingerprint.
+        
+        Args:
+            stats_file: JSON file holding the decaying strategy statistics
+        """
+        from ..pdf.strategy_stats import StrategyStatsStore
+        
+        stats_file = Path(stats_file).resolve()
+        current = self.pdf_processor.strategy_stats
+        if current is None or current.path != stats_file:
+            if current is not None:
+                current.flush()
+            self.pdf_processor.strategy_stats = StrategyStatsStore(stats_file)
+    
+    def get_template_extractor(self, template_dir: Path):
+        """
+        Template-aware extractor for a layout template store (one per directory).
+        
+        Args:
+            template_dir: Root directory of the template store
+            
+        Returns:
+            TemplateExtractor wrapping this service's extractor
+        """
+        from ..extractors.orchestration.layout_templates import TemplateExtractor, TemplateStore
+        
+        key = str(Path(template_dir).resolve())
+        with self._template_lock:
+            if key not in self._template_extractors:
+                self._template_extractors[key] = TemplateExtractor(TemplateStore(template_dir), self.extractor)
+            return self._template_extractors[key]
+    
+    def _extract_and_store_artifacts(
+        self,
+        input_file: Path,
+        extraction_result: Any,
+        artifacts_dir: Path
+    ):
+        """
+        Extract Form16 data and persist the intermediate artifacts.
+        
+        Args:
+            input_file: Source PDF file
+            extraction_result: TableExtractionResult from the PDF processor
+            artifacts_dir: Root directory of the artifact store
+            
+        Returns:
+            Extracted Form16Document
+        """
+        from .reprocess_service import ReprocessService
+        from ..extractors.orchestration.incremental_extraction import ArtifactStore
+        
+        # Page numbers are not passed so classification matches extract_all exactly
+        form16_result, artifacts = ReprocessService(self.extractor).extract_with_artifacts(
+            document_id=input_file.stem,
+            source_file=str(input_file),
+            tables=extraction_result.tables,
+            text_data=getattr(extraction_result, 'text_data', None)
+        )
+        ArtifactStore(artifacts_dir).save(artifacts)
+        
+        return form16_result
+    
     def extract_demo_data(
         self, 
         input_file: Path,
@@ -0,0 +1,362 @@
+"""
+Isolated Extraction - Per-document time and memory limits.
+
+This module runs document extraction in long-lived worker processes:
+- Each document gets a wall-clock timeout enforced from the parent
+- Workers run under an address-space limit (RLIMIT_AS) where the platform has one
+- A worker that breaches a limit is killed and replaced with a fresh process
+- Breaches surface as ExtractionTimeoutError or ExtractionMemoryError
+- Optionally a breached document is retried once with the cheap strategy subset
+- Where available, workers are forked from a fork server that ran the
+  pre-fork initialization, so they start quickly and share its lookup tables
+- Workers plan from a read-only copy of the strategy statistics and return
+  what they learned with each result; the pool records it in the parent's
+  store, the only writer of the statistics file
+"""
+
+import logging
+import multiprocessing
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..exceptions import (
+    ErrorCodes, ErrorSeverity, ExtractionMemoryError, ExtractionTimeoutError, Form16ExtractionError
+)
+
+# Imported by the fork server before it forks any worker
+PREFORK_PRELOAD_MODULE = 'form16x.form16_parser.services.prefork_preload'
+
+
+def build_extraction_service(cheap: bool, strategy_stats_file: Optional[str] = None):
+    """
+    Extraction service for a worker process.
+
+    Page-parallel detection is disabled since the worker is already one of
+    several processes. The cheap variant only uses text extraction and
+    pdfplumber and does not record strategy statistics. The full variant
+    records them without writing the file (see _take_strategy_records).
+    """
+    from ..pdf.reader import RobustPDFProcessor
+    from ..pdf.strategy_stats import StrategyStatsStore
+    from .extraction_service import ExtractionService
+
+    service = ExtractionService()
+    service.pdf_processor = RobustPDFProcessor(
+        page_workers=1,
+        strategies=RobustPDFProcessor.CHEAP_STRATEGIES if cheap else None
+    )
+    if strategy_stats_file and not cheap:
+        service.pdf_processor.strategy_stats = StrategyStatsStore(Path(strategy_stats_file), persist=False)
+    return service
+
+
+def _take_strategy_records(service: Any) -> List[Any]:
+    """Strategy statistics a worker's service recorded since the last request"""
+    stats = getattr(getattr(service, 'pdf_processor', None), 'strategy_stats', None)
+    take_records = getattr(stats, 'take_records', None)
+    return take_records() if take_records is not None else []
+
+
+def _apply_memory_limit(memory_limit_mb: Optional[int]) -> None:
+    if not memory_limit_mb:
+        return
+    try:
+        import resource
+    except ImportError:
+        logging.getLogger(__name__).warning("Memory limits are not supported on this platform")
+        return
+    limit = memory_limit_mb * 1024 * 1024
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _worker_main(connection, memory_limit_mb: Optional[int], strategy_stats_file: Optional[str],
+                 service_factory: Callable[..., Any]) -> None:
+    """Worker process loop: one extraction request at a time until told to stop"""
+    _apply_memory_limit(memory_limit_mb)
+    services = {}
+
+    try:
+        services[False] = service_factory(False, strategy_stats_file)
+        connection.send(('ready', None))
+    except MemoryError:
+        return
+
+    while True:
+        try:
+            request = connection.recv()
+        except (EOFError, OSError):
+            return
+        if request is None:
+            return
+
+        cheap = request.pop('cheap', False)
+        try:
+            if cheap not in services:
+                services[cheap] = service_factory(cheap, strategy_stats_file)
+            result = services[cheap].extract_form16_data(**request)
+            response = ('ok', result, _take_strategy_records(services[cheap]))
+        except MemoryError:
+            # State after a failed allocation is not trustworthy; report and exit
+            try:
+                connection.send(('memory', None))
+            except Exception:
+                pass
+            return
+        except Exception as e:
+            response = ('error', f"{type(e).__name__}: {e}", _take_strategy_records(services.get(cheap)))
+
+        try:
+            connection.send(response)
+        except MemoryError:
+            return
+        except Exception as e:
+            connection.send(('error', f"Could not return extraction result: {e}"))
+
+
+class _WorkerLost(Exception):
+    """The worker process exited without answering"""
+
+
+class _IsolatedWorker:
+    """Parent-side handle of one worker process"""
+
+    # Interpreter start-up and imports are not charged to a document's timeout
+    STARTUP_TIMEOUT = 300.0
+
+    def __init__(self, context, memory_limit_mb: Optional[int], strategy_stats_file: Optional[str],
+                 service_factory: Callable[..., Any]):
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_connection, memory_limit_mb, strategy_stats_file, service_factory),
+            daemon=True
+        )
+        self.process.start()
+        child_connection.close()
+        self.ready = False
+
+    def call(self, request: Dict[str, Any], timeout: Optional[float]) -> Optional[Tuple[str, Any]]:
+        """Send one request; returns the response, or None on timeout"""
+        try:
+            if not self.ready:
+                if not self.connection.poll(self.STARTUP_TIMEOUT):
+                    raise _WorkerLost()
+                self.connection.recv()
+                self.ready = True
+
+            self.connection.send(request)
+            if not self.connection.poll(timeout):
+                return None
+            return self.connection.recv()
+        except (EOFError, OSError):
+            raise _WorkerLost()
+
+    @property
+    def exitcode(self) -> Optional[int]:
+        self.process.join(1.0)
+        return self.process.exitcode
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+    def stop(self) -> None:
+        try:
+            self.connection.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(5.0)
+        self.kill()
+
+
+class IsolatedExtractionPool:
+    """
+    Runs extract_form16_data in worker processes under time and memory limits.
+
+    Safe to call from several threads; each call checks out its own worker.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        timeout_seconds: Optional[float] = None,
+        memory_limit_mb: Optional[int] = None,
+        cheap_retry: bool = False,
+        strategy_stats: Optional[Any] = None,
+        service_factory: Callable[..., Any] = build_extraction_service,
+        start_method: Optional[str] = None
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            workers: Number of worker processes
+            timeout_seconds: Wall-clock limit per document (None for no limit)
+            memory_limit_mb: Address-space limit per worker process (None for no limit)
+            cheap_retry: Retry a document that breached a limit with text and pdfplumber only
+            strategy_stats: The parent's StrategyStatsStore; workers plan from its
+                file and the strategy results they return are recorded in it
+            service_factory: Picklable callable (cheap, strategy_stats_file) -> extraction service
+            start_method: 'forkserver' (preloaded, default where supported) or 'spawn'
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+
+        self.logger = logging.getLogger(__name__)
+        self.workers = workers
+        self.timeout_seconds = timeout_seconds
+        self.memory_limit_mb = memory_limit_mb
+        self.cheap_retry = cheap_retry
+        self.strategy_stats = strategy_stats
+        self.strategy_stats_file = str(strategy_stats.path) if strategy_stats is not None else None
+        self.service_factory = service_factory
+
+        # The batch runs extractions on threads, which plain fork does not mix with;
+        # the fork server is a single-threaded process that preloads the shared state
+        if start_method is None:
+            start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        if start_method not in ('forkserver', 'spawn'):
+            raise ValueError(f"start_method must be 'forkserver' or 'spawn', got {start_method!r}")
+        self.start_method = start_method
+        self._context = multiprocessing.get_context(start_method)
+        if start_method == 'forkserver':
+            self._context.set_forkserver_preload([PREFORK_PRELOAD_MODULE])
+        self._idle: "queue.Queue[_IsolatedWorker]" = queue.Queue()
+        self._started = 0
+        self._lock = threading.Lock()
+        self.stats = {'timeouts': 0, 'memory_errors': 0, 'workers_replaced': 0, 'cheap_retries': 0}
+
+    def __enter__(self) -> "IsolatedExtractionPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _start_worker(self) -> _IsolatedWorker:
+        return _IsolatedWorker(self._context, self.memory_limit_mb, self.strategy_stats_file,
+                               self.service_factory)
+
+    def _acquire(self) -> _IsolatedWorker:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._started < self.workers:
+                self._started += 1
+                return self._start_worker()
+        return self._idle.get()
+
+    def _replace(self, worker: _IsolatedWorker) -> None:
+        worker.kill()
+        with self._lock:
+            self.stats['workers_replaced'] += 1
+        # Start the replacement now so it warms up before the next document
+        self._idle.put(self._start_worker())
+
+    def extract(self, input_file: Path, **kwargs) -> Dict[str, Any]:
+        """
+        Extract one document in a worker process.
+
+        Args:
+            input_file: PDF to extract
+            **kwargs: Further ExtractionService.extract_form16_data arguments (picklable)
+
+        Returns:
+            The extract_form16_data result
+
+        Raises:
+            ExtractionTimeoutError: The document exceeded its time limit
+            ExtractionMemoryError: The worker exceeded its memory limit
+            Form16ExtractionError: Extraction failed inside the worker
+        """
+        try:
+            return self._run(input_file, kwargs, cheap=False)
+        except (ExtractionTimeoutError, ExtractionMemoryError) as e:
+            if not self.cheap_retry:
+                raise
+            self.logger.warning(f"{e}; retrying {input_file.name} with text and pdfplumber only")
+            with self._lock:
+                self.stats['cheap_retries'] += 1
+            return self._run(input_file, kwargs, cheap=True)
+
+    def _run(self, input_file: Path, kwargs: Dict[str, Any], cheap: bool) -> Dict[str, Any]:
+        request = dict(kwargs, input_file=input_file, cheap=cheap)
+        operation = 'extract_form16_data (cheap strategies)' if cheap else 'extract_form16_data'
+        worker = self._acquire()
+
+        try:
+            response = worker.call(request, self.timeout_seconds)
+        except _WorkerLost:
+            exitcode = worker.exitcode
+            self._replace(worker)
+            if self.memory_limit_mb:
+                with self._lock:
+                    self.stats['memory_errors'] += 1
+                raise ExtractionMemoryError(
+                    f"Extraction worker for {input_file.name} died (exit code {exitcode}) "
+                    f"under the {self.memory_limit_mb} MB memory limit",
+                    memory_limit_mb=self.memory_limit_mb,
+                    operation=operation,
+                    severity=ErrorSeverity.HIGH,
+                    error_code=ErrorCodes.MEMORY_LIMIT_EXCEEDED
+                )
+            raise Form16ExtractionError(
+                f"Extraction worker for {input_file.name} exited with code {exitcode}",
+                severity=ErrorSeverity.HIGH,
+                error_code=ErrorCodes.COMPONENT_INIT_FAILED
+            )
+
+        if response is None:
+            self._replace(worker)
+            with self._lock:
+                self.stats['timeouts'] += 1
+            raise ExtractionTimeoutError(
+                f"Extraction of {input_file.name} exceeded the {self.timeout_seconds:g}s time limit",
+                timeout_seconds=self.timeout_seconds,
+                operation=operation,
+                severity=ErrorSeverity.HIGH,
+                error_code=ErrorCodes.TIMEOUT_EXCEEDED
+            )
+
+        status, payload = response[:2]
+        if len(response) > 2 and self.strategy_stats is not None:
+            for keys, attempts, winner, seconds in response[2]:
+                self.strategy_stats.record(keys, attempts, winner, seconds=seconds)
+        if status == 'memory':
+            self._replace(worker)
+            with self._lock:
+                self.stats['memory_errors'] += 1
+            raise ExtractionMemoryError(
+                f"Extraction of {input_file.name} exceeded the {self.memory_limit_mb} MB memory limit",
+                memory_limit_mb=self.memory_limit_mb,
+                operation=operation,
+                severity=ErrorSeverity.HIGH,
+                error_code=ErrorCodes.MEMORY_LIMIT_EXCEEDED
+            )
+
+        self._idle.put(worker)
+        if status == 'error':
+            raise Form16ExtractionError(payload, severity=ErrorSeverity.HIGH,
+                                        context={'pdf_path': str(input_file)})
+        if cheap:
+            payload['cheap_retry'] = True
+        return payload
+
+    def close(self) -> None:
+        """Stop all idle worker processes"""
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            worker.stop()
+        with self._lock:
+            self._started = 0
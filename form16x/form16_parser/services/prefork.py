@@ -0,0 +1,92 @@
+"""
+Pre-fork Initialization - Shared read-only state for forked workers.
+
+Worker processes forked from an initialized parent (a pre-fork server, a
+fork-based pool or the isolated extraction pool's fork server) reuse the
+parent's memory pages instead of rebuilding their own copies:
+- Extraction modules are imported and an extraction service is built once,
+  which registers every classifier's keywords and fills the regex cache
+- The combined table keyword index is compiled
+- The module-level pattern tables of FieldMatcher and IdentityTextExtractor
+  are compiled
+- The tax rule pack is compiled with its regime engines
+- Surviving objects are moved to the permanent generation with gc.freeze(),
+  so garbage collections in the children do not write to the shared pages
+"""
+
+import gc
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+_state: Optional[Dict[str, Any]] = None
+
+
+def prefork_initialize(rules_source: Optional[Union[str, Path]] = None, freeze: bool = True) -> Dict[str, Any]:
+    """
+    Build the shared lookup structures in this process before forking workers.
+
+    Only the first call does any work; later calls return the same summary.
+
+    Args:
+        rules_source: Tax rule directory or pack file (default: package rules)
+        freeze: Freeze the garbage collector's tracked objects afterwards
+
+    Returns:
+        Summary of what was built and how long it took
+    """
+    global _state
+    if _state is not None:
+        return dict(_state)
+
+    logger = logging.getLogger(__name__)
+    start_time = time.perf_counter()
+
+    from ..extractors.domains.identity.text_extractor import IDENTITY_PATTERNS
+    from ..tax_calculators.rules.json_rule_provider import JsonTaxRuleProvider
+    from ..tax_calculators.rules.year_specific_rule_provider import YearSpecificTaxRuleProvider
+    from ..utils.table_features import prepare_keyword_index
+    from .extraction_service import ExtractionService
+
+    ExtractionService()
+    keyword_count = prepare_keyword_index()
+
+    field_pattern_count = 0
+    try:
+        from ..extractors.base.field_matcher import FIELD_PATTERNS
+        field_pattern_count = sum(len(patterns) for patterns in FIELD_PATTERNS.values())
+    except ImportError as e:
+        logger.warning(f"Field matcher patterns not preloaded: {e}")
+
+    rules_path = Path(rules_source) if rules_source else None
+    rule_pack = JsonTaxRuleProvider(str(rules_path) if rules_path else None).rule_pack
+    if rules_path is None:
+        YearSpecificTaxRuleProvider()
+
+    frozen_objects = 0
+    if freeze:
+        gc.collect()
+        gc.freeze()
+        frozen_objects = gc.get_freeze_count()
+
+    _state = {
+        'keywords': keyword_count,
+        'identity_patterns': len(IDENTITY_PATTERNS),
+        'field_patterns': field_pattern_count,
+        'tax_rule_years': rule_pack.years(),
+        'tax_rule_errors': len(rule_pack.errors),
+        'frozen_objects': frozen_objects,
+        'initialization_time': time.perf_counter() - start_time
+    }
+    logger.info(
+        f"Pre-fork initialization done in {_state['initialization_time']:.3f}s "
+        f"({keyword_count} keywords, {len(_state['tax_rule_years'])} tax years, "
+        f"{frozen_objects} objects frozen)"
+    )
+    return dict(_state)
+
+
+def prefork_state() -> Optional[Dict[str, Any]]:
+    """Summary of the pre-fork initialization inherited or run by this process, if any"""
+    return dict(_state) if _state is not None else None
@@ -0,0 +1,10 @@
+"""
+Fork server preload for the isolated extraction pool.
+
+Importing this module runs prefork_initialize(), so worker processes forked
+from the fork server start with the shared lookup structures already built.
+"""
+
+from .prefork import prefork_initialize
+
+prefork_initialize()
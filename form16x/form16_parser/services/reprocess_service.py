@@ -0,0 +1,269 @@
+"""
+Reprocess Service - Incremental re-extraction from persisted artifacts.
+
+This service handles the incremental extraction workflow:
+- Capturing per-document artifacts (tables, classifications, text_data)
+- Fingerprinting each domain extractor's code and configuration
+- Re-running only the extractors whose fingerprint changed
+- Re-merging the Form16Document and rebuilding the JSON output
+"""
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from ..extractors.enhanced_form16_extractor import (
+    EnhancedForm16Extractor, ProcessingLevel, DOMAIN_EXTRACTION_ORDER, DOMAIN_ROUTES
+)
+from ..extractors.orchestration.incremental_extraction import (
+    ArtifactStore, DocumentArtifacts, DomainResult, ExtractorFingerprinter
+)
+from ..models.form16_models import Form16Document
+from ..utils.json_builder import Form16JSONBuilder
+
+
+class ReprocessService:
+    """Service for artifact-based incremental re-extraction."""
+
+    def __init__(self, extractor: Optional[EnhancedForm16Extractor] = None):
+        """
+        Initialize the reprocess service.
+
+        Args:
+            extractor: Extractor to use (default: ENHANCED level extractor)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.extractor = extractor or EnhancedForm16Extractor(ProcessingLevel.ENHANCED)
+        self.fingerprinter = ExtractorFingerprinter()
+        self._domain_fingerprints: Optional[Dict[str, str]] = None
+        self._classification_fingerprint: Optional[str] = None
+
+    def domain_fingerprints(self) -> Dict[str, str]:
+        """Current fingerprint of every domain extractor."""
+        if self._domain_fingerprints is None:
+            self._domain_fingerprints = {
+                domain: self.fingerprinter.fingerprint(self.extractor.get_domain_extractor(domain))
+                for domain in DOMAIN_EXTRACTION_ORDER
+            }
+        return self._domain_fingerprints
+
+    def classification_fingerprint(self) -> str:
+        """Current fingerprint of the table classification and routing stage."""
+        if self._classification_fingerprint is None:
+            parts = [self.fingerprinter.fingerprint(self.extractor.classifier)]
+            if self.extractor.multi_classifier:
+                parts.append(self.fingerprinter.fingerprint(self.extractor.multi_classifier))
+            if self.extractor.routing_coordinator:
+                parts.append(self.fingerprinter.fingerprint(self.extractor.routing_coordinator))
+            self._classification_fingerprint = ':'.join(parts)
+        return self._classification_fingerprint
+
+    def extract_with_artifacts(
+        self,
+        document_id: str,
+        source_file: str,
+        tables: List[pd.DataFrame],
+        page_numbers: Optional[List[int]] = None,
+        text_data: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Form16Document, DocumentArtifacts]:
+        """
+        Run a full extraction while capturing the intermediate artifacts.
+
+        Args:
+            document_id: Stable identifier for the document (usually the PDF stem)
+            source_file: Path of the source PDF
+            tables: Cleaned tables from the PDF processor
+            page_numbers: Page number of each table
+            text_data: Text-extracted identity data
+
+        Returns:
+            Tuple of (Form16Document, DocumentArtifacts)
+        """
+        classified_tables, tables_by_type = self.extractor.classify_tables(tables, page_numbers)
+
+        artifacts = DocumentArtifacts(
+            document_id=document_id,
+            source_file=str(source_file),
+            tables=tables,
+            page_numbers=page_numbers,
+            text_data=text_data,
+            classified_tables=classified_tables,
+            tables_by_type=tables_by_type,
+            classification_fingerprint=self.classification_fingerprint(),
+            processing_level=int(self.extractor.processing_level),
+            routed_tables=self.extractor.route_tables(classified_tables)
+        )
+
+        self._run_domains(artifacts, DOMAIN_EXTRACTION_ORDER)
+        form16_doc = self.extractor.merge_domain_updates(self._collect_updates(artifacts))
+
+        return form16_doc, artifacts
+
+    def reprocess_document(
+        self,
+        store: ArtifactStore,
+        document_id: str,
+        force_domains: Optional[Iterable[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Re-run stale domain extractors for one stored document.
+
+        Args:
+            store: Artifact store holding the document
+            document_id: Document to reprocess
+            force_domains: Domains to re-run even if their fingerprint is unchanged
+
+        Returns:
+            Dict with the merged Form16Document and which domains were re-run
+        """
+        artifacts = store.load(document_id)
+        forced = set(force_domains or [])
+
+        # Classification or routing changes invalidate the grouping and therefore every domain
+        reclassified = artifacts.classification_fingerprint != self.classification_fingerprint()
+        if reclassified:
+            self.logger.info(f"{document_id}: classification changed, re-classifying stored tables")
+            classified_tables, tables_by_type = self.extractor.classify_tables(
+                artifacts.tables, artifacts.page_numbers
+            )
+            artifacts.classified_tables = classified_tables
+            artifacts.tables_by_type = tables_by_type
+            artifacts.routed_tables = self.extractor.route_tables(classified_tables)
+            artifacts.classification_fingerprint = self.classification_fingerprint()
+
+        current = self.domain_fingerprints()
+        stale_domains = [
+            domain for domain in DOMAIN_EXTRACTION_ORDER
+            if reclassified
+            or domain in forced
+            or domain not in artifacts.domain_results
+            or artifacts.domain_results[domain].fingerprint != current[domain]
+        ]
+
+        if stale_domains:
+            self._run_domains(artifacts, stale_domains)
+            artifacts.processing_level = int(self.extractor.processing_level)
+            store.save(artifacts)
+
+        form16_doc = self.extractor.merge_domain_updates(self._collect_updates(artifacts))
+
+        return {
+            'document_id': document_id,
+            'source_file': artifacts.source_file,
+            'form16_result': form16_doc,
+            'rerun_domains': stale_domains,
+            'reused_domains': [d for d in DOMAIN_EXTRACTION_ORDER if d not in stale_domains],
+            'reclassified': reclassified
+        }
+
+    def reprocess_all(
+        self,
+        artifacts_dir: Path,
+        output_dir: Path,
+        force_domains: Optional[Iterable[str]] = None,
+        document_ids: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Reprocess every stored document and rewrite its JSON output.
+
+        Args:
+            artifacts_dir: Directory containing per-document artifacts
+            output_dir: Directory to write refreshed JSON results
+            force_domains: Domains to re-run unconditionally
+            document_ids: Restrict reprocessing to these documents
+
+        Returns:
+            Dictionary containing per-document results and statistics
+        """
+        start_time = time.time()
+        store = ArtifactStore(artifacts_dir)
+
+        available = store.list_documents()
+        if not available:
+            return {
+                'success': False,
+                'error': f'No extraction artifacts found in {artifacts_dir}',
+                'processing_time': time.time() - start_time
+            }
+
+        targets = [doc_id for doc_id in available if not document_ids or doc_id in document_ids]
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        results = []
+        for document_id in targets:
+            doc_start = time.time()
+            try:
+                outcome = self.reprocess_document(store, document_id, force_domains)
+                output_file = output_dir / f'{document_id}.json'
+
+                form16_data = Form16JSONBuilder.build_comprehensive_json(
+                    form16_doc=outcome['form16_result'],
+                    pdf_file_name=Path(outcome['source_file']).name,
+                    processing_time=time.time() - doc_start,
+                    extraction_metadata={}
+                )
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    json.dump(form16_data, f, indent=2, ensure_ascii=False, default=str)
+
+                results.append({
+                    'document_id': document_id,
+                    'output_file': str(output_file),
+                    'success': True,
+                    'rerun_domains': outcome['rerun_domains'],
+                    'reused_domains': outcome['reused_domains'],
+                    'processing_time': time.time() - doc_start,
+                    'error_message': None
+                })
+            except Exception as e:
+                self.logger.error(f"Reprocessing failed for {document_id}: {e}")
+                results.append({
+                    'document_id': document_id,
+                    'output_file': None,
+                    'success': False,
+                    'rerun_domains': [],
+                    'reused_domains': [],
+                    'processing_time': time.time() - doc_start,
+                    'error_message': str(e)
+                })
+
+        successful = [r for r in results if r['success']]
+        statistics = {
+            'total_documents': len(results),
+            'successful_documents': len(successful),
+            'failed_documents': len(results) - len(successful),
+            'extractor_runs': sum(len(r['rerun_domains']) for r in successful),
+            'extractor_runs_skipped': sum(len(r['reused_domains']) for r in successful),
+        }
+
+        return {
+            'success': True,
+            'results': results,
+            'statistics': statistics,
+            'artifacts_directory': str(artifacts_dir),
+            'output_directory': str(output_dir),
+            'processing_time': time.time() - start_time
+        }
+
+    def _run_domains(self, artifacts: DocumentArtifacts, domains: Iterable[str]) -> None:
+        """Run the given domain extractors on their routed tables and store their fingerprinted output."""
+        fingerprints = self.domain_fingerprints()
+        routed_tables = artifacts.routed_tables or {}
+
+        for domain in domains:
+            updates, metadata = self.extractor.run_domain_extractor(
+                domain, artifacts.tables_by_type, artifacts.tables, routed_tables.get(DOMAIN_ROUTES[domain])
+            )
+            artifacts.domain_results[domain] = DomainResult(
+                fingerprint=fingerprints[domain],
+                updates=updates,
+                metadata=metadata
+            )
+
+    @staticmethod
+    def _collect_updates(artifacts: DocumentArtifacts) -> Dict[str, Dict[str, Any]]:
+        """Map each domain to its stored Form16Document field updates."""
+        return {domain: result.updates for domain, result in artifacts.domain_results.items()}
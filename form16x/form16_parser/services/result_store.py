@@ -0,0 +1,354 @@
+"""
+Result Store - Indexed local database of extracted Form16s.
+
+This module keeps extraction results in a SQLite database so they can be
+looked up without reading thousands of JSON files:
+- Each document is normalized into employee, employer, salary, deduction,
+  quarterly TDS and tax computation tables
+- Documents are indexed by employee PAN, employer TAN, assessment year,
+  certificate number and content hash
+- The extracted Form16Document is kept alongside, so consolidation and
+  other consumers can reload it without re-extracting the PDF
+- Storing the same source file again replaces its previous rows
+
+Amounts are stored as decimal text so no precision is lost; compare them
+with CAST(... AS REAL) in ad-hoc SQL.
+"""
+
+import datetime
+import json
+import logging
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..models.form16_models import (
+    ChapterVIADeductions, EmployeeInfo, EmployerInfo, Form16Document, SalaryBreakdown,
+    Section16Deductions, TaxComputation, TaxDeductionQuarterly
+)
+from .batch_planner import content_digest
+
+
+# Tables holding one row per document: table name -> (Form16Document attribute, model)
+_SECTION_TABLES: Dict[str, Tuple[str, type]] = {
+    'employee': ('employee', EmployeeInfo),
+    'employer': ('employer', EmployerInfo),
+    'salary': ('salary', SalaryBreakdown),
+    'chapter_via_deductions': ('chapter_via_deductions', ChapterVIADeductions),
+    'section16_deductions': ('section16_deductions', Section16Deductions),
+    'tax_computation': ('tax_computation', TaxComputation),
+}
+
+# Bulky raw table dumps are not needed to rebuild a document for consolidation
+_EXCLUDED_DOCUMENT_FIELDS = {'raw_tables'}
+
+_DOCUMENTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    source_file TEXT NOT NULL UNIQUE,
+    content_sha256 TEXT,
+    certificate_number TEXT,
+    assessment_year TEXT,
+    financial_year TEXT,
+    period_from TEXT,
+    period_to TEXT,
+    employee_pan TEXT,
+    employer_tan TEXT,
+    stored_at REAL NOT NULL,
+    document_json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS documents_pan ON documents (employee_pan, assessment_year);
+CREATE INDEX IF NOT EXISTS documents_tan ON documents (employer_tan, assessment_year);
+CREATE INDEX IF NOT EXISTS documents_assessment_year ON documents (assessment_year);
+CREATE INDEX IF NOT EXISTS documents_certificate ON documents (certificate_number);
+CREATE INDEX IF NOT EXISTS documents_content ON documents (content_sha256);
+"""
+
+
+def _model_columns(model_cls: type) -> List[str]:
+    return list(getattr(model_cls, 'model_fields', None) or model_cls.__fields__)
+
+
+def _section_schema(table_name: str, model_cls: type, one_per_document: bool = True) -> str:
+    columns = ',\n    '.join(f'{name} TEXT' for name in _model_columns(model_cls))
+    key = 'PRIMARY KEY' if one_per_document else 'NOT NULL'
+    return (
+        f"CREATE TABLE IF NOT EXISTS {table_name} (\n"
+        f"    document_id INTEGER {key} REFERENCES documents (id) ON DELETE CASCADE,\n"
+        f"    {columns}\n"
+        f");\n"
+    )
+
+
+_SCHEMA = _DOCUMENTS_SCHEMA + ''.join(
+    _section_schema(table_name, model_cls) for table_name, (_, model_cls) in _SECTION_TABLES.items()
+) + _section_schema('quarterly_tds', TaxDeductionQuarterly, one_per_document=False) + """
+CREATE INDEX IF NOT EXISTS employee_pan ON employee (pan);
+CREATE INDEX IF NOT EXISTS employer_tan ON employer (tan);
+CREATE INDEX IF NOT EXISTS quarterly_tds_document ON quarterly_tds (document_id);
+"""
+
+
+def _to_cell(value: Any) -> Any:
+    """Convert a model value to a SQLite value"""
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, (Decimal, datetime.date)):
+        return str(value)
+    if isinstance(value, dict):
+        return json.dumps(value, sort_keys=True, default=str) if value else None
+    return value
+
+
+def _normalize_key(value: Optional[str]) -> Optional[str]:
+    """PANs and TANs are matched upper-case without surrounding whitespace"""
+    value = (value or '').strip().upper()
+    return value or None
+
+
+def _section_values(section: Any, model_cls: type) -> List[Any]:
+    return [_to_cell(getattr(section, name, None)) for name in _model_columns(model_cls)]
+
+
+@dataclass
+class StoredDocument:
+    """Summary of one stored Form16, as returned by queries"""
+    id: int
+    source_file: str
+    certificate_number: Optional[str]
+    assessment_year: Optional[str]
+    employee_pan: Optional[str]
+    employee_name: Optional[str]
+    employer_tan: Optional[str]
+    employer_name: Optional[str]
+    gross_salary: Optional[Decimal]
+    total_tds: Optional[Decimal]
+    stored_at: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'source_file': self.source_file,
+            'certificate_number': self.certificate_number,
+            'assessment_year': self.assessment_year,
+            'employee_pan': self.employee_pan,
+            'employee_name': self.employee_name,
+            'employer_tan': self.employer_tan,
+            'employer_name': self.employer_name,
+            'gross_salary': str(self.gross_salary) if self.gross_salary is not None else None,
+            'total_tds': str(self.total_tds) if self.total_tds is not None else None,
+            'stored_at': self.stored_at,
+        }
+
+
+_SUMMARY_QUERY = """
+SELECT d.id, d.source_file, d.certificate_number, d.assessment_year, d.employee_pan, e.name,
+       d.employer_tan, r.name, s.gross_salary, t.total_tds, d.stored_at
+FROM documents d
+LEFT JOIN employee e ON e.document_id = d.id
+LEFT JOIN employer r ON r.document_id = d.id
+LEFT JOIN salary s ON s.document_id = d.id
+LEFT JOIN tax_computation t ON t.document_id = d.id
+"""
+
+
+class ResultStore:
+    """SQLite store of extracted Form16s, indexed for lookup by PAN, TAN and assessment year"""
+
+    def __init__(self, db_path: Path, busy_timeout: float = 60.0):
+        """
+        Open (and create if needed) a result store.
+
+        Args:
+            db_path: SQLite database file
+            busy_timeout: Seconds to wait for another writer's lock
+        """
+        self.logger = logging.getLogger(__name__)
+        self.db_path = Path(db_path)
+        self.busy_timeout = busy_timeout
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # One connection per operation, so batch worker threads can share a store
+        connection = sqlite3.connect(str(self.db_path), timeout=self.busy_timeout, isolation_level=None)
+        try:
+            connection.execute("PRAGMA foreign_keys=ON")
+            yield connection
+        finally:
+            connection.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction taking the database lock up front"""
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    # ===============================
+    # WRITING
+    # ===============================
+
+    def add_document(self, form16_doc: Form16Document, source_file: Path,
+                     content_sha256: Optional[str] = None) -> int:
+        """
+        Store an extracted document, replacing any earlier result for the same file.
+
+        Args:
+            form16_doc: Extracted Form16 document
+            source_file: PDF the document was extracted from
+            content_sha256: Content hash of the PDF (computed from the file when omitted)
+
+        Returns:
+            Row id of the stored document
+        """
+        source_file = Path(source_file)
+        if content_sha256 is None and source_file.is_file():
+            content_sha256 = content_digest(source_file)
+
+        metadata = form16_doc.metadata
+        document_json = form16_doc.model_dump_json(exclude=_EXCLUDED_DOCUMENT_FIELDS)
+
+        with self._transaction() as connection:
+            # Child rows go with the old document through ON DELETE CASCADE
+            connection.execute("DELETE FROM documents WHERE source_file = ?", (str(source_file.resolve()),))
+            cursor = connection.execute(
+                "INSERT INTO documents (source_file, content_sha256, certificate_number, assessment_year, "
+                "financial_year, period_from, period_to, employee_pan, employer_tan, stored_at, document_json) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    str(source_file.resolve()), content_sha256, metadata.certificate_number,
+                    metadata.assessment_year, metadata.financial_year, _to_cell(metadata.period_from),
+                    _to_cell(metadata.period_to), _normalize_key(form16_doc.employee.pan),
+                    _normalize_key(form16_doc.employer.tan),
+                    time.time(), document_json
+                )
+            )
+            document_id = cursor.lastrowid
+
+            for table_name, (attr, model_cls) in _SECTION_TABLES.items():
+                self._insert_rows(connection, table_name, model_cls, document_id, [getattr(form16_doc, attr)])
+            self._insert_rows(connection, 'quarterly_tds', TaxDeductionQuarterly, document_id,
+                              form16_doc.quarterly_tds or [])
+
+        self.logger.debug(f"Stored {source_file.name} as document {document_id} in {self.db_path}")
+        return document_id
+
+    @staticmethod
+    def _insert_rows(connection: sqlite3.Connection, table_name: str, model_cls: type,
+                     document_id: int, sections: List[Any]) -> None:
+        columns = _model_columns(model_cls)
+        placeholders = ', '.join('?' * (len(columns) + 1))
+        connection.executemany(
+            f"INSERT INTO {table_name} (document_id, {', '.join(columns)}) VALUES ({placeholders})",
+            [[document_id] + _section_values(section, model_cls) for section in sections if section is not None]
+        )
+
+    def remove(self, source_file: Path) -> bool:
+        """Delete the stored result for a file; returns whether one existed"""
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                "DELETE FROM documents WHERE source_file = ?", (str(Path(source_file).resolve()),)
+            )
+        return cursor.rowcount > 0
+
+    # ===============================
+    # QUERIES
+    # ===============================
+
+    def find(self, pan: Optional[str] = None, tan: Optional[str] = None,
+             assessment_year: Optional[str] = None, certificate_number: Optional[str] = None,
+             limit: Optional[int] = None) -> List[StoredDocument]:
+        """
+        Find stored documents matching every given criterion.
+
+        Args:
+            pan: Employee PAN (case-insensitive)
+            tan: Employer TAN (case-insensitive)
+            assessment_year: Assessment year as printed on the certificate, e.g. '2024-25'
+            certificate_number: Certificate number
+            limit: Return at most this many documents
+
+        Returns:
+            Matching documents ordered by assessment year, PAN and TAN
+        """
+        conditions, parameters = [], []
+        for column, value in (('d.employee_pan', _normalize_key(pan)), ('d.employer_tan', _normalize_key(tan)),
+                              ('d.assessment_year', assessment_year and assessment_year.strip()),
+                              ('d.certificate_number', certificate_number and certificate_number.strip())):
+            if value:
+                conditions.append(f"{column} = ?")
+                parameters.append(value)
+
+        sql = _SUMMARY_QUERY
+        if conditions:
+            sql += "WHERE " + " AND ".join(conditions) + "\n"
+        sql += "ORDER BY d.assessment_year, d.employee_pan, d.employer_tan, d.source_file"
+        if limit:
+            sql += " LIMIT ?"
+            parameters.append(int(limit))
+
+        with self._connect() as connection:
+            rows = connection.execute(sql, parameters).fetchall()
+        return [self._summary(row) for row in rows]
+
+    @staticmethod
+    def _summary(row: Tuple[Any, ...]) -> StoredDocument:
+        values = list(row)
+        for index in (8, 9):
+            values[index] = Decimal(values[index]) if values[index] is not None else None
+        return StoredDocument(*values)
+
+    def find_by_content(self, content_sha256: str) -> Optional[int]:
+        """Id of a stored document extracted from a PDF with these bytes, if any"""
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT id FROM documents WHERE content_sha256 = ? ORDER BY stored_at DESC LIMIT 1",
+                (content_sha256,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def load(self, document_id: int) -> Form16Document:
+        """
+        Rebuild a stored Form16Document.
+
+        Raises:
+            KeyError: If no document has this id
+        """
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT document_json FROM documents WHERE id = ?", (document_id,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(f"No stored document with id {document_id}")
+        return Form16Document.model_validate_json(row[0])
+
+    def stats(self) -> Dict[str, Any]:
+        """Document, employee, employer and assessment year counts"""
+        with self._connect() as connection:
+            documents, pans, tans = connection.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT employee_pan), COUNT(DISTINCT employer_tan) FROM documents"
+            ).fetchone()
+            years = connection.execute(
+                "SELECT assessment_year, COUNT(*) FROM documents GROUP BY assessment_year ORDER BY assessment_year"
+            ).fetchall()
+        return {
+            'store': str(self.db_path),
+            'documents': documents,
+            'employees': pans,
+            'employers': tans,
+            'assessment_years': {year or 'unknown': count for year, count in years},
+        }
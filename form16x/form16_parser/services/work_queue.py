@@ -0,0 +1,377 @@
+"""
+Work Queue - Shared-filesystem job queue for multi-node batch runs.
+
+This module lets any number of batch workers, on any number of machines,
+divide one input directory through a SQLite database on a shared volume:
+- Documents are enqueued idempotently; every worker may enqueue the same directory
+- Workers claim one document at a time under a lease and heartbeat while working
+- Leases that expire (crashed or stalled worker) are reclaimed for retry
+- Completion is idempotent, so a reclaimed document finishing twice is harmless
+- Progress, throughput and per-worker activity can be read by a coordinator
+
+SQLite relies on the shared filesystem's POSIX locks. The database uses the
+rollback journal (WAL needs shared memory, which network filesystems do not
+provide) and every operation is a short transaction on its own connection.
+"""
+
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    path TEXT PRIMARY KEY,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_expires REAL,
+    enqueued REAL NOT NULL,
+    started REAL,
+    finished REAL,
+    processing_time REAL,
+    output_file TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_claim ON jobs (status, lease_expires);
+CREATE INDEX IF NOT EXISTS jobs_finished ON jobs (finished);
+CREATE TABLE IF NOT EXISTS workers (
+    id TEXT PRIMARY KEY,
+    host TEXT NOT NULL,
+    pid INTEGER NOT NULL,
+    started REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+@dataclass
+class Job:
+    """A document claimed by a worker"""
+    path: Path
+    attempt: int
+    lease_expires: float
+
+
+class WorkQueue:
+    """SQLite-backed document queue with leases"""
+
+    def __init__(self, db_path: Path, lease_seconds: float = 300.0, max_attempts: int = 3,
+                 busy_timeout: float = 60.0):
+        """
+        Open (and create if needed) a queue database.
+
+        Args:
+            db_path: Queue database on the shared volume
+            lease_seconds: How long a claim lasts without a heartbeat
+            max_attempts: Claims per document before an expiring lease fails it
+            busy_timeout: Seconds to wait for another worker's lock
+        """
+        self.logger = logging.getLogger(__name__)
+        self.db_path = Path(db_path)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.busy_timeout = busy_timeout
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=DELETE")
+            connection.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(str(self.db_path), timeout=self.busy_timeout, isolation_level=None)
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction taking the database lock up front"""
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def enqueue(self, paths: Iterable[Path]) -> int:
+        """
+        Add documents to the queue; documents already queued are left alone.
+
+        Returns:
+            Number of documents newly added
+        """
+        now = time.time()
+        rows = [(str(Path(path).resolve()), now) for path in paths]
+        with self._transaction() as connection:
+            before = connection.total_changes
+            connection.executemany("INSERT OR IGNORE INTO jobs (path, enqueued) VALUES (?, ?)", rows)
+            added = connection.total_changes - before
+        if added:
+            self.logger.info(f"Enqueued {added} documents in {self.db_path}")
+        return added
+
+    def register_worker(self, worker_id: str) -> None:
+        """Record a worker for progress reporting"""
+        now = time.time()
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO workers (id, host, pid, started, last_seen) VALUES (?, ?, ?, ?, ?)",
+                (worker_id, socket.gethostname(), os.getpid(), now, now)
+            )
+
+    def claim(self, worker_id: str) -> Optional[Job]:
+        """
+        Lease a document whose lease has expired, or else the next pending one.
+
+        Documents whose lease expired max_attempts times are marked failed
+        instead of being claimed again.
+
+        Returns:
+            The claimed Job, or None if nothing is claimable right now
+        """
+        now = time.time()
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE jobs SET status = 'failed', worker = NULL, finished = ?, "
+                "error = 'Lease expired ' || attempts || ' times' "
+                "WHERE status = 'running' AND lease_expires < ? AND attempts >= ?",
+                (now, now, self.max_attempts)
+            )
+            row = connection.execute(
+                "SELECT path, attempts FROM jobs "
+                "WHERE status = 'pending' OR (status = 'running' AND lease_expires < ?) "
+                "ORDER BY status = 'pending', enqueued, path LIMIT 1",
+                (now,)
+            ).fetchone()
+            connection.execute("UPDATE workers SET last_seen = ? WHERE id = ?", (now, worker_id))
+            if row is None:
+                return None
+
+            path, attempts = row
+            lease_expires = now + self.lease_seconds
+            connection.execute(
+                "UPDATE jobs SET status = 'running', worker = ?, attempts = attempts + 1, "
+                "lease_expires = ?, started = ? WHERE path = ?",
+                (worker_id, lease_expires, now, path)
+            )
+        if attempts:
+            self.logger.info(f"Reclaimed {Path(path).name} after an expired lease (attempt {attempts + 1})")
+        return Job(Path(path), attempts + 1, lease_expires)
+
+    def heartbeat(self, job: Job, worker_id: str) -> bool:
+        """
+        Extend a lease.
+
+        Returns:
+            False if the lease was lost (expired and reclaimed, or finished elsewhere)
+        """
+        now = time.time()
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET lease_expires = ? WHERE path = ? AND worker = ? AND status = 'running'",
+                (now + self.lease_seconds, str(job.path), worker_id)
+            )
+            connection.execute("UPDATE workers SET last_seen = ? WHERE id = ?", (now, worker_id))
+        return cursor.rowcount == 1
+
+    def complete(self, job: Job, worker_id: str, output_file: Optional[str] = None,
+                 processing_time: Optional[float] = None) -> None:
+        """Mark a document done (a no-op if it is already done)"""
+        now = time.time()
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET status = 'done', worker = ?, finished = ?, lease_expires = NULL, "
+                "processing_time = ?, output_file = ?, error = NULL WHERE path = ? AND status != 'done'",
+                (worker_id, now, processing_time, output_file, str(job.path))
+            )
+            if cursor.rowcount:
+                connection.execute(
+                    "UPDATE workers SET completed = completed + 1, last_seen = ? WHERE id = ?", (now, worker_id)
+                )
+
+    def fail(self, job: Job, worker_id: str, error: str) -> None:
+        """Mark a document failed, unless another worker has taken it over or finished it"""
+        now = time.time()
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET status = 'failed', finished = ?, lease_expires = NULL, error = ? "
+                "WHERE path = ? AND worker = ? AND status = 'running'",
+                (now, error, str(job.path), worker_id)
+            )
+            if cursor.rowcount:
+                connection.execute(
+                    "UPDATE workers SET failed = failed + 1, last_seen = ? WHERE id = ?", (now, worker_id)
+                )
+
+    def requeue_failed(self) -> int:
+        """Put failed documents back in the queue with a fresh attempt count"""
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                "UPDATE jobs SET status = 'pending', attempts = 0, worker = NULL, error = NULL, "
+                "finished = NULL WHERE status = 'failed'"
+            )
+        return cursor.rowcount
+
+    def is_drained(self) -> bool:
+        """True when nothing is pending or running"""
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status IN ('pending', 'running')"
+            ).fetchone()
+        return row[0] == 0
+
+    def progress(self, window_seconds: float = 300.0) -> Dict[str, Any]:
+        """
+        Global progress across all workers.
+
+        Args:
+            window_seconds: Period over which throughput is measured
+
+        Returns:
+            Status counts, throughput, ETA, failures and per-worker activity
+        """
+        now = time.time()
+        with self._connect() as connection:
+            counts = dict(connection.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+            expired = connection.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = 'running' AND lease_expires < ?", (now,)
+            ).fetchone()[0]
+            recent = connection.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = 'done' AND finished >= ?", (now - window_seconds,)
+            ).fetchone()[0]
+            first_start = connection.execute("SELECT MIN(started) FROM jobs").fetchone()[0]
+            workers = [
+                {
+                    'id': worker_id, 'host': host, 'pid': pid, 'completed': completed, 'failed': failed,
+                    'seconds_since_seen': round(now - last_seen, 1), 'running': running
+                }
+                for worker_id, host, pid, completed, failed, last_seen, running in connection.execute(
+                    "SELECT w.id, w.host, w.pid, w.completed, w.failed, w.last_seen, "
+                    "(SELECT COUNT(*) FROM jobs j WHERE j.worker = w.id AND j.status = 'running') "
+                    "FROM workers w ORDER BY w.started"
+                )
+            ]
+            failures = [
+                {'path': path, 'error': error}
+                for path, error in connection.execute(
+                    "SELECT path, error FROM jobs WHERE status = 'failed' ORDER BY finished DESC LIMIT 20"
+                )
+            ]
+
+        total = sum(counts.values())
+        finished = counts.get('done', 0) + counts.get('failed', 0)
+        window = min(window_seconds, now - first_start) if first_start else window_seconds
+        per_minute = recent / window * 60 if window > 0 else 0.0
+        remaining = counts.get('pending', 0) + counts.get('running', 0)
+
+        return {
+            'total': total,
+            'pending': counts.get('pending', 0),
+            'running': counts.get('running', 0),
+            'expired_leases': expired,
+            'done': counts.get('done', 0),
+            'failed': counts.get('failed', 0),
+            'percent_complete': round(finished / total * 100, 1) if total else 0.0,
+            'documents_per_minute': round(per_minute, 2),
+            'eta_seconds': round(remaining / per_minute * 60) if per_minute > 0 else None,
+            'workers': workers,
+            'recent_failures': failures
+        }
+
+
+def new_worker_id() -> str:
+    """Worker id unique across hosts: host, process and a random suffix"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class QueueWorker:
+    """Claims documents from a WorkQueue and processes them until the queue drains"""
+
+    def __init__(self, queue: WorkQueue, process: Callable[[Path], Dict[str, Any]],
+                 worker_id: Optional[str] = None, heartbeat_interval: Optional[float] = None,
+                 idle_poll: float = 5.0):
+        """
+        Initialize the worker.
+
+        Args:
+            queue: Shared work queue
+            process: Processes one document and returns a batch result dict
+                ('success', 'output_file', 'processing_time', 'error_message')
+            worker_id: Unique worker id (default: host, pid and a random suffix)
+            heartbeat_interval: Seconds between lease renewals (default: a third of the lease)
+            idle_poll: Seconds to wait while other workers still hold leases
+        """
+        self.logger = logging.getLogger(__name__)
+        self.queue = queue
+        self.process = process
+        self.worker_id = worker_id or new_worker_id()
+        self.heartbeat_interval = heartbeat_interval or queue.lease_seconds / 3
+        self.idle_poll = idle_poll
+
+    def run(self, max_jobs: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Work the queue until nothing is pending or running (or max_jobs are done).
+
+        Returns:
+            Batch result dicts for the documents this worker processed
+        """
+        self.queue.register_worker(self.worker_id)
+        results = []
+
+        while max_jobs is None or len(results) < max_jobs:
+            job = self.queue.claim(self.worker_id)
+            if job is None:
+                if self.queue.is_drained():
+                    break
+                # Others hold leases; wait in case one expires
+                time.sleep(self.idle_poll)
+                continue
+            results.append(self._run_job(job))
+
+        return results
+
+    def _run_job(self, job: Job) -> Dict[str, Any]:
+        stop = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(job, stop), daemon=True)
+        heartbeat.start()
+        try:
+            result = self.process(job.path)
+        except Exception as e:
+            result = {
+                'file_name': job.path.name, 'file_path': str(job.path), 'output_file': None,
+                'success': False, 'processing_time': 0.0, 'fields_extracted': 0, 'total_fields': 0,
+                'extraction_rate': 0.0, 'error_message': str(e)
+            }
+        finally:
+            stop.set()
+            heartbeat.join()
+
+        if result.get('success'):
+            self.queue.complete(job, self.worker_id, result.get('output_file'), result.get('processing_time'))
+        else:
+            self.queue.fail(job, self.worker_id, result.get('error_message') or 'Extraction failed')
+        return result
+
+    def _heartbeat(self, job: Job, stop: threading.Event) -> None:
+        while not stop.wait(self.heartbeat_interval):
+            try:
+                if not self.queue.heartbeat(job, self.worker_id):
+                    self.logger.warning(f"Lost the lease on {job.path.name}; another worker may redo it")
+                    return
+            except sqlite3.Error as e:
+                self.logger.warning(f"Heartbeat for {job.path.name} failed: {e}")
@@ -0,0 +1,444 @@
+"""
+Bulk tax calculator for tables of employee records.
+
+Evaluates thousands of employees per call instead of one TaxCalculationInput
+at a time. Records are grouped by (assessment year, regime, age category);
+each group's slabs, rebate, surcharge and marginal relief parameters are
+resolved once from the rule provider and applied to the whole group with
+numpy array operations.
+
+Results match MultiYearTaxCalculator.calculate_tax row for row: amounts are
+carried as integer paise and micro-rupees so slab rounding (half-up),
+marginal relief and cess rounding (half-even) come out exactly as with
+Decimal arithmetic. Input amounts are rounded to the paisa.
+"""
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .interfaces.calculator_interface import AgeCategory, TaxRegimeType
+from .interfaces.rule_provider_interface import ITaxRuleProvider
+
+
+REGIMES = (TaxRegimeType.OLD, TaxRegimeType.NEW)
+
+# Amount columns read from the input, all optional except gross_salary
+AMOUNT_COLUMNS = (
+    'gross_salary', 'bank_interest', 'dividend_income', 'other_income', 'house_property_income',
+    'standard_deduction', 'section_80c', 'section_80d', 'section_80ccd_1b',
+    'hra_exemption', 'lta_exemption', 'tds_paid',
+)
+
+RESULT_FIELDS = ('taxable_income', 'tax_before_rebate', 'rebate_87a', 'surcharge', 'cess', 'tax')
+
+# Same flat rate as MultiYearTaxCalculator._calculate_cess, in percent
+CESS_PERCENT = 4
+
+_MICRO_PER_PAISA = 10_000   # micro-rupees per paisa
+_MICRO_PER_RUPEE = 1_000_000
+
+
+def _basis_points(rate_percent: float) -> int:
+    return int(round(rate_percent * 100))
+
+
+def _round_half_up(numerator: np.ndarray, denominator: int) -> np.ndarray:
+    """Divide non-negative integers, rounding halves up"""
+    return (numerator + denominator // 2) // denominator
+
+
+def _round_half_even(numerator: np.ndarray, denominator: int) -> np.ndarray:
+    """Divide non-negative integers, rounding halves to even (Decimal.quantize default)"""
+    quotient, remainder = np.divmod(numerator, denominator)
+    round_up = (2 * remainder > denominator) | ((2 * remainder == denominator) & (quotient % 2 == 1))
+    return quotient + round_up
+
+
+@dataclass(frozen=True)
+class RegimeParameters:
+    """One regime's rules for one age category, pre-converted to integer paise and basis points"""
+    slab_from: Tuple[int, ...]
+    slab_width: Tuple[Optional[int], ...]  # None for the open top slab
+    slab_rate_bp: Tuple[int, ...]
+    standard_deduction: int
+    rebate_limit: int
+    rebate_max: int
+    surcharge_thresholds: Tuple[int, int, int, int]
+    surcharge_rates_bp: Tuple[int, int, int, int]
+    # Unrounded tax (micro-rupees) at each surcharge threshold, for marginal relief
+    threshold_tax: Tuple[int, int, int, int]
+
+
+def _paise(amount) -> int:
+    return int((amount or 0) * 100)
+
+
+def _slab_tax_micro(income: int, slab_from, slab_width, slab_rate_bp) -> int:
+    """Unrounded slab tax on one income, in micro-rupees"""
+    remaining, tax = income, 0
+    for width, rate in zip(slab_width, slab_rate_bp):
+        if remaining <= 0:
+            break
+        in_slab = remaining if width is None else min(remaining, width)
+        tax += in_slab * rate
+        remaining -= in_slab
+    return tax
+
+
+def build_regime_parameters(regime, age_category: AgeCategory) -> RegimeParameters:
+    """
+    Resolve a regime engine's settings and slabs into RegimeParameters.
+
+    Args:
+        regime: ITaxRegime from a rule provider
+        age_category: Age category whose slabs apply
+
+    Returns:
+        RegimeParameters for vectorized evaluation
+    """
+    settings = regime.get_regime_settings()
+    slabs = regime.get_tax_slabs(age_category)
+
+    def slab_tuples(slab_list):
+        return (
+            tuple(_paise(slab.from_amount) for slab in slab_list),
+            tuple(None if slab.to_amount is None else _paise(slab.to_amount - slab.from_amount)
+                  for slab in slab_list),
+            tuple(_basis_points(slab.rate_percent) for slab in slab_list),
+        )
+
+    slab_from, slab_width, slab_rate_bp = slab_tuples(slabs)
+
+    thresholds = tuple(_paise(value) for value in (
+        settings.surcharge_threshold_1, settings.surcharge_threshold_2,
+        settings.surcharge_threshold_3, settings.surcharge_threshold_4,
+    ))
+    rates = tuple(_basis_points(value or 0) for value in (
+        settings.surcharge_rate_1, settings.surcharge_rate_2,
+        settings.surcharge_rate_3, settings.surcharge_rate_4,
+    ))
+
+    # Marginal relief always measures threshold tax on the below-60 slabs
+    relief_slabs = slab_tuples(regime.get_tax_slabs(AgeCategory.BELOW_60))
+    threshold_tax = tuple(
+        _slab_tax_micro(threshold, *relief_slabs) if threshold else 0 for threshold in thresholds
+    )
+
+    return RegimeParameters(
+        slab_from=slab_from,
+        slab_width=slab_width,
+        slab_rate_bp=slab_rate_bp,
+        standard_deduction=_paise(settings.standard_deduction),
+        rebate_limit=_paise(settings.rebate_limit),
+        rebate_max=_paise(settings.rebate_max_amount),
+        surcharge_thresholds=thresholds,
+        surcharge_rates_bp=rates,
+        threshold_tax=threshold_tax,
+    )
+
+
+def _age_from_years(ages: pd.Series) -> pd.Series:
+    years = pd.to_numeric(ages, errors='coerce')
+    category = np.where(years >= 80, AgeCategory.SUPER_SENIOR_ABOVE_80.value,
+                        np.where(years >= 60, AgeCategory.SENIOR_60_TO_80.value, AgeCategory.BELOW_60.value))
+    return pd.Series(category, index=ages.index).where(years.notna(), None)
+
+
+class BulkTaxCalculator:
+    """
+    Vectorized tax calculation over a DataFrame of employee records.
+
+    Input columns:
+        assessment_year, regime ('old', 'new' or 'both'), age_category (or age
+        in years), gross_salary, and optionally bank_interest, dividend_income,
+        other_income, house_property_income, standard_deduction, section_80c,
+        section_80d, section_80ccd_1b, hra_exemption, lta_exemption, tds_paid.
+        Other columns are passed through to the result.
+
+    Result columns, per regime (old_*, new_*): taxable_income,
+    tax_before_rebate, rebate_87a, surcharge, cess and tax; then
+    recommended_regime, savings, balance (TDS minus the recommended tax,
+    positive for a refund) and error.
+    """
+
+    def __init__(self, rule_provider: Optional[ITaxRuleProvider] = None):
+        """
+        Initialize the bulk calculator.
+
+        Args:
+            rule_provider: Tax rule provider; defaults to YearSpecificTaxRuleProvider
+        """
+        if rule_provider is None:
+            from .rules.year_specific_rule_provider import YearSpecificTaxRuleProvider
+            rule_provider = YearSpecificTaxRuleProvider()
+        self.rule_provider = rule_provider
+        if hasattr(rule_provider, 'add_refresh_listener'):
+            rule_provider.add_refresh_listener(self.clear_cache)
+        self._parameters: Dict[Tuple[str, TaxRegimeType, AgeCategory], Union[RegimeParameters, str]] = {}
+
+    def regime_parameters(self, assessment_year: str, regime_type: TaxRegimeType,
+                          age_category: AgeCategory) -> Union[RegimeParameters, str]:
+        """
+        Parameters for one group, resolved once and shared by every chunk.
+
+        Returns:
+            RegimeParameters, or an error message when the rules are unavailable
+        """
+        key = (assessment_year, regime_type, age_category)
+        if key not in self._parameters:
+            try:
+                if assessment_year not in self.rule_provider.get_supported_years():
+                    raise ValueError(f"Assessment year {assessment_year} not supported")
+                if not self.rule_provider.is_regime_supported(assessment_year, regime_type):
+                    raise ValueError(f"Regime {regime_type.value} not supported for year {assessment_year}")
+                regime = self.rule_provider.get_tax_regime(assessment_year, regime_type)
+                self._parameters[key] = build_regime_parameters(regime, age_category)
+            except Exception as e:
+                self._parameters[key] = str(e) or type(e).__name__
+        return self._parameters[key]
+
+    def clear_cache(self) -> None:
+        """Forget resolved parameters, e.g. after the rule provider's rules were refreshed"""
+        self._parameters.clear()
+
+    # ===============================
+    # CALCULATION
+    # ===============================
+
+    def calculate(
+        self,
+        records: pd.DataFrame,
+        assessment_year: Optional[str] = None,
+        regime: str = 'both',
+        age_category: str = AgeCategory.BELOW_60.value
+    ) -> pd.DataFrame:
+        """
+        Calculate tax for every record.
+
+        Args:
+            records: One row per employee
+            assessment_year: Used for rows without an assessment_year column
+            regime: Used for rows without a regime column
+            age_category: Used for rows without an age_category or age column
+
+        Returns:
+            The input columns followed by the result columns, in input order
+
+        Raises:
+            ValueError: If gross_salary is missing, or assessment_year is
+                neither a column nor given
+        """
+        if 'gross_salary' not in records.columns:
+            raise ValueError("Bulk tax input needs a gross_salary column")
+        if 'assessment_year' not in records.columns and not assessment_year:
+            raise ValueError("Bulk tax input needs an assessment_year column or a default assessment year")
+
+        if hasattr(self.rule_provider, 'check_for_updates'):
+            self.rule_provider.check_for_updates()
+        
+        count = len(records)
+        index = records.index
+        years = self._text_column(records, 'assessment_year', assessment_year)
+        regimes = self._text_column(records, 'regime', regime).str.lower()
+        if 'age_category' in records.columns:
+            ages = self._text_column(records, 'age_category', age_category).str.lower()
+        elif 'age' in records.columns:
+            ages = _age_from_years(records['age']).fillna(age_category)
+        else:
+            ages = pd.Series(age_category, index=index)
+
+        amounts = {column: self._paise_column(records, column) for column in AMOUNT_COLUMNS}
+        errors = np.full(count, None, dtype=object)
+        errors[amounts['gross_salary'] < 0] = "Gross salary cannot be negative"
+        errors[amounts['other_income'] < 0] = "Other income cannot be negative"
+        errors[~regimes.isin(['old', 'new', 'both']).to_numpy()] = "Regime must be old, new or both"
+        errors[~ages.isin([category.value for category in AgeCategory]).to_numpy()] = "Unknown age category"
+
+        results = {
+            regime_type: {name: np.full(count, np.nan) for name in RESULT_FIELDS}
+            for regime_type in REGIMES
+        }
+        regime_errors = {regime_type: np.full(count, None, dtype=object) for regime_type in REGIMES}
+
+        valid = pd.Series(errors == None, index=index)  # noqa: E711 - elementwise comparison
+        group_keys = pd.DataFrame({'year': years, 'age': ages})[valid.to_numpy()]
+        for (year, age), positions in group_keys.groupby(['year', 'age'], sort=False).indices.items():
+            rows = np.flatnonzero(valid.to_numpy())[positions]
+            age_enum = AgeCategory(age)
+            for regime_type in REGIMES:
+                wanted = rows[regimes.to_numpy()[rows] != ('new' if regime_type == TaxRegimeType.OLD else 'old')]
+                if not len(wanted):
+                    continue
+                parameters = self.regime_parameters(year, regime_type, age_enum)
+                if isinstance(parameters, str):
+                    regime_errors[regime_type][wanted] = parameters
+                    continue
+                group_amounts = {column: values[wanted] for column, values in amounts.items()}
+                for name, values in self._evaluate(parameters, regime_type, group_amounts).items():
+                    results[regime_type][name][wanted] = values
+
+        return self._result_frame(records, regimes, amounts['tds_paid'], results, regime_errors, errors)
+
+    def _evaluate(self, parameters: RegimeParameters, regime_type: TaxRegimeType,
+                  amounts: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Evaluate one group; mirrors MultiYearTaxCalculator.calculate_tax step by step"""
+        gross = amounts['gross_salary']
+        total_income = (gross + amounts['bank_interest'] + amounts['dividend_income']
+                        + amounts['other_income'] + amounts['house_property_income'])
+
+        standard = amounts['standard_deduction']
+        deductions = np.where(standard > 0, standard, np.minimum(gross, parameters.standard_deduction))
+        exemptions = np.zeros_like(gross)
+        if regime_type == TaxRegimeType.OLD:
+            deductions = deductions + amounts['section_80c'] + amounts['section_80d'] + amounts['section_80ccd_1b']
+            exemptions = amounts['hra_exemption'] + amounts['lta_exemption']
+        taxable = np.maximum(0, total_income - deductions - exemptions)
+
+        # Slab tax, each slab rounded to the rupee
+        tax_before_rebate = np.zeros_like(gross)
+        remaining = taxable.copy()
+        for width, rate in zip(parameters.slab_width, parameters.slab_rate_bp):
+            in_slab = np.maximum(remaining, 0) if width is None else np.clip(remaining, 0, width)
+            tax_before_rebate += _round_half_up(in_slab * rate, _MICRO_PER_RUPEE) * 100
+            remaining = remaining - in_slab
+
+        rebate = np.where(total_income > parameters.rebate_limit, 0,
+                          np.minimum(tax_before_rebate, parameters.rebate_max))
+        tax_after_rebate = np.maximum(0, tax_before_rebate - rebate)
+
+        surcharge_micro = self._surcharge(parameters, tax_after_rebate, total_income)
+
+        tax_micro = tax_after_rebate * _MICRO_PER_PAISA + surcharge_micro
+        cess_micro = _round_half_even(tax_micro * CESS_PERCENT, 100 * _MICRO_PER_RUPEE) * _MICRO_PER_RUPEE
+
+        return {
+            'taxable_income': taxable / 100,
+            'tax_before_rebate': tax_before_rebate / 100,
+            'rebate_87a': rebate / 100,
+            'surcharge': surcharge_micro / _MICRO_PER_RUPEE,
+            'cess': cess_micro / _MICRO_PER_RUPEE,
+            'tax': (tax_micro + cess_micro) / _MICRO_PER_RUPEE,
+        }
+
+    @staticmethod
+    def _surcharge(parameters: RegimeParameters, tax_paise: np.ndarray, income: np.ndarray) -> np.ndarray:
+        """Surcharge with marginal relief in micro-rupees, as in BaseTaxRegime.calculate_surcharge"""
+        th1, th2, th3, th4 = parameters.surcharge_thresholds
+        rate1, rate2, rate3, rate4 = parameters.surcharge_rates_bp
+        tax1, tax2, tax3, tax4 = parameters.threshold_tax
+
+        band2 = income <= th2
+        band3 = ~band2 & bool(th3) & (income <= th3)
+        band4 = ~band2 & ~band3 & bool(th4) & (income <= th4)
+        top = ~(band2 | band3 | band4)
+        top_rate = rate4 or rate3 or rate2
+        top_threshold, top_tax = (th4, tax4) if th4 else ((th3, tax3) if th3 else (th2, tax2))
+
+        rate = np.select([band2, band3, band4, top], [rate1, rate2, rate3, top_rate])
+        threshold = np.select([band2, band3, band4, top], [th1, th2, th3, top_threshold])
+        threshold_tax = np.select([band2, band3, band4, top], [tax1, tax2, tax3, top_tax])
+
+        surcharge = _round_half_up(tax_paise * rate, _MICRO_PER_RUPEE) * _MICRO_PER_RUPEE
+
+        excess = (income - threshold) * _MICRO_PER_PAISA
+        overshoot = tax_paise * _MICRO_PER_PAISA + surcharge - (threshold_tax + excess)
+        relieved = (threshold > 0) & (excess > 0) & (overshoot > 0)
+        surcharge = np.where(relieved, np.maximum(0, surcharge - overshoot), surcharge)
+
+        return np.where(income > th1, surcharge, 0)
+
+    @staticmethod
+    def _text_column(records: pd.DataFrame, column: str, default: Optional[str]) -> pd.Series:
+        if column not in records.columns:
+            return pd.Series(default, index=records.index, dtype=object)
+        values = records[column].astype(object).where(records[column].notna(), default)
+        return values.astype(str).str.strip()
+
+    @staticmethod
+    def _paise_column(records: pd.DataFrame, column: str) -> np.ndarray:
+        if column not in records.columns:
+            return np.zeros(len(records), dtype=np.int64)
+        values = pd.to_numeric(records[column], errors='coerce').fillna(0).to_numpy(dtype=float)
+        return np.round(values * 100).astype(np.int64)
+
+    @staticmethod
+    def _result_frame(records: pd.DataFrame, regimes: pd.Series, tds_paise: np.ndarray,
+                      results: Dict[TaxRegimeType, Dict[str, np.ndarray]],
+                      regime_errors: Dict[TaxRegimeType, np.ndarray], errors: np.ndarray) -> pd.DataFrame:
+        output = records.copy()
+        for regime_type in REGIMES:
+            for name in RESULT_FIELDS:
+                output[f'{regime_type.value}_{name}'] = results[regime_type][name]
+
+        old_tax = results[TaxRegimeType.OLD]['tax']
+        new_tax = results[TaxRegimeType.NEW]['tax']
+        has_old, has_new = ~np.isnan(old_tax), ~np.isnan(new_tax)
+        recommended = np.select(
+            [has_old & has_new & (new_tax < old_tax), has_old & has_new, has_old, has_new],
+            ['new', 'old', 'old', 'new'], default=None
+        )
+        recommended_tax = np.where(recommended == 'new', new_tax, old_tax)
+
+        # A 'both' row keeps the regime that could be calculated; a row with none fails
+        for regime_type in REGIMES:
+            failed = (regime_errors[regime_type] != None) & (recommended == None)  # noqa: E711
+            errors = np.where(failed & (errors == None), regime_errors[regime_type], errors)  # noqa: E711
+
+        output['recommended_regime'] = recommended
+        output['savings'] = np.where(has_old & has_new, np.abs(old_tax - new_tax), 0.0)
+        output['balance'] = tds_paise / 100 - recommended_tax
+        output['error'] = errors
+        return output
+
+    # ===============================
+    # STREAMING
+    # ===============================
+
+    def calculate_chunks(self, chunks: Iterable[pd.DataFrame], **defaults) -> Iterator[pd.DataFrame]:
+        """Calculate a stream of record chunks, yielding each result chunk as it is ready"""
+        for chunk in chunks:
+            yield self.calculate(chunk, **defaults)
+
+    def calculate_csv(self, input_file: Path, output_file: Path, chunk_size: int = 50_000,
+                      **defaults) -> Dict[str, Any]:
+        """
+        Calculate a CSV of records into a result CSV, holding one chunk in memory at a time.
+
+        Args:
+            input_file: CSV with one row per employee
+            output_file: Result CSV (input columns plus result columns)
+            chunk_size: Rows read, calculated and written per step
+            **defaults: assessment_year, regime and age_category for rows without them
+
+        Returns:
+            Row, error and regime recommendation counts plus throughput
+        """
+        start_time = time.time()
+        output_file = Path(output_file)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+
+        stats = {'rows': 0, 'errors': 0, 'chunks': 0, 'recommended': {'old': 0, 'new': 0}}
+        chunks = pd.read_csv(input_file, chunksize=max(1, chunk_size), dtype={'assessment_year': str})
+        for result in self.calculate_chunks(chunks, **defaults):
+            result.to_csv(output_file, mode='w' if stats['chunks'] == 0 else 'a',
+                          header=stats['chunks'] == 0, index=False)
+            stats['rows'] += len(result)
+            stats['errors'] += int(result['error'].notna().sum())
+            for regime_name, count in result['recommended_regime'].value_counts().items():
+                stats['recommended'][regime_name] += int(count)
+            stats['chunks'] += 1
+
+        elapsed = time.time() - start_time
+        stats.update({
+            'input_file': str(input_file),
+            'output_file': str(output_file),
+            'processing_time': elapsed,
+            'rows_per_second': stats['rows'] / elapsed if elapsed > 0 else 0.0,
+        })
+        return stats
+
@@ -22,6 +22,7 @@ from .interfaces.calculator_interface import (
 )
 from .interfaces.rule_provider_interface import ITaxRuleProvider
 from .main_calculator import MultiYearTaxCalculator
+from .result_cache import DEFAULT_CACHE_SIZE, TaxResultCache, canonical_key
 from .components.hra_calculator import HRACalculator, HRADetails, CityType
 from .components.lta_calculator import LTACalculator
 from .components.professional_tax import ProfessionalTaxCalculator, IndianState, get_state_from_code
@@ -107,10 +108,16 @@ class ComprehensiveTaxCalculator(ITaxCalculator):
     - Medical reimbursement exemption
     """
     
-    def __init__(self, rule_provider: Optional[ITaxRuleProvider] = None):
+    def __init__(self, rule_provider: Optional[ITaxRuleProvider] = None,
+                 cache_size: int = DEFAULT_CACHE_SIZE):
         """Initialize comprehensive tax calculator."""
-        self.base_calculator = MultiYearTaxCalculator(rule_provider)
+        # The comprehensive cache already covers every input the base calculator sees
+        # from here, so a second cache inside it would only add copying on each miss
+        self.base_calculator = MultiYearTaxCalculator(rule_provider, cache_size=0)
         self.rule_provider = self.base_calculator.rule_provider
+        self.result_cache = TaxResultCache(cache_size)
+        if hasattr(self.rule_provider, 'add_refresh_listener'):
+            self.rule_provider.add_refresh_listener(self.result_cache.clear)
         
         # Initialize component calculators
         self.hra_calculator = HRACalculator()
@@ -121,6 +128,30 @@ class ComprehensiveTaxCalculator(ITaxCalculator):
         self.gratuity_calculator = GratuityCalculator()
     
     def calculate_tax(self, input_data: ComprehensiveTaxCalculationInput) -> ComprehensiveTaxCalculationResult:
+        """
+        Calculate comprehensive tax, reusing the result for identical inputs.
+        
+        Results are memoized by a canonical form of input_data and dropped
+        when the rule provider's rules are refreshed.
+        """
+        if hasattr(self.rule_provider, 'check_for_updates'):
+            self.rule_provider.check_for_updates()
+        
+        key = canonical_key(input_data)
+        result = self.result_cache.get(key)
+        if result is None:
+            result = self._calculate_tax(input_data)
+            self.result_cache.put(key, result)
+        return result
+    
+    def cache_stats(self) -> Dict[str, Dict]:
+        """Hit/miss statistics of the comprehensive and base result caches."""
+        return {
+            'comprehensive': self.result_cache.stats(),
+            'base': self.base_calculator.cache_stats(),
+        }
+    
+    def _calculate_tax(self, input_data: ComprehensiveTaxCalculationInput) -> ComprehensiveTaxCalculationResult:
         """
         Calculate comprehensive tax with all components integrated.
         
@@ -2,8 +2,9 @@
 Interface for tax rule providers.
 """
 
+import weakref
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 from decimal import Decimal
 
 from .regime_interface import ITaxRegime, RegimeSettings
@@ -121,6 +122,39 @@ class ITaxRuleProvider(ABC):
         Refresh tax rules from configuration source.
         
         This method should reload rules from the configuration
-        system to pick up any updates.
+        system to pick up any updates, then call
+        _notify_rules_refreshed() so dependent caches are dropped.
         """
-        pass
\ No newline at end of file
+        pass
+    
+    def check_for_updates(self) -> bool:
+        """
+        Reload rules whose source changed since they were loaded.
+        
+        Providers with hot reloading notify refresh listeners when this
+        picks up new rules; the default does nothing.
+        
+        Returns:
+            True if the rules changed
+        """
+        return False
+    
+    def add_refresh_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Call listener after every refresh_rules().
+        
+        Args:
+            listener: Bound method, held weakly so registering does not keep
+                its owner (e.g. a calculator's result cache) alive
+        """
+        self.__dict__.setdefault('_refresh_listeners', []).append(weakref.WeakMethod(listener))
+    
+    def _notify_rules_refreshed(self) -> None:
+        """Call the live refresh listeners and forget the dead ones."""
+        listeners = self.__dict__.get('_refresh_listeners', [])
+        for reference in list(listeners):
+            listener = reference()
+            if listener is None:
+                listeners.remove(reference)
+            else:
+                listener()
\ No newline at end of file
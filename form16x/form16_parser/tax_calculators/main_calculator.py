@@ -12,6 +12,7 @@ from .interfaces.calculator_interface import (
     TaxRegimeType, TaxSlabCalculation
 )
 from .interfaces.rule_provider_interface import ITaxRuleProvider
+from .result_cache import DEFAULT_CACHE_SIZE, TaxResultCache, canonical_key
 from .rules.json_rule_provider import JsonTaxRuleProvider
 from ..utils.validation import ValidationError
 
@@ -29,16 +30,38 @@ class MultiYearTaxCalculator(ITaxCalculator):
     assessment years and regimes using configurable rule providers.
     """
     
-    def __init__(self, rule_provider: Optional[ITaxRuleProvider] = None):
+    def __init__(self, rule_provider: Optional[ITaxRuleProvider] = None,
+                 cache_size: int = DEFAULT_CACHE_SIZE):
         """
         Initialize tax calculator.
         
         Args:
             rule_provider: Tax rule provider. If None, uses default JSON provider.
+            cache_size: Number of results memoized by input (0 disables the cache)
         """
         self.rule_provider = rule_provider or JsonTaxRuleProvider()
+        self.result_cache = TaxResultCache(cache_size)
+        if hasattr(self.rule_provider, 'add_refresh_listener'):
+            self.rule_provider.add_refresh_listener(self.result_cache.clear)
     
     def calculate_tax(self, input_data: TaxCalculationInput) -> TaxCalculationResult:
+        """Calculate income tax for the given input, reusing the result for identical inputs."""
+        # A hot reload of the rules clears the cache through the refresh listener
+        if hasattr(self.rule_provider, 'check_for_updates'):
+            self.rule_provider.check_for_updates()
+        
+        key = canonical_key(input_data)
+        result = self.result_cache.get(key)
+        if result is None:
+            result = self._calculate_tax(input_data)
+            self.result_cache.put(key, result)
+        return result
+    
+    def cache_stats(self) -> Dict:
+        """Result cache hit/miss statistics."""
+        return self.result_cache.stats()
+    
+    def _calculate_tax(self, input_data: TaxCalculationInput) -> TaxCalculationResult:
         """Calculate income tax for the given input."""
         # Validate input
         validation_errors = self.validate_input(input_data)
@@ -0,0 +1,149 @@
+"""
+Memoization of tax calculation results.
+
+The optimize flow, the regime comparison displays and what-if recalculations
+repeatedly evaluate identical inputs. TaxResultCache keeps the most recently
+used results keyed by a canonical form of the input dataclass, so equal
+inputs hit the cache however their Decimals are written ('1200000' and
+'1200000.00' share an entry).
+
+A hit has to cost less than the calculation it saves, which for the base
+calculator is tens of microseconds, so keys are built from the input's
+values directly and results are copied shallowly rather than deep-copied.
+
+Calculators register the cache's clear() with their rule provider, so
+refresh_rules() drops every cached result.
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+DEFAULT_CACHE_SIZE = 1024
+
+# Field names per dataclass type; dataclasses.fields() is too slow to call per key
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def _field_names(cls: type) -> Tuple[str, ...]:
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(field.name for field in fields(cls))
+    return names
+
+
+def canonical_key(value: Any) -> Hashable:
+    """
+    Build a hashable, canonical form of a calculation input.
+
+    Dataclasses become (type name, field values) tuples, enums use their
+    values and dicts are sorted by key. Finite Decimals and ints are kept as
+    they are: numerically equal amounts already compare and hash equal.
+    """
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, int):
+        return value
+    if isinstance(value, Decimal):
+        return value if value.is_finite() else ('amount', str(value))
+    if is_dataclass(value) and not isinstance(value, type):
+        return (type(value).__qualname__,) + tuple(
+            (name, canonical_key(getattr(value, name))) for name in _field_names(type(value))
+        )
+    if isinstance(value, Enum):
+        return (type(value).__qualname__, value.value)
+    if isinstance(value, dict):
+        return ('dict',) + tuple(sorted((str(key), canonical_key(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return ('list',) + tuple(canonical_key(item) for item in value)
+    return (type(value).__qualname__, repr(value))
+
+
+def _copy_result(result: Any) -> Any:
+    """
+    Shallow copy of a result whose list, dict and set attributes are copied too.
+
+    Callers annotate returned results by setting attributes (compare_regimes
+    sets other_regime_tax) or appending to warning lists; neither reaches the
+    cached entry. Decimals and strings are immutable and shared.
+    """
+    result = copy.copy(result)
+    values = result if isinstance(result, dict) else getattr(result, '__dict__', None)
+    if values:
+        for name, value in list(values.items()):
+            if isinstance(value, (list, dict, set)):
+                values[name] = copy.copy(value)
+    return result
+
+
+class TaxResultCache:
+    """
+    Bounded LRU cache of calculation results with hit/miss statistics.
+
+    Results are copied on the way in and out (see _copy_result), so callers
+    that annotate a returned result cannot change cached entries. A maxsize
+    of 0 disables caching.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached results
+        """
+        self.maxsize = max(0, maxsize)
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return a copy of the cached result for key, or None"""
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            result = self._entries[key]
+        return _copy_result(result)
+
+    def put(self, key: Hashable, result: Any) -> None:
+        """Cache a copy of result, evicting the least recently used entry when full"""
+        if not self.maxsize:
+            return
+        result = _copy_result(result)
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached result (statistics are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit, miss, eviction and invalidation counts"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+            }
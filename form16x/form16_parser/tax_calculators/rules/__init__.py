@@ -3,7 +3,13 @@ Tax rule management components.
 """
 
 from .json_rule_provider import JsonTaxRuleProvider
+from .rule_pack import RulePack, RulePackLoader, build_rule_pack, compile_rule_pack, load_rule_pack
 
 __all__ = [
-    'JsonTaxRuleProvider'
-]
\ No newline at end of file
+    'JsonTaxRuleProvider',
+    'RulePack',
+    'RulePackLoader',
+    'build_rule_pack',
+    'compile_rule_pack',
+    'load_rule_pack'
+]
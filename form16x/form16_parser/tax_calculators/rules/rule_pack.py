@@ -0,0 +1,395 @@
+"""
+Compiled tax rule pack.
+
+Every assessment year's old and new regime rules are compiled once into an
+immutable RulePack: each JSON configuration is validated, frozen and turned
+into a ready regime engine whose slabs, settings and deduction limits are
+parsed to Decimal up front. Rule providers share one pack per source
+through RulePackLoader, which reloads it when the source's modification
+times change, so long-running servers pick up edited rules.
+
+A source is either a configuration directory (ay_YYYY_YY/{old,new}_regime.json)
+or a single compact pack file written by RulePack.save() / build_rule_pack().
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+from ..engines.new_regime import NewTaxRegime
+from ..engines.old_regime import OldTaxRegime
+from ..interfaces.calculator_interface import AgeCategory, TaxRegimeType
+from ..interfaces.regime_interface import ITaxRegime
+
+
+PACK_FORMAT = 'form16x-tax-rules'
+PACK_VERSION = 1
+
+# Seconds between source modification checks of a loaded pack
+DEFAULT_CHECK_INTERVAL = 2.0
+
+REQUIRED_FIELDS = ('assessment_year', 'regime_type', 'tax_slabs', 'surcharge', 'rebate_87a', 'cess', 'basic_settings')
+
+
+class UnsupportedYearError(Exception):
+    """Raised when assessment year is not supported."""
+    pass
+
+
+class UnsupportedRegimeError(Exception):
+    """Raised when regime is not supported for the given year."""
+    pass
+
+
+class RulePackError(RuntimeError):
+    """Raised when a rule configuration is invalid or a pack file cannot be read."""
+    pass
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy of a JSON value: dicts become mapping proxies, lists tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _amount(value: Any, name: str) -> Decimal:
+    try:
+        amount = Decimal(str(value))
+    except Exception:
+        raise ValueError(f"{name} is not a number: {value!r}")
+    if not amount.is_finite() or amount < 0:
+        raise ValueError(f"{name} must be a non-negative amount, got {value!r}")
+    return amount
+
+
+def _rate(value: Any, name: str) -> float:
+    rate = float(_amount(value, name))
+    if rate > 100:
+        raise ValueError(f"{name} must be a percentage, got {value!r}")
+    return rate
+
+
+def validate_rule_config(config: Dict, assessment_year: str, regime_type: TaxRegimeType) -> None:
+    """
+    Validate one regime configuration.
+
+    Raises:
+        ValueError: Describing the first problem found
+    """
+    for name in REQUIRED_FIELDS:
+        if name not in config:
+            raise ValueError(f"Missing required field '{name}' in config for {assessment_year} {regime_type.value}")
+
+    if config['assessment_year'] != assessment_year:
+        raise ValueError(
+            f"Config assessment year {config['assessment_year']} doesn't match requested {assessment_year}"
+        )
+    if config['regime_type'] != regime_type.value:
+        raise ValueError(
+            f"Config regime type {config['regime_type']} doesn't match requested {regime_type.value}"
+        )
+
+    for age, slabs in config['tax_slabs'].items():
+        AgeCategory(age)
+        if not slabs:
+            raise ValueError(f"No tax slabs for {age}")
+        expected_from = Decimal('0')
+        for index, slab in enumerate(slabs):
+            slab_from = _amount(slab['from'], f"{age} slab {index + 1} 'from'")
+            if slab_from != expected_from:
+                raise ValueError(f"{age} slab {index + 1} starts at {slab_from}, expected {expected_from}")
+            _rate(slab['rate'], f"{age} slab {index + 1} rate")
+            if slab['to'] is None:
+                if index != len(slabs) - 1:
+                    raise ValueError(f"{age} slab {index + 1} is open-ended but not the last slab")
+                break
+            expected_from = _amount(slab['to'], f"{age} slab {index + 1} 'to'")
+            if expected_from < slab_from:
+                raise ValueError(f"{age} slab {index + 1} ends before it starts")
+
+    surcharge = config['surcharge']
+    previous = Decimal('0')
+    for level in range(1, 5):
+        threshold = surcharge.get(f'threshold_{level}')
+        if threshold in (None, 0):
+            continue
+        threshold = _amount(threshold, f"Surcharge threshold_{level}")
+        if threshold <= previous:
+            raise ValueError(f"Surcharge threshold_{level} must be above the previous threshold")
+        previous = threshold
+        _rate(surcharge.get(f'rate_{level}', 0), f"Surcharge rate_{level}")
+
+    _amount(config['rebate_87a']['income_limit'], "Rebate income_limit")
+    _amount(config['rebate_87a']['max_rebate'], "Rebate max_rebate")
+    _rate(config['cess']['health_education_cess_rate'], "Cess rate")
+    _amount(config['basic_settings']['standard_deduction'], "Standard deduction")
+    for section, limit in config.get('deduction_limits', {}).items():
+        _amount(limit, f"Deduction limit {section}")
+
+
+@dataclass(frozen=True)
+class RegimeRules:
+    """One assessment year's rules for one regime, validated and pre-parsed."""
+    assessment_year: str
+    regime_type: TaxRegimeType
+    config: Mapping[str, Any]
+    regime: ITaxRegime
+    deduction_limits: Mapping[str, Decimal]
+    is_default: bool
+
+    @classmethod
+    def compile(cls, config: Dict, assessment_year: str, regime_type: TaxRegimeType) -> 'RegimeRules':
+        """Validate a configuration and build its engine with slabs and settings parsed"""
+        validate_rule_config(config, assessment_year, regime_type)
+        frozen = _freeze(config)
+
+        regime = OldTaxRegime(frozen) if regime_type == TaxRegimeType.OLD else NewTaxRegime(frozen)
+        regime.get_regime_settings()
+        for age in frozen['tax_slabs']:
+            regime.get_tax_slabs(AgeCategory(age))
+
+        return cls(
+            assessment_year=assessment_year,
+            regime_type=regime_type,
+            config=frozen,
+            regime=regime,
+            deduction_limits=MappingProxyType({
+                section: Decimal(str(limit)) for section, limit in frozen.get('deduction_limits', {}).items()
+            }),
+            is_default=bool(frozen.get('is_default', False)),
+        )
+
+
+@dataclass(frozen=True)
+class RulePack:
+    """All years' and regimes' rules, plus the configurations that failed validation."""
+    rules: Mapping[Tuple[str, TaxRegimeType], RegimeRules]
+    errors: Mapping[Tuple[str, TaxRegimeType], str] = field(default_factory=lambda: MappingProxyType({}))
+    source: Optional[str] = None
+
+    @classmethod
+    def from_configs(cls, configs: List[Tuple[str, TaxRegimeType, Dict, str]],
+                     source: Optional[str] = None) -> 'RulePack':
+        """
+        Compile (assessment year, regime, config, origin) entries into a pack.
+
+        An invalid configuration does not fail the whole pack; requests for
+        it raise RulePackError naming its origin.
+        """
+        rules, errors = {}, {}
+        for assessment_year, regime_type, config, origin in configs:
+            key = (assessment_year, regime_type)
+            if isinstance(config, Exception):
+                errors[key] = f"Invalid JSON in {origin}: {config}"
+                continue
+            try:
+                rules[key] = RegimeRules.compile(config, assessment_year, regime_type)
+            except Exception as e:
+                errors[key] = f"Error loading config from {origin}: {e}"
+        return cls(rules=MappingProxyType(rules), errors=MappingProxyType(errors), source=source)
+
+    def get(self, assessment_year: str, regime_type: TaxRegimeType) -> RegimeRules:
+        """
+        Rules for one year and regime.
+
+        Raises:
+            UnsupportedYearError: If the pack has no rules for the year
+            UnsupportedRegimeError: If the year has no rules for the regime
+            RulePackError: If the regime's configuration is invalid
+        """
+        key = (assessment_year, regime_type)
+        if key in self.rules:
+            return self.rules[key]
+        if key in self.errors:
+            raise RulePackError(self.errors[key])
+        if assessment_year not in self.years():
+            raise UnsupportedYearError(f"Assessment year {assessment_year} not supported")
+        raise UnsupportedRegimeError(f"Regime {regime_type.value} not supported for year {assessment_year}")
+
+    def years(self) -> List[str]:
+        """Assessment years with at least one regime configuration"""
+        return sorted({year for year, _ in list(self.rules) + list(self.errors)})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain JSON form of the valid configurations"""
+        return {
+            'format': PACK_FORMAT,
+            'version': PACK_VERSION,
+            'rules': [_thaw(rules.config) for _, rules in sorted(self.rules.items(), key=lambda item: (
+                item[0][0], item[0][1].value))],
+        }
+
+    def save(self, pack_file: Union[str, Path]) -> Path:
+        """Write the pack as one compact JSON file (atomically replacing an existing one)"""
+        pack_file = Path(pack_file)
+        pack_file.parent.mkdir(parents=True, exist_ok=True)
+        temporary = pack_file.with_name(f".{pack_file.name}.{os.getpid()}.tmp")
+        temporary.write_text(json.dumps(self.to_dict(), separators=(',', ':')), encoding='utf-8')
+        os.replace(temporary, pack_file)
+        return pack_file
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def _regime_files(config_dir: Path):
+    for year_dir in sorted(config_dir.glob('ay_*')):
+        if not year_dir.is_dir():
+            continue
+        assessment_year = year_dir.name[3:].replace('_', '-')
+        for regime_type in (TaxRegimeType.OLD, TaxRegimeType.NEW):
+            regime_file = year_dir / f"{regime_type.value}_regime.json"
+            if regime_file.exists():
+                yield assessment_year, regime_type, regime_file
+
+
+def compile_rule_pack(config_dir: Union[str, Path]) -> RulePack:
+    """Compile every ay_*/{old,new}_regime.json under config_dir"""
+    config_dir = Path(config_dir)
+    configs = []
+    for assessment_year, regime_type, regime_file in _regime_files(config_dir):
+        try:
+            config = json.loads(regime_file.read_text(encoding='utf-8'))
+        except json.JSONDecodeError as e:
+            config = e
+        configs.append((assessment_year, regime_type, config, str(regime_file)))
+    return RulePack.from_configs(configs, source=str(config_dir))
+
+
+def load_rule_pack(source: Union[str, Path]) -> RulePack:
+    """
+    Load a pack from a configuration directory or a pack file.
+
+    Raises:
+        RulePackError: If a pack file is unreadable or not a rule pack
+    """
+    source = Path(source)
+    if source.is_dir():
+        return compile_rule_pack(source)
+
+    try:
+        data = json.loads(source.read_bytes())
+    except (OSError, ValueError) as e:
+        raise RulePackError(f"Cannot read rule pack {source}: {e}")
+    if not isinstance(data, dict) or data.get('format') != PACK_FORMAT or data.get('version') != PACK_VERSION:
+        raise RulePackError(f"{source} is not a version {PACK_VERSION} tax rule pack")
+
+    try:
+        configs = [
+            (config['assessment_year'], TaxRegimeType(config['regime_type']), config, str(source))
+            for config in data['rules']
+        ]
+    except (KeyError, TypeError, ValueError) as e:
+        raise RulePackError(f"Malformed rule pack {source}: {e}")
+    return RulePack.from_configs(configs, source=str(source))
+
+
+def build_rule_pack(config_dir: Union[str, Path], pack_file: Union[str, Path]) -> RulePack:
+    """
+    Compile a configuration directory into a pack file.
+
+    Raises:
+        RulePackError: If any configuration is invalid
+    """
+    pack = compile_rule_pack(config_dir)
+    if pack.errors:
+        raise RulePackError('; '.join(pack.errors.values()))
+    pack.save(pack_file)
+    return pack
+
+
+def source_signature(source: Path) -> Tuple:
+    """Modification times and sizes that change whenever the source's rules may have"""
+    def stat(path: Path):
+        try:
+            info = path.stat()
+        except OSError:
+            return (str(path), None, None)
+        return (str(path), info.st_mtime_ns, info.st_size)
+
+    if not source.is_dir():
+        return (stat(source),)
+    entries = [stat(source)]
+    for year_dir in sorted(source.glob('ay_*')):
+        entries.append(stat(year_dir))
+        entries.extend(stat(regime_file) for regime_file in sorted(year_dir.glob('*_regime.json')))
+    return tuple(entries)
+
+
+class RulePackLoader:
+    """
+    Holds the current RulePack for one source and hot-reloads it.
+
+    At most every check_interval seconds, an access compares the source's
+    modification times with those the pack was built from and recompiles on
+    a change. The pack is swapped atomically, so readers always see a
+    complete pack.
+    """
+
+    _shared: Dict[str, 'RulePackLoader'] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, source: Union[str, Path], check_interval: float = DEFAULT_CHECK_INTERVAL):
+        """
+        Initialize the loader; the pack is compiled on first use.
+
+        Args:
+            source: Configuration directory or pack file
+            check_interval: Seconds between modification checks (0 checks on every access)
+        """
+        self.source = Path(source)
+        self.check_interval = check_interval
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._pack: Optional[RulePack] = None
+        self._signature = None
+        self._checked_at = 0.0
+
+    @classmethod
+    def shared(cls, source: Union[str, Path]) -> 'RulePackLoader':
+        """The process-wide loader for a source, so providers share one compiled pack"""
+        key = str(Path(source).resolve())
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(source)
+            return cls._shared[key]
+
+    @property
+    def pack(self) -> RulePack:
+        """The current pack, reloaded first if the source changed"""
+        pack = self._pack
+        if pack is not None and time.monotonic() - self._checked_at < self.check_interval:
+            return pack
+        return self._refresh(force=False)
+
+    def reload(self) -> RulePack:
+        """Recompile the pack from the source now"""
+        return self._refresh(force=True)
+
+    def _refresh(self, force: bool) -> RulePack:
+        with self._lock:
+            signature = source_signature(self.source)
+            self._checked_at = time.monotonic()
+            if force or self._pack is None or signature != self._signature:
+                start_time = time.perf_counter()
+                pack = load_rule_pack(self.source)
+                if self._pack is not None:
+                    self.logger.info(f"Reloaded tax rules from {self.source} "
+                                     f"in {(time.perf_counter() - start_time) * 1000:.1f} ms")
+                self._pack, self._signature = pack, signature
+            return self._pack
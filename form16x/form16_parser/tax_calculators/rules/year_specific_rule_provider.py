@@ -23,20 +23,28 @@ class YearSpecificTaxRuleProvider(ITaxRuleProvider):
     logic that accurately reflects the tax laws for that specific year.
     """
     
-    def __init__(self):
-        """Initialize the year-specific rule provider."""
+    def __init__(self, config_base_path: Optional[str] = None):
+        """
+        Initialize the year-specific rule provider.
+        
+        Args:
+            config_base_path: Tax rule configuration directory or rule pack
+                file shared by every year's provider (package rules if None)
+        """
+        self._json_provider = JsonTaxRuleProvider(config_base_path)
+        self._json_provider.add_refresh_listener(self._notify_rules_refreshed)
         self._year_providers = {}
         self._initialize_year_providers()
     
     def _initialize_year_providers(self):
         """Initialize providers for specific assessment years."""
-        # Initialize providers for supported assessment years
+        # Initialize providers for supported assessment years, all reading one rule pack
         self._year_providers = {
-            "2020-21": AY_2020_21_RuleProvider(),  # Add ONE historical year first
-            "2021-22": AY_2021_22_RuleProvider(),
-            "2023-24": AY_2023_24_RuleProvider(),
-            "2024-25": AY_2024_25_RuleProvider(),
-            "2025-26": AY_2025_26_RuleProvider(),
+            "2020-21": AY_2020_21_RuleProvider(self._json_provider),  # Add ONE historical year first
+            "2021-22": AY_2021_22_RuleProvider(self._json_provider),
+            "2023-24": AY_2023_24_RuleProvider(self._json_provider),
+            "2024-25": AY_2024_25_RuleProvider(self._json_provider),
+            "2025-26": AY_2025_26_RuleProvider(self._json_provider),
         }
     
     def get_tax_regime(self, assessment_year: str, regime_type) -> ITaxRegime:
@@ -119,6 +127,12 @@ class YearSpecificTaxRuleProvider(ITaxRuleProvider):
     def refresh_rules(self) -> None:
         """Refresh tax rules from configuration source."""
         self._initialize_year_providers()
+        # Reloading the shared pack notifies this provider's listeners
+        self._json_provider.refresh_rules()
+    
+    def check_for_updates(self) -> bool:
+        """Pick up rules reloaded because their files changed."""
+        return self._json_provider.check_for_updates()
     
     def _get_year_provider(self, assessment_year: str) -> 'BaseYearRuleProvider':
         """Get provider for specific assessment year."""
@@ -131,6 +145,16 @@ class YearSpecificTaxRuleProvider(ITaxRuleProvider):
 class BaseYearRuleProvider(ABC):
     """Base class for year-specific rule providers."""
     
+    def __init__(self, json_provider: Optional[JsonTaxRuleProvider] = None):
+        """
+        Initialize the year's rule provider.
+        
+        Args:
+            json_provider: Provider of the compiled rule pack; a provider for
+                the package rules if None
+        """
+        self.json_provider = json_provider or JsonTaxRuleProvider()
+    
     @abstractmethod
     def get_assessment_year(self) -> str:
         """Get the assessment year this provider handles."""
@@ -164,10 +188,6 @@ class AY_2023_24_RuleProvider(BaseYearRuleProvider):
     - Surcharge: 10%, 15%, 25% for new regime (37% not applicable)
     """
     
-    def __init__(self):
-        """Initialize AY 2023-24 rule provider."""
-        self.json_provider = JsonTaxRuleProvider()
-    
     def get_assessment_year(self) -> str:
         """Get assessment year."""
         return "2023-24"
@@ -190,11 +210,11 @@ class AY_2023_24_RuleProvider(BaseYearRuleProvider):
         # Use AY 2024-25 configurations as they are identical for most purposes
         configs = {}
         try:
-            configs["new"] = self.json_provider._load_rule_config("2024-25", TaxRegimeType.NEW)
+            configs["new"] = self.json_provider.get_rule_config("2024-25", TaxRegimeType.NEW)
         except:
             pass
         try:
-            configs["old"] = self.json_provider._load_rule_config("2024-25", TaxRegimeType.OLD)  
+            configs["old"] = self.json_provider.get_rule_config("2024-25", TaxRegimeType.OLD)  
         except:
             pass
         
@@ -208,8 +228,8 @@ class AY_2023_24_RuleProvider(BaseYearRuleProvider):
             from ..interfaces.calculator_interface import TaxRegimeType
             
             # Validate new regime slabs
-            new_config = self.json_provider._load_rule_config("2023-24", TaxRegimeType.NEW)
-            old_config = self.json_provider._load_rule_config("2023-24", TaxRegimeType.OLD)
+            new_config = self.json_provider.get_rule_config("2023-24", TaxRegimeType.NEW)
+            old_config = self.json_provider.get_rule_config("2023-24", TaxRegimeType.OLD)
             
             # Validate key AY 2023-24 features
             if new_config.get("rebate_87a", {}).get("income_limit") != 500000:
@@ -237,10 +257,6 @@ class AY_2024_25_RuleProvider(BaseYearRuleProvider):
     - Old regime unchanged but no longer default
     """
     
-    def __init__(self):
-        """Initialize AY 2024-25 rule provider."""
-        self.json_provider = JsonTaxRuleProvider()
-    
     def get_assessment_year(self) -> str:
         """Get assessment year."""
         return "2024-25"
@@ -261,11 +277,11 @@ class AY_2024_25_RuleProvider(BaseYearRuleProvider):
         
         configs = {}
         try:
-            configs["new"] = self.json_provider._load_rule_config(assessment_year, TaxRegimeType.NEW)
+            configs["new"] = self.json_provider.get_rule_config(assessment_year, TaxRegimeType.NEW)
         except:
             pass
         try:
-            configs["old"] = self.json_provider._load_rule_config(assessment_year, TaxRegimeType.OLD)  
+            configs["old"] = self.json_provider.get_rule_config(assessment_year, TaxRegimeType.OLD)  
         except:
             pass
         
@@ -278,8 +294,8 @@ class AY_2024_25_RuleProvider(BaseYearRuleProvider):
         try:
             from ..interfaces.calculator_interface import TaxRegimeType
             
-            new_config = self.json_provider._load_rule_config("2024-25", TaxRegimeType.NEW)
-            old_config = self.json_provider._load_rule_config("2024-25", TaxRegimeType.OLD)
+            new_config = self.json_provider.get_rule_config("2024-25", TaxRegimeType.NEW)
+            old_config = self.json_provider.get_rule_config("2024-25", TaxRegimeType.OLD)
             
             # Validate key AY 2024-25 features
             if not new_config.get("is_default", False):
@@ -314,10 +330,6 @@ class AY_2025_26_RuleProvider(BaseYearRuleProvider):
     - This means effective zero tax up to 12L in new regime
     """
     
-    def __init__(self):
-        """Initialize AY 2025-26 rule provider."""
-        self.json_provider = JsonTaxRuleProvider()
-    
     def get_assessment_year(self) -> str:
         """Get assessment year."""
         return "2025-26"
@@ -347,15 +359,15 @@ class AY_2025_26_RuleProvider(BaseYearRuleProvider):
         
         configs = {}
         try:
-            configs["new"] = self.json_provider._load_rule_config(assessment_year, TaxRegimeType.NEW)
+            configs["new"] = self.json_provider.get_rule_config(assessment_year, TaxRegimeType.NEW)
         except:
             pass
         try:
-            configs["old"] = self.json_provider._load_rule_config(assessment_year, TaxRegimeType.OLD)  
+            configs["old"] = self.json_provider.get_rule_config(assessment_year, TaxRegimeType.OLD)  
         except:
             # If old regime config not available for 2025-26, use 2024-25 old regime
             try:
-                configs["old"] = self.json_provider._load_rule_config("2024-25", TaxRegimeType.OLD)
+                configs["old"] = self.json_provider.get_rule_config("2024-25", TaxRegimeType.OLD)
             except:
                 pass
         
@@ -368,7 +380,7 @@ class AY_2025_26_RuleProvider(BaseYearRuleProvider):
         try:
             from ..interfaces.calculator_interface import TaxRegimeType
             
-            new_config = self.json_provider._load_rule_config("2025-26", TaxRegimeType.NEW)
+            new_config = self.json_provider.get_rule_config("2025-26", TaxRegimeType.NEW)
             
             # Validate key AY 2025-26 features
             if new_config.get("basic_settings", {}).get("standard_deduction") != 75000:
@@ -395,10 +407,6 @@ class AY_2025_26_RuleProvider(BaseYearRuleProvider):
 class AY_2020_21_RuleProvider(BaseYearRuleProvider):
     """Tax rule provider for Assessment Year 2020-21 - Historical rules."""
     
-    def __init__(self):
-        """Initialize AY 2020-21 rule provider."""
-        self.json_provider = JsonTaxRuleProvider()
-    
     def get_assessment_year(self) -> str:
         """Get assessment year."""
         return "2020-21"
@@ -425,7 +433,7 @@ class AY_2020_21_RuleProvider(BaseYearRuleProvider):
         # Use 2024-25 old regime config but only return old regime
         configs = {}
         try:
-            configs["old"] = self.json_provider._load_rule_config("2024-25", TaxRegimeType.OLD)
+            configs["old"] = self.json_provider.get_rule_config("2024-25", TaxRegimeType.OLD)
         except Exception:
             pass
         
@@ -439,10 +447,6 @@ class AY_2020_21_RuleProvider(BaseYearRuleProvider):
 class AY_2021_22_RuleProvider(BaseYearRuleProvider):
     """Tax rule provider for Assessment Year 2021-22 - Historical rules."""
     
-    def __init__(self):
-        """Initialize AY 2021-22 rule provider."""
-        self.json_provider = JsonTaxRuleProvider()
-    
     def get_assessment_year(self) -> str:
         """Get assessment year."""
         return "2021-22"
@@ -469,7 +473,7 @@ class AY_2021_22_RuleProvider(BaseYearRuleProvider):
         # Use 2024-25 old regime config but only return old regime
         configs = {}
         try:
-            configs["old"] = self.json_provider._load_rule_config("2024-25", TaxRegimeType.OLD)
+            configs["old"] = self.json_provider.get_rule_config("2024-25", TaxRegimeType.OLD)
         except Exception:
             pass
         
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Columnar Export for Form16 Documents
+====================================
+
+Flattens Form16Document sections into typed Arrow record batches and writes
+them incrementally to a partitioned Parquet dataset for analytics.
+
+One dataset is written per section under the output directory:
+
+- documents: metadata, employee and employer fields (one row per document)
+- salary, chapter_via_deductions, section16_deductions, tax_computation:
+  one row per document, one column per model field
+- quarterly_tds: one row per quarter
+- extraction_confidence: one row per (document, field)
+
+Every row carries document_id plus the partition columns assessment_year and
+employer_tan. Decimal amounts are stored as decimal128 so no precision is
+lost to floating point; extractors sometimes leave floats in Decimal fields,
+which are converted through their string form. pyarrow is an optional
+dependency and is only imported when an exporter is created.
+"""
+
+import datetime
+import json
+import logging
+import threading
+import typing
+import uuid
+from decimal import ROUND_HALF_UP, Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from form16x.form16_parser.models.form16_models import (
+    ChapterVIADeductions, EmployeeInfo, EmployerInfo, Form16Document, Form16Metadata,
+    SalaryBreakdown, Section16Deductions, TaxComputation, TaxDeductionQuarterly
+)
+
+PARTITION_COLUMNS = ('assessment_year', 'employer_tan')
+UNKNOWN_PARTITION = 'unknown'
+
+# Wide enough for any rupee amount with paise; amounts are rounded half-up
+# to four decimal places when a document is flattened
+DECIMAL_PRECISION = 22
+DECIMAL_SCALE = 4
+_DECIMAL_QUANTUM = Decimal(1).scaleb(-DECIMAL_SCALE)
+
+# Per-document sections exported as one row with one column per model field
+_ROW_SECTIONS: Dict[str, Tuple[str, type]] = {
+    'salary': ('salary', SalaryBreakdown),
+    'chapter_via_deductions': ('chapter_via_deductions', ChapterVIADeductions),
+    'section16_deductions': ('section16_deductions', Section16Deductions),
+    'tax_computation': ('tax_computation', TaxComputation),
+}
+
+# Models flattened into the documents table, with their column prefix
+_DOCUMENT_SECTIONS: Tuple[Tuple[str, str, type], ...] = (
+    ('metadata', '', Form16Metadata),
+    ('employee', 'employee_', EmployeeInfo),
+    ('employer', 'employer_', EmployerInfo),
+)
+
+
+def _import_pyarrow():
+    """Import pyarrow lazily with an actionable error message"""
+    try:
+        import pyarrow
+        import pyarrow.dataset
+        return pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Columnar export requires pyarrow. Install it with: pip install 'form16x[analytics]'"
+        ) from e
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    """Return T for Optional[T], otherwise the annotation unchanged"""
+    if typing.get_origin(annotation) is typing.Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _model_field_types(model_cls: type) -> Dict[str, Any]:
+    """Field name -> unwrapped annotation for a pydantic model"""
+    hints = typing.get_type_hints(model_cls)
+    return {
+        name: _unwrap_optional(hints[name])
+        for name in getattr(model_cls, 'model_fields', None) or model_cls.__fields__
+    }
+
+
+class ColumnarExporter:
+    """
+    Incremental, thread-safe writer of Form16Documents to partitioned Parquet.
+
+    Documents are buffered in memory and flushed as Arrow record batches every
+    `batch_size` documents, so memory stays bounded regardless of run size.
+    """
+
+    def __init__(self, output_dir: Path, batch_size: int = 500, compression: str = 'zstd'):
+        """
+        Args:
+            output_dir: Root directory for the Parquet datasets
+            batch_size: Documents buffered before each flush
+            compression: Parquet compression codec
+        """
+        self.logger = logging.getLogger(__name__)
+        self.pa = _import_pyarrow()
+        self.output_dir = Path(output_dir)
+        self.batch_size = max(1, batch_size)
+        self.compression = compression
+
+        self._run_id = uuid.uuid4().hex[:8]
+        self._flush_count = 0
+        self._lock = threading.Lock()
+        self._pending_documents = 0
+        self._buffers: Dict[str, List[Dict[str, Any]]] = {}
+        self._schemas = self._build_schemas()
+
+        self.documents_written = 0
+        self.rows_written: Dict[str, int] = {name: 0 for name in self._schemas}
+        self.rows_dropped: Dict[str, int] = {name: 0 for name in self._schemas}
+
+    # ===============================
+    # SCHEMAS
+    # ===============================
+
+    def _arrow_type(self, annotation: Any):
+        """Map a model field annotation to an Arrow type"""
+        pa = self.pa
+        if annotation is Decimal:
+            return pa.decimal128(DECIMAL_PRECISION, DECIMAL_SCALE)
+        if annotation is datetime.date:
+            return pa.date32()
+        if annotation is float:
+            return pa.float64()
+        if annotation is int:
+            return pa.int64()
+        if annotation is bool:
+            return pa.bool_()
+        # str, Enums and nested dicts (stored as JSON text)
+        return pa.string()
+
+    def _key_fields(self) -> List[Any]:
+        pa = self.pa
+        return [pa.field('document_id', pa.string(), nullable=False)] + [
+            pa.field(name, pa.string(), nullable=False) for name in PARTITION_COLUMNS
+        ]
+
+    def _model_fields(self, model_cls: type, prefix: str = '', exclude: Iterable[str] = ()) -> List[Any]:
+        return [
+            self.pa.field(f'{prefix}{name}', self._arrow_type(annotation))
+            for name, annotation in _model_field_types(model_cls).items()
+            if f'{prefix}{name}' not in exclude
+        ]
+
+    def _build_schemas(self) -> Dict[str, Any]:
+        pa = self.pa
+        key_names = {'document_id', *PARTITION_COLUMNS}
+
+        document_fields = self._key_fields() + [pa.field('source_file', pa.string())]
+        for _, prefix, model_cls in _DOCUMENT_SECTIONS:
+            document_fields += self._model_fields(model_cls, prefix, exclude=key_names)
+
+        schemas = {'documents': pa.schema(document_fields)}
+        for table_name, (_, model_cls) in _ROW_SECTIONS.items():
+            schemas[table_name] = pa.schema(self._key_fields() + self._model_fields(model_cls))
+
+        schemas['quarterly_tds'] = pa.schema(self._key_fields() + self._model_fields(TaxDeductionQuarterly))
+        schemas['extraction_confidence'] = pa.schema(self._key_fields() + [
+            pa.field('field', pa.string()),
+            pa.field('confidence', pa.float64()),
+        ])
+        return schemas
+
+    # ===============================
+    # FLATTENING
+    # ===============================
+
+    @staticmethod
+    def _to_cell(value: Any, annotation: Any = None) -> Any:
+        """Convert a model value to something Arrow accepts for its column type"""
+        if value is None:
+            return None
+        if annotation is Decimal:
+            # Floats left in Decimal fields by the extractors go through str, so 0.1 stays 0.1
+            amount = value if isinstance(value, Decimal) else Decimal(str(value))
+            return amount.quantize(_DECIMAL_QUANTUM, rounding=ROUND_HALF_UP) if amount.is_finite() else None
+        if isinstance(value, Enum):
+            return value.value
+        if isinstance(value, dict):
+            return json.dumps(value, sort_keys=True, default=str) if value else None
+        return value
+
+    def _section_values(self, section: Any, model_cls: type, prefix: str = '') -> Dict[str, Any]:
+        if section is None:
+            return {}
+        return {
+            f'{prefix}{name}': self._to_cell(getattr(section, name, None), annotation)
+            for name, annotation in _model_field_types(model_cls).items()
+        }
+
+    def flatten(self, form16_doc: Form16Document, document_id: str,
+                source_file: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Flatten a document into per-table row dicts.
+
+        Args:
+            form16_doc: Extracted Form16 document
+            document_id: Identifier stored in every row (usually the PDF stem)
+            source_file: Path of the source PDF
+
+        Returns:
+            Dict mapping table name to its rows
+        """
+        metadata = form16_doc.metadata
+        employer = form16_doc.employer
+        keys = {
+            'document_id': document_id,
+            'assessment_year': (metadata.assessment_year if metadata else None) or UNKNOWN_PARTITION,
+            'employer_tan': (employer.tan if employer else None) or UNKNOWN_PARTITION,
+        }
+
+        document_row = dict(keys, source_file=source_file)
+        for attr, prefix, model_cls in _DOCUMENT_SECTIONS:
+            for column, value in self._section_values(getattr(form16_doc, attr), model_cls, prefix).items():
+                document_row.setdefault(column, value)
+
+        rows: Dict[str, List[Dict[str, Any]]] = {'documents': [document_row]}
+        for table_name, (attr, model_cls) in _ROW_SECTIONS.items():
+            rows[table_name] = [dict(keys, **self._section_values(getattr(form16_doc, attr), model_cls))]
+
+        rows['quarterly_tds'] = [
+            dict(keys, **self._section_values(quarter, TaxDeductionQuarterly))
+            for quarter in form16_doc.quarterly_tds or []
+        ]
+        rows['extraction_confidence'] = [
+            dict(keys, field=field_name, confidence=float(confidence))
+            for field_name, confidence in (form16_doc.extraction_confidence or {}).items()
+        ]
+        return rows
+
+    # ===============================
+    # WRITING
+    # ===============================
+
+    def add_document(self, form16_doc: Form16Document, document_id: str,
+                     source_file: Optional[str] = None) -> None:
+        """Buffer a document, flushing when the batch is full"""
+        rows = self.flatten(form16_doc, document_id, source_file)
+
+        with self._lock:
+            for table_name, table_rows in rows.items():
+                self._buffers.setdefault(table_name, []).extend(table_rows)
+            self._pending_documents += 1
+
+            if self._pending_documents >= self.batch_size:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Write all buffered rows"""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> Dict[str, Any]:
+        """Flush remaining rows and return export statistics"""
+        self.flush()
+        return {
+            'output_directory': str(self.output_dir),
+            'documents_written': self.documents_written,
+            'rows_written': dict(self.rows_written),
+            'rows_dropped': {name: count for name, count in self.rows_dropped.items() if count},
+            'flushes': self._flush_count,
+        }
+
+    def _record_batch(self, table_name: str, table_rows: List[Dict[str, Any]]):
+        """Convert buffered rows to a record batch, dropping rows Arrow rejects"""
+        pa = self.pa
+        schema = self._schemas[table_name]
+        try:
+            return pa.RecordBatch.from_pylist(table_rows, schema=schema)
+        except (pa.ArrowException, TypeError, ValueError):
+            pass
+
+        valid_rows = []
+        for row in table_rows:
+            try:
+                pa.RecordBatch.from_pylist([row], schema=schema)
+                valid_rows.append(row)
+            except (pa.ArrowException, TypeError, ValueError) as e:
+                self.logger.warning(f"Dropping {table_name} row of {row.get('document_id')}: {e}")
+                self.rows_dropped[table_name] += 1
+        return pa.RecordBatch.from_pylist(valid_rows, schema=schema)
+
+    def _flush_locked(self) -> None:
+        if not self._pending_documents:
+            return
+
+        # Take the buffers first, so a failed write cannot fail every later document
+        buffers, pending_documents = self._buffers, self._pending_documents
+        self._buffers = {}
+        self._pending_documents = 0
+        flush_number = self._flush_count
+        self._flush_count += 1
+
+        pa = self.pa
+        ds = pa.dataset
+        partitioning = ds.partitioning(
+            pa.schema([pa.field(name, pa.string()) for name in PARTITION_COLUMNS]), flavor='hive'
+        )
+        file_format = ds.ParquetFileFormat()
+        write_options = file_format.make_write_options(compression=self.compression)
+
+        for table_name, table_rows in buffers.items():
+            if not table_rows:
+                continue
+            batch = self._record_batch(table_name, table_rows)
+            if not batch.num_rows:
+                continue
+            ds.write_dataset(
+                batch,
+                self.output_dir / table_name,
+                format=file_format,
+                file_options=write_options,
+                partitioning=partitioning,
+                basename_template=f'part-{self._run_id}-{flush_number:05d}-{{i}}.parquet',
+                existing_data_behavior='overwrite_or_ignore',
+            )
+            self.rows_written[table_name] += batch.num_rows
+
+        self.logger.debug(f"Flushed {pending_documents} documents to {self.output_dir}")
+        self.documents_written += pending_documents
+
+    def __enter__(self) -> 'ColumnarExporter':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def export_documents(documents: Iterable[Tuple[str, Form16Document]], output_dir: Path,
+                     batch_size: int = 500) -> Dict[str, Any]:
+    """
+    Export (document_id, Form16Document) pairs to a partitioned Parquet dataset.
+
+    Returns:
+        Export statistics from ColumnarExporter.close()
+    """
+    exporter = ColumnarExporter(output_dir, batch_size=batch_size)
+    for document_id, form16_doc in documents:
+        exporter.add_document(form16_doc, document_id)
+    return exporter.close()
@@ -0,0 +1,62 @@
+"""
+Advisory file locks for JSON stores shared between processes.
+
+The strategy statistics and layout template stores are plain JSON files
+that several processes (isolated extraction workers, parallel batch runs
+on one machine) may update at once. Writers take an exclusive lock on a
+sidecar '<name>.lock' file, re-read the current contents, apply their
+change and replace the file, so no update is lost to a stale in-memory copy.
+
+Uses fcntl on POSIX and msvcrt on Windows; elsewhere the lock only
+serializes threads of this process.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+_thread_lock = threading.RLock()
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """
+    Hold an exclusive lock on path + '.lock' for the duration of the block.
+
+    Args:
+        path: File being protected (the lock file sits next to it)
+    """
+    lock_path = Path(path).with_name(Path(path).name + '.lock')
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with _thread_lock, open(lock_path, 'a+b') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        elif msvcrt is not None:  # pragma: no cover - Windows
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:  # pragma: no cover - Windows
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def writer_temp_path(path: Path) -> Path:
+    """Temporary file name unique to this process and thread, for atomic replaces"""
+    path = Path(path)
+    return path.with_name(f'{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
@@ -36,6 +36,12 @@ class Form16JSONBuilder:
             Comprehensive JSON dictionary with all fields
         """
         
+        # Build each part once; metrics count fields on the same structure
+        form16_json = {
+            "part_a": Form16JSONBuilder._build_part_a(form16_doc),
+            "part_b": Form16JSONBuilder._build_part_b(form16_doc)
+        }
+        
         return {
             "status": "success",
             "metadata": {
@@ -45,13 +51,10 @@ class Form16JSONBuilder:
                 "extractor_version": "1.0.0"
             },
             
-            "form16": {
-                "part_a": Form16JSONBuilder._build_part_a(form16_doc),
-                "part_b": Form16JSONBuilder._build_part_b(form16_doc)
-            },
+            "form16": form16_json,
             
             "extraction_metrics": Form16JSONBuilder._build_metrics(
-                form16_doc, extraction_metadata
+                form16_doc, extraction_metadata, form16_json
             )
         }
     
@@ -505,14 +508,16 @@ class Form16JSONBuilder:
         }
     
     @staticmethod
-    def _build_metrics(doc: Form16Document, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    def _build_metrics(doc: Form16Document, metadata: Dict[str, Any],
+                       form16_json: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Build extraction metrics with comprehensive field counting"""
         
-        # Build the complete JSON to count all actual fields
-        form16_json = {
-            "part_a": Form16JSONBuilder._build_part_a(doc),
-            "part_b": Form16JSONBuilder._build_part_b(doc)
-        }
+        # Build the complete JSON to count all actual fields unless already built
+        if form16_json is None:
+            form16_json = {
+                "part_a": Form16JSONBuilder._build_part_a(doc),
+                "part_b": Form16JSONBuilder._build_part_b(doc)
+            }
         
         # Recursively count all non-null fields
         def count_non_null_fields(obj):
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+JSON Serialization
+==================
+
+Pluggable JSON serializer for extraction results.
+
+Backends, in order of preference when backend='auto':
+- orjson: fast C encoder, Decimal handled by a default hook
+- msgspec: encodes Decimal natively as strings (datetimes use ISO 'T' format)
+- json: standard library fallback, streamed to disk with iterencode
+
+Decimals are always written as strings, matching the previous
+json.dump(..., default=str) output, so amounts stay exact.
+
+Output can optionally be compressed with gzip (standard library) or zstd
+(requires the optional 'zstandard' package). Files are written through a
+binary stream, so the stdlib backend never holds the full document text in
+memory and compressed output never exists uncompressed on disk. Files are
+written under a temporary name and renamed into place, so readers (and
+workers rewriting the same result) never see a partial file.
+"""
+
+import gzip
+import io
+import json
+import os
+import uuid
+from enum import Enum
+from pathlib import Path
+from typing import Any, BinaryIO, Optional
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+BACKENDS = ('auto', 'msgspec', 'orjson', 'json')
+COMPRESSIONS = (None, 'gzip', 'zstd')
+
+_COMPRESSION_SUFFIXES = {'gzip': '.gz', 'zstd': '.zst'}
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _encode_fallback(value: Any) -> Any:
+    """Fallback for values JSON cannot represent (mirrors json.dump(default=str))"""
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def resolve_backend(backend: str = 'auto') -> str:
+    """
+    Resolve a backend name to one that is installed.
+
+    Raises:
+        ValueError: If the backend name is unknown
+        ImportError: If an explicitly requested backend is not installed
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown JSON backend: {backend}. Choose from {', '.join(BACKENDS)}")
+
+    if backend == 'auto':
+        if ORJSON_AVAILABLE:
+            return 'orjson'
+        if MSGSPEC_AVAILABLE:
+            return 'msgspec'
+        return 'json'
+
+    if backend == 'msgspec' and not MSGSPEC_AVAILABLE:
+        raise ImportError("JSON backend 'msgspec' requested but msgspec is not installed")
+    if backend == 'orjson' and not ORJSON_AVAILABLE:
+        raise ImportError("JSON backend 'orjson' requested but orjson is not installed")
+
+    return backend
+
+
+def compressed_path(path: Path, compression: Optional[str]) -> Path:
+    """Append the compression suffix (.gz/.zst) to an output path"""
+    if not compression:
+        return Path(path)
+    return Path(str(path) + _COMPRESSION_SUFFIXES[compression])
+
+
+def open_output(path: Path, compression: Optional[str] = None) -> BinaryIO:
+    """
+    Open a binary output stream, compressing on the fly if requested.
+
+    Raises:
+        ValueError: If the compression is unknown
+        ImportError: If zstd is requested without the zstandard package
+    """
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression: {compression}. Choose from gzip, zstd")
+
+    if compression == 'gzip':
+        return gzip.open(path, 'wb', compresslevel=6)
+
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("zstd compression requires the 'zstandard' package") from e
+        return zstandard.ZstdCompressor(level=3).stream_writer(open(path, 'wb'))
+
+    return open(path, 'wb')
+
+
+def open_input(path: Path) -> BinaryIO:
+    """Open a (possibly compressed) JSON file written by JsonSerializer"""
+    path = Path(path)
+    if path.suffix == '.gz':
+        return gzip.open(path, 'rb')
+    if path.suffix == '.zst':
+        import zstandard
+        return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'))
+    return open(path, 'rb')
+
+
+class JsonSerializer:
+    """Serialize extraction results with the fastest available JSON backend"""
+
+    def __init__(self, backend: str = 'auto', pretty: bool = False,
+                 compression: Optional[str] = None):
+        """
+        Args:
+            backend: 'auto', 'msgspec', 'orjson' or 'json'
+            pretty: Indent output by two spaces (compact otherwise)
+            compression: None, 'gzip' or 'zstd'
+        """
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression: {compression}. Choose from gzip, zstd")
+
+        self.backend = resolve_backend(backend)
+        self.pretty = pretty
+        self.compression = compression
+
+        if self.backend == 'msgspec':
+            self._encoder = msgspec.json.Encoder(enc_hook=_encode_fallback, decimal_format='string')
+        elif self.backend == 'orjson':
+            # Datetimes go through the fallback so all backends format them like str()
+            self._orjson_options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            if pretty:
+                self._orjson_options |= orjson.OPT_INDENT_2
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize an object to UTF-8 JSON bytes"""
+        if self.backend == 'msgspec':
+            encoded = self._encoder.encode(obj)
+            return msgspec.json.format(encoded, indent=2) if self.pretty else encoded
+
+        if self.backend == 'orjson':
+            return orjson.dumps(obj, default=_encode_fallback, option=self._orjson_options)
+
+        return json.dumps(
+            obj, indent=2 if self.pretty else None, ensure_ascii=False, default=_encode_fallback,
+            separators=None if self.pretty else (',', ':')
+        ).encode('utf-8')
+
+    def write(self, obj: Any, stream: BinaryIO) -> None:
+        """Write an object to a binary stream"""
+        if self.backend != 'json':
+            stream.write(self.dumps(obj))
+            return
+
+        # Stream the stdlib encoder's chunks instead of building the full string
+        encoder = json.JSONEncoder(
+            indent=2 if self.pretty else None, ensure_ascii=False, default=_encode_fallback,
+            separators=None if self.pretty else (',', ':')
+        )
+        buffer = io.StringIO()
+        for chunk in encoder.iterencode(obj):
+            buffer.write(chunk)
+            if buffer.tell() >= _STREAM_CHUNK_SIZE:
+                stream.write(buffer.getvalue().encode('utf-8'))
+                buffer.seek(0)
+                buffer.truncate()
+        stream.write(buffer.getvalue().encode('utf-8'))
+
+    def dump(self, obj: Any, path: Path) -> Path:
+        """
+        Write an object to a file, applying the configured compression.
+
+        Args:
+            obj: JSON-serializable object (Decimals, dates and Enums allowed)
+            path: Output path without compression suffix
+
+        Returns:
+            Path actually written (with .gz/.zst suffix when compressed)
+        """
+        output_path = compressed_path(path, self.compression)
+        temp_path = output_path.with_name(f".{output_path.name}.{uuid.uuid4().hex[:12]}.tmp")
+        try:
+            with open_output(temp_path, self.compression) as stream:
+                self.write(obj, stream)
+            os.replace(temp_path, output_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        return output_path
+
+
+def get_serializer(backend: str = 'auto', pretty: bool = False,
+                   compression: Optional[str] = None) -> JsonSerializer:
+    """Factory function for JSON serializers"""
+    return JsonSerializer(backend=backend, pretty=pretty, compression=compression)
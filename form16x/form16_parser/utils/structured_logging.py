@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Structured Logging
+==================
+
+Logging building blocks for extraction running on worker threads.
+
+- document_context() tags every record logged while a document is being
+  extracted with its document id (a context variable, so each worker
+  thread sees only its own document)
+- CorrelationFilter copies that id onto the record as record.document_id
+- SamplingFilter keeps one in every n records below WARNING for chosen
+  loggers, for high-frequency debug sites
+- JsonFormatter writes one JSON object per record
+- DeferredQueueHandler puts records on a queue for a QueueListener without
+  formatting them, so message formatting and I/O happen on the listener's
+  thread instead of the worker thread
+
+These have no side effects on import; config.logging_config.setup_logging
+wires them into the root logger.
+"""
+
+import json
+import logging
+import logging.handlers
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Dict, Iterator, Optional
+
+# Record attribute used when no document is being extracted
+NO_DOCUMENT = '-'
+
+_document_id: ContextVar[Optional[str]] = ContextVar('form16_document_id', default=None)
+
+# Argument types that cannot change between logging a record and the listener formatting it
+_IMMUTABLE_ARG_TYPES = (str, int, float, bool, type(None), Decimal, bytes)
+
+
+@contextmanager
+def document_context(document_id: str) -> Iterator[str]:
+    """
+    Tag records logged inside the block (on this thread) with a document id.
+
+    Args:
+        document_id: Correlation id of the document, e.g. its file name
+    """
+    token = _document_id.set(document_id)
+    try:
+        yield document_id
+    finally:
+        _document_id.reset(token)
+
+
+def current_document_id() -> Optional[str]:
+    """Document id of the enclosing document_context(), if any"""
+    return _document_id.get()
+
+
+class CorrelationFilter(logging.Filter):
+    """Adds record.document_id from the enclosing document_context()"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, 'document_id'):
+            record.document_id = _document_id.get() or NO_DOCUMENT
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps one in every n records below WARNING for configured loggers.
+
+    Rates apply to a logger and its children; the most specific configured
+    name wins. Sampling is deterministic (the 1st, n+1th, ... record of each
+    configured name is kept), and warnings and errors are never dropped.
+    """
+
+    def __init__(self, rates: Dict[str, int]):
+        super().__init__()
+        self.rates = {name: int(rate) for name, rate in rates.items() if int(rate) > 1}
+        self._counters = dict.fromkeys(self.rates, 0)
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+
+        name = self._configured_name(record.name)
+        if name is None:
+            return True
+
+        with self._lock:
+            count = self._counters[name]
+            self._counters[name] = count + 1
+        return count % self.rates[name] == 0
+
+    def _configured_name(self, logger_name: str) -> Optional[str]:
+        """Most specific configured logger name covering logger_name"""
+        name = logger_name
+        while True:
+            if name in self.rates:
+                return name
+            if '.' not in name:
+                return None
+            name = name.rsplit('.', 1)[0]
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats each record as a single-line JSON object"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'timestamp': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'document_id': getattr(record, 'document_id', NO_DOCUMENT),
+            'thread': record.threadName,
+            'location': f"{record.module}:{record.lineno}"
+        }
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        if record.stack_info:
+            entry['stack'] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the QueueListener.
+
+    The standard QueueHandler formats every record before queueing it so it
+    can cross process boundaries. The listener here runs in the same process,
+    so the record is queued as is and the listener's handlers format it.
+    Records whose arguments could change before the listener gets to them
+    (lists, dicts, objects) have their message rendered now instead.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args and not _immutable_args(record.args):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+def _immutable_args(args) -> bool:
+    """Whether every logging argument is an immutable scalar"""
+    values = args.values() if isinstance(args, dict) else args
+    return all(isinstance(value, _IMMUTABLE_ARG_TYPES) for value in values)
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Table Feature Extraction
+========================
+
+Single-pass domain features shared by every table scorer.
+
+MultiCategoryClassifier, TableScorer and the PART A/PART B routers all
+score tables by keyword presence and amount statistics. Instead of each
+one re-stringifying the table and substring-scanning its own keyword
+list, a table is normalized once (column labels and cells, lower-cased)
+and scanned once with a combined regex built from the union of every
+registered keyword list. The resulting TableFeatures (keyword counts,
+per-cell keyword hits and amount statistics) are cached per table object.
+
+The combined pattern is a lookahead alternation ordered longest-first, so
+at each position it reports the longest keyword starting there; every
+shorter keyword that is a prefix of it is counted too, which makes the
+counts identical to scanning for each keyword separately, including
+overlapping keywords such as 'tax' and 'tax deducted'.
+"""
+
+import re
+import threading
+import weakref
+from bisect import bisect_right
+from collections import Counter
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from .table_utils import cell_matrix
+
+# Monetary values as matched by the classifier's amount scoring
+AMOUNT_PATTERN = re.compile(r'₹[\d,]+\.?\d*|[\d,]+\.?\d*')
+
+
+class _KeywordIndex:
+    """Compiled combined pattern for a keyword vocabulary"""
+
+    def __init__(self, keywords: FrozenSet[str]):
+        self.keywords = keywords
+        ordered = sorted(keywords, key=lambda keyword: (-len(keyword), keyword))
+        self.pattern = re.compile(
+            '(?=(' + '|'.join(re.escape(keyword) for keyword in ordered) + '))'
+        ) if ordered else None
+        # Keywords counted for each longest match (the match and all its keyword prefixes)
+        self.prefixes: Dict[str, Tuple[str, ...]] = {
+            keyword: tuple(other for other in keywords if keyword.startswith(other))
+            for keyword in keywords
+        }
+
+
+_VOCABULARY: set = set()
+_INDEX: Optional[_KeywordIndex] = None
+_LOCK = threading.Lock()
+
+# TableFeatures keyed by id(table), evicted when the table is collected
+_FEATURE_CACHE: Dict[int, Tuple[Tuple[int, int], FrozenSet[str], 'TableFeatures']] = {}
+
+
+def register_keywords(keywords: Iterable[str]) -> None:
+    """
+    Add keywords to the shared vocabulary.
+
+    Scorers register their keyword lists at construction; features computed
+    before a new keyword was registered are recomputed on next access.
+    """
+    global _INDEX
+    new_keywords = {keyword.lower() for keyword in keywords if keyword} - _VOCABULARY
+    if not new_keywords:
+        return
+
+    with _LOCK:
+        _VOCABULARY.update(new_keywords)
+        _INDEX = None
+
+
+def _keyword_index() -> _KeywordIndex:
+    global _INDEX
+    index = _INDEX
+    if index is None:
+        with _LOCK:
+            if _INDEX is None:
+                _INDEX = _KeywordIndex(frozenset(_VOCABULARY))
+            index = _INDEX
+    return index
+
+
+def prepare_keyword_index() -> int:
+    """
+    Compile the combined keyword pattern now rather than on first use.
+
+    Called before forking workers so they share the compiled index.
+
+    Returns:
+        Number of keywords in the vocabulary
+    """
+    return len(_keyword_index().keywords)
+
+
+class TableFeatures:
+    """Keyword counts and amount statistics for one table"""
+
+    __slots__ = (
+        'text', 'cell_text', 'keyword_counts', 'scoped_keywords', 'cell_keywords', 'header_text',
+        'amounts', 'numeric_cells', 'numeric_values', 'total_cells', 'vocabulary'
+    )
+
+    def __init__(self, text: str, cell_text: str, keyword_counts: Counter,
+                 scoped_keywords: Dict[str, FrozenSet[str]], cell_keywords: List[FrozenSet[str]],
+                 header_text: str, amounts: Tuple[float, ...], numeric_cells: int,
+                 numeric_values: Tuple[float, ...], total_cells: int, vocabulary: FrozenSet[str]):
+        self.text = text
+        self.cell_text = cell_text
+        self.keyword_counts = keyword_counts
+        self.scoped_keywords = scoped_keywords
+        self.cell_keywords = cell_keywords
+        self.header_text = header_text
+        self.amounts = amounts
+        self.numeric_cells = numeric_cells
+        self.numeric_values = numeric_values
+        self.total_cells = total_cells
+        self.vocabulary = vocabulary
+
+    def has(self, keyword: str, scope: str = 'text') -> bool:
+        """Whether the keyword occurs in the given scope ('text', 'cells' or 'segment')"""
+        if keyword in self.vocabulary:
+            return keyword in self.scoped_keywords[scope]
+        # Unregistered keyword: fall back to a direct scan
+        return keyword in (self.cell_text if scope == 'cells' else self.text)
+
+    def count(self, keyword: str) -> int:
+        """Number of (possibly overlapping) occurrences of a registered keyword in the text"""
+        return self.keyword_counts.get(keyword, 0)
+
+    def matched(self, keywords: Iterable[str], scope: str = 'text') -> int:
+        """Number of the given keywords present in the scope"""
+        return sum(1 for keyword in keywords if self.has(keyword, scope))
+
+    def weighted(self, weighted_keywords: Iterable[Tuple[str, float]], scope: str = 'text') -> float:
+        """Sum of weights of the keywords present in the scope"""
+        return sum(weight for keyword, weight in weighted_keywords if self.has(keyword, scope))
+
+    def cells_with_any(self, keywords: FrozenSet[str]) -> int:
+        """Number of cells containing at least one of the keywords"""
+        return sum(1 for found in self.cell_keywords if found and not found.isdisjoint(keywords))
+
+    def count_values_between(self, low: float, high: float) -> int:
+        """Number of numeric (int/float typed) cells within [low, high]"""
+        return sum(1 for value in self.numeric_values if low <= value <= high)
+
+    def count_amounts_above(self, threshold: float) -> int:
+        """Number of amount tokens greater than threshold"""
+        return sum(1 for amount in self.amounts if amount > threshold)
+
+
+def _parse_amount(token: str) -> float:
+    try:
+        return float(token.replace('₹', '').replace(',', ''))
+    except ValueError:
+        return 0.0
+
+
+def _is_numeric_text(value: str) -> bool:
+    clean_value = re.sub(r'[₹,/-]', '', value.strip())
+    clean_value = re.sub(r'[^0-9.-]', '', clean_value)
+    if not clean_value:
+        return False
+    try:
+        float(clean_value)
+        return True
+    except ValueError:
+        return False
+
+
+def extract_table_features(table: pd.DataFrame) -> TableFeatures:
+    """
+    Compute features for a table with a single scan of its normalized text.
+
+    The text is the lower-cased column labels followed by the non-empty cells,
+    joined with single spaces. Amount tokens additionally include numeric row
+    index labels, matching what the classifier saw through DataFrame.to_string().
+    """
+    index = _keyword_index()
+    cells = cell_matrix(table)
+
+    header_parts = [str(column).lower() for column in table.columns]
+    cell_parts = [value.lower() for value in cells.ravel() if value]
+
+    # Segment offsets so matches can be attributed to individual cells
+    parts = header_parts + cell_parts
+    starts = []
+    position = 0
+    for part in parts:
+        starts.append(position)
+        position += len(part) + 1
+    text = ' '.join(parts)
+
+    keyword_counts: Counter = Counter()
+    in_cells: set = set()
+    in_segment: set = set()
+    cell_hits: Dict[int, set] = {}
+    first_cell = len(header_parts)
+    cells_start = starts[first_cell] if cell_parts else len(text) + 1
+
+    if index.pattern is not None:
+        for match in index.pattern.finditer(text):
+            start = match.start()
+            segment = bisect_right(starts, start) - 1
+            segment_end = starts[segment] + len(parts[segment])
+            for keyword in index.prefixes[match.group(1)]:
+                keyword_counts[keyword] += 1
+                if start >= cells_start:
+                    in_cells.add(keyword)
+                if start + len(keyword) <= segment_end:
+                    in_segment.add(keyword)
+                    if segment >= first_cell:
+                        cell_hits.setdefault(segment - first_cell, set()).add(keyword)
+
+    cell_keywords = [frozenset(cell_hits.get(i, ())) for i in range(len(cell_parts))]
+    scoped_keywords = {
+        'text': frozenset(keyword_counts),
+        'cells': frozenset(in_cells),
+        'segment': frozenset(in_segment),
+    }
+
+    amount_text = ' '.join([str(label) for label in table.index] + [str(column) for column in table.columns]
+                           + [value for value in cells.ravel() if value])
+    amounts = tuple(_parse_amount(token) for token in AMOUNT_PATTERN.findall(amount_text))
+
+    numeric_values = tuple(
+        float(value) for value in table.values.ravel()
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and pd.notna(value)
+    )
+
+    return TableFeatures(
+        text=text,
+        cell_text=' '.join(cell_parts),
+        keyword_counts=keyword_counts,
+        scoped_keywords=scoped_keywords,
+        cell_keywords=cell_keywords,
+        header_text=' '.join(header_parts),
+        amounts=amounts,
+        numeric_cells=sum(1 for value in cell_parts if _is_numeric_text(value)),
+        numeric_values=numeric_values,
+        total_cells=table.size,
+        vocabulary=index.keywords
+    )
+
+
+def table_features(table: pd.DataFrame) -> TableFeatures:
+    """
+    Cached TableFeatures for a table object.
+
+    Computed once per table (and vocabulary) and shared by every scorer.
+    Tables must not be mutated in place after their features were requested.
+    """
+    key = id(table)
+    vocabulary = _keyword_index().keywords
+    cached = _FEATURE_CACHE.get(key)
+    if cached is not None and cached[0] == table.shape and cached[1] is vocabulary:
+        return cached[2]
+
+    features = extract_table_features(table)
+    if key not in _FEATURE_CACHE:
+        weakref.finalize(table, _FEATURE_CACHE.pop, key, None)
+    _FEATURE_CACHE[key] = (table.shape, vocabulary, features)
+    return features
@@ -5,17 +5,99 @@ Table Processing Utilities
 
 Utilities for preprocessing and normalizing Form16 tables.
 Handles merged cells, empty rows/columns, and header normalization.
+
+Cell normalization works on the whole table at once: the DataFrame is
+converted to a single NumPy string matrix, normalized with array
+operations, and the stripped matrix is cached per table (see cell_matrix)
+so extractors can read cells without calling str(table.iloc[i, j]).
 """
 
 import logging
 import re
-from typing import List, Dict, Optional, Tuple, Any
+import weakref
+from typing import List, Dict, Optional, Tuple, Any, Iterable
 import pandas as pd
 import numpy as np
 
 
 logger = logging.getLogger(__name__)
 
+# Cell values treated as empty by TablePreprocessor (compared case-insensitively)
+EMPTY_CELL_TOKENS = ('nan', 'none', '', '-', 'nil', 'na')
+
+# Stripped cell matrices keyed by id(table), evicted when the table is collected
+_CELL_MATRIX_CACHE: Dict[int, Tuple[Tuple[int, int], np.ndarray]] = {}
+
+
+def string_matrix(table: pd.DataFrame, null_tokens: Iterable[str] = (),
+                  case_sensitive: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert a DataFrame to a stripped NumPy string matrix in one pass.
+
+    Args:
+        table: DataFrame to convert
+        null_tokens: Stripped cell values that count as empty
+        case_sensitive: Compare null_tokens case-sensitively
+
+    Returns:
+        (strings, empty_mask): unicode matrix with '' for empty cells, and
+        a boolean mask of the empty cells
+    """
+    values = table.to_numpy(dtype=object)
+    if values.size == 0:
+        return np.zeros(values.shape, dtype=str), np.ones(values.shape, dtype=bool)
+
+    null_mask = pd.isna(values)
+    strings = np.char.strip(values.astype(str))
+    strings[null_mask] = ''
+
+    empty_mask = strings == ''
+    tokens = list(null_tokens)
+    if tokens:
+        comparable = strings if case_sensitive else np.char.lower(strings)
+        empty_mask |= np.isin(comparable, tokens)
+        strings[empty_mask] = ''
+
+    return strings, empty_mask
+
+
+def _matrix_to_frame(strings: np.ndarray, empty_mask: np.ndarray,
+                     like: pd.DataFrame) -> pd.DataFrame:
+    """Build an object DataFrame from a string matrix, with None for empty cells"""
+    values = strings.astype(object)
+    values[empty_mask] = None
+    return pd.DataFrame(values, index=like.index, columns=like.columns)
+
+
+def cell_matrix(table: pd.DataFrame) -> np.ndarray:
+    """
+    Stripped cell strings for a table, with '' for missing cells.
+
+    Equivalent to str(table.iloc[i, j]).strip() for every non-null cell. The
+    matrix is computed once per table object and cached, so repeated scans by
+    different extractors share it. Tables must not be mutated in place after
+    their matrix has been requested.
+
+    Returns:
+        Object ndarray of Python str, shaped like the table
+    """
+    key = id(table)
+    cached = _CELL_MATRIX_CACHE.get(key)
+    if cached is not None and cached[0] == table.shape:
+        return cached[1]
+
+    strings, _ = string_matrix(table)
+    return _cache_cell_matrix(table, strings.astype(object))
+
+
+def _cache_cell_matrix(table: pd.DataFrame, matrix: np.ndarray) -> np.ndarray:
+    """Store a precomputed cell matrix for a table"""
+    key = id(table)
+    if key not in _CELL_MATRIX_CACHE:
+        weakref.finalize(table, _CELL_MATRIX_CACHE.pop, key, None)
+    _CELL_MATRIX_CACHE[key] = (table.shape, matrix)
+    return matrix
+
 
 class TablePreprocessor:
     """Preprocess and normalize Form16 tables"""
@@ -78,27 +160,13 @@ class TablePreprocessor:
         if table.empty:
             return table
         
-        def normalize_cell(cell):
-            if pd.isna(cell):
-                return None
-            
-            cell_str = str(cell).strip()
-            
-            # Convert common empty indicators to None
-            if cell_str.lower() in ['nan', 'none', '', '-', 'nil', 'na']:
-                return None
-            
-            # Normalize whitespace
-            cell_str = re.sub(r'\s+', ' ', cell_str)
-            
-            return cell_str if cell_str else None
+        strings, empty_mask = string_matrix(table, EMPTY_CELL_TOKENS, case_sensitive=False)
         
-        # Apply normalization to all cells
-        for row_idx in range(len(table)):
-            for col_idx in range(len(table.columns)):
-                table.iloc[row_idx, col_idx] = normalize_cell(table.iloc[row_idx, col_idx])
+        # Collapse internal whitespace in a single pass over all cells
+        collapsed = pd.Series(strings.ravel()).str.replace(r'\s+', ' ', regex=True)
+        strings = collapsed.to_numpy(dtype=str).reshape(strings.shape)
         
-        return table
+        return _matrix_to_frame(strings, empty_mask, table)
     
     @staticmethod
     def handle_merged_cells(table: pd.DataFrame) -> pd.DataFrame:
@@ -117,59 +185,58 @@ class TablePreprocessor:
     @staticmethod
     def _fill_merged_headers(table: pd.DataFrame) -> pd.DataFrame:
         """Fill down merged header cells"""
-        # Look for patterns where first column has value but subsequent columns are empty
-        for row_idx in range(len(table) - 1):
-            for col_idx in range(len(table.columns)):
-                current_cell = table.iloc[row_idx, col_idx]
-                next_cell = table.iloc[row_idx + 1, col_idx]
-                
-                # If current cell has content and next is empty, it might be merged
-                if (current_cell and pd.notna(current_cell) and 
-                    (not next_cell or pd.isna(next_cell))):
-                    
-                    # Check if the row below has content in other columns (indicating merge)
-                    row_below_has_content = any(
-                        table.iloc[row_idx + 1, c] and pd.notna(table.iloc[row_idx + 1, c])
-                        for c in range(len(table.columns)) if c != col_idx
-                    )
-                    
-                    if row_below_has_content:
-                        table.iloc[row_idx + 1, col_idx] = current_cell
-        
-        return table
+        strings, empty_mask = string_matrix(table)
+        n_rows, n_cols = strings.shape
+        
+        # An empty cell below a filled one is a merge artifact when its row has
+        # content elsewhere; fill-forward runs until a completely empty row
+        row_has_content = ~empty_mask.all(axis=1)
+        anchors = ~empty_mask | ~row_has_content[:, None]
+        source_rows = np.where(anchors, np.arange(n_rows)[:, None], 0)
+        source_rows = np.maximum.accumulate(source_rows, axis=0)
+        
+        columns = np.arange(n_cols)
+        return _matrix_to_frame(
+            strings[source_rows, columns], empty_mask[source_rows, columns], table
+        )
     
     @staticmethod
     def _combine_split_text(table: pd.DataFrame) -> pd.DataFrame:
         """Combine text that was split across rows"""
-        rows_to_remove = []
+        strings, empty_mask = string_matrix(table)
+        if len(strings) < 2:
+            return table
         
-        for row_idx in range(len(table) - 1):
-            current_row_cells = [table.iloc[row_idx, c] for c in range(len(table.columns))]
-            next_row_cells = [table.iloc[row_idx + 1, c] for c in range(len(table.columns))]
-            
-            # Check if next row looks like continuation of current row
-            if TablePreprocessor._is_continuation_row(current_row_cells, next_row_cells):
-                # Combine the rows
-                for col_idx in range(len(table.columns)):
-                    current_val = table.iloc[row_idx, col_idx]
-                    next_val = table.iloc[row_idx + 1, col_idx]
-                    
-                    if current_val and next_val:
-                        # Combine with space
-                        table.iloc[row_idx, col_idx] = f"{current_val} {next_val}"
-                    elif next_val and not current_val:
-                        # Move next value to current
-                        table.iloc[row_idx, col_idx] = next_val
-                
-                # Mark next row for removal
-                rows_to_remove.append(row_idx + 1)
+        filled = ~empty_mask
+        current, following = strings[:-1], strings[1:]
+        current_filled, following_filled = filled[:-1], filled[1:]
         
-        # Remove combined rows
-        if rows_to_remove:
-            table = table.drop(table.index[rows_to_remove])
-            table = table.reset_index(drop=True)
+        # Continuation rows have fewer filled cells, and at least one of them
+        # starts lowercase or is a short fragment
+        fewer_cells = following_filled.sum(axis=1) < current_filled.sum(axis=1)
+        fragment = following_filled & (
+            np.char.islower(following.astype('<U1')) | (np.char.str_len(following) < 10)
+        )
+        continuation = fewer_cells & fragment.any(axis=1)
         
-        return table
+        if not continuation.any():
+            return table
+        
+        # Merge each continuation row into the row above, then drop it
+        joined = np.char.add(np.char.add(current, ' '), following)
+        merged = np.where(current_filled & following_filled, joined,
+                          np.where(following_filled, following, current))
+        
+        combined = strings.astype(object)
+        combined[:-1][continuation] = merged[continuation].astype(object)
+        combined_empty = empty_mask.copy()
+        combined_empty[:-1][continuation] = (~current_filled & ~following_filled)[continuation]
+        combined[combined_empty] = None
+        
+        keep = np.ones(len(strings), dtype=bool)
+        keep[1:][continuation] = False
+        
+        return pd.DataFrame(combined[keep], columns=table.columns)
     
     @staticmethod
     def _is_continuation_row(current_row: List[Any], next_row: List[Any]) -> bool:
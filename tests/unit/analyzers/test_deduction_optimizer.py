@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Tests for Deduction Optimizer
+=============================
+
+Test coverage for exact tax evaluation and the investment vs tax-saved frontier.
+"""
+
+import unittest
+from decimal import Decimal
+
+from form16x.form16_parser.analyzers.deduction_optimizer import (
+    DeductionOptimizer, TaxEvaluator, TaxProfile
+)
+from form16x.form16_parser.analyzers.tax_optimization_engine import TaxOptimizationEngine
+from form16x.form16_parser.tax_calculators.engines.new_regime import NewTaxRegime
+from form16x.form16_parser.tax_calculators.engines.old_regime import OldTaxRegime
+from form16x.form16_parser.tax_calculators.interfaces.calculator_interface import (
+    TaxCalculationInput, TaxRegimeType
+)
+from form16x.form16_parser.tax_calculators.main_calculator import MultiYearTaxCalculator
+
+SURCHARGE = {
+    'threshold_1': 5000000, 'rate_1': 10.0,
+    'threshold_2': 10000000, 'rate_2': 15.0,
+    'threshold_3': 20000000, 'rate_3': 25.0,
+}
+
+OLD_CONFIG = {
+    'basic_settings': {'standard_deduction': 50000, 'basic_exemption_limits': {'below_60': 250000}},
+    'tax_slabs': {'below_60': [
+        {'from': 0, 'to': 250000, 'rate': 0.0},
+        {'from': 250000, 'to': 500000, 'rate': 5.0},
+        {'from': 500000, 'to': 1000000, 'rate': 20.0},
+        {'from': 1000000, 'to': None, 'rate': 30.0},
+    ]},
+    'surcharge': dict(SURCHARGE, threshold_4=50000000, rate_4=37.0),
+    'rebate_87a': {'income_limit': 500000, 'max_rebate': 12500},
+    'cess': {'health_education_cess_rate': 4.0},
+    'deduction_limits': {'section_80c': 150000, 'section_80d': 25000, 'section_80ccd_1b': 50000},
+    'allowed_deductions': ['section_80c', 'section_80d', 'section_80ccd_1b', 'section_80e', 'section_80g'],
+    'allowed_exemptions': ['hra', 'lta'],
+}
+
+NEW_CONFIG = {
+    'basic_settings': {'standard_deduction': 50000, 'basic_exemption_limits': {'below_60': 300000}},
+    'tax_slabs': {'below_60': [
+        {'from': 0, 'to': 300000, 'rate': 0.0},
+        {'from': 300000, 'to': 600000, 'rate': 5.0},
+        {'from': 600000, 'to': 900000, 'rate': 10.0},
+        {'from': 900000, 'to': 1200000, 'rate': 15.0},
+        {'from': 1200000, 'to': 1500000, 'rate': 20.0},
+        {'from': 1500000, 'to': None, 'rate': 30.0},
+    ]},
+    'surcharge': SURCHARGE,
+    'rebate_87a': {'income_limit': 700000, 'max_rebate': 25000},
+    'cess': {'health_education_cess_rate': 4.0},
+    'allowed_deductions': ['section_80ccd_2'],
+    'allowed_exemptions': [],
+}
+
+
+class InMemoryRuleProvider:
+    """Rule provider serving the inline configurations above."""
+
+    def get_supported_years(self):
+        return ['2024-25']
+
+    def is_regime_supported(self, assessment_year, regime_type):
+        return assessment_year == '2024-25'
+
+    def get_tax_regime(self, assessment_year, regime_type):
+        if regime_type == TaxRegimeType.OLD:
+            return OldTaxRegime(OLD_CONFIG)
+        return NewTaxRegime(NEW_CONFIG)
+
+
+class TestTaxEvaluator(unittest.TestCase):
+    """Test TaxEvaluator against the full calculator."""
+
+    def test_matches_calculator(self):
+        """The compiled evaluator reproduces calculate_tax across slabs, rebate and surcharge."""
+        calculator = MultiYearTaxCalculator(InMemoryRuleProvider())
+        provider = InMemoryRuleProvider()
+
+        for regime_type in (TaxRegimeType.OLD, TaxRegimeType.NEW):
+            evaluator = TaxEvaluator(provider.get_tax_regime('2024-25', regime_type))
+            for gross in ('300000', '512345', '749999', '1234567', '5020000', '10150000', '23000000'):
+                for deduction in ('0', '12345', '200000'):
+                    with self.subTest(regime=regime_type.value, gross=gross, deduction=deduction):
+                        gross_salary = Decimal(gross)
+                        result = calculator.calculate_tax(TaxCalculationInput(
+                            assessment_year='2024-25', regime_type=regime_type,
+                            gross_salary=gross_salary,
+                            other_deductions={'other': Decimal(deduction)} if regime_type == TaxRegimeType.OLD else {}
+                        ))
+                        claimed = Decimal(deduction) if regime_type == TaxRegimeType.OLD else Decimal('0')
+                        taxable = max(Decimal('0'), gross_salary - evaluator.standard_deduction_for(gross_salary) - claimed)
+
+                        self.assertEqual(evaluator.total_tax(gross_salary, taxable), result.total_tax_liability)
+
+
+class TestDeductionOptimizer(unittest.TestCase):
+    """Test DeductionOptimizer frontiers."""
+
+    def setUp(self):
+        """Set up optimizer and a salaried profile."""
+        self.optimizer = DeductionOptimizer.from_rule_provider('2024-25', InMemoryRuleProvider())
+        self.profile = TaxProfile(
+            gross_salary=Decimal('1500000'), section_80c=Decimal('50000'),
+            hra_received=Decimal('240000'), basic_salary=Decimal('600000'),
+            rent_paid=Decimal('100000'), is_metro=True, max_donation=Decimal('100000')
+        )
+
+    def test_frontier_is_pareto_optimal(self):
+        """Frontier points strictly increase in both investment and tax saved."""
+        result = self.optimizer.optimize(self.profile)
+        frontier = result.frontiers['old']
+
+        self.assertEqual(frontier[0].investment, Decimal('0'))
+        self.assertEqual(frontier[0].tax_saved, Decimal('0'))
+        for previous, point in zip(frontier, frontier[1:]):
+            self.assertGreater(point.investment, previous.investment)
+            self.assertGreater(point.tax_saved, previous.tax_saved)
+
+    def test_savings_are_exact(self):
+        """Each plan's saving equals re-evaluating tax with its allocation."""
+        result = self.optimizer.optimize(self.profile)
+
+        for point in result.frontiers['old'][::10]:
+            self.assertEqual(point.tax_saved, self.optimizer.exact_savings(self.profile, 'old', point.allocation))
+            self.assertEqual(point.investment, sum(point.allocation.values(), Decimal('0')))
+
+    def test_allocation_respects_limits(self):
+        """Plans never exceed section headroom or the budget."""
+        result = self.optimizer.optimize(self.profile, budget=Decimal('120000'))
+
+        for point in result.frontiers['old']:
+            self.assertLessEqual(point.investment, Decimal('120000'))
+            self.assertLessEqual(point.allocation.get('80C', Decimal('0')), Decimal('100000'))
+            self.assertLessEqual(point.allocation.get('80D', Decimal('0')), Decimal('25000'))
+
+    def test_new_regime_has_no_levers(self):
+        """Chapter VI-A levers do not apply under the new regime."""
+        result = self.optimizer.optimize(self.profile)
+
+        self.assertEqual(len(result.frontiers['new']), 1)
+        self.assertEqual(result.frontiers['new'][0].allocation, {})
+
+    def test_combined_frontier_and_plans(self):
+        """The combined frontier picks the cheaper regime and answers budget/target queries."""
+        result = self.optimizer.optimize(self.profile)
+        best_free = result.best_for_budget(Decimal('0'))
+
+        self.assertEqual(best_free.tax_saved, max(points[0].tax_saved for points in result.frontiers.values()))
+
+        target = result.combined[-1].tax_saved
+        plan = result.plan_for_target(target)
+        self.assertEqual(plan, result.combined[-1])
+        self.assertIsNone(result.best_for_budget(Decimal('-1')))
+
+
+class TestExactSavingsInEngine(unittest.TestCase):
+    """Test exact savings in TaxOptimizationEngine."""
+
+    def setUp(self):
+        """Set up engine with an in-memory optimizer."""
+        optimizer = DeductionOptimizer.from_rule_provider('2024-25', InMemoryRuleProvider())
+        self.engine = TaxOptimizationEngine(deduction_optimizer=optimizer)
+        self.tax_data = {
+            'recommended_regime': 'old',
+            'regime_comparison': {'old_regime': {'tax_liability': 0, 'deductions_used': {'80C': 100000}}},
+        }
+        self.form16_data = {'form16': {'part_b': {'gross_salary': {'total': 1200000}}}}
+
+    def test_suggestions_use_exact_savings(self):
+        """A 50,000 80C top-up at 12L saves exactly 30% plus cess."""
+        analysis = self.engine.analyze_optimization_opportunities(self.tax_data, self.form16_data)
+
+        ppf = analysis.get_suggestions_by_section('80C')[0]
+        self.assertEqual(ppf.suggested_amount, Decimal('50000'))
+        self.assertEqual(ppf.potential_tax_savings, Decimal('15600'))
+        self.assertTrue(analysis.savings_frontier)
+
+    def test_target_plan_savings_add_up(self):
+        """Suggestions sized to a frontier plan sum to the plan's exact saving."""
+        analysis = self.engine.analyze_optimization_opportunities(self.tax_data, self.form16_data, target_savings=20000)
+
+        sections = {suggestion.section for suggestion in analysis.suggestions}
+        self.assertTrue(sections <= {'80C', '80D', '80CCD(1B)', '80G'})
+        self.assertGreaterEqual(analysis.potential_total_savings, Decimal('20000'))
+
+
+if __name__ == '__main__':
+    unittest.main()
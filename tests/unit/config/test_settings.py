@@ -9,10 +9,12 @@ Test coverage for application configuration settings.
 import unittest
 import os
 from pathlib import Path
+from unittest.mock import patch
 
 from form16x.form16_parser.config.settings import (
     Environment,
     ExtractionSettings,
+    LoggingSettings,
     Settings,
     get_settings
 )
@@ -88,6 +90,44 @@ class TestExtractionSettings(unittest.TestCase):
         self.assertEqual(settings.preferred_strategies, expected_strategies)
 
 
+class TestLoggingSettings(unittest.TestCase):
+    """Test logging settings configuration."""
+    
+    def test_hot_path_logging_defaults(self):
+        """Test queue, JSON and sampling are off by default."""
+        settings = LoggingSettings()
+        
+        self.assertFalse(settings.enable_queue_logging)
+        self.assertFalse(settings.enable_json_logging)
+        self.assertEqual(settings.log_sample_rates, {})
+        self.assertIsNot(settings.log_sample_rates, LoggingSettings().log_sample_rates)
+    
+    def test_hot_path_logging_from_env_vars(self):
+        """Test queue, JSON and sampling settings from environment variables."""
+        env = {
+            "FORM16_ENV": "development",
+            "FORM16_LOG_QUEUE": "true",
+            "FORM16_LOG_JSON": "true",
+            "FORM16_LOG_SAMPLE": "form16x.form16_parser.extractors=20, form16x.form16_parser.pdf=5"
+        }
+        with patch.dict(os.environ, env):
+            settings = Settings()
+        
+        self.assertTrue(settings.logging.enable_queue_logging)
+        self.assertTrue(settings.logging.enable_json_logging)
+        self.assertEqual(settings.logging.log_sample_rates, {
+            "form16x.form16_parser.extractors": 20,
+            "form16x.form16_parser.pdf": 5
+        })
+    
+    def test_production_uses_queue_logging(self):
+        """Test production enables queue logging unless turned off."""
+        with patch.dict(os.environ, {"FORM16_ENV": "production"}):
+            self.assertTrue(Settings().logging.enable_queue_logging)
+        with patch.dict(os.environ, {"FORM16_ENV": "production", "FORM16_LOG_QUEUE": "false"}):
+            self.assertFalse(Settings().logging.enable_queue_logging)
+
+
 class TestSettingsFactory(unittest.TestCase):
     """Test settings factory functions."""
     
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Tests for Layout Templates
+==========================
+
+Test coverage for layout fingerprinting, learned cell maps, direct template
+extraction and the full-extraction fallback.
+"""
+
+import shutil
+import tempfile
+import unittest
+import warnings
+from decimal import Decimal
+from pathlib import Path
+
+import pandas as pd
+
+from form16x.form16_parser.extractors.orchestration.layout_templates import (
+    LayoutFingerprinter, TemplateExtractor, TemplateStore
+)
+from form16x.form16_parser.models.form16_models import (
+    EmployeeInfo, EmployerInfo, Form16Document, SalaryBreakdown, TaxComputation, TaxRegime
+)
+
+
+def _tables(name, pan, gross, salary_17_1, tan='ABCD12345E'):
+    return [
+        pd.DataFrame([
+            ['Name of Employee', 'PAN of Employee', 'Gross Salary'],
+            [name, pan, gross],
+            ['TAN of Deductor', tan, ''],
+        ]),
+        pd.DataFrame([
+            ['Particulars', 'Amount'],
+            ['Salary u/s 17(1)', salary_17_1],
+            ['Total', gross],
+        ]),
+    ]
+
+
+class TableReadingExtractor:
+    """Stand-in for EnhancedForm16Extractor reading the synthetic layout"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def extract_all(self, tables, page_numbers=None, text_data=None):
+        self.calls += 1
+        identity = tables[0]
+        return Form16Document(
+            employee=EmployeeInfo(name=identity.iloc[1, 0], pan=identity.iloc[1, 1]),
+            employer=EmployerInfo(tan=identity.iloc[2, 1]),
+            salary=SalaryBreakdown(gross_salary=Decimal(identity.iloc[1, 2].replace(',', ''))),
+            tax_computation=TaxComputation(tax_regime=TaxRegime.NEW)
+        )
+
+
+class AddressReadingExtractor(TableReadingExtractor):
+    """Stand-in that also builds an address which never sits in a single cell"""
+
+    def extract_all(self, tables, page_numbers=None, text_data=None):
+        document = super().extract_all(tables, page_numbers, text_data)
+        document.employee.address = f'{document.employee.name.title()} House, Pune'
+        # Extractors assign floats to Decimal fields after validation
+        document.salary.other_allowances = 12000.0
+        return document
+
+
+class TestLayoutFingerprinter(unittest.TestCase):
+    """Test LayoutFingerprinter."""
+
+    def setUp(self):
+        """Set up the fingerprinter."""
+        self.fingerprinter = LayoutFingerprinter()
+
+    def test_same_layout_different_employees(self):
+        """Employee values do not change the fingerprint."""
+        first, tan = self.fingerprinter.fingerprint(_tables('JOHN DOE', 'ABCDE1234F', '1,200,000', '1,200,000'))
+        second, _ = self.fingerprinter.fingerprint(_tables('JANE ROE', 'PQRST6789K', '900,000', '850,000'))
+
+        self.assertEqual(first, second)
+        self.assertEqual(tan, 'ABCD12345E')
+
+    def test_different_employer_or_structure(self):
+        """Employer TAN and table shapes change the fingerprint."""
+        base, _ = self.fingerprinter.fingerprint(_tables('JOHN DOE', 'ABCDE1234F', '1,200,000', '1,200,000'))
+        other_tan, _ = self.fingerprinter.fingerprint(
+            _tables('JOHN DOE', 'ABCDE1234F', '1,200,000', '1,200,000', tan='WXYZ98765A')
+        )
+        other_shape, _ = self.fingerprinter.fingerprint(
+            _tables('JOHN DOE', 'ABCDE1234F', '1,200,000', '1,200,000')[:1]
+        )
+
+        self.assertNotEqual(base, other_tan)
+        self.assertNotEqual(base, other_shape)
+
+
+class TestTemplateExtractor(unittest.TestCase):
+    """Test TemplateExtractor and TemplateStore."""
+
+    def setUp(self):
+        """Set up a temporary template store."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.extractor = TableReadingExtractor()
+        self.template_extractor = TemplateExtractor(TemplateStore(self.temp_dir), self.extractor)
+
+    def tearDown(self):
+        """Remove temporary files."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _learn_two_documents(self):
+        # The first employee's 17(1) salary equals the gross salary, the second's does not
+        self.template_extractor.extract_all(_tables('JOHN DOE', 'ABCDE1234F', '1,200,000', '1,200,000'))
+        self.template_extractor.extract_all(_tables('JANE ROE', 'PQRST6789K', '900,000', '850,000'))
+
+    def test_template_needs_agreeing_observations(self):
+        """A single observation is not enough to read fields directly."""
+        document = self.template_extractor.extract_all(
+            _tables('JOHN DOE', 'ABCDE1234F', '1,200,000', '1,200,000')
+        )
+
+        self.assertEqual(document.processing_metadata['layout_template']['status'], 'unmatched_learned')
+        self.assertEqual(self.extractor.calls, 1)
+
+    def test_repeat_layout_read_from_cells(self):
+        """A matching layout is read from the learned cells without full extraction."""
+        self._learn_two_documents()
+
+        tables = _tables('RAVI KUMAR', 'LMNOP4321Q', '1,500,000', '1,400,000')
+        document = self.template_extractor.extract_all(tables)
+
+        self.assertEqual(self.extractor.calls, 2)
+        self.assertEqual(document.processing_metadata['layout_template']['status'], 'hit')
+        expected = TableReadingExtractor().extract_all(tables)
+        self.assertEqual(document.employee, expected.employee)
+        self.assertEqual(document.employer, expected.employer)
+        self.assertEqual(document.salary.gross_salary, Decimal('1500000'))
+        self.assertEqual(document.tax_computation.tax_regime, TaxRegime.NEW)
+
+    def test_validation_failure_falls_back(self):
+        """A mapped cell failing validation runs the full extractor."""
+        self._learn_two_documents()
+
+        document = self.template_extractor.extract_all(
+            _tables('RAVI KUMAR', 'NOT A PAN', '1,500,000', '1,400,000')
+        )
+
+        self.assertEqual(self.extractor.calls, 3)
+        self.assertTrue(document.processing_metadata['layout_template']['status'].startswith('miss'))
+
+    def test_statistics_persist(self):
+        """Hit-rate statistics and templates survive a new store instance."""
+        self._learn_two_documents()
+        self.template_extractor.extract_all(_tables('RAVI KUMAR', 'LMNOP4321Q', '1,500,000', '1,400,000'))
+
+        store = TemplateStore(self.temp_dir)
+        stats = store.stats()
+
+        self.assertEqual(stats['lookups'], 3)
+        self.assertEqual(stats['hit'], 1)
+        self.assertEqual(stats['unmatched'], 2)
+        self.assertEqual(stats['templates'], 1)
+        self.assertAlmostEqual(stats['hit_rate'], 1 / 3, places=3)
+
+        template_stats = store.template_stats()
+        self.assertEqual(template_stats[0]['observations'], 2)
+        self.assertEqual(template_stats[0]['hits'], 1)
+        self.assertTrue(template_stats[0]['ready'])
+
+    def test_unlocated_field_keeps_full_extraction(self):
+        """A learned field that varied and was never located stops the template being ready."""
+        extractor = AddressReadingExtractor()
+        template_extractor = TemplateExtractor(TemplateStore(self.temp_dir), extractor)
+        template_extractor.extract_all(_tables('JOHN DOE', 'ABCDE1234F', '1,200,000', '1,200,000'))
+        template_extractor.extract_all(_tables('JANE ROE', 'PQRST6789K', '900,000', '850,000'))
+
+        document = template_extractor.extract_all(_tables('RAVI KUMAR', 'LMNOP4321Q', '1,500,000', '1,400,000'))
+
+        self.assertEqual(extractor.calls, 3)
+        self.assertEqual(document.employee.address, 'Ravi Kumar House, Pune')
+        template_stats = template_extractor.store.template_stats()[0]
+        self.assertFalse(template_stats['ready'])
+        self.assertEqual(template_stats['unlocated_fields'], 1)
+
+    def test_learning_float_amounts_is_quiet(self):
+        """Floats left in Decimal fields do not raise serializer warnings while learning."""
+        template_extractor = TemplateExtractor(TemplateStore(self.temp_dir), AddressReadingExtractor())
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            template_extractor.extract_all(_tables('JOHN DOE', 'ABCDE1234F', '1,200,000', '1,200,000'))
+
+        self.assertEqual([str(w.message) for w in caught], [])
+
+    def test_stores_sharing_a_directory(self):
+        """Stores in different workers add to each other's observations and statistics."""
+        other = TemplateExtractor(TemplateStore(self.temp_dir), self.extractor)
+
+        self.template_extractor.extract_all(_tables('JOHN DOE', 'ABCDE1234F', '1,200,000', '1,200,000'))
+        other.extract_all(_tables('JANE ROE', 'PQRST6789K', '900,000', '850,000'))
+        document = self.template_extractor.extract_all(
+            _tables('RAVI KUMAR', 'LMNOP4321Q', '1,500,000', '1,400,000')
+        )
+
+        self.assertEqual(document.processing_metadata['layout_template']['status'], 'hit')
+        stats = TemplateStore(self.temp_dir).stats()
+        self.assertEqual((stats['lookups'], stats['learned'], stats['hit']), (3, 2, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Tests for Routing-Aware Extraction
+==================================
+
+Test coverage for per-extractor table subsets built from routing decisions,
+early stopping on confidence-ordered tables, the full-set fallback and
+routed documents matching the full-set path.
+"""
+
+import unittest
+from decimal import Decimal
+from unittest.mock import patch
+
+import pandas as pd
+
+from form16x.form16_parser.extractors.classification.routing_coordinator import (
+    RoutingCoordinator, RoutingDecision
+)
+from form16x.form16_parser.extractors.domains.identity.employee_extractor import EmployeeExtractor
+from form16x.form16_parser.extractors.enhanced_form16_extractor import (
+    DOMAIN_EXTRACTION_ORDER, EnhancedForm16Extractor, ProcessingLevel
+)
+
+
+def _decision(table_index, routes):
+    return RoutingDecision(
+        table_index=table_index,
+        part_type='PART_B',
+        extractor_routes={name: {'confidence': confidence, 'reasoning': ''} for name, confidence in routes.items()}
+    )
+
+
+class TestExtractorTableSets(unittest.TestCase):
+    """Test RoutingCoordinator.build_extractor_table_sets."""
+
+    def test_tables_ordered_by_confidence(self):
+        """Each extractor gets its routed tables, highest confidence first."""
+        tables = [{'index': i} for i in range(4)]
+        decisions = [
+            _decision(0, {'salary': 0.5}),
+            _decision(1, {'salary': 0.9, 'tax': 0.6}),
+            _decision(2, {}),
+            _decision(3, {'salary': 0.5, 'tax': 0.8}),
+        ]
+
+        table_sets = RoutingCoordinator().build_extractor_table_sets(decisions, tables)
+
+        self.assertEqual([t['index'] for t in table_sets['salary']], [1, 0, 3])
+        self.assertEqual([t['index'] for t in table_sets['tax']], [3, 1])
+        self.assertNotIn('identity', table_sets)
+
+
+class TestRoutedExtraction(unittest.TestCase):
+    """Test routed table subsets in the enhanced extractor."""
+
+    def setUp(self):
+        """Set up a scored extractor and synthetic tables."""
+        self.extractor = EnhancedForm16Extractor(ProcessingLevel.SCORED)
+        self.employee_table = pd.DataFrame([
+            ["Name and address of the Employee/Specified senior citizen", ""],
+            ["JOHN DOE", ""],
+            ["123 Test Street, Test City - 100001", ""],
+            ["Test State", ""],
+            ["PAN of the Employee/Specified senior citizen", ""],
+            ["ABCDE1234F", ""]
+        ])
+        self.salary_table = pd.DataFrame([
+            ['Gross Salary', ''],
+            ['(a) Salary as per provisions contained in section 17(1)', '1200000.00'],
+        ])
+        self.tables = [self.salary_table, self.employee_table]
+        self.classified, self.tables_by_type = self.extractor.classify_tables(self.tables)
+
+    def test_complete_routed_subset_skips_full_set(self):
+        """A routed subset that fills the required fields is used on its own."""
+        updates, metadata = self.extractor.run_domain_extractor(
+            'employee', self.tables_by_type, self.tables, [self.classified[1]]
+        )
+
+        self.assertEqual(metadata['table_selection'], 'routed')
+        self.assertEqual(metadata['tables_processed'], 1)
+        self.assertEqual(updates['employee'].pan, 'ABCDE1234F')
+
+    def test_incomplete_routed_subset_falls_back(self):
+        """Missing required fields re-run the extractor over every table."""
+        full_updates, _ = self.extractor.run_domain_extractor('employee', self.tables_by_type, self.tables)
+
+        updates, metadata = self.extractor.run_domain_extractor(
+            'employee', self.tables_by_type, self.tables, [self.classified[0]]
+        )
+
+        self.assertEqual(metadata['table_selection'], 'fallback')
+        self.assertEqual(metadata['tables_processed'], 2)
+        self.assertEqual(updates['employee'], full_updates['employee'])
+
+    def test_extract_all_matches_unrouted_extraction(self):
+        """Routing-aware extract_all produces the same document as the full-set path."""
+        routed_doc = self.extractor.extract_all(self.tables)
+        full_doc = self.extractor._extract_with_optimized_tables(self.tables_by_type, self.tables)
+
+        self.assertEqual(routed_doc.employee, full_doc.employee)
+        self.assertEqual(routed_doc.salary, full_doc.salary)
+        self.assertEqual(routed_doc.tax_computation, full_doc.tax_computation)
+        self.assertEqual(routed_doc.chapter_via_deductions, full_doc.chapter_via_deductions)
+        self.assertEqual(routed_doc.quarterly_tds, full_doc.quarterly_tds)
+
+
+def form16_tables():
+    """Identity, salary, deductions with tax computation, and quarterly TDS tables"""
+    return [
+        pd.DataFrame([
+            ["Name and address of the Employer/Specified Bank",
+             "Name and address of the Employee/Specified senior citizen"],
+            ["ACME SOFTWARE PRIVATE LIMITED", "JOHN DOE"],
+            ["PAN of the Deductor", "PAN of the Employee/Specified senior citizen"],
+            ["AAACA1234B", "ABCDE1234F"],
+            ["TAN of the Deductor", ""],
+            ["ABCD12345E", ""],
+        ]),
+        pd.DataFrame([
+            ['Gross Salary', ''],
+            ['(a) Salary as per provisions contained in section 17(1)', '1100000.00'],
+            ['(d) Total', '1100000.00'],
+            ['Standard deduction under section 16(ia)', '50000.00'],
+            ['Income chargeable under the head "Salaries"', '1050000.00'],
+            ['Total tax deducted at source (TDS)', '124800.00'],
+        ]),
+        pd.DataFrame([
+            ['Deductions under Chapter VI-A', '', ''],
+            ['(a) section 80C', '150000.00', '150000.00'],
+            ['Aggregate of deductible amount under Chapter VI-A', '', '150000.00'],
+            ['Gross total income', '', '1025000.00'],
+            ['Total taxable income', '', '875000.00'],
+            ['Tax on total income', '', '120000.00'],
+            ['Health and education cess', '', '4800.00'],
+            ['Net tax payable', '', '124800.00'],
+        ]),
+        pd.DataFrame([
+            ['Quarter(s)', 'Receipt Numbers of original quarterly statements', 'Amount paid/credited',
+             'Amount of tax deducted', 'Amount of tax deposited / remitted'],
+            ['Q1', 'QVXBCDEF', '275000.00', '31200.00', '31200.00'],
+            ['Q2', 'QVXBCDEG', '275000.00', '31200.00', '31200.00'],
+            ['Q3', 'QVXBCDEH', '275000.00', '31200.00', '31200.00'],
+            ['Q4', 'QVXBCDEI', '275000.00', '31200.00', '31200.00'],
+        ]),
+    ]
+
+
+class TestRoutedDocument(unittest.TestCase):
+    """Test routed extraction of a complete document against the full-set path."""
+
+    def setUp(self):
+        """Extract a complete document with and without routing."""
+        self.extractor = EnhancedForm16Extractor(ProcessingLevel.ENHANCED)
+        self.tables = form16_tables()
+        self.classified, self.tables_by_type = self.extractor.classify_tables(self.tables)
+        self.routed = self.extractor.route_tables(self.classified)
+        self.routed_doc = self.extractor.extract_all(self.tables)
+        self.full_doc = self.extractor.merge_domain_updates({
+            domain: self.extractor.run_domain_extractor(domain, self.tables_by_type, self.tables)[0]
+            for domain in DOMAIN_EXTRACTION_ORDER
+        })
+
+    def test_salary_table_is_routed_to_tax(self):
+        """The salary table's TDS row routes it to the tax extractor too."""
+        self.assertIn(1, [table_info['index'] for table_info in self.routed['tax']])
+
+    def test_zero_tax_values_fall_back(self):
+        """Explicit zero amounts from a routed subset do not count as coverage."""
+        salary_only = [table_info for table_info in self.routed['tax'] if table_info['index'] == 1]
+
+        updates, metadata = self.extractor.run_domain_extractor(
+            'tax', self.tables_by_type, self.tables, salary_only
+        )
+
+        self.assertEqual(metadata['table_selection'], 'fallback')
+        self.assertEqual(updates['tax_computation'].tax_on_total_income, Decimal('120000'))
+
+    def test_tax_computation_matches_full_set(self):
+        """Routing keeps every tax computation amount."""
+        tax = self.routed_doc.tax_computation
+
+        self.assertEqual(tax, self.full_doc.tax_computation)
+        self.assertEqual(tax.total_tax_liability, Decimal('124800'))
+        self.assertEqual(tax.gross_total_income, Decimal('1025000'))
+        self.assertEqual(tax.tax_on_total_income, Decimal('120000'))
+        self.assertEqual(tax.health_education_cess, Decimal('4800'))
+
+    def test_deductions_match_full_set(self):
+        """Routing keeps the Chapter VI-A deductions."""
+        self.assertEqual(self.routed_doc.chapter_via_deductions, self.full_doc.chapter_via_deductions)
+        self.assertEqual(self.routed_doc.chapter_via_deductions.total_chapter_via_deductions, Decimal('150000'))
+
+    def test_quarterly_tds_matches_full_set(self):
+        """Routing keeps every quarter."""
+        self.assertEqual(self.routed_doc.quarterly_tds, self.full_doc.quarterly_tds)
+        self.assertEqual([row.quarter for row in self.routed_doc.quarterly_tds], ['Q1', 'Q2', 'Q3', 'Q4'])
+
+    def test_every_section_matches_full_set(self):
+        """The routed document equals the full-set document section by section."""
+        for section in ('employee', 'employer', 'salary', 'metadata'):
+            with self.subTest(section=section):
+                self.assertEqual(getattr(self.routed_doc, section), getattr(self.full_doc, section))
+
+
+class TestEmployeeEarlyStop(unittest.TestCase):
+    """Test early stopping in EmployeeExtractor."""
+
+    def setUp(self):
+        """Set up the extractor and an identity table."""
+        self.extractor = EmployeeExtractor()
+        self.table = pd.DataFrame([
+            ["Employee Name", ":", "JOHN DOE", ""],
+            ["Employee PAN", ":", "ABCDE1234F", ""],
+        ])
+
+    def test_stops_once_required_fields_are_confident(self):
+        """Later tables are skipped when required fields are already filled."""
+        with patch.object(self.extractor, '_extract_from_table',
+                          wraps=self.extractor._extract_from_table) as extract_from_table:
+            result = self.extractor.extract_employee_info(
+                [self.table, self.table.copy(), self.table.copy()],
+                required_fields=('name', 'pan')
+            )
+
+        self.assertEqual(extract_from_table.call_count, 1)
+        self.assertEqual(result.name, 'JOHN DOE')
+
+    def test_scans_all_tables_by_default(self):
+        """Without required fields every table is processed."""
+        with patch.object(self.extractor, '_extract_from_table',
+                          wraps=self.extractor._extract_from_table) as extract_from_table:
+            self.extractor.extract_employee_info([self.table, self.table.copy(), self.table.copy()])
+
+        self.assertEqual(extract_from_table.call_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for Thread-Safe Extraction
+================================
+
+Test coverage for extractors shared across threads: per-call state,
+per-thread metrics and locked orchestrator statistics.
+"""
+
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from form16x.form16_parser.extractors.base.extraction_metrics import ExtractionMetrics, ExtractorComponent
+from form16x.form16_parser.extractors.base.extraction_orchestrator import ExtractionOrchestrator
+from form16x.form16_parser.extractors.domains.salary.salary_coordinator import SalaryCoordinator
+from form16x.form16_parser.extractors.enhanced_form16_extractor import EnhancedForm16Extractor
+from form16x.form16_parser.extractors.form16_extractor import ModularSimpleForm16Extractor
+
+
+def _salary_table(gross):
+    return pd.DataFrame([
+        ['Gross Salary', ''],
+        ['(a) Salary as per provisions contained in section 17(1)', f'{gross}.00'],
+        ['(d) Total', f'{gross}.00'],
+    ])
+
+
+class _CountingExtractor:
+    def extract(self, table):
+        return {'rows': len(table)}
+
+
+class TestSharedExtractors(unittest.TestCase):
+    """Test extractors used from several threads at once."""
+
+    def test_concurrent_documents_match_sequential(self):
+        """Documents extracted on a thread pool equal their sequential results."""
+        extractor = EnhancedForm16Extractor()
+        grosses = [600000 + number * 10000 for number in range(12)]
+        expected = [extractor.extract_all([_salary_table(gross)]).salary.gross_salary for gross in grosses]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(
+                lambda gross: extractor.extract_all([_salary_table(gross)]).salary.gross_salary, grosses
+            ))
+
+        self.assertEqual(results, expected)
+
+    def test_salary_coordinator_keeps_no_call_state(self):
+        """Detailed perquisites are returned per call rather than stored on the coordinator."""
+        coordinator = SalaryCoordinator()
+
+        components, perquisites = coordinator.extract_components_with_perquisites([_salary_table(900000)])
+
+        self.assertEqual(components['gross_salary'], 900000.0)
+        self.assertIsInstance(perquisites, dict)
+        self.assertFalse(hasattr(coordinator, 'detailed_perquisites'))
+
+    def test_components_keep_their_loggers(self):
+        """The modular extractor does not replace its components' loggers."""
+        extractor = ModularSimpleForm16Extractor()
+
+        self.assertNotEqual(extractor.salary_component.logger.name, extractor.logger.name)
+        self.assertNotEqual(extractor.tds_component.logger.name, extractor.logger.name)
+
+
+class TestThreadSafeMetrics(unittest.TestCase):
+    """Test ExtractionMetrics and ExtractionOrchestrator under threads."""
+
+    def test_sessions_and_timers_are_per_thread(self):
+        """Each thread sees only its own session and component timers."""
+        metrics = ExtractionMetrics()
+        metrics.start_session('main.pdf')
+        metrics.start_component_timer(ExtractorComponent.SALARY_EXTRACTOR)
+        seen = {}
+
+        def worker():
+            seen['session'] = metrics.current_session
+            seen['timers'] = dict(metrics.component_timers)
+            metrics.start_session('worker.pdf')
+            seen['finalized'] = metrics.finalize_session().file_name
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        self.assertIsNone(seen['session'])
+        self.assertEqual(seen['timers'], {})
+        self.assertEqual(seen['finalized'], 'worker.pdf')
+        self.assertEqual(metrics.current_session.file_name, 'main.pdf')
+        self.assertIn(ExtractorComponent.SALARY_EXTRACTOR, metrics.component_timers)
+
+    def test_orchestrator_counts_every_table(self):
+        """Concurrent process_table calls are all counted."""
+        orchestrator = ExtractionOrchestrator()
+        orchestrator.register_extractor('salary', _CountingExtractor())
+        tables = [_salary_table(700000) for _ in range(40)]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(orchestrator.process_table, tables))
+
+        stats = orchestrator.get_performance_metrics()
+        self.assertEqual(stats['tables_processed'], 40)
+        self.assertEqual(stats['routes_distribution'].get('salary', 0), stats['total_extractions'])
+        self.assertEqual(len(orchestrator.extraction_lineage), 40)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Tests for the TRACES Part A Fast Path
+=====================================
+
+Test coverage for reading Part A from positioned words, the quarter total
+checksum and overlaying Part A onto a general-path document.
+"""
+
+import shutil
+import tempfile
+import unittest
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+from form16x.form16_parser.extractors.orchestration.traces_part_a import TracesPartAExtractor
+from form16x.form16_parser.models.form16_models import Form16Document, SalaryBreakdown
+from form16x.form16_parser.pdf.reader import PDFPLUMBER_AVAILABLE
+
+
+def _text_pdf(pages):
+    """Minimal PDF placing (x, y, text) items on each page"""
+    objects = [b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>", b""]
+    page_ids = []
+    for items in pages:
+        ops = []
+        for x, y, text in items:
+            escaped = text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+            ops.append(f"BT /F1 8 Tf {x} {y} Td ({escaped}) Tj ET")
+        stream = "\n".join(ops).encode()
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                       b"/Resources << /Font << /F1 1 0 R >> >> /Contents %d 0 R >>" % len(objects))
+        page_ids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(b"%d 0 R" % i for i in page_ids), len(page_ids))
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+
+    data = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(data)
+    data += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    data += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    data += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, len(objects), xref)
+    return bytes(data)
+
+
+def _part_a_page(total_paid='1,200,000.00'):
+    quarters = [
+        ('Q1', 'QRSTUVWX', '300,000.00', '30,000.00'),
+        ('Q2', 'ABCDEFGH', '300,000.00', '30,000.00'),
+        ('Q3', 'IJKLMNOP', '300,000.00', '30,000.00'),
+        ('Q4', 'YZABCDEF', '300,000.00', '30,000.00'),
+    ]
+    items = [
+        (250, 800, 'FORM NO. 16'), (270, 785, 'PART A'),
+        (50, 760, 'Certificate No.'), (130, 760, 'QWERTYU'), (300, 760, 'Last updated on'),
+        (300, 745, '05-Jun-2024'),
+        (50, 720, 'Name and address of the Employer'), (300, 720, 'Name and address of the Employee'),
+        (50, 705, 'ACME TECHNOLOGIES PVT LTD'), (300, 705, 'JOHN DOE'),
+        (50, 690, '12 MG ROAD, BENGALURU'), (300, 690, '45 PARK STREET, PUNE'),
+        (50, 660, 'PAN of the Deductor'), (200, 660, 'TAN of the Deductor'), (380, 660, 'PAN of the Employee'),
+        (50, 645, 'AAACA1234F'), (200, 645, 'BLRA12345B'), (380, 645, 'ABCPE1234F'),
+        (50, 615, 'Assessment Year'), (300, 615, 'Period with the Employer'),
+        (50, 600, '2024-25'), (300, 600, 'From'), (420, 600, 'To'),
+        (300, 585, '01-Apr-2023'), (420, 585, '31-Mar-2024'),
+        (50, 550, 'Quarter(s)'), (120, 550, 'Receipt'), (260, 550, 'paid/credited'),
+        (370, 550, 'deducted'), (470, 550, 'deposited'),
+    ]
+    for row, (quarter, receipt, paid, tax) in enumerate(quarters):
+        y = 535 - row * 15
+        items += [(50, y, quarter), (120, y, receipt), (260, y, paid), (370, y, tax), (470, y, tax)]
+    items += [(50, 475, 'Total (Rs.)'), (260, 475, total_paid), (370, 475, '120,000.00'), (470, 475, '120,000.00')]
+    return items
+
+
+PART_B_PAGE = [(250, 800, 'FORM NO. 16'), (240, 785, 'PART B (Annexure)'), (50, 760, 'Gross Salary')]
+
+
+@unittest.skipUnless(PDFPLUMBER_AVAILABLE, "pdfplumber not available")
+class TestTracesPartAExtractor(unittest.TestCase):
+    """Test TracesPartAExtractor."""
+
+    def setUp(self):
+        """Set up the extractor and a temporary directory."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.extractor = TracesPartAExtractor()
+
+    def tearDown(self):
+        """Remove temporary files."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _extract(self, pages):
+        pdf_path = self.temp_dir / 'form16.pdf'
+        pdf_path.write_bytes(_text_pdf(pages))
+        return self.extractor.extract(pdf_path)
+
+    def test_reads_part_a_fields(self):
+        """Identity, metadata and quarters are read by geometric anchors."""
+        result = self._extract([_part_a_page(), PART_B_PAGE])
+
+        self.assertIsNotNone(result)
+        self.assertEqual(result.metadata.certificate_number, 'QWERTYU')
+        self.assertEqual(result.metadata.last_updated, date(2024, 6, 5))
+        self.assertEqual(result.metadata.assessment_year, '2024-25')
+        self.assertEqual(result.metadata.financial_year, '2023-24')
+        self.assertEqual((result.metadata.period_from, result.metadata.period_to),
+                         (date(2023, 4, 1), date(2024, 3, 31)))
+        self.assertEqual(result.employer.name, 'ACME TECHNOLOGIES PVT LTD')
+        self.assertEqual(result.employer.address, '12 MG ROAD, BENGALURU')
+        self.assertEqual((result.employer.pan, result.employer.tan), ('AAACA1234F', 'BLRA12345B'))
+        self.assertEqual((result.employee.name, result.employee.pan), ('JOHN DOE', 'ABCPE1234F'))
+
+        self.assertEqual([q.quarter for q in result.quarterly_tds], ['Q1', 'Q2', 'Q3', 'Q4'])
+        first = result.quarterly_tds[0]
+        self.assertEqual(first.receipt_number, 'QRSTUVWX')
+        self.assertEqual((first.amount_paid, first.tax_deducted, first.tax_deposited),
+                         (Decimal('300000.00'), Decimal('30000.00'), Decimal('30000.00')))
+        self.assertTrue(all(result.checks['checksums'].values()))
+        self.assertEqual(result.pages, [1])
+        self.assertEqual(result.tables_from_page, 2)
+
+    def test_checksum_failure_falls_back(self):
+        """Quarters not adding up to the Total row reject the fast path."""
+        self.assertIsNone(self._extract([_part_a_page(total_paid='1,250,000.00'), PART_B_PAGE]))
+
+    def test_non_traces_document(self):
+        """Documents without the Part A anchors are left to the general path."""
+        self.assertIsNone(self._extract([PART_B_PAGE]))
+
+    def test_apply_to_keeps_general_path_fields(self):
+        """Part A values overlay identity and TDS without touching Part B data."""
+        result = self._extract([_part_a_page(), PART_B_PAGE])
+        document = Form16Document(salary=SalaryBreakdown(gross_salary=Decimal('1200000')))
+
+        result.apply_to(document)
+
+        self.assertEqual(document.employee.pan, 'ABCPE1234F')
+        self.assertEqual(document.metadata.certificate_number, 'QWERTYU')
+        self.assertEqual(len(document.quarterly_tds), 4)
+        self.assertEqual(document.salary.gross_salary, Decimal('1200000'))
+        self.assertEqual(document.processing_metadata['part_a_fast_path']['status'], 'used')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for Extraction-Time Records
+=================================
+
+Test coverage for DocumentDraft and single-pass document assembly.
+"""
+
+import unittest
+from decimal import Decimal
+from unittest.mock import patch
+
+from pydantic import ValidationError
+
+from form16x.form16_parser.models.extraction_records import DocumentDraft
+from form16x.form16_parser.models.form16_models import (
+    EmployeeInfo, Form16Document, SalaryBreakdown, TaxDeductionQuarterly
+)
+from form16x.form16_parser.utils.json_builder import Form16JSONBuilder
+
+
+class TestDocumentDraft(unittest.TestCase):
+    """Test DocumentDraft functionality."""
+
+    def test_to_document_passes_models_through(self):
+        """Validated sections are used as-is and missing sections get defaults."""
+        salary = SalaryBreakdown(gross_salary=Decimal('1000000'))
+        draft = DocumentDraft().apply({'salary': salary})
+
+        document = draft.to_document()
+
+        self.assertIsInstance(document, Form16Document)
+        self.assertIs(document.salary, salary)
+        self.assertIsInstance(document.employee, EmployeeInfo)
+        self.assertEqual(document.quarterly_tds, [])
+
+    def test_to_document_validates_plain_sections(self):
+        """Plain dict sections are validated at the boundary."""
+        draft = DocumentDraft().apply({
+            'employee': {'name': 'JOHN DOE', 'pan': 'abcde1234f'},
+            'quarterly_tds': [{'quarter': 'Q1', 'tax_deducted': '2500'}],
+        })
+
+        document = draft.to_document()
+
+        self.assertEqual(document.employee.pan, 'ABCDE1234F')
+        self.assertIsInstance(document.quarterly_tds[0], TaxDeductionQuarterly)
+        self.assertEqual(document.quarterly_tds[0].tax_deducted, Decimal('2500'))
+
+    def test_invalid_plain_section_raises(self):
+        """Invalid plain sections fail validation."""
+        draft = DocumentDraft().apply({'salary': {'gross_salary': '-5'}})
+
+        with self.assertRaises(ValidationError):
+            draft.to_document()
+
+    def test_unknown_field_rejected(self):
+        """Slotted drafts reject fields that Form16Document does not have."""
+        with self.assertRaises(AttributeError):
+            DocumentDraft().apply({'not_a_field': 1})
+
+
+class TestSinglePassAssembly(unittest.TestCase):
+    """Test single-pass counting and JSON building."""
+
+    def setUp(self):
+        """Set up a populated document."""
+        self.document = Form16Document()
+        self.document.employee = EmployeeInfo(name='JOHN DOE', pan='ABCDE1234F')
+        self.document.salary = SalaryBreakdown(gross_salary=Decimal('1000000'), basic_salary=Decimal('0'))
+        self.document.extraction_confidence = {'salary': 0.8}
+
+    def test_count_extracted_fields(self):
+        """Counting reads fields directly with the same semantics as before."""
+        # name, pan, employer.contact_info ({}), gross_salary
+        self.assertEqual(self.document._count_extracted_fields(), 4)
+
+    def test_summary_counts_once(self):
+        """The extraction summary counts fields a single time."""
+        with patch.object(Form16Document, '_count_extracted_fields', return_value=4) as counter:
+            summary = self.document.get_extraction_summary()
+
+        self.assertEqual(counter.call_count, 1)
+        self.assertEqual(summary['extracted_fields'], 4)
+
+    def test_json_parts_built_once(self):
+        """Part A and Part B are built once per JSON document."""
+        with patch.object(Form16JSONBuilder, '_build_part_a', wraps=Form16JSONBuilder._build_part_a) as part_a, \
+                patch.object(Form16JSONBuilder, '_build_part_b', wraps=Form16JSONBuilder._build_part_b) as part_b:
+            result = Form16JSONBuilder.build_comprehensive_json(self.document, 'test.pdf', 0.1, {})
+
+        self.assertEqual(part_a.call_count, 1)
+        self.assertEqual(part_b.call_count, 1)
+        self.assertGreater(result['extraction_metrics']['extraction_summary']['extracted_fields'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
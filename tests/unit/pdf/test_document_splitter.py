@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Tests for the Bulk Form16 Document Splitter
+===========================================
+
+Test coverage for certificate boundary detection and for cutting bulk PDFs
+into per-certificate files.
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import PyPDF2
+
+from form16x.form16_parser.pdf.document_splitter import Form16DocumentSplitter, page_identifiers
+
+
+def _part_a(certificate, employee_pan, deductor_pan='AAACX1234L'):
+    return (f"FORM NO. 16\nCertificate No. {certificate} Last updated on 05-Jun-2023\n"
+            f"PAN of the Deductor TAN of the Deductor PAN of the Employee\n"
+            f"{deductor_pan} MUMX12345A {employee_pan}\nSummary of amount paid/credited")
+
+
+def _part_b(employee_pan):
+    return f"FORM NO. 16\nPART B (Annexure)\nPAN of the Employee {employee_pan}\nGross Salary"
+
+
+class TestPageIdentifiers(unittest.TestCase):
+    """Test page_identifiers."""
+
+    def test_identifiers_on_part_a(self):
+        """The certificate number and only individual PANs are picked up."""
+        has_header, certificate, pans = page_identifiers(_part_a('QWERTYU', 'ABCPE1234F'))
+
+        self.assertTrue(has_header)
+        self.assertEqual(certificate, 'QWERTYU')
+        self.assertEqual(pans, ['ABCPE1234F'])
+
+    def test_form_16a_is_not_a_form16_header(self):
+        """FORM NO. 16A pages do not count as Form16 headers."""
+        self.assertFalse(page_identifiers("FORM NO. 16A\nCertificate under section 203")[0])
+
+
+class TestCertificateBoundaries(unittest.TestCase):
+    """Test Form16DocumentSplitter.split_texts."""
+
+    def setUp(self):
+        """Set up the splitter."""
+        self.splitter = Form16DocumentSplitter()
+
+    def _ranges(self, pages):
+        return [(s.first_page, s.last_page, s.certificate_number, s.employee_pan)
+                for s in self.splitter.split_texts(pages)]
+
+    def test_splits_on_certificate_and_pan_changes(self):
+        """Part A, Part B and annexure pages stay with their employee."""
+        pages = [
+            _part_a('QWERTYU', 'ABCPE1234F'), _part_b('ABCPE1234F'), 'Form 12BA annexure',
+            _part_a('ASDFGHJ', 'PQRPS6789K'), _part_b('PQRPS6789K'),
+            _part_b('LMNPO4321Q'),
+        ]
+
+        self.assertEqual(self._ranges(pages), [
+            (1, 3, 'QWERTYU', 'ABCPE1234F'),
+            (4, 5, 'ASDFGHJ', 'PQRPS6789K'),
+            (6, 6, None, 'LMNPO4321Q'),
+        ])
+
+    def test_individual_employer_pan_does_not_merge_certificates(self):
+        """A proprietor's PAN on every page does not hide a certificate change."""
+        pages = [
+            _part_a('QWERTYU', 'ABCPE1234F', deductor_pan='ZZZPZ9999Z'),
+            _part_a('ASDFGHJ', 'PQRPS6789K', deductor_pan='ZZZPZ9999Z'),
+        ]
+
+        self.assertEqual([r[:3] for r in self._ranges(pages)], [(1, 1, 'QWERTYU'), (2, 2, 'ASDFGHJ')])
+
+    def test_segments_stream_before_the_end(self):
+        """A certificate is yielded as soon as the next one starts."""
+        read = []
+
+        def pages():
+            for text in [_part_a('QWERTYU', 'ABCPE1234F'), _part_a('ASDFGHJ', 'PQRPS6789K'), 'never needed']:
+                read.append(text)
+                yield text
+
+        first = next(self.splitter.split_texts(pages()))
+
+        self.assertEqual(first.certificate_number, 'QWERTYU')
+        self.assertEqual(len(read), 2)
+
+
+class TestSplitToFiles(unittest.TestCase):
+    """Test Form16DocumentSplitter.split_to_files."""
+
+    def setUp(self):
+        """Write a bulk PDF without a text layer."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.pdf_path = self.temp_dir / 'bulk.pdf'
+        writer = PyPDF2.PdfWriter()
+        for _ in range(3):
+            writer.add_blank_page(width=595, height=842)
+        with open(self.pdf_path, 'wb') as pdf_file:
+            writer.write(pdf_file)
+
+    def tearDown(self):
+        """Remove temporary files."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_pages_without_identifiers_stay_together(self):
+        """Without boundaries the whole file is one certificate PDF."""
+        results = list(Form16DocumentSplitter().split_to_files(self.pdf_path, self.temp_dir / 'out'))
+
+        self.assertEqual(len(results), 1)
+        segment, segment_pdf = results[0]
+        self.assertEqual((segment.first_page, segment.last_page), (1, 3))
+        self.assertEqual(len(PyPDF2.PdfReader(str(segment_pdf)).pages), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
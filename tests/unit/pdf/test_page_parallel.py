@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Tests for Page-Parallel Table Detection
+=======================================
+
+Test coverage for page chunking and for merging tables detected by page
+worker processes back into document order.
+"""
+
+import gc
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from form16x.form16_parser.pdf.reader import (
+    PDFPLUMBER_AVAILABLE, ExtractionStrategy, RobustPDFProcessor, page_chunks
+)
+from form16x.form16_parser.pdf.strategy_stats import StrategyStatsStore
+
+
+def _ruled_table_pdf(pages):
+    """Minimal PDF with one ruled two-column table per page"""
+    objects = [b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>", b""]
+    page_ids = []
+    for rows in pages:
+        top, height, columns = 750, 20, (50, 250, 450)
+        ops = [f"{columns[0]} {top - i * height} m {columns[-1]} {top - i * height} l S" for i in range(len(rows) + 1)]
+        ops += [f"{x} {top} m {x} {top - len(rows) * height} l S" for x in columns]
+        for i, row in enumerate(rows):
+            ops += [f"BT /F1 10 Tf {x + 5} {top - i * height - 14} Td ({text}) Tj ET" for x, text in zip(columns, row)]
+        stream = "\n".join(ops).encode()
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                       b"/Resources << /Font << /F1 1 0 R >> >> /Contents %d 0 R >>" % (len(objects)))
+        page_ids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(b"%d 0 R" % i for i in page_ids), len(page_ids))
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+
+    data = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(data)
+    data += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    data += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    data += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, len(objects), xref)
+    return bytes(data)
+
+
+class TestPageChunks(unittest.TestCase):
+    """Test page_chunks."""
+
+    def test_chunks_cover_every_page_in_order(self):
+        """Chunks are contiguous, ordered and cover all pages exactly once."""
+        for page_count, workers in [(1, 4), (9, 1), (20, 4), (40, 8), (7, 16)]:
+            chunks = page_chunks(page_count, workers)
+            pages = [page for first, last in chunks for page in range(first, last + 1)]
+            self.assertEqual(pages, list(range(1, page_count + 1)))
+
+    def test_chunk_size_adapts_to_workers(self):
+        """More workers give smaller chunks, never below the minimum."""
+        self.assertEqual(len(page_chunks(40, 4)), 8)
+        self.assertEqual(len(page_chunks(40, 8)), 14)
+        self.assertTrue(all(last - first + 1 >= 2 for first, last in page_chunks(40, 64)))
+
+
+@unittest.skipUnless(PDFPLUMBER_AVAILABLE, "pdfplumber not available")
+class TestPageParallelExtraction(unittest.TestCase):
+    """Test page-parallel pdfplumber extraction."""
+
+    def setUp(self):
+        """Write a multi-page PDF with one table per page."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.pdf_path = self.temp_dir / 'annexures.pdf'
+        self.pdf_path.write_bytes(_ruled_table_pdf(
+            [[('Page', str(page)), ('Gross Salary', str(1000 * page))] for page in range(1, 10)]
+        ))
+
+    def tearDown(self):
+        """Remove temporary files."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_parallel_matches_serial(self):
+        """Tables from page workers come back with the serial tables and page order."""
+        serial = RobustPDFProcessor(page_workers=1)._extract_with_pdfplumber(self.pdf_path)
+
+        processor = RobustPDFProcessor(page_workers=2)
+        try:
+            self.assertIsNotNone(processor._page_chunks_for(self.pdf_path))
+            parallel = processor._extract_with_pdfplumber(self.pdf_path)
+        finally:
+            processor.close()
+
+        self.assertEqual(parallel.page_numbers, list(range(1, 10)))
+        self.assertEqual(parallel.page_numbers, serial.page_numbers)
+        self.assertEqual(parallel.metadata, serial.metadata)
+        for parallel_table, serial_table in zip(parallel.tables, serial.tables):
+            self.assertTrue(parallel_table.equals(serial_table))
+
+    def test_small_documents_stay_serial(self):
+        """Documents under the page threshold are not split."""
+        small_pdf = self.temp_dir / 'small.pdf'
+        small_pdf.write_bytes(_ruled_table_pdf([[('Page', '1'), ('Tax', '100')]] * 2))
+
+        self.assertIsNone(RobustPDFProcessor(page_workers=4)._page_chunks_for(small_pdf))
+
+    def test_document_probed_once(self):
+        """Fingerprinting and page chunking share one probe per extraction."""
+        processor = RobustPDFProcessor(
+            strategy_stats=StrategyStatsStore(self.temp_dir / 'stats.json'), page_workers=2,
+            strategies=(ExtractionStrategy.PDFPLUMBER, ExtractionStrategy.TEXT_EXTRACTION)
+        )
+        self.addCleanup(processor.close)
+        probe = processor._probe_document
+        probes = []
+        processor._probe_document = lambda pdf_path: probes.append(pdf_path) or probe(pdf_path)
+
+        result = processor.extract_tables(self.pdf_path)
+
+        self.assertEqual(result.page_numbers, list(range(1, 10)))
+        self.assertEqual(probes, [self.pdf_path])
+
+    def test_pool_stops_with_processor(self):
+        """A processor nobody closes shuts its page workers down when collected."""
+        processor = RobustPDFProcessor(page_workers=2)
+        processor._extract_with_pdfplumber(self.pdf_path)
+        pool = processor._page_pool
+
+        del processor
+        gc.collect()
+
+        self.assertTrue(pool._shutdown_thread)
+
+
+if __name__ == '__main__':
+    unittest.main()
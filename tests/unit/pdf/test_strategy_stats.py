@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Tests for Extraction Strategy Statistics
+========================================
+
+Test coverage for learned strategy ordering per document fingerprint,
+decay on layout changes, persistence and the processor integration.
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from form16x.form16_parser.pdf.reader import (
+    ExtractionStrategy, RobustPDFProcessor, TableExtractionResult
+)
+from form16x.form16_parser.pdf.strategy_stats import StrategyStatsStore, document_fingerprint
+
+CANDIDATES = ['camelot_lattice:default', 'camelot_stream:default', 'pdfplumber', 'fallback']
+
+
+def _attempt(candidate, succeeded=True, confidence=0.75, seconds=1.0):
+    return {'candidate': candidate, 'succeeded': succeeded, 'confidence': confidence, 'seconds': seconds}
+
+
+class TestStrategyStatsStore(unittest.TestCase):
+    """Test StrategyStatsStore."""
+
+    def setUp(self):
+        """Set up a temporary statistics file."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.path = self.temp_dir / 'strategy_stats.json'
+        self.store = StrategyStatsStore(self.path)
+
+    def tearDown(self):
+        """Remove temporary files."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_unknown_fingerprint_keeps_default_order(self):
+        """Without history candidates are tried in the default order."""
+        plan = self.store.plan(['unknown'], CANDIDATES)
+
+        self.assertEqual(plan.order, CANDIDATES)
+        self.assertIsNone(plan.winner)
+
+    def test_winner_first_and_failures_last(self):
+        """The historical winner leads and a never-winning failure is tried last."""
+        self.store.record(['fp'], [_attempt('camelot_lattice:default', succeeded=False),
+                                   _attempt('camelot_stream:default', confidence=0.72)],
+                          'camelot_stream:default')
+
+        plan = self.store.plan(['fp'], CANDIDATES)
+
+        self.assertEqual(plan.order, ['camelot_stream:default', 'pdfplumber', 'fallback',
+                                      'camelot_lattice:default'])
+        self.assertEqual(plan.winner, 'camelot_stream:default')
+        self.assertAlmostEqual(plan.expected_confidence, 0.72)
+
+    def test_decay_follows_layout_change(self):
+        """A new winner overtakes the old one after a few documents."""
+        for _ in range(5):
+            self.store.record(['fp'], [_attempt('camelot_stream:default')], 'camelot_stream:default')
+        for _ in range(4):
+            self.store.record(['fp'], [_attempt('camelot_stream:default', succeeded=False),
+                                       _attempt('pdfplumber')], 'pdfplumber')
+
+        self.assertEqual(self.store.plan(['fp'], CANDIDATES).winner, 'pdfplumber')
+
+    def test_most_specific_key_wins_and_persists(self):
+        """Lookups prefer the TAN key and statistics survive a new store."""
+        self.store.record(['tan', 'layout'], [_attempt('pdfplumber')], 'pdfplumber')
+        self.store.record(['layout'], [_attempt('camelot_stream:default')], 'camelot_stream:default')
+        self.store.flush()
+
+        store = StrategyStatsStore(self.path)
+
+        self.assertEqual(store.plan(['tan', 'layout'], CANDIDATES).winner, 'pdfplumber')
+        self.assertEqual(store.plan(['other_tan', 'layout'], CANDIDATES).fingerprint, 'layout')
+        self.assertEqual(store.summary()['fingerprints'], 2)
+
+    def test_saves_in_batches(self):
+        """Records reach the file every save_every documents, through a per-writer temp file."""
+        store = StrategyStatsStore(self.path, save_every=3)
+        for number in range(2):
+            store.record([f'fp{number}'], [_attempt('pdfplumber')], 'pdfplumber')
+
+        self.assertFalse(self.path.exists())
+
+        store.record(['fp2'], [_attempt('pdfplumber')], 'pdfplumber')
+
+        self.assertEqual(StrategyStatsStore(self.path).summary()['fingerprints'], 3)
+        self.assertEqual(list(self.temp_dir.glob('*.tmp')), [])
+
+    def test_flush_merges_other_writers(self):
+        """Two stores sharing a file keep each other's records."""
+        other = StrategyStatsStore(self.path)
+        self.store.record(['first'], [_attempt('pdfplumber')], 'pdfplumber')
+        other.record(['second'], [_attempt('camelot_stream:default')], 'camelot_stream:default')
+
+        self.store.flush()
+        other.flush()
+
+        merged = StrategyStatsStore(self.path)
+        self.assertEqual(merged.plan(['first'], CANDIDATES).winner, 'pdfplumber')
+        self.assertEqual(merged.plan(['second'], CANDIDATES).winner, 'camelot_stream:default')
+
+    def test_fingerprint_includes_tan(self):
+        """The same layout from a different employer gets a different key."""
+        base = document_fingerprint('iText', 3, (595, 842))
+
+        self.assertEqual(base, document_fingerprint('iText', 3, (595, 842)))
+        self.assertNotEqual(base, document_fingerprint('iText', 3, (595, 842), 'ABCD12345E'))
+        self.assertNotEqual(base, document_fingerprint('iText', 4, (595, 842)))
+
+
+class TestLearnedStrategyOrder(unittest.TestCase):
+    """Test strategy learning in RobustPDFProcessor."""
+
+    def setUp(self):
+        """Set up a processor whose strategies are scripted per candidate."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.pdf_path = self.temp_dir / 'form16.pdf'
+        self.pdf_path.write_bytes(b'%PDF-1.4')
+
+        self.processor = RobustPDFProcessor(strategy_stats=StrategyStatsStore(self.temp_dir / 'stats.json'))
+        self.processor.extraction_strategies = {strategy: True for strategy in ExtractionStrategy}
+        self.processor._probe_document = lambda pdf_path: ('Producer', 2, (595, 842))
+        self.calls = []
+        self.processor._extract_with_strategy = self._scripted_strategy
+
+    def tearDown(self):
+        """Remove temporary files."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _scripted_strategy(self, pdf_path, strategy, parameter_set=None, first_page=1, page_count=None):
+        self.calls.append(strategy)
+        if strategy == ExtractionStrategy.TEXT_EXTRACTION:
+            return TableExtractionResult([], strategy, 0.7, 0.0, {}, [], [],
+                                         text_data={'employer_tan': 'ABCD12345E'})
+        if strategy == ExtractionStrategy.CAMELOT_LATTICE:
+            raise RuntimeError('no ruling lines')
+        if strategy == ExtractionStrategy.PDFPLUMBER:
+            table = pd.DataFrame([['Gross Salary', '1200000'], ['Tax', '100000']])
+            return TableExtractionResult([table], strategy, 0.0, 0.0, {}, [], [1])
+        return TableExtractionResult([], strategy, 0.0, 0.0, {}, [], [])
+
+    def test_historical_winner_tried_first(self):
+        """A repeat document skips the strategies that lost last time."""
+        first = self.processor.extract_tables(self.pdf_path)
+        self.calls.clear()
+
+        second = self.processor.extract_tables(self.pdf_path)
+
+        self.assertEqual(first.strategy_used, ExtractionStrategy.PDFPLUMBER)
+        self.assertEqual(second.strategy_used, ExtractionStrategy.PDFPLUMBER)
+        self.assertEqual(self.calls, [ExtractionStrategy.TEXT_EXTRACTION, ExtractionStrategy.PDFPLUMBER])
+        self.assertEqual(second.metadata['strategy_selection']['learned_winner'], 'pdfplumber')
+        self.assertEqual(second.text_data, {'employer_tan': 'ABCD12345E'})
+
+    def test_without_store_default_order(self):
+        """Without statistics the default strategy order is unchanged."""
+        self.processor.strategy_stats = None
+
+        self.processor.extract_tables(self.pdf_path)
+
+        self.assertEqual(self.calls[:3], [ExtractionStrategy.CAMELOT_LATTICE,
+                                          ExtractionStrategy.TEXT_EXTRACTION,
+                                          ExtractionStrategy.CAMELOT_STREAM])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Tests for the Batch Planner
+===========================
+
+Test coverage for per-file cost estimates, historical timing, the
+longest/shortest/balanced scheduling orders and duplicate detection.
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import PyPDF2
+
+from form16x.form16_parser.pdf.reader import probe_document
+from form16x.form16_parser.pdf.strategy_stats import StrategyStatsStore, document_fingerprint
+from form16x.form16_parser.services import batch_planner
+from form16x.form16_parser.services.batch_planner import BatchPlanner
+
+
+def _blank_pdf(path: Path, pages: int, producer: str = 'Form16 Generator') -> Path:
+    writer = PyPDF2.PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(595, 842)
+    writer.add_metadata({'/Producer': producer})
+    with open(path, 'wb') as pdf_file:
+        writer.write(pdf_file)
+    return path
+
+
+def _text_pdf(path: Path, text, producer: str) -> Path:
+    """PDF with a text layer (one page per string when text is a list) and the given producer"""
+    texts = [text] if isinstance(text, str) else list(text)
+    page_numbers = [4 + 2 * index for index in range(len(texts))]
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+            b" ".join(b"%d 0 R" % number for number in page_numbers), len(texts)
+        ),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for number, page_text in zip(page_numbers, texts):
+        stream = f"BT /F1 12 Tf 50 800 Td ({page_text}) Tj ET".encode()
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                       b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (number + 1))
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+    objects.append(b"<< /Producer (%s) >>" % producer.encode())
+    data = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(data)
+    data += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    data += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    data += b"trailer\n<< /Size %d /Root 1 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, len(objects), xref
+    )
+    path.write_bytes(bytes(data))
+    return path
+
+
+class TestBatchPlanner(unittest.TestCase):
+    """Test BatchPlanner."""
+
+    def setUp(self):
+        """Create PDFs of 1, 3 and 12 pages."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.small = _blank_pdf(self.temp_dir / 'a_small.pdf', 1)
+        self.medium = _blank_pdf(self.temp_dir / 'b_medium.pdf', 3)
+        self.large = _blank_pdf(self.temp_dir / 'c_large.pdf', 12)
+        self.files = [self.small, self.medium, self.large]
+
+    def tearDown(self):
+        """Remove temporary files."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _order(self, order, planner=None):
+        estimates = (planner or BatchPlanner()).plan(self.files, order)
+        return [estimate.path.name for estimate in estimates]
+
+    def test_probe_reads_page_count(self):
+        """The page count and page size come from the page tree root."""
+        self.assertEqual(probe_document(self.large), ('Form16 Generator', 12, (595, 842)))
+
+    def test_longest_and_shortest_first(self):
+        """Estimates follow page counts and set the order."""
+        self.assertEqual(self._order('longest'), ['c_large.pdf', 'b_medium.pdf', 'a_small.pdf'])
+        self.assertEqual(self._order('shortest'), ['a_small.pdf', 'b_medium.pdf', 'c_large.pdf'])
+        self.assertEqual(self._order('balanced'), ['c_large.pdf', 'a_small.pdf', 'b_medium.pdf'])
+        self.assertEqual(self._order('name'), ['a_small.pdf', 'b_medium.pdf', 'c_large.pdf'])
+
+    def test_history_overrides_model(self):
+        """A recorded extraction time for the fingerprint replaces the model estimate."""
+        store = StrategyStatsStore(self.temp_dir / 'stats.json')
+        fingerprint = document_fingerprint('Form16 Generator', 1, (595, 842))
+        store.record([fingerprint], [], None, seconds=90.0)
+        planner = BatchPlanner(strategy_stats=store)
+
+        estimate = planner.estimate(self.small)
+
+        self.assertTrue(estimate.from_history)
+        self.assertAlmostEqual(estimate.estimated_seconds, 90.0)
+        self.assertEqual(self._order('longest', planner)[0], 'a_small.pdf')
+
+    def test_unreadable_file_estimated_from_size(self):
+        """Files without a readable xref still get an estimate."""
+        broken = self.temp_dir / 'broken.pdf'
+        broken.write_bytes(b'not a pdf' * 1000)
+
+        estimate = BatchPlanner().estimate(broken)
+
+        self.assertIsNone(estimate.page_count)
+        self.assertGreater(estimate.estimated_seconds, 0)
+
+    def test_unknown_order_rejected(self):
+        """Only the supported orders are accepted."""
+        with self.assertRaises(ValueError):
+            BatchPlanner().plan(self.files, 'random')
+
+
+class TestDuplicateDetection(unittest.TestCase):
+    """Test BatchPlanner.find_duplicates."""
+
+    def setUp(self):
+        """Create an original, a byte copy, a re-saved copy and a different certificate."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.original = _text_pdf(self.temp_dir / 'a_original.pdf', 'Certificate No. QWERTYU', 'HR System 1.0')
+        self.copy = self.temp_dir / 'b_reupload.pdf'
+        shutil.copyfile(self.original, self.copy)
+        self.resaved = _text_pdf(self.temp_dir / 'c_resend.pdf', 'Certificate No. QWERTYU', 'Mail Gateway 7.2')
+        self.other = _text_pdf(self.temp_dir / 'd_other.pdf', 'Certificate No. ASDFGHJ', 'HR System 1.0')
+        self.files = [self.original, self.copy, self.resaved, self.other]
+
+    def tearDown(self):
+        """Remove temporary files."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_exact_duplicates(self):
+        """Byte-identical files are extracted once."""
+        unique, groups = BatchPlanner().find_duplicates(self.files, 'exact')
+
+        self.assertEqual(unique, [self.original, self.resaved, self.other])
+        self.assertEqual(groups[self.original].matches, {self.copy: 'identical'})
+
+    def test_near_duplicates_by_text_layer(self):
+        """A re-saved copy with different metadata matches on its text layer."""
+        self.assertNotEqual(self.original.read_bytes(), self.resaved.read_bytes())
+
+        unique, groups = BatchPlanner().find_duplicates(self.files, 'near')
+
+        self.assertEqual(unique, [self.original, self.other])
+        self.assertEqual(groups[self.original].matches, {self.copy: 'identical', self.resaved: 'text'})
+
+    def test_exact_is_default(self):
+        """Without a mode only byte-identical files are merged and no PDF is parsed."""
+        with patch.object(batch_planner, 'probe_document', side_effect=AssertionError('probed')):
+            unique, groups = BatchPlanner().find_duplicates(self.files)
+
+        self.assertEqual(unique, [self.original, self.resaved, self.other])
+        self.assertEqual(groups[self.original].matches, {self.copy: 'identical'})
+
+    def test_near_reads_full_text_only_when_first_pages_match(self):
+        """Multi-page files are compared on their first page before their whole text."""
+        first = _text_pdf(self.temp_dir / 'e_first.pdf', ['Employee AAAPA1111A', 'Part B'], 'HR System 1.0')
+        resend = _text_pdf(self.temp_dir / 'f_resend.pdf', ['Employee AAAPA1111A', 'Part B'], 'Mail Gateway 7.2')
+        revised = _text_pdf(self.temp_dir / 'g_revised.pdf', ['Employee AAAPA1111A', 'Part B revised'],
+                            'HR System 1.0')
+        other = _text_pdf(self.temp_dir / 'h_other.pdf', ['Employee BBBPB2222B', 'Part B'], 'HR System 1.0')
+        reads = []
+        digest = batch_planner.text_layer_digest
+
+        def record(path, max_pages=None):
+            reads.append((path.name, max_pages))
+            return digest(path, max_pages)
+
+        with patch.object(batch_planner, 'text_layer_digest', side_effect=record):
+            unique, groups = BatchPlanner().find_duplicates([first, resend, revised, other], 'near')
+
+        self.assertEqual(unique, [first, revised, other])
+        self.assertEqual(groups[first].matches, {resend: 'text'})
+        self.assertNotIn(('h_other.pdf', None), reads)
+        self.assertIn(('g_revised.pdf', None), reads)
+
+    def test_files_are_probed_once(self):
+        """Near-duplicate detection and planning share each file's probe."""
+        planner = BatchPlanner()
+        with patch.object(batch_planner, 'probe_document', wraps=probe_document) as probe:
+            unique, _ = planner.find_duplicates(self.files, 'near')
+            planner.plan(unique)
+
+        self.assertEqual(sorted(call.args[0] for call in probe.call_args_list),
+                         sorted([self.original, self.resaved, self.other]))
+
+    def test_off(self):
+        """Detection can be disabled."""
+        unique, groups = BatchPlanner().find_duplicates(self.files, 'off')
+
+        self.assertEqual(unique, self.files)
+        self.assertEqual(groups, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
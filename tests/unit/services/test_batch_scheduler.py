@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Tests for the Batch Scheduler
+=============================
+
+Test coverage for bounded in-flight submission, RSS watermark backpressure,
+large/small ordering and progress counts.
+"""
+
+import concurrent.futures
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from form16x.form16_parser.services.batch_scheduler import BatchScheduler, balanced_order
+
+
+class TestBalancedOrder(unittest.TestCase):
+    """Test balanced_order."""
+
+    def setUp(self):
+        """Create files of increasing size."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.files = []
+        for size in range(1, 6):
+            path = self.temp_dir / f"doc{size}.pdf"
+            path.write_bytes(b'x' * size * 100)
+            self.files.append(path)
+
+    def tearDown(self):
+        """Remove temporary files."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_alternates_large_and_small(self):
+        """Largest and smallest remaining files alternate."""
+        names = [path.name for path in balanced_order(self.files)]
+
+        self.assertEqual(names, ['doc5.pdf', 'doc1.pdf', 'doc4.pdf', 'doc2.pdf', 'doc3.pdf'])
+
+
+class TestBatchScheduler(unittest.TestCase):
+    """Test BatchScheduler.run."""
+
+    def _run(self, scheduler, items, on_result=None, workers=4):
+        active = []
+        peak = [0]
+        lock = threading.Lock()
+        progress = []
+
+        def work(item):
+            with lock:
+                active.append(item)
+                peak[0] = max(peak[0], len(active))
+            with lock:
+                active.remove(item)
+            return item * 2
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            counts = scheduler.run(
+                executor, iter(items), len(items),
+                lambda ex, item: ex.submit(work, item),
+                on_result or (lambda item, future: True),
+                progress.append
+            )
+        return counts, progress
+
+    def test_in_flight_window_is_bounded(self):
+        """Never more than max_in_flight documents are submitted at once."""
+        counts, progress = self._run(BatchScheduler(max_in_flight=3), list(range(50)))
+
+        self.assertEqual(counts.completed, 50)
+        self.assertEqual(counts.queued, 0)
+        self.assertLessEqual(max(c.in_flight for c in progress), 3)
+        self.assertEqual(progress[-1].completed, 50)
+
+    def test_items_consumed_lazily(self):
+        """Items are pulled only as the window has room."""
+        pulled = []
+        release = threading.Event()
+
+        def items():
+            for item in range(10):
+                pulled.append(item)
+                yield item
+
+        def slow(item):
+            release.wait(5)
+            return item
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            runner = threading.Thread(target=BatchScheduler(max_in_flight=2).run, args=(
+                executor, items(), 10, lambda ex, item: ex.submit(slow, item), lambda item, future: True
+            ))
+            runner.start()
+            runner.join(0.3)
+            pulled_while_blocked = len(pulled)
+            release.set()
+            runner.join(5)
+
+        self.assertEqual(pulled_while_blocked, 3)
+        self.assertEqual(len(pulled), 10)
+
+    def test_watermark_pauses_submission(self):
+        """Above the watermark submission waits for in-flight work to drain."""
+        readings = iter([10, 10] + [1] * 100)
+        scheduler = BatchScheduler(max_in_flight=8, rss_watermark_bytes=5, poll_interval=0.01,
+                                   rss_reader=lambda: next(readings))
+
+        counts, progress = self._run(scheduler, list(range(6)))
+
+        self.assertEqual(counts.completed, 6)
+        self.assertTrue(any(c.paused_for_memory for c in progress))
+
+    def test_stop_submitting_on_request(self):
+        """on_result returning False stops new submissions."""
+        seen = []
+
+        def on_result(item, future):
+            seen.append(item)
+            return item != 0
+
+        counts, _ = self._run(BatchScheduler(max_in_flight=1), list(range(10)), on_result, workers=1)
+
+        self.assertEqual(seen, [0])
+        self.assertEqual(counts.queued, 9)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Tests for Extraction Service
+============================
+
+Test coverage for the shared table detection and TRACES Part A fast path
+used by extract, batch, consolidate and the tax calculation API.
+"""
+
+import unittest
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from form16x.form16_parser.api.tax_calculation_api import TaxCalculationAPI
+from form16x.form16_parser.extractors.orchestration.traces_part_a import PartAResult
+from form16x.form16_parser.models.form16_models import (
+    EmployeeInfo, EmployerInfo, Form16Document, Form16Metadata, SalaryBreakdown, TaxDeductionQuarterly
+)
+from form16x.form16_parser.progress import Form16ProgressTracker
+from form16x.form16_parser.services import consolidation_service
+from form16x.form16_parser.services.consolidation_service import ConsolidationService
+from form16x.form16_parser.services.extraction_service import extract_document
+
+
+def _part_a():
+    return PartAResult(
+        metadata=Form16Metadata(certificate_number='QWERTYU', assessment_year='2024-25'),
+        employer=EmployerInfo(name='ACME SOFTWARE PRIVATE LIMITED', tan='ABCD12345E'),
+        employee=EmployeeInfo(name='JOHN DOE', pan='ABCDE1234F'),
+        quarterly_tds=[TaxDeductionQuarterly(quarter='Q1', tax_deducted=Decimal('31200.00'))],
+        pages=[1],
+        page_count=3
+    )
+
+
+class TestExtractDocument(unittest.TestCase):
+    """Test extract_document."""
+
+    def setUp(self):
+        """Set up a table detector and an extractor returning a Part B document."""
+        self.pdf_processor = MagicMock()
+        self.pdf_processor.extract_tables.return_value = SimpleNamespace(tables=['part_b'], text_data=None)
+        self.extractor = MagicMock()
+        self.extractor.extract_all.side_effect = lambda tables, text_data=None: Form16Document(
+            salary=SalaryBreakdown(gross_salary=Decimal('1100000'))
+        )
+        self.part_a_extractor = MagicMock()
+        self.part_a_extractor.extract.return_value = _part_a()
+
+    def test_part_a_read_from_words(self):
+        """Tables are detected after Part A and Part A values are overlaid."""
+        _, document = extract_document(Path('form16.pdf'), self.pdf_processor, self.extractor,
+                                       self.part_a_extractor)
+
+        self.pdf_processor.extract_tables.assert_called_once_with(Path('form16.pdf'), first_page=2)
+        self.assertEqual(document.employee.pan, 'ABCDE1234F')
+        self.assertEqual(document.salary.gross_salary, Decimal('1100000'))
+        self.assertEqual(document.processing_metadata['part_a_fast_path']['status'], 'used')
+
+    def test_fast_path_off(self):
+        """Without a Part A extractor every page goes through table detection."""
+        _, document = extract_document(Path('form16.pdf'), self.pdf_processor, self.extractor)
+
+        self.pdf_processor.extract_tables.assert_called_once_with(Path('form16.pdf'))
+        self.assertIsNone(document.employee.pan)
+
+    def test_part_a_checks_failed(self):
+        """A document failing the Part A checks is detected on every page."""
+        self.part_a_extractor.extract.return_value = None
+
+        _, document = extract_document(Path('form16.pdf'), self.pdf_processor, self.extractor,
+                                       self.part_a_extractor)
+
+        self.pdf_processor.extract_tables.assert_called_once_with(Path('form16.pdf'))
+        self.assertNotIn('part_a_fast_path', document.processing_metadata)
+
+
+class TestCallersUsePartA(unittest.TestCase):
+    """Test that consolidate and the tax calculation API share the Part A fast path."""
+
+    def test_consolidation(self):
+        """Consolidation extracts through extract_document and honours the opt-out."""
+        service = ConsolidationService()
+        tracker = Form16ProgressTracker(enable_animation=False)
+        document = Form16Document(metadata=Form16Metadata(assessment_year='2024-25'))
+
+        with patch.object(consolidation_service, 'extract_document',
+                          return_value=(None, document)) as extract:
+            service._extract_all_form16_data([Path('a.pdf')], False, tracker)
+            service._extract_all_form16_data([Path('b.pdf')], False, tracker, part_a_fast_path=False)
+
+        self.assertIs(extract.call_args_list[0].args[3], service.part_a_extractor)
+        self.assertIsNone(extract.call_args_list[1].args[3])
+
+    def test_tax_calculation_api(self):
+        """The tax calculation API reads Part A the way extract does."""
+        api = TaxCalculationAPI()
+        api.pdf_processor = MagicMock()
+        api.pdf_processor.extract_tables.return_value = SimpleNamespace(tables=[], text_data=None)
+        api.part_a_extractor = MagicMock()
+        api.part_a_extractor.extract.return_value = _part_a()
+
+        with patch('pathlib.Path.exists', return_value=True):
+            api.calculate_tax_from_form16('form16.pdf')
+
+        api.part_a_extractor.extract.assert_called_once()
+        self.assertEqual(api.pdf_processor.extract_tables.call_args.kwargs, {'first_page': 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
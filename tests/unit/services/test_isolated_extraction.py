@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Tests for Isolated Extraction
+=============================
+
+Test coverage for per-document timeouts, memory limits, worker replacement,
+the cheap strategy retry and strategy statistics learned in workers.
+"""
+
+import shutil
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+from form16x.form16_parser.exceptions import ExtractionMemoryError, ExtractionTimeoutError, Form16ExtractionError
+from form16x.form16_parser.pdf.reader import ExtractionStrategy, RobustPDFProcessor
+from form16x.form16_parser.pdf.strategy_stats import StrategyStatsStore
+from form16x.form16_parser.services.isolated_extraction import IsolatedExtractionPool
+
+try:
+    import resource  # noqa: F401
+    HAS_RLIMIT = True
+except ImportError:
+    HAS_RLIMIT = False
+
+
+class _ScriptedService:
+    """Behaves according to the input file name; cheap services always succeed"""
+
+    def __init__(self, cheap):
+        self.cheap = cheap
+
+    def extract_form16_data(self, input_file, **kwargs):
+        name = Path(input_file).stem
+        if not self.cheap:
+            if name == 'slow':
+                time.sleep(60)
+            if name == 'huge':
+                return {'data': bytearray(8 * 1024 ** 3)}
+            if name == 'broken':
+                raise ValueError('no tables')
+        return {'extraction_success': True, 'file': name, 'cheap': self.cheap}
+
+
+def scripted_service(cheap, strategy_stats_file=None):
+    return _ScriptedService(cheap)
+
+
+class _RecordingService:
+    """Records one strategy win per document, keyed by the file name"""
+
+    def __init__(self, strategy_stats_file):
+        self.pdf_processor = SimpleNamespace(
+            strategy_stats=StrategyStatsStore(Path(strategy_stats_file), persist=False)
+        )
+
+    def extract_form16_data(self, input_file, **kwargs):
+        attempt = {'candidate': 'pdfplumber', 'succeeded': True, 'confidence': 0.8, 'seconds': 0.1}
+        self.pdf_processor.strategy_stats.record([Path(input_file).stem], [attempt], 'pdfplumber')
+        return {'extraction_success': True}
+
+
+def recording_service(cheap, strategy_stats_file=None):
+    return _RecordingService(strategy_stats_file)
+
+
+class TestIsolatedExtractionPool(unittest.TestCase):
+    """Test IsolatedExtractionPool with scripted worker services."""
+
+    def _pool(self, **kwargs):
+        pool = IsolatedExtractionPool(workers=1, service_factory=scripted_service, **kwargs)
+        self.addCleanup(pool.close)
+        return pool
+
+    def test_timeout_kills_and_replaces_worker(self):
+        """A slow document fails with ExtractionTimeoutError and the next one still runs."""
+        pool = self._pool(timeout_seconds=1.0)
+        pool.extract(Path('warmup.pdf'))
+
+        with self.assertRaises(ExtractionTimeoutError) as caught:
+            pool.extract(Path('slow.pdf'))
+        result = pool.extract(Path('fast.pdf'))
+
+        self.assertEqual(caught.exception.timeout_seconds, 1.0)
+        self.assertEqual(result['file'], 'fast')
+        self.assertEqual(pool.stats['timeouts'], 1)
+        self.assertEqual(pool.stats['workers_replaced'], 1)
+
+    @unittest.skipUnless(HAS_RLIMIT, "resource limits not available")
+    def test_memory_limit(self):
+        """An allocation beyond the limit fails the document with ExtractionMemoryError."""
+        pool = self._pool(memory_limit_mb=4096)
+
+        with self.assertRaises(ExtractionMemoryError) as caught:
+            pool.extract(Path('huge.pdf'))
+
+        self.assertEqual(caught.exception.memory_limit_mb, 4096)
+        self.assertEqual(pool.extract(Path('fast.pdf'))['file'], 'fast')
+
+    def test_cheap_retry(self):
+        """With cheap_retry a breached document is retried with the cheap service."""
+        pool = self._pool(timeout_seconds=1.0, cheap_retry=True)
+        pool.extract(Path('warmup.pdf'))
+
+        result = pool.extract(Path('slow.pdf'))
+
+        self.assertTrue(result['cheap'])
+        self.assertTrue(result['cheap_retry'])
+        self.assertEqual(pool.stats['cheap_retries'], 1)
+
+    def test_extraction_errors_keep_worker(self):
+        """Ordinary extraction failures are reported without replacing the worker."""
+        pool = self._pool(timeout_seconds=30.0)
+
+        with self.assertRaises(Form16ExtractionError) as caught:
+            pool.extract(Path('broken.pdf'))
+
+        self.assertIn('no tables', str(caught.exception))
+        self.assertEqual(pool.stats['workers_replaced'], 0)
+
+
+class TestWorkerStrategyStats(unittest.TestCase):
+    """Test strategy statistics recorded by worker processes."""
+
+    def setUp(self):
+        """Set up a statistics file owned by the parent."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.temp_dir, True)
+
+    def test_worker_records_reach_the_parent_store(self):
+        """Every document's record survives, however many workers learned in parallel."""
+        stats = StrategyStatsStore(self.temp_dir / 'stats.json')
+        pool = IsolatedExtractionPool(workers=3, service_factory=recording_service, strategy_stats=stats)
+        self.addCleanup(pool.close)
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(lambda number: pool.extract(Path(f'document-{number}.pdf')), range(30)))
+
+        stats.flush()
+
+        self.assertEqual(stats.summary()['fingerprints'], 30)
+        self.assertEqual(StrategyStatsStore(self.temp_dir / 'stats.json').summary()['fingerprints'], 30)
+        self.assertEqual(list(self.temp_dir.glob('*.tmp')), [])
+
+
+class TestCheapStrategies(unittest.TestCase):
+    """Test restricting RobustPDFProcessor strategies."""
+
+    def test_restricted_processor(self):
+        """Only text extraction, pdfplumber and the fallback stay enabled."""
+        processor = RobustPDFProcessor(page_workers=1, strategies=RobustPDFProcessor.CHEAP_STRATEGIES)
+
+        supported = processor.get_supported_strategies()
+
+        self.assertIn(ExtractionStrategy.FALLBACK, supported)
+        self.assertNotIn(ExtractionStrategy.CAMELOT_LATTICE, supported)
+        self.assertNotIn(ExtractionStrategy.TABULA_STREAM, supported)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for Pre-fork Initialization
+=================================
+
+Test coverage for building shared lookup structures before forking and
+for isolated workers forked from the preloaded fork server.
+"""
+
+import multiprocessing
+import unittest
+from pathlib import Path
+
+from form16x.form16_parser.extractors.domains.identity.text_extractor import IdentityTextExtractor
+from form16x.form16_parser.services.isolated_extraction import IsolatedExtractionPool
+from form16x.form16_parser.services.prefork import prefork_initialize, prefork_state
+
+
+class _PreforkReportingService:
+    """Returns the pre-fork state of the worker process"""
+
+    def extract_form16_data(self, input_file, **kwargs):
+        return {'extraction_success': True, 'prefork': prefork_state()}
+
+
+def prefork_reporting_service(cheap, strategy_stats_file=None):
+    return _PreforkReportingService()
+
+
+class TestPreforkInitialize(unittest.TestCase):
+    """Test prefork_initialize."""
+
+    def test_builds_shared_tables_once(self):
+        """The summary covers keywords, patterns and tax rules, and later calls reuse it."""
+        summary = prefork_initialize(freeze=False)
+
+        self.assertGreater(summary['keywords'], 0)
+        self.assertEqual(summary['identity_patterns'], 8)
+        self.assertIn('2024-25', summary['tax_rule_years'])
+        self.assertEqual(summary['tax_rule_errors'], 0)
+        self.assertEqual(prefork_initialize(), summary)
+        self.assertEqual(prefork_state(), summary)
+
+    def test_identity_patterns_are_shared(self):
+        """Extractor instances use one read-only pattern table."""
+        first, second = IdentityTextExtractor(), IdentityTextExtractor()
+
+        self.assertIs(first._patterns, second._patterns)
+        with self.assertRaises(TypeError):
+            first._patterns['employee_pan'] = None
+
+
+@unittest.skipUnless('forkserver' in multiprocessing.get_all_start_methods(), "fork server not available")
+class TestPreforkedWorkers(unittest.TestCase):
+    """Test isolated workers forked from the preloaded fork server."""
+
+    def test_workers_inherit_initialization(self):
+        """Workers start with the fork server's frozen pre-fork state."""
+        pool = IsolatedExtractionPool(workers=1, service_factory=prefork_reporting_service,
+                                      start_method='forkserver', timeout_seconds=120.0)
+        self.addCleanup(pool.close)
+
+        state = pool.extract(Path('any.pdf'))['prefork']
+
+        self.assertIsNotNone(state)
+        self.assertGreater(state['frozen_objects'], 0)
+        self.assertIn('2025-26', state['tax_rule_years'])
+
+    def test_rejects_plain_fork(self):
+        """Plain fork is refused since the batch runs on threads."""
+        with self.assertRaises(ValueError):
+            IsolatedExtractionPool(workers=1, start_method='fork')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Tests for Reprocess Service
+===========================
+
+Test coverage for artifact-based incremental re-extraction.
+"""
+
+import shutil
+import tempfile
+import unittest
+from decimal import Decimal
+from pathlib import Path
+
+import pandas as pd
+
+from form16x.form16_parser.extractors.enhanced_form16_extractor import (
+    EnhancedForm16Extractor, ProcessingLevel, DOMAIN_EXTRACTION_ORDER
+)
+from form16x.form16_parser.extractors.orchestration.incremental_extraction import (
+    ArtifactStore, ExtractorFingerprinter
+)
+from form16x.form16_parser.services.reprocess_service import ReprocessService
+
+
+def _routed_form16_tables():
+    """Identity, salary and tax computation tables; the salary table is also routed to tax"""
+    return [
+        pd.DataFrame([
+            ["Name and address of the Employer/Specified Bank",
+             "Name and address of the Employee/Specified senior citizen"],
+            ["ACME SOFTWARE PRIVATE LIMITED", "JOHN DOE"],
+            ["PAN of the Deductor", "PAN of the Employee/Specified senior citizen"],
+            ["AAACA1234B", "ABCDE1234F"],
+        ]),
+        pd.DataFrame([
+            ['Gross Salary', ''],
+            ['(a) Salary as per provisions contained in section 17(1)', '1100000.00'],
+            ['(d) Total', '1100000.00'],
+            ['Total tax deducted at source (TDS)', '124800.00'],
+        ]),
+        pd.DataFrame([
+            ['Deductions under Chapter VI-A', '', ''],
+            ['Aggregate of deductible amount under Chapter VI-A', '', '150000.00'],
+            ['Gross total income', '', '1025000.00'],
+            ['Tax on total income', '', '120000.00'],
+            ['Health and education cess', '', '4800.00'],
+            ['Net tax payable', '', '124800.00'],
+        ]),
+    ]
+
+
+class TestReprocessService(unittest.TestCase):
+    """Test ReprocessService functionality."""
+
+    def setUp(self):
+        """Set up a temporary artifact store and synthetic tables."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.store = ArtifactStore(self.temp_dir / 'artifacts')
+        self.service = ReprocessService(EnhancedForm16Extractor(ProcessingLevel.SCORED))
+        self.tables = [
+            pd.DataFrame([
+                ['Name and address of the Employee', 'PAN of the Employee'],
+                ['JOHN DOE', 'ABCDE1234F'],
+            ]),
+            pd.DataFrame([
+                ['Gross Salary', ''],
+                ['(a) Salary as per provisions contained in section 17(1)', '1200000.00'],
+                ['Deductions under section 80C', '150000.00'],
+            ]),
+        ]
+
+    def tearDown(self):
+        """Remove temporary files."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _save_document(self, document_id: str = 'form16_a'):
+        form16_doc, artifacts = self.service.extract_with_artifacts(
+            document_id=document_id,
+            source_file=f'/input/{document_id}.pdf',
+            tables=self.tables
+        )
+        self.store.save(artifacts)
+        return form16_doc, artifacts
+
+    def test_artifacts_round_trip(self):
+        """Saved artifacts reload with tables, classifications and domain results."""
+        _, artifacts = self._save_document()
+
+        loaded = self.store.load('form16_a')
+
+        self.assertEqual(self.store.list_documents(), ['form16_a'])
+        self.assertEqual(len(loaded.tables), 2)
+        self.assertEqual(len(loaded.classified_tables), 2)
+        self.assertEqual(set(loaded.domain_results), set(DOMAIN_EXTRACTION_ORDER))
+        self.assertEqual(loaded.classification_fingerprint, artifacts.classification_fingerprint)
+
+    def test_unchanged_extractors_are_reused(self):
+        """Reprocessing with identical code re-runs nothing."""
+        self._save_document()
+
+        outcome = self.service.reprocess_document(self.store, 'form16_a')
+
+        self.assertEqual(outcome['rerun_domains'], [])
+        self.assertEqual(outcome['reused_domains'], list(DOMAIN_EXTRACTION_ORDER))
+        self.assertFalse(outcome['reclassified'])
+
+    def test_changed_fingerprint_reruns_only_that_domain(self):
+        """A stale deductions fingerprint re-runs only the deductions extractor."""
+        _, artifacts = self._save_document()
+        artifacts.domain_results['deductions'].fingerprint = 'outdated'
+        self.store.save(artifacts)
+
+        outcome = self.service.reprocess_document(self.store, 'form16_a')
+
+        self.assertEqual(outcome['rerun_domains'], ['deductions'])
+        reloaded = self.store.load('form16_a')
+        self.assertEqual(
+            reloaded.domain_results['deductions'].fingerprint,
+            self.service.domain_fingerprints()['deductions']
+        )
+
+    def test_classification_change_reruns_all_domains(self):
+        """A changed classifier invalidates every domain result."""
+        _, artifacts = self._save_document()
+        artifacts.classification_fingerprint = 'outdated'
+        self.store.save(artifacts)
+
+        outcome = self.service.reprocess_document(self.store, 'form16_a')
+
+        self.assertTrue(outcome['reclassified'])
+        self.assertEqual(outcome['rerun_domains'], list(DOMAIN_EXTRACTION_ORDER))
+
+    def test_merged_document_matches_full_extraction(self):
+        """Re-merged documents match the original extraction."""
+        form16_doc, _ = self._save_document()
+
+        outcome = self.service.reprocess_document(self.store, 'form16_a', force_domains=['salary'])
+
+        self.assertEqual(outcome['rerun_domains'], ['salary'])
+        self.assertEqual(outcome['form16_result'].salary, form16_doc.salary)
+        self.assertEqual(outcome['form16_result'].employee, form16_doc.employee)
+
+    def test_artifact_extraction_matches_extract_all(self):
+        """Artifact extraction and reprocessing use the same routed tables as extract_all."""
+        extractor = EnhancedForm16Extractor(ProcessingLevel.ENHANCED)
+        service = ReprocessService(extractor)
+        tables = _routed_form16_tables()
+        expected = extractor.extract_all(tables)
+
+        form16_doc, artifacts = service.extract_with_artifacts(
+            document_id='form16_b', source_file='/input/form16_b.pdf', tables=tables
+        )
+        self.store.save(artifacts)
+        outcome = service.reprocess_document(self.store, 'form16_b', force_domains=DOMAIN_EXTRACTION_ORDER)
+
+        self.assertIn('tax', artifacts.routed_tables)
+        for document in (form16_doc, outcome['form16_result']):
+            self.assertEqual(document.tax_computation, expected.tax_computation)
+            self.assertEqual(document.chapter_via_deductions, expected.chapter_via_deductions)
+            self.assertEqual(document.quarterly_tds, expected.quarterly_tds)
+            self.assertEqual(document.salary, expected.salary)
+        self.assertEqual(form16_doc.tax_computation.total_tax_liability, Decimal('124800'))
+
+    def test_reprocess_all_writes_outputs(self):
+        """reprocess_all writes one JSON result per stored document."""
+        self._save_document('form16_a')
+        self._save_document('form16_b')
+        output_dir = self.temp_dir / 'output'
+
+        result = self.service.reprocess_all(self.temp_dir / 'artifacts', output_dir)
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['statistics']['successful_documents'], 2)
+        self.assertEqual(result['statistics']['extractor_runs'], 0)
+        self.assertTrue((output_dir / 'form16_a.json').exists())
+        self.assertTrue((output_dir / 'form16_b.json').exists())
+
+    def test_reprocess_all_without_artifacts(self):
+        """An empty artifact directory is reported as an error."""
+        result = self.service.reprocess_all(self.temp_dir / 'missing', self.temp_dir / 'output')
+
+        self.assertFalse(result['success'])
+        self.assertIn('No extraction artifacts', result['error'])
+
+
+class TestExtractorFingerprinter(unittest.TestCase):
+    """Test ExtractorFingerprinter functionality."""
+
+    def test_fingerprint_is_stable(self):
+        """Identical extractors produce identical fingerprints."""
+        fingerprinter = ExtractorFingerprinter()
+        extractor_a = EnhancedForm16Extractor(ProcessingLevel.SCORED)
+        extractor_b = EnhancedForm16Extractor(ProcessingLevel.SCORED)
+
+        for domain in DOMAIN_EXTRACTION_ORDER:
+            self.assertEqual(
+                fingerprinter.fingerprint(extractor_a.get_domain_extractor(domain)),
+                fingerprinter.fingerprint(extractor_b.get_domain_extractor(domain))
+            )
+
+    def test_fingerprint_tracks_configuration(self):
+        """Changing plain-data configuration changes the fingerprint."""
+        fingerprinter = ExtractorFingerprinter()
+        extractor = EnhancedForm16Extractor(ProcessingLevel.SCORED)
+        deductions = extractor.get_domain_extractor('deductions')
+
+        before = fingerprinter.fingerprint(deductions)
+        deductions.custom_threshold = 0.42
+        after = fingerprinter.fingerprint(deductions)
+
+        self.assertNotEqual(before, after)
+
+    def test_fingerprint_tracks_imported_helpers(self):
+        """Editing a helper module an extractor imports changes its fingerprint."""
+        extractor = EnhancedForm16Extractor(ProcessingLevel.SCORED)
+        helper = 'form16x.form16_parser.utils.table_utils'
+
+        for domain in ('employee', 'tds'):
+            component = extractor.get_domain_extractor(domain)
+            before = ExtractorFingerprinter().fingerprint(component)
+            edited = ExtractorFingerprinter()
+            edited._module_hashes[helper] = 'edited'
+
+            self.assertNotEqual(before, edited.fingerprint(component), domain)
+
+
+if __name__ == '__main__':
+    unittest.main()
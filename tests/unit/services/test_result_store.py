@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Tests for the Result Store
+==========================
+
+Test coverage for normalized storage, replacing re-stored files, lookups
+by PAN, TAN, assessment year and certificate, and consolidating stored
+documents without re-extraction.
+"""
+
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import patch
+
+from form16x.form16_parser.models.form16_models import Form16Document, TaxDeductionQuarterly
+from form16x.form16_parser.services.consolidation_service import ConsolidationService
+from form16x.form16_parser.services.result_store import ResultStore
+
+
+def _document(pan: str, tan: str, employer: str, gross: str, certificate: str) -> Form16Document:
+    document = Form16Document()
+    document.metadata.assessment_year = '2024-25'
+    document.metadata.certificate_number = certificate
+    document.employee.name = 'Asha Rao'
+    document.employee.pan = pan
+    document.employer.name = employer
+    document.employer.tan = tan
+    document.salary.gross_salary = Decimal(gross)
+    document.tax_computation.total_tds = Decimal('50000.25')
+    document.quarterly_tds = [
+        TaxDeductionQuarterly(quarter=f'Q{quarter}', tax_deducted=Decimal('12500.0625'))
+        for quarter in range(1, 5)
+    ]
+    return document
+
+
+class TestResultStore(unittest.TestCase):
+    """Test ResultStore."""
+
+    def setUp(self):
+        """Store two employers' Form16s for one employee and one for another."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.files = {}
+        for name in ('acme.pdf', 'globex.pdf', 'other.pdf'):
+            self.files[name] = self.temp_dir / name
+            self.files[name].write_bytes(b'%PDF-1.4 ' + name.encode())
+
+        self.store = ResultStore(self.temp_dir / 'results.db')
+        self.store.add_document(_document('ABCDE1234F', 'MUMA12345B', 'Acme', '1200000.50', 'CERT1'),
+                                self.files['acme.pdf'])
+        self.store.add_document(_document('ABCDE1234F', 'DELG54321C', 'Globex', '800000', 'CERT2'),
+                                self.files['globex.pdf'])
+        self.store.add_document(_document('ZYXWV9876K', 'MUMA12345B', 'Acme', '650000', 'CERT3'),
+                                self.files['other.pdf'])
+
+    def tearDown(self):
+        """Remove temporary files."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_lookups(self):
+        """Documents are found by PAN, TAN, assessment year and certificate."""
+        by_pan = self.store.find(pan='abcde1234f ')
+        by_tan = self.store.find(tan='MUMA12345B', assessment_year='2024-25')
+
+        self.assertEqual([document.employer_name for document in by_pan], ['Globex', 'Acme'])
+        self.assertEqual(sorted(document.employee_pan for document in by_tan), ['ABCDE1234F', 'ZYXWV9876K'])
+        self.assertEqual(self.store.find(certificate_number='CERT3')[0].employee_pan, 'ZYXWV9876K')
+        self.assertEqual(self.store.find(assessment_year='2023-24'), [])
+        self.assertEqual(by_pan[1].gross_salary, Decimal('1200000.50'))
+
+    def test_lookups_use_indexes(self):
+        """PAN and TAN lookups are index searches, not table scans."""
+        with sqlite3.connect(str(self.store.db_path)) as connection:
+            plan = connection.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM documents WHERE employee_pan = ? AND assessment_year = ?",
+                ('ABCDE1234F', '2024-25')
+            ).fetchall()
+
+        detail = ' '.join(str(row[-1]) for row in plan)
+        self.assertTrue(detail.startswith('SEARCH'), detail)
+        self.assertIn('INDEX documents_pan', detail)
+
+    def test_restoring_file_replaces_rows(self):
+        """Storing a file again replaces its document and child rows."""
+        self.store.add_document(_document('ABCDE1234F', 'MUMA12345B', 'Acme', '1300000', 'CERT1'),
+                                self.files['acme.pdf'])
+
+        with sqlite3.connect(str(self.store.db_path)) as connection:
+            quarters = connection.execute("SELECT COUNT(*) FROM quarterly_tds").fetchone()[0]
+
+        self.assertEqual(self.store.stats()['documents'], 3)
+        self.assertEqual(quarters, 12)
+        self.assertEqual(self.store.find(certificate_number='CERT1')[0].gross_salary, Decimal('1300000'))
+
+    def test_load_round_trips_document(self):
+        """A stored document is rebuilt with exact amounts."""
+        document_id = self.store.find(certificate_number='CERT2')[0].id
+
+        document = self.store.load(document_id)
+
+        self.assertEqual(document.employer.tan, 'DELG54321C')
+        self.assertEqual(document.quarterly_tds[3].tax_deducted, Decimal('12500.0625'))
+        with self.assertRaises(KeyError):
+            self.store.load(999)
+
+    def test_consolidate_from_store(self):
+        """An employee's stored Form16s are consolidated without extracting any PDF."""
+        service = ConsolidationService()
+        with patch.object(service.pdf_processor, 'extract_tables', side_effect=AssertionError('re-extracted')):
+            result = service.consolidate_from_store(self.store.db_path, pan='ABCDE1234F',
+                                                    assessment_year='2024-25')
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['employers_count'], 2)
+        self.assertEqual(result['consolidated_data']['consolidated_salary']['gross_salary'], 2000000.50)
+        self.assertEqual(result['consolidated_data']['consolidated_tds'], 100000.50)
+
+    def test_consolidate_files_reuses_stored_results(self):
+        """PDFs already in the store are read from it rather than extracted."""
+        service = ConsolidationService()
+        with patch.object(service.pdf_processor, 'extract_tables', side_effect=AssertionError('re-extracted')):
+            result = service.consolidate_form16_files(
+                [self.files['acme.pdf'], self.files['globex.pdf']],
+                self.temp_dir / 'consolidated.json',
+                verbose=True,
+                result_store=self.store.db_path
+            )
+
+        self.assertTrue(result['success'], result.get('error'))
+        self.assertEqual([employer['name'] for employer in result['consolidated_data']['employers']],
+                         ['Acme', 'Globex'])
+
+
+if __name__ == '__main__':
+    unittest.main()
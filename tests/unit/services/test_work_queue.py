@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for the Shared Work Queue
+===============================
+
+Test coverage for idempotent enqueueing, leases, heartbeats, reclaiming
+expired leases, progress reporting and several worker processes sharing
+one queue.
+"""
+
+import multiprocessing
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from form16x.form16_parser.services.work_queue import QueueWorker, WorkQueue
+
+
+def _write_output(pdf_file: Path, output_dir: Path) -> dict:
+    time.sleep(0.02)
+    output_file = output_dir / (pdf_file.stem + '.json')
+    output_file.write_text('{}')
+    return {'file_name': pdf_file.name, 'success': True, 'output_file': str(output_file),
+            'processing_time': 0.02, 'error_message': None}
+
+
+def _run_worker(db_path: str, output_dir: str) -> None:
+    queue = WorkQueue(Path(db_path), lease_seconds=30)
+    QueueWorker(queue, lambda pdf_file: _write_output(pdf_file, Path(output_dir)), idle_poll=0.05).run()
+
+
+class TestWorkQueue(unittest.TestCase):
+    """Test WorkQueue."""
+
+    def setUp(self):
+        """Create a queue with three documents."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.files = []
+        for name in ('a.pdf', 'b.pdf', 'c.pdf'):
+            path = self.temp_dir / name
+            path.write_bytes(b'%PDF-1.4')
+            self.files.append(path)
+        self.queue = WorkQueue(self.temp_dir / 'queue.db', lease_seconds=30)
+        self.queue.enqueue(self.files)
+
+    def tearDown(self):
+        """Remove temporary files."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_enqueue_is_idempotent(self):
+        """Enqueueing the same directory again adds nothing."""
+        self.assertEqual(self.queue.enqueue(self.files), 0)
+        self.assertEqual(self.queue.progress()['total'], 3)
+
+    def test_claims_are_exclusive(self):
+        """Each document is leased to one worker at a time."""
+        claimed = [self.queue.claim(f"worker-{i}") for i in range(4)]
+
+        self.assertEqual(sorted(job.path.name for job in claimed[:3]), ['a.pdf', 'b.pdf', 'c.pdf'])
+        self.assertIsNone(claimed[3])
+        self.assertEqual(self.queue.progress()['running'], 3)
+
+    def test_expired_lease_is_reclaimed(self):
+        """A document whose worker stopped heartbeating is retried by another."""
+        queue = WorkQueue(self.temp_dir / 'queue.db', lease_seconds=0.05)
+        stalled = queue.claim('stalled')
+        time.sleep(0.1)
+
+        retried = queue.claim('healthy')
+
+        self.assertEqual(retried.path, stalled.path)
+        self.assertEqual(retried.attempt, 2)
+        self.assertFalse(queue.heartbeat(stalled, 'stalled'))
+        self.assertTrue(queue.heartbeat(retried, 'healthy'))
+
+    def test_completion_is_idempotent(self):
+        """A document finished by two workers is counted once and never failed afterwards."""
+        queue = WorkQueue(self.temp_dir / 'queue.db', lease_seconds=0.05)
+        first = queue.claim('first')
+        time.sleep(0.1)
+        second = queue.claim('second')
+
+        queue.complete(second, 'second', 'out.json', 1.0)
+        queue.complete(first, 'first', 'out.json', 1.0)
+        queue.fail(first, 'first', 'late failure')
+
+        progress = queue.progress()
+        self.assertEqual((progress['done'], progress['failed']), (1, 0))
+
+    def test_repeatedly_expiring_document_fails(self):
+        """After max_attempts expired leases the document is failed instead of retried."""
+        queue = WorkQueue(self.temp_dir / 'queue.db', lease_seconds=0.01, max_attempts=2)
+        for _ in range(2):
+            while queue.claim('crashing').path.name != 'a.pdf':
+                pass
+            time.sleep(0.03)
+
+        queue.claim('next')
+
+        failures = queue.progress()['recent_failures']
+        self.assertEqual([Path(failure['path']).name for failure in failures], ['a.pdf'])
+        self.assertIn('Lease expired 2 times', failures[0]['error'])
+
+    def test_worker_processes_share_queue(self):
+        """Several processes drain the queue with every document done exactly once."""
+        files = []
+        for index in range(30):
+            path = self.temp_dir / f"doc{index:02d}.pdf"
+            path.write_bytes(b'%PDF-1.4')
+            files.append(path)
+        self.queue.enqueue(files)
+        output_dir = self.temp_dir / 'out'
+        output_dir.mkdir()
+
+        context = multiprocessing.get_context('spawn')
+        processes = [
+            context.Process(target=_run_worker, args=(str(self.temp_dir / 'queue.db'), str(output_dir)))
+            for _ in range(3)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(120)
+
+        progress = self.queue.progress()
+        self.assertEqual(progress['done'], 33)
+        self.assertEqual(progress['pending'] + progress['running'] + progress['failed'], 0)
+        self.assertEqual(sum(worker['completed'] for worker in progress['workers']), 33)
+        self.assertEqual(len(list(output_dir.glob('*.json'))), 33)
+        self.assertGreater(progress['documents_per_minute'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
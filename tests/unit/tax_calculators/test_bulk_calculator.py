@@ -0,0 +1,224 @@
+"""
+Unit tests for the bulk tax calculator.
+"""
+
+import json
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from form16x.form16_parser.tax_calculators.bulk_calculator import BulkTaxCalculator
+from form16x.form16_parser.tax_calculators.interfaces.calculator_interface import (
+    AgeCategory, TaxCalculationInput, TaxRegimeType
+)
+from form16x.form16_parser.tax_calculators.main_calculator import MultiYearTaxCalculator
+from form16x.form16_parser.tax_calculators.rules.json_rule_provider import JsonTaxRuleProvider
+
+
+def _regime_config(regime_type, slabs, standard_deduction, rebate, surcharge):
+    return {
+        "assessment_year": "2024-25",
+        "regime_type": regime_type,
+        "basic_settings": {
+            "standard_deduction": standard_deduction,
+            "basic_exemption_limits": {age: slab_list[0]["to"] for age, slab_list in slabs.items()}
+        },
+        "tax_slabs": slabs,
+        "surcharge": surcharge,
+        "rebate_87a": {"income_limit": rebate[0], "max_rebate": rebate[1]},
+        "cess": {"health_education_cess_rate": 4.0},
+        "deduction_limits": {"section_80c": 150000, "section_80d": 25000, "section_80ccd_1b": 50000},
+        "allowed_deductions": ["section_80c", "section_80d", "section_80ccd_1b"],
+        "allowed_exemptions": ["hra", "lta"]
+    }
+
+
+def _old_slabs(exemption):
+    return [
+        {"from": 0, "to": exemption, "rate": 0.0},
+        {"from": exemption, "to": 500000, "rate": 5.0},
+        {"from": 500000, "to": 1000000, "rate": 20.0},
+        {"from": 1000000, "to": None, "rate": 30.0}
+    ]
+
+
+NEW_SLABS = [
+    {"from": 0, "to": 300000, "rate": 0.0},
+    {"from": 300000, "to": 700000, "rate": 5.0},
+    {"from": 700000, "to": 1000000, "rate": 10.0},
+    {"from": 1000000, "to": 1200000, "rate": 15.0},
+    {"from": 1200000, "to": 1500000, "rate": 20.0},
+    {"from": 1500000, "to": None, "rate": 30.0}
+]
+
+
+@pytest.fixture
+def rule_provider(tmp_path):
+    """Rule files for AY 2024-25 (both regimes) and AY 2020-21 (old regime only)."""
+    old_config = _regime_config(
+        "old",
+        {"below_60": _old_slabs(250000), "senior_60_to_80": _old_slabs(300000),
+         "super_senior_above_80": _old_slabs(500000)},
+        50000, (500000, 12500),
+        {"threshold_1": 5000000, "rate_1": 10.0, "threshold_2": 10000000, "rate_2": 15.0,
+         "threshold_3": 20000000, "rate_3": 25.0, "threshold_4": 50000000, "rate_4": 37.0}
+    )
+    new_config = _regime_config(
+        "new",
+        {age: NEW_SLABS for age in ("below_60", "senior_60_to_80", "super_senior_above_80")},
+        50000, (700000, 25000),
+        {"threshold_1": 5000000, "rate_1": 10.0, "threshold_2": 10000000, "rate_2": 15.0,
+         "threshold_3": 20000000, "rate_3": 25.0}
+    )
+
+    for year, configs in (("ay_2024_25", (old_config, new_config)), ("ay_2020_21", (dict(old_config, assessment_year="2020-21"),))):
+        year_dir = tmp_path / year
+        year_dir.mkdir()
+        for config in configs:
+            (year_dir / f"{config['regime_type']}_regime.json").write_text(json.dumps(config))
+
+    return JsonTaxRuleProvider(config_base_path=str(tmp_path))
+
+
+class TestBulkTaxCalculator:
+    """Test cases for BulkTaxCalculator."""
+
+    GROSS_SALARIES = [
+        0, 300000, 550000.50, 760000, 1234567.89, 2500000,
+        5000000, 5040000, 9999999.99, 10050000, 20080000, 50100000, 65000000
+    ]
+
+    @pytest.fixture(autouse=True)
+    def setup_calculators(self, rule_provider):
+        """Set up the bulk calculator and the scalar reference calculator."""
+        self.rule_provider = rule_provider
+        self.calculator = BulkTaxCalculator(rule_provider)
+        self.reference = MultiYearTaxCalculator(rule_provider)
+
+    def _reference_tax(self, row, regime_type):
+        return self.reference.calculate_tax(TaxCalculationInput(
+            assessment_year=row['assessment_year'],
+            regime_type=regime_type,
+            age_category=AgeCategory(row['age_category']),
+            gross_salary=Decimal(str(row['gross_salary'])),
+            bank_interest_income=Decimal(str(row['bank_interest'])),
+            section_80c=Decimal(str(row['section_80c'])),
+            hra_exemption=Decimal(str(row['hra_exemption']))
+        ))
+
+    def test_matches_scalar_calculator(self):
+        """Every component matches MultiYearTaxCalculator, including surcharge and marginal relief."""
+        records = pd.DataFrame([
+            {
+                'assessment_year': '2024-25',
+                'age_category': age.value,
+                'gross_salary': gross,
+                'bank_interest': 12345.67 if index % 2 else 0,
+                'section_80c': 150000 if index % 3 else 0,
+                'hra_exemption': 96000.5 if index % 4 else 0,
+            }
+            for index, gross in enumerate(self.GROSS_SALARIES)
+            for age in AgeCategory
+        ])
+
+        results = self.calculator.calculate(records)
+
+        assert results['error'].isna().all()
+        for _, row in results.iterrows():
+            for regime_type in (TaxRegimeType.OLD, TaxRegimeType.NEW):
+                expected = self._reference_tax(row, regime_type)
+                prefix = regime_type.value
+                assert row[f'{prefix}_taxable_income'] == pytest.approx(float(expected.taxable_income))
+                assert row[f'{prefix}_tax_before_rebate'] == float(expected.tax_before_rebate)
+                assert row[f'{prefix}_rebate_87a'] == float(expected.rebate_under_87a)
+                assert row[f'{prefix}_surcharge'] == pytest.approx(float(expected.surcharge), abs=1e-6)
+                assert row[f'{prefix}_cess'] == float(expected.health_education_cess)
+                assert row[f'{prefix}_tax'] == pytest.approx(float(expected.total_tax_liability), abs=1e-6)
+
+    def test_recommendation_and_savings(self):
+        """The cheaper regime is recommended and the difference reported."""
+        records = pd.DataFrame({
+            'gross_salary': [700000, 1500000],
+            'section_80c': [0, 150000],
+            'hra_exemption': [0, 400000],
+            'tds_paid': [0, 100000],
+        })
+
+        results = self.calculator.calculate(records, assessment_year='2024-25')
+
+        assert results['new_tax'].iloc[0] == 0
+        assert results['recommended_regime'].tolist() == ['new', 'old']
+        assert results['savings'].iloc[1] == pytest.approx(results['new_tax'].iloc[1] - results['old_tax'].iloc[1])
+        assert results['balance'].iloc[1] == pytest.approx(100000 - results['old_tax'].iloc[1])
+
+    def test_requested_regime_and_age_from_years(self):
+        """Rows get only their requested regime; numeric ages map to age categories."""
+        records = pd.DataFrame({
+            'assessment_year': ['2024-25', '2024-25', '2024-25'],
+            'regime': ['old', 'New', 'both'],
+            'age': [45, 70, 85],
+            'gross_salary': [800000, 800000, 800000],
+        })
+
+        results = self.calculator.calculate(records)
+
+        assert np.isnan(results['new_tax'].iloc[0]) and results['recommended_regime'].iloc[0] == 'old'
+        assert np.isnan(results['old_tax'].iloc[1]) and results['recommended_regime'].iloc[1] == 'new'
+        super_senior = self._reference_tax(
+            {'assessment_year': '2024-25', 'age_category': 'super_senior_above_80', 'gross_salary': 800000,
+             'bank_interest': 0, 'section_80c': 0, 'hra_exemption': 0},
+            TaxRegimeType.OLD
+        )
+        assert results['old_tax'].iloc[2] == float(super_senior.total_tax_liability)
+
+    def test_unsupported_year_and_regime(self):
+        """Unsupported rules fail only the affected rows; 'both' falls back to the supported regime."""
+        records = pd.DataFrame({
+            'assessment_year': ['2024-25', '2019-20', '2020-21', '2020-21'],
+            'regime': ['both', 'both', 'new', 'both'],
+            'gross_salary': [900000, 900000, 900000, 900000],
+        })
+
+        results = self.calculator.calculate(records)
+
+        assert results['error'].iloc[0] is None
+        assert 'not supported' in results['error'].iloc[1]
+        assert results['error'].iloc[2] == "Regime new not supported for year 2020-21"
+        assert results['error'].iloc[3] is None
+        assert results['recommended_regime'].iloc[3] == 'old'
+
+    def test_negative_salary_rejected(self):
+        """Rows failing scalar input validation are reported, not calculated."""
+        records = pd.DataFrame({'assessment_year': ['2024-25'], 'gross_salary': [-5]})
+
+        results = self.calculator.calculate(records)
+
+        assert results['error'].iloc[0] == "Gross salary cannot be negative"
+        assert np.isnan(results['old_tax'].iloc[0])
+
+    def test_missing_columns(self):
+        """Gross salary and an assessment year are required."""
+        with pytest.raises(ValueError):
+            self.calculator.calculate(pd.DataFrame({'assessment_year': ['2024-25']}))
+        with pytest.raises(ValueError):
+            self.calculator.calculate(pd.DataFrame({'gross_salary': [100000]}))
+
+    def test_calculate_csv_in_chunks(self, tmp_path):
+        """CSV input is streamed chunk by chunk into one result file."""
+        records = pd.DataFrame({
+            'employee_id': range(25),
+            'assessment_year': ['2024-25'] * 25,
+            'gross_salary': [400000 + 100000 * index for index in range(25)],
+        })
+        input_file = tmp_path / 'employees.csv'
+        records.to_csv(input_file, index=False)
+
+        stats = self.calculator.calculate_csv(input_file, tmp_path / 'out' / 'tax.csv', chunk_size=10)
+
+        written = pd.read_csv(tmp_path / 'out' / 'tax.csv')
+        assert stats['rows'] == 25 and stats['chunks'] == 3 and stats['errors'] == 0
+        assert written['employee_id'].tolist() == list(range(25))
+        assert written['new_tax'].tolist() == self.calculator.calculate(records)['new_tax'].tolist()
+        assert sum(stats['recommended'].values()) == 25
@@ -0,0 +1,159 @@
+"""
+Unit tests for memoized tax calculation results.
+"""
+
+import json
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from form16x.form16_parser.tax_calculators.comprehensive_calculator import (
+    ComprehensiveTaxCalculationInput, ComprehensiveTaxCalculator
+)
+from form16x.form16_parser.tax_calculators.interfaces.calculator_interface import (
+    TaxCalculationInput, TaxRegimeType
+)
+from form16x.form16_parser.tax_calculators.main_calculator import MultiYearTaxCalculator
+from form16x.form16_parser.tax_calculators.result_cache import TaxResultCache, canonical_key
+from form16x.form16_parser.tax_calculators.rules.json_rule_provider import JsonTaxRuleProvider
+
+
+SLABS = [
+    {"from": 0, "to": 300000, "rate": 0.0},
+    {"from": 300000, "to": 700000, "rate": 5.0},
+    {"from": 700000, "to": None, "rate": 20.0}
+]
+
+
+@pytest.fixture
+def rule_provider(tmp_path):
+    """Rule files for AY 2024-25, both regimes sharing one slab table."""
+    year_dir = tmp_path / "ay_2024_25"
+    year_dir.mkdir()
+    for regime_type in ("old", "new"):
+        (year_dir / f"{regime_type}_regime.json").write_text(json.dumps({
+            "assessment_year": "2024-25",
+            "regime_type": regime_type,
+            "basic_settings": {"standard_deduction": 50000, "basic_exemption_limits": {"below_60": 300000}},
+            "tax_slabs": {"below_60": SLABS},
+            "surcharge": {"threshold_1": 5000000, "rate_1": 10.0, "threshold_2": 10000000, "rate_2": 15.0},
+            "rebate_87a": {"income_limit": 500000, "max_rebate": 12500},
+            "cess": {"health_education_cess_rate": 4.0},
+            "deduction_limits": {},
+            "allowed_deductions": ["section_80c"],
+            "allowed_exemptions": ["hra"]
+        }))
+    return JsonTaxRuleProvider(config_base_path=str(tmp_path))
+
+
+def _input(gross="1200000", **overrides):
+    return TaxCalculationInput(assessment_year="2024-25", regime_type=TaxRegimeType.OLD,
+                               gross_salary=Decimal(gross), **overrides)
+
+
+class TestCanonicalKey:
+    """Test cases for canonical_key."""
+
+    def test_equal_amounts_share_a_key(self):
+        """Decimal scale, ints and dict order do not change the key."""
+        first = _input("1200000", other_deductions={"80G": Decimal("5000"), "80E": Decimal("0.00")})
+        second = _input("1200000.00", other_deductions={"80E": Decimal("0"), "80G": 5000})
+
+        assert canonical_key(first) == canonical_key(second)
+        assert hash(canonical_key(first)) == hash(canonical_key(second))
+
+    def test_different_inputs_differ(self):
+        """Amounts, regimes and input types are all part of the key."""
+        base = _input()
+
+        assert canonical_key(base) != canonical_key(_input("1200000.01"))
+        assert canonical_key(base) != canonical_key(
+            TaxCalculationInput(assessment_year="2024-25", regime_type=TaxRegimeType.NEW,
+                                gross_salary=Decimal("1200000")))
+        assert canonical_key(base) != canonical_key(ComprehensiveTaxCalculationInput(
+            assessment_year="2024-25", regime_type=TaxRegimeType.OLD, gross_salary=Decimal("1200000")))
+
+
+class TestTaxResultCache:
+    """Test cases for TaxResultCache."""
+
+    def test_lru_eviction_and_stats(self):
+        """The least recently used entry is evicted and lookups are counted."""
+        cache = TaxResultCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert cache.stats() == {
+            'hits': 2, 'misses': 1, 'hit_rate': 2 / 3, 'evictions': 1,
+            'invalidations': 0, 'size': 2, 'maxsize': 2
+        }
+
+    def test_cached_results_are_copies(self):
+        """Changing a returned result does not change the cached one."""
+        cache = TaxResultCache()
+        cache.put("key", {"tax": [1]})
+        cache.get("key")["tax"].append(2)
+
+        assert cache.get("key") == {"tax": [1]}
+
+
+class TestCalculatorMemoization:
+    """Test cases for memoized calculators."""
+
+    def test_repeated_input_is_not_recalculated(self, rule_provider):
+        """An equal input is served from the cache with an equal result."""
+        calculator = MultiYearTaxCalculator(rule_provider)
+        first = calculator.calculate_tax(_input("1200000"))
+
+        with patch.object(calculator, '_calculate_tax', side_effect=AssertionError('recalculated')):
+            second = calculator.calculate_tax(_input("1200000.00"))
+
+        assert second.total_tax_liability == first.total_tax_liability
+        assert second is not first
+        assert calculator.cache_stats()['hits'] == 1
+        assert calculator.cache_stats()['misses'] == 1
+
+    def test_annotating_a_result_does_not_change_the_cache(self, rule_provider):
+        """Attributes set and warnings appended on a returned result stay out of the cache."""
+        calculator = MultiYearTaxCalculator(rule_provider)
+        first = calculator.calculate_tax(_input())
+        first.other_regime_tax = Decimal("1")
+        first.calculation_warnings = (first.calculation_warnings or []) + ["annotated"]
+        first.slab_calculations.clear()
+
+        second = calculator.calculate_tax(_input())
+
+        assert second.other_regime_tax is None
+        assert "annotated" not in (second.calculation_warnings or [])
+        assert second.slab_calculations
+
+    def test_refresh_rules_invalidates(self, rule_provider):
+        """Refreshing the provider's rules drops every cached result."""
+        calculator = ComprehensiveTaxCalculator(rule_provider)
+        input_data = ComprehensiveTaxCalculationInput(
+            assessment_year="2024-25", regime_type=TaxRegimeType.NEW, gross_salary=Decimal("900000"))
+        calculator.calculate_tax(input_data)
+        calculator.calculate_tax(input_data)
+
+        rule_provider.refresh_rules()
+        calculator.calculate_tax(input_data)
+
+        stats = calculator.cache_stats()
+        assert stats['comprehensive']['hits'] == 1
+        assert stats['comprehensive']['misses'] == 2
+        assert stats['comprehensive']['invalidations'] == 1
+        assert stats['base']['invalidations'] == 1
+
+    def test_cache_disabled(self, rule_provider):
+        """cache_size=0 calculates every call."""
+        calculator = MultiYearTaxCalculator(rule_provider, cache_size=0)
+        calculator.calculate_tax(_input())
+        calculator.calculate_tax(_input())
+
+        assert calculator.cache_stats()['size'] == 0
+        assert calculator.cache_stats()['hits'] == 0
@@ -0,0 +1,156 @@
+"""
+Unit tests for the compiled tax rule pack.
+"""
+
+import gc
+import json
+import shutil
+import time
+import weakref
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from form16x.form16_parser.tax_calculators.interfaces.calculator_interface import (
+    AgeCategory, TaxCalculationInput, TaxRegimeType
+)
+from form16x.form16_parser.tax_calculators.main_calculator import MultiYearTaxCalculator
+from form16x.form16_parser.tax_calculators.rules.json_rule_provider import JsonTaxRuleProvider
+from form16x.form16_parser.tax_calculators.rules.rule_pack import (
+    RulePackError, UnsupportedRegimeError, UnsupportedYearError, build_rule_pack, compile_rule_pack, load_rule_pack
+)
+from form16x.form16_parser.tax_calculators.rules.year_specific_rule_provider import YearSpecificTaxRuleProvider
+
+
+PACKAGE_RULES = Path(__file__).parents[3] / "form16x" / "form16_parser" / "config" / "tax_rules"
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    """A copy of the package rule files that tests may edit."""
+    target = tmp_path / "tax_rules"
+    shutil.copytree(PACKAGE_RULES, target, ignore=shutil.ignore_patterns("__pycache__", "*.py"))
+    return target
+
+
+def _edit(regime_file: Path, change) -> None:
+    config = json.loads(regime_file.read_text())
+    change(config)
+    regime_file.write_text(json.dumps(config, indent=2))
+
+
+def _tax(calculator, gross, regime_type=TaxRegimeType.NEW, assessment_year="2025-26"):
+    return calculator.calculate_tax(TaxCalculationInput(
+        assessment_year=assessment_year, regime_type=regime_type, gross_salary=Decimal(gross)
+    )).total_tax_liability
+
+
+class TestRulePack:
+    """Test cases for compiling and loading rule packs."""
+
+    def test_package_rules_compile(self):
+        """Shipped rules compile cleanly with Decimal slabs and settings ready."""
+        pack = compile_rule_pack(PACKAGE_RULES)
+
+        assert dict(pack.errors) == {}
+        assert pack.years() == ["2024-25", "2025-26"]
+        rules = pack.get("2024-25", TaxRegimeType.OLD)
+        assert rules.regime.get_tax_slabs(AgeCategory.SENIOR_60_TO_80)[0].to_amount == Decimal("300000")
+        assert rules.regime.get_regime_settings().surcharge_rate_4 == 37.0
+        assert rules.deduction_limits["section_80c"] == Decimal("150000")
+        assert pack.get("2025-26", TaxRegimeType.NEW).is_default
+
+    def test_rules_are_read_only(self):
+        """Compiled configurations cannot be modified."""
+        config = compile_rule_pack(PACKAGE_RULES).get("2024-25", TaxRegimeType.NEW).config
+
+        with pytest.raises(TypeError):
+            config["rebate_87a"]["max_rebate"] = 0
+        with pytest.raises(TypeError):
+            config["tax_slabs"]["below_60"][0]["rate"] = 50.0
+
+    def test_invalid_configuration_is_isolated(self, config_dir):
+        """A bad file fails only its own year and regime, naming the problem."""
+        _edit(config_dir / "ay_2025_26" / "new_regime.json",
+              lambda config: config["tax_slabs"]["below_60"][2].update({"from": 710000}))
+
+        pack = compile_rule_pack(config_dir)
+
+        with pytest.raises(RulePackError, match="below_60 slab 3 starts at 710000"):
+            pack.get("2025-26", TaxRegimeType.NEW)
+        assert pack.get("2025-26", TaxRegimeType.OLD).regime is not None
+        with pytest.raises(UnsupportedYearError):
+            pack.get("2019-20", TaxRegimeType.OLD)
+        (config_dir / "ay_2025_26" / "old_regime.json").unlink()
+        with pytest.raises(UnsupportedRegimeError):
+            compile_rule_pack(config_dir).get("2025-26", TaxRegimeType.OLD)
+
+    def test_pack_file_round_trip(self, tmp_path):
+        """A pack file gives the same rules and taxes as the configuration directory."""
+        pack_file = tmp_path / "tax_rules.pack"
+        build_rule_pack(PACKAGE_RULES, pack_file)
+
+        start_time = time.perf_counter()
+        loaded = load_rule_pack(pack_file)
+        elapsed = time.perf_counter() - start_time
+
+        assert loaded.years() == ["2024-25", "2025-26"]
+        assert elapsed < 0.5
+        from_file = MultiYearTaxCalculator(JsonTaxRuleProvider(str(pack_file)))
+        from_directory = MultiYearTaxCalculator(JsonTaxRuleProvider(str(PACKAGE_RULES)))
+        for gross in ("650000", "1450000", "7500000"):
+            for regime_type in (TaxRegimeType.OLD, TaxRegimeType.NEW):
+                assert _tax(from_file, gross, regime_type) == _tax(from_directory, gross, regime_type)
+
+    def test_build_rejects_invalid_rules(self, config_dir, tmp_path):
+        """Building a pack file fails on any invalid configuration."""
+        _edit(config_dir / "ay_2024_25" / "old_regime.json",
+              lambda config: config["surcharge"].update({"threshold_2": 4000000}))
+
+        with pytest.raises(RulePackError, match="threshold_2"):
+            build_rule_pack(config_dir, tmp_path / "tax_rules.pack")
+
+
+class TestRuleProviders:
+    """Test cases for providers reading the rule pack."""
+
+    def test_providers_share_one_pack(self):
+        """Every year's provider reads the same compiled rules."""
+        provider = YearSpecificTaxRuleProvider()
+
+        assert provider.get_tax_regime("2024-25", TaxRegimeType.OLD) is \
+            provider.get_tax_regime("2020-21", TaxRegimeType.OLD)
+        assert JsonTaxRuleProvider().rule_pack is provider._json_provider.rule_pack
+        assert provider.get_deduction_limits("2024-25", TaxRegimeType.OLD)["section_80ccd_1b"] == Decimal("50000")
+
+    def test_year_specific_rules_validate(self):
+        """Shipped rules satisfy the year providers' checks."""
+        provider = YearSpecificTaxRuleProvider()
+
+        for assessment_year in ("2024-25", "2025-26"):
+            assert provider._get_year_provider(assessment_year).validate_year_specific_rules() == []
+
+    def test_hot_reload_invalidates_results(self, config_dir):
+        """Edited rule files are picked up and cached results dropped."""
+        provider = JsonTaxRuleProvider(str(config_dir))
+        provider._rule_loader.check_interval = 0
+        calculator = MultiYearTaxCalculator(provider)
+        assert _tax(calculator, "1000000") == Decimal("0")
+
+        _edit(config_dir / "ay_2025_26" / "new_regime.json",
+              lambda config: config["rebate_87a"].update({"income_limit": 700000, "max_rebate": 25000}))
+
+        assert _tax(calculator, "1000000") == Decimal("44200")
+        assert calculator.cache_stats()['invalidations'] == 1
+
+    def test_provider_is_not_pinned(self):
+        """Providers are garbage collected once unused."""
+        provider = JsonTaxRuleProvider()
+        provider.get_rule_config("2024-25", TaxRegimeType.OLD)
+        reference = weakref.ref(provider)
+
+        del provider
+        gc.collect()
+
+        assert reference() is None
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Tests for Columnar Export
+=========================
+
+Test coverage for flattening Form16 documents into partitioned Parquet.
+"""
+
+import importlib.util
+import shutil
+import tempfile
+import unittest
+from decimal import Decimal
+from pathlib import Path
+
+import pandas as pd
+
+from form16x.form16_parser.extractors.enhanced_form16_extractor import (
+    EnhancedForm16Extractor, ProcessingLevel
+)
+from form16x.form16_parser.models.form16_models import (
+    Form16Document, TaxDeductionQuarterly, TaxRegime
+)
+
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+
+@unittest.skipUnless(PYARROW_AVAILABLE, "pyarrow not installed")
+class TestColumnarExporter(unittest.TestCase):
+    """Test ColumnarExporter functionality."""
+
+    def setUp(self):
+        """Set up a sample document and output directory."""
+        from form16x.form16_parser.utils.columnar_export import ColumnarExporter
+
+        self.ColumnarExporter = ColumnarExporter
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+        self.document = Form16Document()
+        self.document.metadata.assessment_year = '2024-25'
+        self.document.employer.tan = 'ABCD12345E'
+        self.document.employee.pan = 'ABCDE1234F'
+        self.document.salary.gross_salary = Decimal('1234567.89')
+        self.document.tax_computation.tax_regime = TaxRegime.NEW
+        self.document.quarterly_tds = [
+            TaxDeductionQuarterly(quarter='Q1', tax_deducted=Decimal('25000.10')),
+            TaxDeductionQuarterly(quarter='Q2', tax_deducted=Decimal('25000.20')),
+        ]
+        self.document.extraction_confidence = {'salary': 0.9}
+
+    def tearDown(self):
+        """Remove temporary files."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _read(self, table_name):
+        import pyarrow.dataset as ds
+        return ds.dataset(self.temp_dir / table_name, partitioning='hive').to_table()
+
+    def test_flatten_sections(self):
+        """Documents flatten into one row per section and one row per quarter."""
+        exporter = self.ColumnarExporter(self.temp_dir)
+
+        rows = exporter.flatten(self.document, 'doc1', '/input/doc1.pdf')
+
+        self.assertEqual(rows['documents'][0]['employee_pan'], 'ABCDE1234F')
+        self.assertEqual(rows['salary'][0]['gross_salary'], Decimal('1234567.89'))
+        self.assertEqual(rows['tax_computation'][0]['tax_regime'], 'new')
+        self.assertEqual(len(rows['quarterly_tds']), 2)
+        self.assertEqual(rows['extraction_confidence'][0]['field'], 'salary')
+
+    def test_decimals_are_exact_and_partitioned(self):
+        """Decimal amounts round-trip exactly and rows are partitioned by AY and TAN."""
+        with self.ColumnarExporter(self.temp_dir) as exporter:
+            exporter.add_document(self.document, 'doc1')
+
+        salary = self._read('salary').to_pylist()
+        self.assertEqual(salary[0]['gross_salary'], Decimal('1234567.89'))
+        self.assertTrue(
+            (self.temp_dir / 'salary' / 'assessment_year=2024-25' / 'employer_tan=ABCD12345E').is_dir()
+        )
+
+        tds = self._read('quarterly_tds').to_pylist()
+        self.assertEqual(sum(row['tax_deducted'] for row in tds), Decimal('50000.30'))
+
+    def test_incremental_flushes(self):
+        """Documents are flushed every batch_size documents."""
+        exporter = self.ColumnarExporter(self.temp_dir, batch_size=2)
+        for index in range(5):
+            exporter.add_document(Form16Document(), f'doc{index}')
+        stats = exporter.close()
+
+        self.assertEqual(stats['documents_written'], 5)
+        self.assertEqual(stats['flushes'], 3)
+        self.assertEqual(self._read('documents').num_rows, 5)
+        self.assertIn('unknown', {row['assessment_year'] for row in self._read('documents').to_pylist()})
+
+    def test_extracted_document_with_float_amounts(self):
+        """Float amounts left by the extractors are exported as exact decimals."""
+        document = EnhancedForm16Extractor(ProcessingLevel.ENHANCED).extract_all([pd.DataFrame([
+            ['Gross Salary', ''],
+            ['(a) Salary as per provisions contained in section 17(1)', '1100000.00'],
+            ['(d) Total', '1100000.00'],
+            ['Standard deduction under section 16(ia)', '50000.00'],
+            ['Income chargeable under the head "Salaries"', '1050000.00'],
+        ])])
+        document.salary.perquisites_value = 0.1
+        self.assertIsInstance(document.salary.other_allowances, float)
+
+        with self.ColumnarExporter(self.temp_dir) as exporter:
+            exporter.add_document(document, 'extracted')
+
+        salary = self._read('salary').to_pylist()[0]
+        self.assertEqual(salary['gross_salary'], Decimal('1100000.0000'))
+        self.assertEqual(salary['other_allowances'], Decimal('0'))
+        self.assertEqual(salary['perquisites_value'], Decimal('0.1'))
+
+    def test_bad_rows_are_dropped(self):
+        """A row Arrow rejects is dropped and later documents are still written."""
+        exporter = self.ColumnarExporter(self.temp_dir, batch_size=1)
+        overflow = Form16Document()
+        overflow.salary.gross_salary = Decimal('1e20')
+        exporter.add_document(overflow, 'overflow')
+        exporter.add_document(self.document, 'doc1')
+        stats = exporter.close()
+
+        self.assertEqual(stats['documents_written'], 2)
+        self.assertEqual(stats['rows_dropped'], {'salary': 1})
+        self.assertEqual([row['document_id'] for row in self._read('salary').to_pylist()], ['doc1'])
+        self.assertEqual(self._read('documents').num_rows, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
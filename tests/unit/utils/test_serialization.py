@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for JSON Serialization
+============================
+
+Test coverage for the pluggable JSON serializer and compressed output.
+"""
+
+import importlib.util
+import json
+import shutil
+import tempfile
+import unittest
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+from form16x.form16_parser.models.form16_models import TaxRegime
+from form16x.form16_parser.utils.serialization import (
+    MSGSPEC_AVAILABLE, ORJSON_AVAILABLE, JsonSerializer, open_input, resolve_backend
+)
+
+ZSTD_AVAILABLE = importlib.util.find_spec('zstandard') is not None
+
+SAMPLE = {
+    'employee': {'name': 'RAMÉSH KUMAR', 'pan': 'ABCDE1234F'},
+    'salary': {'gross_salary': Decimal('1234567.89'), 'basic_salary': None},
+    'issued_on': date(2024, 6, 15),
+    'regime': TaxRegime.NEW,
+    'quarters': [{'quarter': 'Q1', 'tax_deducted': Decimal('25000.10')}],
+}
+
+# What the previous json.dump(..., default=str) output decoded to
+EXPECTED = json.loads(json.dumps(SAMPLE, ensure_ascii=False, default=str))
+EXPECTED['regime'] = 'new'
+
+
+class TestJsonSerializer(unittest.TestCase):
+    """Test JsonSerializer functionality."""
+
+    def setUp(self):
+        """Set up temporary output directory."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        """Remove temporary files."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _available_backends(self):
+        backends = ['json']
+        if ORJSON_AVAILABLE:
+            backends.append('orjson')
+        if MSGSPEC_AVAILABLE:
+            backends.append('msgspec')
+        return backends
+
+    def test_backends_produce_identical_values(self):
+        """Every backend writes Decimals as exact strings, like the old default=str."""
+        for backend in self._available_backends():
+            with self.subTest(backend=backend):
+                encoded = JsonSerializer(backend=backend).dumps(SAMPLE)
+                self.assertEqual(json.loads(encoded), EXPECTED)
+                self.assertNotIn(b'\n', encoded)
+
+    def test_pretty_output_is_indented(self):
+        """Pretty mode indents by two spaces."""
+        for backend in self._available_backends():
+            with self.subTest(backend=backend):
+                encoded = JsonSerializer(backend=backend, pretty=True).dumps(SAMPLE)
+                self.assertIn(b'\n  "employee"', encoded)
+                self.assertEqual(json.loads(encoded), EXPECTED)
+
+    def test_stdlib_streaming_dump(self):
+        """The stdlib backend streams large documents to disk in chunks."""
+        document = {'rows': [{'index': i, 'amount': Decimal(i)} for i in range(20000)]}
+
+        path = JsonSerializer(backend='json').dump(document, self.temp_dir / 'large.json')
+
+        with open_input(path) as stream:
+            loaded = json.load(stream)
+        self.assertEqual(len(loaded['rows']), 20000)
+        self.assertEqual(loaded['rows'][-1]['amount'], '19999')
+
+    def test_gzip_output(self):
+        """Gzip output gets a .gz suffix and round-trips."""
+        path = JsonSerializer(compression='gzip').dump(SAMPLE, self.temp_dir / 'doc.json')
+
+        self.assertEqual(path.name, 'doc.json.gz')
+        with open_input(path) as stream:
+            self.assertEqual(json.load(stream), EXPECTED)
+
+    @unittest.skipUnless(ZSTD_AVAILABLE, "zstandard not installed")
+    def test_zstd_output(self):
+        """Zstd output gets a .zst suffix and round-trips."""
+        path = JsonSerializer(compression='zstd').dump(SAMPLE, self.temp_dir / 'doc.json')
+
+        self.assertEqual(path.name, 'doc.json.zst')
+        with open_input(path) as stream:
+            self.assertEqual(json.loads(stream.read()), EXPECTED)
+
+    def test_invalid_options(self):
+        """Unknown backends and compressions are rejected."""
+        with self.assertRaises(ValueError):
+            resolve_backend('yaml')
+        with self.assertRaises(ValueError):
+            JsonSerializer(compression='bz2')
+
+
+if __name__ == '__main__':
+    unittest.main()
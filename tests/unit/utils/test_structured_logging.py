@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Tests for Structured Logging
+============================
+
+Test coverage for document correlation ids, sampling, JSON records and
+the deferred queue handler used by queue mode logging.
+"""
+
+import io
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import unittest
+
+from form16x.form16_parser.utils.structured_logging import (
+    CorrelationFilter,
+    DeferredQueueHandler,
+    JsonFormatter,
+    NO_DOCUMENT,
+    SamplingFilter,
+    current_document_id,
+    document_context
+)
+
+
+def _record(name='form16x.test', level=logging.DEBUG, msg='value %s', args=('x',)):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+class TestDocumentContext(unittest.TestCase):
+    """Test document correlation ids."""
+
+    def test_context_sets_and_restores_id(self):
+        """The id is set inside the block and restored afterwards."""
+        self.assertIsNone(current_document_id())
+        with document_context('a.pdf'):
+            with document_context('b.pdf'):
+                self.assertEqual(current_document_id(), 'b.pdf')
+            self.assertEqual(current_document_id(), 'a.pdf')
+        self.assertIsNone(current_document_id())
+
+    def test_context_is_per_thread(self):
+        """Another thread does not see this thread's document."""
+        seen = []
+        with document_context('main.pdf'):
+            thread = threading.Thread(target=lambda: seen.append(current_document_id()))
+            thread.start()
+            thread.join()
+
+        self.assertEqual(seen, [None])
+
+    def test_correlation_filter_tags_records(self):
+        """Records get the current document id, or a placeholder outside a document."""
+        correlation = CorrelationFilter()
+        inside, outside = _record(), _record()
+
+        with document_context('form16.pdf'):
+            self.assertTrue(correlation.filter(inside))
+        correlation.filter(outside)
+
+        self.assertEqual(inside.document_id, 'form16.pdf')
+        self.assertEqual(outside.document_id, NO_DOCUMENT)
+
+
+class TestSamplingFilter(unittest.TestCase):
+    """Test per-logger sampling."""
+
+    def test_keeps_one_in_n_for_configured_loggers(self):
+        """Configured loggers and their children are sampled; others pass."""
+        sampling = SamplingFilter({'form16x.extractors': 3})
+
+        kept = [sampling.filter(_record('form16x.extractors.identity')) for _ in range(9)]
+        others = [sampling.filter(_record('form16x.pdf')) for _ in range(3)]
+
+        self.assertEqual(kept, [True, False, False] * 3)
+        self.assertEqual(others, [True] * 3)
+
+    def test_warnings_and_specific_rates(self):
+        """Warnings are never dropped and the most specific name wins."""
+        sampling = SamplingFilter({'form16x': 100, 'form16x.extractors': 2})
+
+        warnings = [sampling.filter(_record('form16x.extractors', logging.WARNING)) for _ in range(4)]
+        debug = [sampling.filter(_record('form16x.extractors.salary')) for _ in range(4)]
+
+        self.assertEqual(warnings, [True] * 4)
+        self.assertEqual(debug, [True, False, True, False])
+
+
+class TestJsonFormatter(unittest.TestCase):
+    """Test JSON records."""
+
+    def test_formats_record_as_json(self):
+        """The record's message, level, logger and document id are written."""
+        record = _record(level=logging.INFO, msg='%d tables', args=(3,))
+        record.document_id = 'form16.pdf'
+
+        entry = json.loads(JsonFormatter().format(record))
+
+        self.assertEqual(entry['message'], '3 tables')
+        self.assertEqual(entry['level'], 'INFO')
+        self.assertEqual(entry['logger'], 'form16x.test')
+        self.assertEqual(entry['document_id'], 'form16.pdf')
+
+    def test_includes_exception(self):
+        """Exception tracebacks are included."""
+        try:
+            raise ValueError('bad amount')
+        except ValueError:
+            record = logging.LogRecord('form16x.test', logging.ERROR, __file__, 1, 'failed', None,
+                                       sys.exc_info())
+
+        entry = json.loads(JsonFormatter().format(record))
+
+        self.assertIn('ValueError: bad amount', entry['exception'])
+
+
+class TestDeferredQueueHandler(unittest.TestCase):
+    """Test queueing records without formatting them."""
+
+    def test_immutable_args_are_not_formatted(self):
+        """Records with scalar arguments are queued as logged."""
+        handler = DeferredQueueHandler(queue.SimpleQueue())
+        record = _record(msg='%s has %d fields', args=('employee', 4))
+
+        handler.handle(record)
+        queued = handler.queue.get_nowait()
+
+        self.assertEqual(queued.msg, '%s has %d fields')
+        self.assertEqual(queued.args, ('employee', 4))
+
+    def test_mutable_args_are_rendered(self):
+        """Records with mutable arguments are rendered before queueing."""
+        handler = DeferredQueueHandler(queue.SimpleQueue())
+        fields = ['pan']
+
+        handler.handle(_record(msg='fields: %s', args=(fields,)))
+        fields.append('tan')
+
+        self.assertEqual(handler.queue.get_nowait().getMessage(), "fields: ['pan']")
+
+    def test_listener_writes_records_with_document_ids(self):
+        """Records logged on worker threads reach the listener's handler with their ids."""
+        stream = io.StringIO()
+        output = logging.StreamHandler(stream)
+        output.setFormatter(JsonFormatter())
+        handler = DeferredQueueHandler(queue.SimpleQueue())
+        handler.addFilter(CorrelationFilter())
+        listener = logging.handlers.QueueListener(handler.queue, output)
+        logger = logging.getLogger('form16x.test.queue')
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        self.addCleanup(logger.removeHandler, handler)
+
+        def work(number):
+            with document_context(f'document-{number}.pdf'):
+                logger.debug('document %d', number)
+
+        listener.start()
+        threads = [threading.Thread(target=work, args=(number,)) for number in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        listener.stop()
+
+        entries = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(
+            sorted((entry['message'], entry['document_id']) for entry in entries),
+            [(f'document {number}', f'document-{number}.pdf') for number in range(4)]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Tests for Table Feature Extraction
+==================================
+
+Test coverage for the single-pass keyword and amount features shared by
+the table classifiers and routers.
+"""
+
+import unittest
+import pandas as pd
+
+from form16x.form16_parser.utils.table_features import (
+    extract_table_features,
+    register_keywords,
+    table_features
+)
+
+
+class TestTableFeatures(unittest.TestCase):
+    """Test TableFeatures keyword and amount statistics."""
+
+    def setUp(self):
+        """Register test keywords and build a sample table."""
+        register_keywords(['tax', 'tax deducted', 'deducted', 'gross', 'salary', 'x sal'])
+        self.table = pd.DataFrame({
+            'Description': ['Gross Salary', 'Tax Deducted', 'TAX'],
+            'Amount': [500000, 25000.0, '₹1,20,000']
+        })
+
+    def test_overlapping_keywords_counted_independently(self):
+        """Shorter keywords inside longer ones are still counted."""
+        features = table_features(self.table)
+
+        self.assertEqual(features.count('tax deducted'), 1)
+        self.assertEqual(features.count('tax'), 2)
+        self.assertEqual(features.count('deducted'), 1)
+        self.assertTrue(features.has('gross'))
+
+    def test_counts_match_direct_substring_scan(self):
+        """Counts equal a per-keyword overlapping substring scan of the text."""
+        features = table_features(self.table)
+
+        for keyword in ['tax', 'tax deducted', 'deducted', 'gross', 'salary']:
+            expected = sum(
+                1 for i in range(len(features.text))
+                if features.text.startswith(keyword, i)
+            )
+            self.assertEqual(features.count(keyword), expected, keyword)
+
+    def test_scopes(self):
+        """Column labels and cross-cell matches are only seen by the wider scopes."""
+        table = pd.DataFrame({'Gross': ['tax', 'salary']})
+        features = table_features(table)
+
+        self.assertTrue(features.has('gross', scope='text'))
+        self.assertFalse(features.has('gross', scope='cells'))
+        # 'tax salary' spans two cells: visible in the joined text only
+        self.assertTrue(features.has('x sal', scope='cells'))
+        self.assertFalse(features.has('x sal', scope='segment'))
+        self.assertTrue(features.has('salary', scope='segment'))
+
+    def test_cells_with_any(self):
+        """Cells are attributed the keywords they contain."""
+        features = table_features(self.table)
+
+        self.assertEqual(features.cells_with_any(frozenset(['tax'])), 2)
+        self.assertEqual(features.cells_with_any(frozenset(['gross', 'deducted'])), 2)
+        self.assertEqual(features.cells_with_any(frozenset(['missing'])), 0)
+
+    def test_unregistered_keyword_falls_back_to_scan(self):
+        """Keywords outside the vocabulary are still answered."""
+        features = table_features(self.table)
+
+        self.assertTrue(features.has('description'))
+        self.assertFalse(features.has('description', scope='cells'))
+
+    def test_amount_statistics(self):
+        """Typed numeric cells and amount tokens are collected."""
+        features = table_features(self.table)
+
+        self.assertEqual(features.numeric_values, (500000.0, 25000.0))
+        self.assertEqual(features.count_values_between(50000, 10000000), 1)
+        self.assertEqual(features.count_amounts_above(100000), 2)
+        self.assertEqual(features.numeric_cells, 3)
+        self.assertEqual(features.total_cells, 6)
+
+    def test_features_cached_per_table(self):
+        """The same table object reuses its features."""
+        first = table_features(self.table)
+        self.assertIs(table_features(self.table), first)
+        self.assertIsNot(extract_table_features(self.table), first)
+
+    def test_new_keywords_invalidate_cache(self):
+        """Registering new keywords recomputes features on next access."""
+        first = table_features(self.table)
+        register_keywords(['description amount'])
+        second = table_features(self.table)
+
+        self.assertIsNot(second, first)
+        self.assertTrue(second.has('description amount'))
+
+    def test_empty_table(self):
+        """Empty tables produce empty features."""
+        features = table_features(pd.DataFrame())
+
+        self.assertEqual(features.total_cells, 0)
+        self.assertEqual(features.keyword_counts, {})
+        self.assertEqual(features.cell_keywords, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,6 +13,7 @@ from unittest.mock import Mock, patch
 from form16x.form16_parser.utils.table_utils import (
     TablePreprocessor,
     TableAnalyzer,
+    cell_matrix,
     preprocess_tables
 )
 
@@ -78,6 +79,65 @@ class TestTablePreprocessor(unittest.TestCase):
         
         # Should return a DataFrame
         self.assertIsInstance(handled_df, pd.DataFrame)
+    
+    def test_normalize_cell_values_tokens_and_whitespace(self):
+        """Test null tokens become None and whitespace collapses."""
+        df = pd.DataFrame([['  Gross\n  Salary ', 'NIL'], [None, ' - '], ['na', '1,000']])
+        
+        normalized_df = TablePreprocessor.normalize_cell_values(df)
+        
+        self.assertEqual(
+            normalized_df.values.tolist(),
+            [['Gross Salary', None], [None, None], [None, '1,000']]
+        )
+    
+    def test_fill_merged_headers_stops_at_empty_rows(self):
+        """Test merged cells fill down until a completely empty row."""
+        df = pd.DataFrame([['Salary', 'a'], [None, 'b'], [None, None], [None, 'c']])
+        
+        filled_df = TablePreprocessor._fill_merged_headers(df)
+        
+        self.assertEqual(
+            filled_df.values.tolist(),
+            [['Salary', 'a'], ['Salary', 'b'], [None, None], [None, 'c']]
+        )
+    
+    def test_combine_split_text(self):
+        """Test continuation rows are merged into the row above."""
+        df = pd.DataFrame([
+            ['Gross Salary as per provisions', '50000'],
+            ['contained in section 17(1)', None],
+            ['Perquisites under section 17(2)', '0'],
+        ])
+        
+        combined_df = TablePreprocessor._combine_split_text(df)
+        
+        self.assertEqual(len(combined_df), 2)
+        self.assertEqual(
+            combined_df.iloc[0, 0],
+            'Gross Salary as per provisions contained in section 17(1)'
+        )
+        self.assertEqual(combined_df.iloc[1, 1], '0')
+
+
+class TestCellMatrix(unittest.TestCase):
+    """Test cell_matrix functionality."""
+    
+    def test_cell_matrix_strips_and_blanks_nulls(self):
+        """Test cells are stripped strings with '' for missing values."""
+        df = pd.DataFrame([[' PAN ', None], [float('nan'), ' 42 ']])
+        
+        cells = cell_matrix(df)
+        
+        self.assertEqual(cells.tolist(), [['PAN', ''], ['', '42']])
+        self.assertIs(type(cells[0, 0]), str)
+    
+    def test_cell_matrix_is_cached_per_table(self):
+        """Test the matrix is computed once per table object."""
+        df = pd.DataFrame([['a', 'b']])
+        
+        self.assertIs(cell_matrix(df), cell_matrix(df))
+        self.assertIsNot(cell_matrix(df), cell_matrix(df.copy()))
 
 
 class TestTableAnalyzer(unittest.TestCase):